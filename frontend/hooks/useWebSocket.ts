@@ -6,7 +6,7 @@
 import { useEffect, useRef, useState, useCallback } from "react";
 import { apiClient } from "@/lib/api-client";
 import { Signal } from "@/types";
-import type { IDaytradingSignal } from "@/types";
+import type { IDaytradingSignal, IWSPriceBatchMessage } from "@/types";
 import {
   WebSocketClient,
   ConnectionState,
@@ -173,6 +173,31 @@ export function useWebSocket(options: UseWebSocketOptions = {}) {
         }
       }
 
+      // 가격 일괄 업데이트 (사이클당 1 프레임)
+      if (message.type === "price_batch") {
+        const batchMsg = message as IWSPriceBatchMessage;
+        const batchPrices: RealtimePrice[] = Object.entries(batchMsg.data.prices).map(
+          ([ticker, data]) => ({
+            ticker,
+            price: data.price,
+            change: data.change,
+            change_rate: data.change_rate,
+            volume: data.volume,
+            timestamp: batchMsg.timestamp,
+          })
+        );
+
+        setPrices((prev) => {
+          const next = new Map(prev);
+          batchPrices.forEach((price) => next.set(price.ticker, price));
+          return next;
+        });
+
+        if (onPriceUpdate) {
+          batchPrices.forEach((price) => onPriceUpdate(price));
+        }
+      }
+
       // 지수 업데이트
       if (message.type === "index_update") {
         const indexMsg = message as IndexUpdateMessage;
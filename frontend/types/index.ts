@@ -85,6 +85,7 @@ export type WSMessageType =
   | "subscribed"
   | "unsubscribed"
   | "price_update"
+  | "price_batch"         // 사이클당 구독 종목 가격 일괄 전송
   | "index_update"
   | "market_gate_update"
   | "signal_update"       // VCP 시그널 실시간 업데이트
@@ -119,6 +120,16 @@ export interface IWSPriceUpdateMessage {
   timestamp: string;
 }
 
+// 가격 일괄 업데이트 메시지 (구독 종목만 포함)
+export interface IWSPriceBatchMessage {
+  type: "price_batch";
+  data: {
+    count: number;
+    prices: Record<string, IWSPriceUpdateMessage["data"]>;
+  };
+  timestamp: string;
+}
+
 // 지수 업데이트 메시지
 export interface IWSIndexUpdateMessage {
   type: "index_update";
@@ -188,6 +199,7 @@ export type IWSMessage =
   | IWSConnectedMessage
   | IWSSubscribedMessage
   | IWSPriceUpdateMessage
+  | IWSPriceBatchMessage
   | IWSIndexUpdateMessage
   | IWSMarketGateUpdateMessage
   | IWSSignalUpdateMessage
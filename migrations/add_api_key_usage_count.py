@@ -0,0 +1,23 @@
+"""
+Add usage_count field to APIKey model
+
+Revision ID: 005
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+
+def upgrade():
+    """Add usage_count column to api_keys table"""
+    op.execute("""
+        ALTER TABLE api_keys
+        ADD COLUMN IF NOT EXISTS usage_count INTEGER NOT NULL DEFAULT 0
+    """)
+
+
+def downgrade():
+    """Remove usage_count column"""
+    op.execute("""
+        ALTER TABLE api_keys
+        DROP COLUMN IF EXISTS usage_count
+    """)
@@ -0,0 +1,46 @@
+"""
+Add signal history tables (signal_date 월 단위 RANGE 파티션)
+
+Revision ID: 004
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+
+HISTORY_TABLES = {
+    "signals_history": "signals",
+    "daytrading_signals_history": "daytrading_signals",
+}
+
+
+def upgrade():
+    """
+    보관 기간이 지난 시그널 이력 테이블 생성
+
+    월 파티션은 SignalArchiveRepository가 이관 전에 생성하며,
+    DEFAULT 파티션은 월 파티션이 없는 구간의 행을 받습니다
+    (해당 월 파티션을 만들 때 새 파티션으로 옮겨집니다).
+    """
+    for history, source in HISTORY_TABLES.items():
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {history} (
+                LIKE {source} INCLUDING DEFAULTS,
+                archived_at TIMESTAMP,
+                PRIMARY KEY (id, signal_date)
+            ) PARTITION BY RANGE (signal_date)
+        """)
+        op.execute(f"ALTER TABLE {history} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"""
+            CREATE TABLE IF NOT EXISTS {history}_default
+            PARTITION OF {history} DEFAULT
+        """)
+        op.execute(f"""
+            CREATE INDEX IF NOT EXISTS ix_{history}_ticker_date
+            ON {history} (ticker, signal_date)
+        """)
+
+
+def downgrade():
+    """Drop signal history tables"""
+    for history in HISTORY_TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {history}")
@@ -0,0 +1,33 @@
+"""
+Add signal_performance_daily table
+
+Revision ID: 003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+
+def upgrade():
+    """Create signal_performance_daily table (시그널 타입별 일별 실현 수익률 집계)"""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS signal_performance_daily (
+            signal_type VARCHAR(20) NOT NULL,
+            signal_date DATE NOT NULL,
+            signal_count INTEGER NOT NULL DEFAULT 0,
+            win_count INTEGER NOT NULL DEFAULT 0,
+            return_sum FLOAT NOT NULL DEFAULT 0,
+            best_return FLOAT,
+            worst_return FLOAT,
+            updated_at TIMESTAMP,
+            PRIMARY KEY (signal_type, signal_date)
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_signal_performance_daily_updated_at
+        ON signal_performance_daily (updated_at)
+    """)
+
+
+def downgrade():
+    """Drop signal_performance_daily table"""
+    op.execute("DROP TABLE IF EXISTS signal_performance_daily")
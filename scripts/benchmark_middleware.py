@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 미들웨어 오버헤드 벤치마크
+
+기존 BaseHTTPMiddleware 4단 스택과 단일 ASGI 파이프라인의 요청당 처리 시간을 비교합니다.
+네트워크 없이 httpx ASGITransport로 앱을 직접 호출합니다.
+
+사용법:
+    python scripts/benchmark_middleware.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from src.middleware.asgi_pipeline import GatewayPipelineMiddleware, build_default_stages
+from src.middleware.logging_middleware import RequestLoggingMiddleware
+from src.middleware.metrics_middleware import MetricsMiddleware
+from src.middleware.request_id import RequestIDMiddleware
+from src.middleware.slow_endpoint import SlowEndpointMiddleware
+
+SKIP_PATHS = ["/health", "/metrics", "/readiness"]
+
+
+def _add_routes(app: FastAPI) -> FastAPI:
+    @app.get("/api/stocks/{ticker}")
+    async def get_stock(ticker: str):
+        return {"ticker": ticker, "price": 70000}
+
+    @app.get("/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(10):
+                yield f"{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def build_bare_app() -> FastAPI:
+    return _add_routes(FastAPI())
+
+
+def build_legacy_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware)
+    app.add_middleware(SlowEndpointMiddleware, threshold=1.0)
+    app.add_middleware(RequestLoggingMiddleware, skip_paths=SKIP_PATHS, log_body=False)
+    app.add_middleware(MetricsMiddleware)
+    return _add_routes(app)
+
+
+def build_pipeline_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        GatewayPipelineMiddleware,
+        stages=build_default_stages(skip_paths=SKIP_PATHS, slow_threshold=1.0),
+    )
+    return _add_routes(app)
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> list[float]:
+    """요청당 소요 시간 (ms) 목록"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get(path)
+
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+
+async def main(requests: int) -> None:
+    # 로그 출력 비용은 양쪽 동일하므로 측정에서 제외
+    logging.disable(logging.CRITICAL)
+
+    apps = {
+        "bare": build_bare_app(),
+        "legacy": build_legacy_app(),
+        "pipeline": build_pipeline_app(),
+    }
+
+    for path in ["/api/stocks/005930", "/api/stream"]:
+        print(f"\n{path} ({requests} requests)")
+        results = {}
+        for name, app in apps.items():
+            samples = await measure(app, path, requests)
+            results[name] = statistics.median(samples)
+            p99 = statistics.quantiles(samples, n=100)[98]
+            print(f"  {name:<9} median {results[name]:.3f} ms  p99 {p99:.3f} ms")
+
+        for name in ("legacy", "pipeline"):
+            overhead = results[name] - results["bare"]
+            print(f"  {name} overhead: {overhead:.3f} ms/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미들웨어 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -64,6 +64,7 @@ try:
     from src.middleware.logging_middleware import RequestLoggingMiddleware
     from src.middleware.request_id import RequestIDMiddleware
     from src.middleware.slow_endpoint import SlowEndpointMiddleware
+    from src.middleware.asgi_pipeline import GatewayPipelineMiddleware, build_default_stages
     WEBSOCKET_AVAILABLE = True
 except ImportError:
     logger.warning("WebSocket/middleware modules not available - running in standalone mode")
@@ -76,10 +77,18 @@ except ImportError:
     RequestLoggingMiddleware = None
     RequestIDMiddleware = None
     SlowEndpointMiddleware = None
+    GatewayPipelineMiddleware = None
+    build_default_stages = None
 
 # Daytrading Price Broadcaster (신규)
 daytrading_price_broadcaster = None
 
+# 실시간 Market Gate 엔진 (선택적)
+try:
+    from src.websocket.market_gate_engine import get_market_gate_engine
+except ImportError:
+    get_market_gate_engine = None
+
 # 대시보드 (선택적)
 try:
     from api_gateway.dashboard import router as dashboard_router
@@ -274,6 +283,14 @@ async def lifespan(app: FastAPI):
                     except Exception as e:
                         print(f"⚠️ Kiwoom WebSocket Bridge: {e}")
 
+                    # 실시간 Market Gate 엔진 (지수/섹터 ETF 이벤트로 Gate 계산)
+                    if get_market_gate_engine:
+                        try:
+                            await get_market_gate_engine().start(kiwoom_pipeline)
+                            print("✅ Realtime Market Gate engine started")
+                        except Exception as e:
+                            print(f"⚠️ Realtime Market Gate engine: {e}")
+
                 else:
                     print("⚠️ Kiwoom Pipeline failed to start. Real-time prices not available.")
         except Exception as e:
@@ -354,6 +371,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Error stopping Kiwoom WebSocket Bridge: {e}")
 
+    # 실시간 Market Gate 엔진 중지 (미저장 상태 저장)
+    if get_market_gate_engine:
+        try:
+            await get_market_gate_engine().stop()
+        except Exception as e:
+            print(f"⚠️ Error stopping Market Gate engine: {e}")
+
     # 가격 브로드캐스터 중지
     if price_broadcaster:
         print("📡 Stopping Price Broadcaster...")
@@ -388,6 +412,16 @@ async def lifespan(app: FastAPI):
         await redis_sub.stop()
         print("✅ Redis Pub/Sub Subscriber stopped")
 
+    # 속도 제한 Redis 연결 정리
+    if gateway_rate_limiter is not None:
+        await gateway_rate_limiter.close()
+
+    # 헬스체커 클라이언트 정리
+    from src.health.health_checker import get_health_checker
+    health_checker = get_health_checker()
+    if health_checker:
+        await health_checker.close()
+
     # Kiwoom 연동 중지
     if kiwoom_integration:
         print("📡 Stopping Kiwoom REST API integration...")
@@ -518,16 +552,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _build_rate_limiter():
+    """
+    게이트웨이 속도 제한 (RATE_LIMIT_ENABLED=true일 때만)
+
+    한도는 Redis(DistributedRateLimiter)에서 모든 워커가 공유하며,
+    Redis 장애 시에는 워커별 로컬 버킷으로 폴백합니다.
+    """
+    if os.getenv("RATE_LIMIT_ENABLED", "false").lower() != "true":
+        return None
+
+    from src.middleware.distributed_rate_limit import DistributedRateLimiter
+    from src.middleware.rate_limit import RateLimitMiddleware
+
+    return RateLimitMiddleware(
+        app=None,
+        requests=int(os.getenv("RATE_LIMIT_PER_MINUTE", "100")),
+        window=60,
+        excluded_paths={"/", "/health", "/readiness", "/metrics", "/docs", "/redoc", "/openapi.json", "/ws"},
+        distributed_limiter=DistributedRateLimiter(),
+    )
+
+
+gateway_rate_limiter = None
+
 # 미들웨어 (선택적 - Docker에서 없을 수 있음)
+# 요청 ID / 로깅 / 메트릭 / 느린 엔드포인트 추적 / 속도 제한을 단일 순수 ASGI 미들웨어로 처리
 if WEBSOCKET_AVAILABLE:
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(SlowEndpointMiddleware, threshold=1.0)
+    gateway_rate_limiter = _build_rate_limiter()
     app.add_middleware(
-        RequestLoggingMiddleware,
-        skip_paths=["/health", "/metrics", "/readiness"],
-        log_body=False,
+        GatewayPipelineMiddleware,
+        stages=build_default_stages(
+            skip_paths=["/health", "/metrics", "/readiness"],
+            slow_threshold=1.0,
+            rate_limiter=gateway_rate_limiter,
+        ),
     )
-    app.add_middleware(MetricsMiddleware)
     app.include_router(websocket_router)
 
 # 대시보드 라우터 포함 (선택적)
@@ -936,7 +996,8 @@ async def get_kr_market_gate(db: Session = Depends(get_db_session)):
     """
     Market Gate 상태 조회
 
-    데이터베이스에서 가장 최신 Market Gate 상태를 반환합니다.
+    실시간 Gate 엔진이 동작 중이면 메모리의 상태를, 아니면 데이터베이스의
+    가장 최신 Market Gate 상태를 반환합니다.
 
     - **GREEN**: 매수 우위 (전체 매수)
     - **YELLOW**: 관망 (일부 매수)
@@ -944,8 +1005,10 @@ async def get_kr_market_gate(db: Session = Depends(get_db_session)):
     """
     from services.api_gateway.schemas import SectorItem
 
-    # 데이터베이스에서 가장 최신 MarketStatus 조회
-    market_status = db.query(MarketStatus).order_by(MarketStatus.date.desc()).first()
+    # 실시간 엔진 스냅샷 우선, 없으면 데이터베이스에서 가장 최신 MarketStatus 조회
+    market_status = get_market_gate_engine().snapshot() if get_market_gate_engine else None
+    if market_status is None:
+        market_status = db.query(MarketStatus).order_by(MarketStatus.date.desc()).first()
 
     # KOSPI/KOSDAQ 상태 결정
     def get_market_status(change_pct: Optional[float]) -> str:
@@ -1071,8 +1134,11 @@ async def get_backtest_kpi(db: Session = Depends(get_db_session)):
 
     repo = BacktestRepository(db)
 
+    # 두 전략 통계를 한 번의 GROUP BY 쿼리로 조회
+    summaries = repo.get_summaries(["vcp", "jongga_v2"])
+
     # VCP 전략 백테스트 통계
-    vcp_summary = repo.get_summary(config_name="vcp")
+    vcp_summary = summaries["vcp"]
     if vcp_summary["total_backtests"] >= 2:
         vcp_stats = BacktestStatsItem(
             strategy="vcp",
@@ -1091,7 +1157,7 @@ async def get_backtest_kpi(db: Session = Depends(get_db_session)):
         )
 
     # 종가베팅 V2 전략 백테스트 통계
-    jongga_summary = repo.get_summary(config_name="jongga_v2")
+    jongga_summary = summaries["jongga_v2"]
     if jongga_summary["total_backtests"] >= 2:
         closing_bet_stats = BacktestStatsItem(
             strategy="jongga_v2",
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from src.database.session import get_db_session
 from src.database.models_api_key import APIKey
 from src.middleware.api_key_auth import require_scope
+from src.middleware.api_key_cache import publish_api_key_change
 
 logger = logging.getLogger(__name__)
 
@@ -141,9 +142,13 @@ async def delete_api_key(
             )
 
         key_name = api_key.name
+        key_value = api_key.key
         session.delete(api_key)
         session.commit()
 
+        # 모든 게이트웨이 워커의 검증 캐시에서 제거
+        await publish_api_key_change(key_value)
+
         logger.info(f"API Key deleted: {key_name} (ID: {key_id})")
 
         return {
@@ -189,6 +194,7 @@ async def deactivate_api_key(
 
         api_key.is_active = False
         session.commit()
+        await publish_api_key_change(api_key.key)
 
         logger.info(f"API Key deactivated: {api_key.name} (ID: {key_id})")
 
@@ -235,6 +241,7 @@ async def activate_api_key(
 
         api_key.is_active = True
         session.commit()
+        await publish_api_key_change(api_key.key)
 
         logger.info(f"API Key activated: {api_key.name} (ID: {key_id})")
 
@@ -383,6 +383,18 @@ async def get_jongga_v2_history(
         )
 
 
+def _shard_status(shard) -> dict:
+    """샤드 태스크 상태 (PROGRESS 메타데이터의 done/total 포함)"""
+    status = {"task_id": shard.id, "state": shard.state}
+    info = shard.info
+    if shard.state == "PROGRESS" and isinstance(info, dict):
+        status["done"] = info.get("done", 0)
+        status["total"] = info.get("total", 0)
+    elif shard.successful() and isinstance(info, dict):
+        status["done"] = status["total"] = info.get("scanned", 0)
+    return status
+
+
 @router.get(
     "/status/{task_id}",
     summary="종가베팅 V2 엔진 상태 조회",
@@ -407,6 +419,8 @@ async def get_jongga_v2_status(
     ## Returns
     - **state**: 태스크 상태 (PENDING/STARTED/SUCCESS/FAILURE)
     - **result**: 태스크 결과 (완료 시)
+    - **shards**: 샤드별 상태/진행률 (전 종목 스캔 발행 시)
+    - **reducer**: 집계 태스크 상태 및 최종 결과
 
     ## Example
     ```bash
@@ -425,12 +439,28 @@ async def get_jongga_v2_status(
                 detail=f"태스크를 찾을 수 없습니다: {task_id}"
             )
 
-        return {
+        response = {
             "task_id": task_id,
             "state": result.state,
             "result": result.result if result.ready() else None,
         }
 
+        # 샤드 fan-out 발행 결과면 샤드/리듀서 진행 상황 포함
+        dispatched = response["result"]
+        if isinstance(dispatched, dict) and "shard_task_ids" in dispatched:
+            response["shards"] = [
+                _shard_status(celery_app.AsyncResult(shard_id))
+                for shard_id in dispatched["shard_task_ids"]
+            ]
+            reducer = celery_app.AsyncResult(dispatched["reducer_task_id"])
+            response["reducer"] = {
+                "task_id": reducer.id,
+                "state": reducer.state,
+                "result": reducer.result if reducer.successful() else None,
+            }
+
+        return response
+
     except HTTPException:
         raise
     except Exception as e:
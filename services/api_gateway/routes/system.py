@@ -6,6 +6,7 @@ System Routes
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text, select
 
@@ -13,7 +14,7 @@ from src.database.session import get_db_session
 from src.database.models import DailyPrice, Signal
 from src.repositories.stock_repository import StockRepository
 from src.repositories.signal_repository import SignalRepository
-from src.health.health_checker import get_health_checker, init_health_checker
+from src.health.health_checker import HealthStatus, get_health_checker, init_health_checker
 from services.api_gateway.schemas import (
     DataStatusResponse,
     DataStatusItem,
@@ -353,80 +354,101 @@ async def get_system_health_v2(
     if health_checker is None:
         return {"error": "Health checker not initialized"}
 
-    # 비동기 세션 변환
+    # 다운스트림 서비스는 체커에 등록해 기본 체크와 함께 동시에 실행 (결과는 캐시됨)
+    _register_downstream_services(health_checker)
+    system_health = await health_checker.system_health()
+    result = system_health.to_dict()
 
-    # 동기 세션을 사용하는 경우, 비동기 체크는 별도 수행
-    system_health = await health_checker.check_all(session=None)
+    # 전체 상태 재계산
+    down_services = sum(
+        1 for s in system_health.services.values()
+        if s.status in (HealthStatus.UNHEALTHY, HealthStatus.UNKNOWN)
+    )
+    total_services = len(system_health.services)
 
-    # 추가 서비스 체크 (VCP Scanner, Signal Engine)
-    try:
-        from services.api_gateway.service_registry import get_registry
-        registry = get_registry()
+    if down_services == 0:
+        result["status"] = HealthStatus.HEALTHY.value
+    elif down_services <= total_services // 2:
+        result["status"] = HealthStatus.DEGRADED.value
+    else:
+        result["status"] = HealthStatus.UNHEALTHY.value
 
-        # VCP Scanner
-        vcp_service = registry.get_service("vcp-scanner")
-        if vcp_service:
-            vcp_health = await health_checker.check_vcp_scanner(vcp_service["url"])
-            system_health.services["vcp_scanner"] = vcp_health
+    return result
 
-        # Signal Engine
-        signal_service = registry.get_service("signal-engine")
-        if signal_service:
-            signal_health = await health_checker.check_signal_engine(signal_service["url"])
-            system_health.services["signal_engine"] = signal_health
 
-        # Market Analyzer
-        market_service = registry.get_service("market-analyzer")
-        if market_service:
-            market_health = await health_checker.check_market_analyzer(market_service["url"])
-            system_health.services["market_analyzer"] = market_health
+def _register_downstream_services(health_checker) -> None:
+    """서비스 레지스트리의 다운스트림 서비스를 헬스체커에 등록"""
+    try:
+        from services.api_gateway.service_registry import get_registry
+        registry = get_registry()
 
-        # Daytrading Scanner
-        daytrading_service = registry.get_service("daytrading-scanner")
-        if daytrading_service:
-            try:
-                import httpx
-                start_time = time.time()
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get(f"{daytrading_service['url']}/health")
-                    response_time = (time.time() - start_time) * 1000
-                    from src.health.health_checker import HealthStatus, ServiceHealth
-                    daytrading_health = ServiceHealth(
-                        name="daytrading_scanner",
-                        status=HealthStatus.HEALTHY if response.status_code == 200 else HealthStatus.UNHEALTHY,
-                        response_time_ms=response_time,
-                        message=f"HTTP {response.status_code}" if response.status_code != 200 else "OK"
-                    )
-                    system_health.services["daytrading_scanner"] = daytrading_health
-            except Exception as e:
-                from src.health.health_checker import HealthStatus, ServiceHealth
-                system_health.services["daytrading_scanner"] = ServiceHealth(
-                    name="daytrading_scanner",
-                    status=HealthStatus.UNHEALTHY,
-                    response_time_ms=0,
-                    message=str(e)
-                )
+        for registry_name, health_name in (
+            ("vcp-scanner", "vcp_scanner"),
+            ("signal-engine", "signal_engine"),
+            ("market-analyzer", "market_analyzer"),
+            ("daytrading-scanner", "daytrading_scanner"),
+        ):
+            service = registry.get_service(registry_name)
+            if service:
+                health_checker.register_http_service(health_name, service["url"])
 
     except Exception:
         # 서비스 레지스트리 실패 시 무시
         pass
 
-    # 전체 상태 재계산
-    from src.health.health_checker import HealthStatus
-    down_services = sum(
-        1 for s in system_health.services.values()
-        if s.status in (HealthStatus.UNHEALTHY, HealthStatus.UNKNOWN)
-    )
-    total_services = len(system_health.services)
 
-    if down_services == 0:
-        system_health.status = HealthStatus.HEALTHY
-    elif down_services <= total_services // 2:
-        system_health.status = HealthStatus.DEGRADED
-    else:
-        system_health.status = HealthStatus.UNHEALTHY
+@router.get(
+    "/liveness",
+    summary="Liveness 프로브",
+    description="프로세스 생존 여부만 확인합니다. 결과는 짧게 캐시되며 의존 서비스를 호출하지 않습니다.",
+    responses={
+        200: {"description": "정상"},
+        503: {"description": "비정상"},
+    },
+)
+async def get_liveness():
+    """
+    Liveness 프로브
+
+    ## Example
+    ```bash
+    curl "http://localhost:5111/api/system/liveness"
+    ```
+    """
+    health_checker = get_health_checker()
+    if health_checker is None:
+        return JSONResponse({"error": "Health checker not initialized"}, status_code=503)
+
+    health = await health_checker.liveness()
+    status_code = 503 if health.status == HealthStatus.UNHEALTHY else 200
+    return JSONResponse(health.to_dict(), status_code=status_code)
+
+
+@router.get(
+    "/readiness",
+    summary="Readiness 프로브",
+    description="핵심 의존성(DB, Redis) 기준으로 처리 가능 여부를 확인합니다. 결과는 짧게 캐시되고 백그라운드에서 갱신됩니다.",
+    responses={
+        200: {"description": "처리 가능"},
+        503: {"description": "처리 불가"},
+    },
+)
+async def get_readiness():
+    """
+    Readiness 프로브
+
+    ## Example
+    ```bash
+    curl "http://localhost:5111/api/system/readiness"
+    ```
+    """
+    health_checker = get_health_checker()
+    if health_checker is None:
+        return JSONResponse({"error": "Health checker not initialized"}, status_code=503)
 
-    return system_health.to_dict()
+    system_health = await health_checker.readiness()
+    status_code = 503 if system_health.status == HealthStatus.UNHEALTHY else 200
+    return JSONResponse(system_health.to_dict(), status_code=status_code)
 
 
 @router.get(
@@ -569,13 +591,15 @@ async def clear_cache(pattern: str = "*"):
     ```
     """
     try:
-        from src.cache import get_cache
+        from src.cache import get_cache, get_tiered_cache
 
         cache = await get_cache()
         if not cache:
             return {"cleared": 0, "message": "Cache not available"}
 
-        count = await cache.clear_pattern(pattern)
+        # L2(Redis) 삭제 + 모든 워커의 L1 무효화
+        tiered = await get_tiered_cache()
+        count = await tiered.clear_pattern(pattern)
         return {"cleared": count, "pattern": pattern}
 
     except Exception as e:
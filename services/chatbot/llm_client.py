@@ -3,13 +3,19 @@ Chatbot LLM Client
 Gemini API 기반 LLM 클라이언트
 """
 
+import asyncio
 import logging
 import os
-from typing import List, Dict, Optional
+import re
+import threading
+from typing import AsyncIterator, List, Dict, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Mock 스트리밍 청크 분할 (단어 + 뒤따르는 공백)
+_MOCK_CHUNK_PATTERN = re.compile(r"\S+\s*")
+
 
 class LLMInitializationError(Exception):
     """LLM 초기화 실패 예외"""
@@ -108,6 +114,95 @@ class LLMClient:
             # API 호출 실패 시 Mock으로 fallback
             return self._generate_mock_reply(prompt)
 
+    async def stream_reply(
+        self,
+        prompt: str,
+        conversation_history: Optional[List[Dict]] = None
+    ) -> AsyncIterator[str]:
+        """
+        LLM 답변 스트리밍 생성
+
+        Gemini 스트리밍 응답을 별도 스레드에서 읽어 텍스트 조각 단위로 전달합니다.
+        첫 조각 전에 실패하면 Mock 답변으로 대체하고, 이후 실패는 그 지점에서 종료합니다.
+
+        Args:
+            prompt: 프롬프트
+            conversation_history: 대화 기록
+
+        Yields:
+            답변 텍스트 조각
+        """
+        if self._use_mock:
+            for chunk in self._mock_chunks(prompt):
+                yield chunk
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        done = object()
+
+        def emit(item) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # 이벤트 루프 종료 후 도착한 조각은 버림
+                cancelled.set()
+
+        def produce() -> None:
+            try:
+                for part in self._client.generate_content(prompt, stream=True):
+                    if cancelled.is_set():
+                        break
+                    text = getattr(part, "text", "")
+                    if text:
+                        emit(text)
+            except Exception as e:
+                emit(e)
+            finally:
+                emit(done)
+
+        loop.run_in_executor(None, produce)
+        started = False
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"❌ LLM streaming failed: {item}")
+                    if not started:
+                        for chunk in self._mock_chunks(prompt):
+                            yield chunk
+                    break
+                started = True
+                yield item
+        finally:
+            # 클라이언트 연결 종료 시 생산 스레드도 다음 조각에서 중단
+            cancelled.set()
+
+    def build_response(self, reply_text: str) -> LLMResponse:
+        """
+        완성된 답변 텍스트로 LLM 응답 구성 (스트리밍 종료 시 사용)
+
+        Args:
+            reply_text: 답변 전문
+
+        Returns:
+            추천 질문이 포함된 LLM 응답
+        """
+        reply_text = reply_text.strip()
+        return LLMResponse(
+            reply=reply_text,
+            suggestions=self._extract_suggestions(reply_text),
+            usage=None,
+        )
+
+    def _mock_chunks(self, prompt: str) -> List[str]:
+        """Mock 답변을 스트리밍 조각으로 분할"""
+        reply = self._get_mock_response(self._extract_question_from_prompt(prompt))
+        return _MOCK_CHUNK_PATTERN.findall(reply)
+
     def _generate_mock_reply(self, prompt: str) -> LLMResponse:
         """
         Mock 응답 생성
@@ -8,9 +8,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any
+import asyncio
+import json
 import logging
 
 # 독립 실행을 위한 유연한 import
@@ -29,7 +31,7 @@ try:
         ContextResponse,
         HealthCheckResponse,
     )
-    from chatbot.session_manager import get_session_manager
+    from chatbot.session_store import get_session_store
     from chatbot.retriever import get_retriever
     from chatbot.prompts import build_rag_prompt
     from chatbot.llm_client import get_llm_client
@@ -41,7 +43,7 @@ except ImportError:
         ContextResponse,
         HealthCheckResponse,
     )
-    from services.chatbot.session_manager import get_session_manager
+    from services.chatbot.session_store import get_session_store
     from services.chatbot.retriever import get_retriever
     from services.chatbot.prompts import build_rag_prompt
     from services.chatbot.llm_client import get_llm_client
@@ -172,35 +174,30 @@ async def chat(request: ChatRequest):
     - **session_id**: 세션 ID (없으면 자동 생성)
     """
     try:
-        session_manager = get_session_manager()
+        session_store = get_session_store()
         retriever = get_retriever()
         llm_client = get_llm_client()
 
         # session_id가 없으면 생성
-        session_id = request.session_id or session_manager.create_session()
+        session_id = request.session_id or await session_store.create_session()
 
         # 사용자 메시지 저장
-        session_manager.add_message(session_id, "user", request.message)
+        await session_store.add_message(session_id, "user", request.message)
 
-        # RAG 컨텍스트 검색
-        context = retriever.retrieve_context(request.message)
+        # RAG 컨텍스트 검색 (단계별 동시 실행 + Kiwoom 실시간 현재가)
+        context = await retriever.retrieve_context_async(request.message)
 
-        # 종목 관련 질문이면 Kiwoom 실시간 현재가 추가
-        if context.get("stocks"):
-            # 비동기로 Kiwoom 데이터 enrich
-            context = await retriever.enrich_with_kiwoom_data(context)
-
-        # 대화 기록 조회
-        history = session_manager.get_history_formatted(session_id)
+        # 대화 기록 조회 (토큰 예산 안의 최근 기록)
+        history = await session_store.get_history_window(session_id)
 
         # LLM 프롬프트 빌드
         prompt = build_rag_prompt(request.message, context, history)
 
-        # LLM 답변 생성 (Phase 4)
-        llm_response = llm_client.generate_reply(prompt, history)
+        # LLM 답변 생성 (Phase 4) - 동기 SDK 호출은 스레드에서 실행
+        llm_response = await asyncio.to_thread(llm_client.generate_reply, prompt, history)
 
         # 어시스턴트 메시지 저장
-        session_manager.add_message(session_id, "assistant", llm_response.reply)
+        await session_store.add_message(session_id, "assistant", llm_response.reply)
 
         return ChatResponse(
             reply=llm_response.reply,
@@ -216,6 +213,54 @@ async def chat(request: ChatRequest):
         )
 
 
+@app.post(
+    "/chat/stream",
+    tags=["chat"],
+    responses={
+        200: {
+            "description": "SSE 스트림 (meta → context → token* → done)",
+            "content": {"text/event-stream": {}},
+        },
+        422: {
+            "description": "요청 데이터 유효성 검사 실패",
+        }
+    },
+)
+async def chat_stream(request: ChatRequest):
+    """
+    채팅 요청 스트리밍 처리 (Server-Sent Events)
+
+    세션 ID를 즉시 보내고, 컨텍스트 검색이 끝나면 LLM 답변을 토큰 단위로 전송합니다.
+
+    - **message**: 사용자 메시지 (필수)
+    - **session_id**: 세션 ID (없으면 자동 생성)
+
+    이벤트:
+    - `meta`: session_id
+    - `context`: 질문 유형, 검색된 종목, 시간 초과 단계
+    - `token`: 답변 텍스트 조각
+    - `done`: 전체 답변과 추천 질문
+    - `error`: 처리 중 오류
+    """
+    session_store = get_session_store()
+    retriever = get_retriever()
+    llm_client = get_llm_client()
+
+    session_id = request.session_id or await session_store.create_session()
+    await session_store.add_message(session_id, "user", request.message)
+
+    return StreamingResponse(
+        _chat_event_stream(
+            request.message, session_id, session_store, retriever, llm_client
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @app.get(
     "/context",
     tags=["chat"],
@@ -234,11 +279,11 @@ async def get_context(session_id: str):
 
     - **session_id**: 세션 ID
     """
-    session_manager = get_session_manager()
+    session_store = get_session_store()
 
     # Redis에서 대화 기록 조회
-    history = session_manager.get_history_formatted(session_id)
-    message_count = session_manager.get_message_count(session_id)
+    history = await session_store.get_history_formatted(session_id)
+    message_count = await session_store.get_message_count(session_id)
 
     return ContextResponse(
         session_id=session_id,
@@ -275,7 +320,7 @@ async def query_context(request: Dict[str, Any]):
         retriever = get_retriever()
 
         # 질문에 대한 컨텍스트 검색
-        context = retriever.retrieve_context(query)
+        context = await retriever.retrieve_context_async(query)
 
         return {
             "query": query,
@@ -322,10 +367,10 @@ async def delete_context(session_id: str):
 
     - **session_id**: 세션 ID
     """
-    session_manager = get_session_manager()
+    session_store = get_session_store()
 
     # 세션 삭제
-    success = session_manager.clear_session(session_id)
+    success = await session_store.clear_session(session_id)
 
     if not success:
         raise HTTPException(
@@ -357,10 +402,10 @@ async def delete_session(session_id: str):
 
     - **session_id**: 세션 ID
     """
-    session_manager = get_session_manager()
+    session_store = get_session_store()
 
     # 세션 삭제
-    success = session_manager.clear_session(session_id)
+    success = await session_store.clear_session(session_id)
 
     if not success:
         raise HTTPException(
@@ -464,10 +509,10 @@ async def get_session(session_id: str):
     - **session_id**: 세션 ID
     """
     try:
-        session_manager = get_session_manager()
+        session_store = get_session_store()
 
         # 세션 정보 조회
-        session_info = session_manager.get_session_info(session_id)
+        session_info = await session_store.get_session_info(session_id)
 
         if session_info is None:
             raise HTTPException(
@@ -476,7 +521,7 @@ async def get_session(session_id: str):
             )
 
         # 대화 기록 조회
-        messages = session_manager.get_history_formatted(session_id)
+        messages = await session_store.get_history_formatted(session_id)
 
         return {
             "session_id": session_id,
@@ -500,6 +545,63 @@ async def get_session(session_id: str):
 # Helper Functions
 # ============================================================================
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """SSE 이벤트 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _chat_event_stream(
+    message: str,
+    session_id: str,
+    session_store,
+    retriever,
+    llm_client,
+) -> AsyncIterator[str]:
+    """
+    /chat/stream 이벤트 생성기
+
+    Args:
+        message: 사용자 메시지
+        session_id: 세션 ID
+        session_store: 세션 저장소
+        retriever: 지식 검색기
+        llm_client: LLM 클라이언트
+
+    Yields:
+        SSE 이벤트 문자열
+    """
+    yield _sse_event("meta", {"session_id": session_id})
+
+    try:
+        context = await retriever.retrieve_context_async(message)
+        yield _sse_event("context", {
+            "query_type": context.get("query_type", "general"),
+            "stocks": [s.get("ticker") for s in context.get("stocks", [])],
+            "timed_out_stages": context.get("timed_out_stages", []),
+        })
+
+        history = await session_store.get_history_window(session_id)
+        prompt = build_rag_prompt(message, context, history)
+
+        parts: List[str] = []
+        async for chunk in llm_client.stream_reply(prompt, history):
+            parts.append(chunk)
+            yield _sse_event("token", {"text": chunk})
+
+        llm_response = llm_client.build_response("".join(parts))
+        await session_store.add_message(session_id, "assistant", llm_response.reply)
+
+        yield _sse_event("done", {
+            "reply": llm_response.reply,
+            "suggestions": llm_response.suggestions,
+            "session_id": session_id,
+        })
+
+    except Exception as e:
+        logger.error(f"스트리밍 채팅 처리 실패: {e}")
+        yield _sse_event("error", {"detail": f"채팅 처리 중 오류가 발생했습니다: {str(e)}"})
+
+
 def _generate_rag_reply(
     message: str,
     context: Dict[str, Any],
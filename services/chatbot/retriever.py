@@ -3,10 +3,12 @@ Chatbot Knowledge Retriever
 RAG 기반 지식 검색 엔진
 """
 
+import asyncio
 import logging
 import sys
 import os
-from typing import List, Dict, Optional, Any
+import threading
+from typing import Awaitable, List, Dict, Optional, Any
 from datetime import datetime
 
 # 현재 파일의 디렉토리를 sys.path에 추가
@@ -18,9 +20,11 @@ if _current_dir not in sys.path:
 try:
     from src.repositories.stock_repository import StockRepository
     from src.repositories.signal_repository import SignalRepository
+    from src.repositories.stock_search_index import StockSearchIndex, get_stock_search_index
 except ImportError:
     from ralph_stock_lib.repositories.stock_repository import StockRepository
     from ralph_stock_lib.repositories.signal_repository import SignalRepository
+    from ralph_stock_lib.repositories.stock_search_index import StockSearchIndex, get_stock_search_index
 
 try:
     from chatbot.kiwoom_integration import is_kiwoom_available
@@ -31,6 +35,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 검색 단계별 마감 시간 (초) - 초과한 단계는 빈 결과로 진행
+STAGE_TIMEOUTS: Dict[str, float] = {
+    "stocks": 2.0,
+    "signals": 2.0,
+    "news": 4.0,
+    "market_status": 2.0,
+    "kiwoom": 3.0,
+}
+
 
 class KnowledgeRetriever:
     """
@@ -39,14 +52,52 @@ class KnowledgeRetriever:
     주식 관련 데이터를 검색하여 RAG를 위한 컨텍스트를 제공합니다.
     """
 
-    def __init__(self):
-        """지식 검색기 초기화"""
+    def __init__(self, stock_index: Optional[StockSearchIndex] = None):
+        """
+        지식 검색기 초기화
+
+        Args:
+            stock_index: 종목 검색 색인 (기본값: 프로세스 전역 색인)
+        """
         self._stock_repo: Optional[StockRepository] = None
         self._signal_repo: Optional[SignalRepository] = None
         self._session = None  # DB 세션 저장
+        self._stock_index = stock_index
+        # 스레드 전용 저장소 (retrieve_context_async의 스레드 단계에서만 설정)
+        self._local = threading.local()
+
+    def _get_stock_index(self) -> StockSearchIndex:
+        """종목 검색 색인 (주입되지 않았으면 전역 색인)"""
+        if self._stock_index is not None:
+            return self._stock_index
+        return get_stock_search_index()
+
+    def _run_with_own_session(self, func, *args, **kwargs):
+        """
+        스레드 전용 단기 세션으로 func 실행
+
+        Session은 스레드 간 공유할 수 없으므로 asyncio.to_thread로 넘기는 DB 단계는
+        호출마다 새 세션을 열고, 그동안 _get_*_repo가 그 세션의 저장소를 반환합니다.
+        """
+        try:
+            from src.database.session import get_db_session_sync
+        except ImportError:
+            from ralph_stock_lib.database.session import get_db_session_sync
+
+        with get_db_session_sync() as session:
+            self._local.stock_repo = StockRepository(session)
+            self._local.signal_repo = SignalRepository(session)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.stock_repo = None
+                self._local.signal_repo = None
 
     def _get_stock_repo(self) -> StockRepository:
         """StockRepository lazy loading"""
+        local_repo = getattr(self._local, "stock_repo", None)
+        if local_repo is not None:
+            return local_repo
         if self._stock_repo is None:
             try:
                 from src.database.session import get_db_session
@@ -61,6 +112,9 @@ class KnowledgeRetriever:
 
     def _get_signal_repo(self) -> SignalRepository:
         """SignalRepository lazy loading"""
+        local_repo = getattr(self._local, "signal_repo", None)
+        if local_repo is not None:
+            return local_repo
         if self._signal_repo is None:
             try:
                 from src.database.session import get_db_session
@@ -90,6 +144,11 @@ class KnowledgeRetriever:
             return []
 
         try:
+            # 인메모리 색인이 있으면 DB 없이 처리 (최초 호출 시 색인 로드)
+            index = self._get_stock_index()
+            if index.ensure_loaded():
+                return self._search_stocks_indexed(index, query, limit)
+
             repo = self._get_stock_repo()
             ticker_parser = get_ticker_parser()
 
@@ -109,28 +168,7 @@ class KnowledgeRetriever:
                     }]
                 else:
                     # DB에 없는 티커지만 패턴으로 식별됨
-                    # 실시간 뉴스 수집을 위해 기본 종목 정보 생성
-                    ticker_type = ticker_parser.get_ticker_type(ticker)
-
-                    # ELW 티커인 경우 market 필드에 표시
-                    if ticker_type == TickerType.ELW:
-                        market = "KOSDAQ-ELW"
-                        name_suffix = " (ELW)"
-                    elif ticker_type == TickerType.RIGHTS:
-                        market = "KOSPI/KOSDAQ-RIGHTS"
-                        name_suffix = " (권리)"
-                    else:
-                        market = "KOSPI/KOSDAQ"
-                        name_suffix = ""
-
-                    return [{
-                        "ticker": ticker,
-                        "name": f"{ticker}종목{name_suffix}",
-                        "market": market,
-                        "sector": "기타",
-                        "_is_fallback": True,  # DB에 없는 종목 표시
-                        "_ticker_type": ticker_type.value,  # 티커 타입 저장
-                    }]
+                    return [self._fallback_stock(ticker)]
 
             # 티커 패턴이 없으면 기존 로직 (이름 검색)
             # 이름 검색 - 먼저 전체 쿼리로 시도
@@ -148,21 +186,18 @@ class KnowledgeRetriever:
 
             # 전체 쿼리로 결과가 없으면, 쿼리에서 주요 단어 추출 후 재시도
             # 예: "삼성전자 현재가 알려줘" -> "삼성전자" 추출
-            words = query.replace("현재가", "").replace("알려줘", "").replace("가격", "").replace("뉴스", "")
-            words = words.strip().split()
-            for word in words:
-                if len(word) >= 2:  # 최소 2글자
-                    results = repo.search(word, limit=limit)
-                    if results:
-                        return [
-                            {
-                                "ticker": s.ticker,
-                                "name": s.name,
-                                "market": s.market,
-                                "sector": s.sector,
-                            }
-                            for s in results[:1]  # 첫 번째 결과만 반환
-                        ]
+            for word in self._query_words(query):
+                results = repo.search(word, limit=limit)
+                if results:
+                    return [
+                        {
+                            "ticker": s.ticker,
+                            "name": s.name,
+                            "market": s.market,
+                            "sector": s.sector,
+                        }
+                        for s in results[:1]  # 첫 번째 결과만 반환
+                    ]
 
             return []
 
@@ -170,6 +205,62 @@ class KnowledgeRetriever:
             logger.error(f"종목 검색 실패: {e}")
             return []
 
+    def _search_stocks_indexed(
+        self,
+        index: StockSearchIndex,
+        query: str,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """인메모리 색인 기반 종목 검색 (search_stocks와 같은 결과 형식)"""
+        tickers = get_ticker_parser().extract(query)
+        if tickers:
+            ticker = tickers[0]
+            entry = index.get(ticker)
+            return [entry.to_dict() if entry else self._fallback_stock(ticker)]
+
+        results = index.search(query, limit=limit)
+        if results:
+            return [entry.to_dict() for entry in results]
+
+        for word in self._query_words(query):
+            results = index.search(word, limit=1)
+            if results:
+                return [results[0].to_dict()]
+
+        return []
+
+    def _fallback_stock(self, ticker: str) -> Dict[str, Any]:
+        """
+        DB에 없지만 패턴으로 식별된 티커의 기본 종목 정보
+        (실시간 뉴스 수집용)
+        """
+        ticker_type = get_ticker_parser().get_ticker_type(ticker)
+
+        # ELW 티커인 경우 market 필드에 표시
+        if ticker_type == TickerType.ELW:
+            market = "KOSDAQ-ELW"
+            name_suffix = " (ELW)"
+        elif ticker_type == TickerType.RIGHTS:
+            market = "KOSPI/KOSDAQ-RIGHTS"
+            name_suffix = " (권리)"
+        else:
+            market = "KOSPI/KOSDAQ"
+            name_suffix = ""
+
+        return {
+            "ticker": ticker,
+            "name": f"{ticker}종목{name_suffix}",
+            "market": market,
+            "sector": "기타",
+            "_is_fallback": True,  # DB에 없는 종목 표시
+            "_ticker_type": ticker_type.value,  # 티커 타입 저장
+        }
+
+    def _query_words(self, query: str) -> List[str]:
+        """질문에서 종목명 후보 단어 추출 (요청 표현 제거, 최소 2글자)"""
+        words = query.replace("현재가", "").replace("알려줘", "").replace("가격", "").replace("뉴스", "")
+        return [word for word in words.strip().split() if len(word) >= 2]
+
     def search_signals(
         self,
         ticker: Optional[str] = None,
@@ -447,6 +538,94 @@ class KnowledgeRetriever:
 
         return context
 
+    async def retrieve_context_async(
+        self,
+        query: str,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        질문에 대한 컨텍스트 비동기 검색
+
+        동기 DB/스크래핑 조회는 스레드로 넘겨 이벤트 루프를 막지 않고
+        (DB 단계는 스레드마다 단기 세션 사용),
+        종목 검색 이후 단계(시그널, 뉴스, Kiwoom 실시간가)와 시장 상태를 동시에 실행합니다.
+        각 단계는 마감 시간을 넘기면 빈 결과로 대체되어 전체 지연이
+        가장 느린 외부 호출에 묶이지 않습니다.
+
+        Args:
+            query: 사용자 질문
+            stage_timeouts: 단계별 마감 시간 재정의 (기본값: STAGE_TIMEOUTS)
+
+        Returns:
+            retrieve_context와 같은 형식의 컨텍스트
+            (마감을 넘긴 단계는 "timed_out_stages"에 기록)
+        """
+        timeouts = {**STAGE_TIMEOUTS, **(stage_timeouts or {})}
+        context = {
+            "query": query,
+            "query_type": self._classify_query(query),
+            "stocks": [],
+            "signals": [],
+            "news": [],
+            "market_status": None,
+            "timestamp": datetime.now().isoformat(),
+            "timed_out_stages": [],
+        }
+
+        async def run_stage(name: str, awaitable: Awaitable, default: Any) -> Any:
+            try:
+                return await asyncio.wait_for(awaitable, timeout=timeouts[name])
+            except asyncio.TimeoutError:
+                logger.warning(f"컨텍스트 검색 단계 시간 초과: {name} ({timeouts[name]}s)")
+                context["timed_out_stages"].append(name)
+            except Exception as e:
+                logger.error(f"컨텍스트 검색 단계 실패: {name}: {e}")
+            return default
+
+        # 시장 상태는 종목 검색과 무관하므로 바로 시작
+        market_task = None
+        if self._is_market_query(query):
+            market_task = asyncio.create_task(
+                run_stage("market_status", asyncio.to_thread(self.get_market_status), None)
+            )
+
+        stocks = await run_stage(
+            "stocks",
+            asyncio.to_thread(self._run_with_own_session, self.search_stocks, query),
+            [],
+        )
+        if stocks:
+            context["stocks"] = stocks[:3]  # 상위 3개
+            tickers = [stock["ticker"] for stock in stocks[:2]]
+
+            # 시그널 조회는 한 세션으로 한 스레드에서 순차 실행
+            def fetch_signals() -> List[Dict[str, Any]]:
+                signals = []
+                for ticker in tickers:
+                    signals.extend(self.search_signals(ticker=ticker, limit=2))
+                return signals
+
+            signals, news, _ = await asyncio.gather(
+                run_stage(
+                    "signals",
+                    asyncio.to_thread(self._run_with_own_session, fetch_signals),
+                    [],
+                ),
+                run_stage(
+                    "news",
+                    asyncio.to_thread(self.search_news, ticker=stocks[0]["ticker"], limit=2),
+                    [],
+                ),
+                run_stage("kiwoom", self.enrich_with_kiwoom_data(context), context),
+            )
+            context["signals"] = signals
+            context["news"] = news
+
+        if market_task is not None:
+            context["market_status"] = await market_task
+
+        return context
+
     def _classify_query(self, query: str) -> str:
         """
         질문 유형 분류
@@ -548,30 +727,32 @@ class KnowledgeRetriever:
                 logger.debug("Kiwoom API not available for realtime enrichment")
                 return context
 
-            # 종목이 있으면 실시간 가격 추가
-            if context.get("stocks"):
-                for stock in context["stocks"]:
-                    ticker = stock.get("ticker")
-                    if ticker:
-                        try:
-                            price_data = await self.get_realtime_price(ticker)
-                            if price_data:
-                                stock["realtime_price"] = {
-                                    "price": price_data.get("price"),
-                                    "change": price_data.get("change"),
-                                    "change_rate": price_data.get("change_rate"),
-                                    "volume": price_data.get("volume"),
-                                    "timestamp": price_data.get("timestamp"),
-                                }
-                        except Exception as e:
-                            logger.warning(f"Failed to enrich {ticker} with realtime data: {e}")
-                            # API 실패해도 컨텍스트는 계속 진행
+            # 종목이 있으면 실시간 가격 추가 (종목별 동시 조회)
+            stocks = [s for s in context.get("stocks") or [] if s.get("ticker")]
+            if stocks:
+                await asyncio.gather(*(self._enrich_stock_price(s) for s in stocks))
 
         except Exception as e:
             logger.warning(f"Kiwoom data enrichment failed: {e}")
 
         return context
 
+    async def _enrich_stock_price(self, stock: Dict[str, Any]) -> None:
+        """단일 종목에 실시간 가격 추가 (실패해도 컨텍스트는 계속 진행)"""
+        ticker = stock["ticker"]
+        try:
+            price_data = await self.get_realtime_price(ticker)
+            if price_data:
+                stock["realtime_price"] = {
+                    "price": price_data.get("price"),
+                    "change": price_data.get("change"),
+                    "change_rate": price_data.get("change_rate"),
+                    "volume": price_data.get("volume"),
+                    "timestamp": price_data.get("timestamp"),
+                }
+        except Exception as e:
+            logger.warning(f"Failed to enrich {ticker} with realtime data: {e}")
+
 
 # 싱글톤 인스턴스
 _retriever: Optional[KnowledgeRetriever] = None
@@ -1,6 +1,8 @@
 """
 Chatbot Session Manager
-Redis 기반 세션 및 대화 기록 관리
+Redis 기반 세션 및 대화 기록 관리 (동기)
+
+FastAPI 엔드포인트는 이벤트 루프를 막지 않는 session_store.AsyncSessionStore를 사용합니다.
 """
 
 import json
@@ -0,0 +1,395 @@
+"""
+Chatbot Async Session Store
+redis.asyncio 기반 세션 및 대화 기록 저장소
+
+SessionManager(동기)와 같은 API를 async로 제공합니다.
+- 메시지 추가/세션 생성은 MULTI/EXEC 파이프라인 한 번(왕복 1회, 원자적)으로 처리
+- 대화 기록은 고정 헤더 + UTF-8 본문(긴 본문은 zlib 압축) 바이너리로 저장
+- 저장 개수는 MAX_HISTORY_MESSAGES로 제한하고, 프롬프트용 기록은 토큰 예산 안에서 최신순으로 자름
+
+Redis에 연결할 수 없으면 SessionManager와 동일하게 저장 없이 동작합니다.
+"""
+
+import logging
+import os
+import struct
+import time
+import uuid
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis 연결 설정
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6380/0")
+
+# Redis 키 Prefix (JSON 형식의 SessionManager 키와 분리)
+SESSION_PREFIX = "chatbot:v2:session:"
+HISTORY_PREFIX = "chatbot:v2:history:"
+
+# 세션 TTL (초) - 24시간
+SESSION_TTL = 86400
+
+# 세션당 저장할 최대 메시지 수 (초과분은 오래된 것부터 삭제)
+MAX_HISTORY_MESSAGES = 50
+
+# 프롬프트에 넣을 대화 기록 토큰 예산
+HISTORY_TOKEN_BUDGET = 2000
+
+# 본문 압축 기준 (바이트)
+COMPRESS_MIN_BYTES = 512
+
+# 토큰 추정: UTF-8 바이트 수 / 3 (한글 1글자 ≈ 1토큰, 영문 3~4글자 ≈ 1토큰)
+BYTES_PER_TOKEN = 3
+
+# 메시지 헤더: 플래그(1) + 역할(1) + 타임스탬프(8) + 토큰 수(4)
+_HEADER = struct.Struct("!BBdI")
+_FLAG_COMPRESSED = 0x01
+_ROLES = ("user", "assistant", "system")
+
+
+def estimate_tokens(text: str) -> int:
+    """본문 토큰 수 추정"""
+    return max(1, -(-len(text.encode("utf-8")) // BYTES_PER_TOKEN))
+
+
+def encode_message(role: str, content: str, timestamp: Optional[float] = None) -> bytes:
+    """
+    메시지를 바이너리로 인코딩
+
+    Raises:
+        ValueError: 지원하지 않는 역할
+    """
+    if role not in _ROLES:
+        raise ValueError(f"지원하지 않는 역할: {role}")
+
+    body = content.encode("utf-8")
+    flags = 0
+    if len(body) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(body)
+        if len(compressed) < len(body):
+            body = compressed
+            flags |= _FLAG_COMPRESSED
+
+    header = _HEADER.pack(
+        flags,
+        _ROLES.index(role),
+        time.time() if timestamp is None else timestamp,
+        estimate_tokens(content),
+    )
+    return header + body
+
+
+def decode_message(raw: bytes) -> Dict:
+    """바이너리 메시지를 {"role", "content", "timestamp", "tokens"}로 디코딩"""
+    flags, role, timestamp, tokens = _HEADER.unpack_from(raw)
+    body = raw[_HEADER.size:]
+    if flags & _FLAG_COMPRESSED:
+        body = zlib.decompress(body)
+    return {
+        "role": _ROLES[role],
+        "content": body.decode("utf-8"),
+        "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+        "tokens": tokens,
+    }
+
+
+def _message_tokens(raw: bytes) -> int:
+    """본문을 풀지 않고 헤더에서 토큰 수만 읽기"""
+    return _HEADER.unpack_from(raw)[3]
+
+
+class AsyncSessionStore:
+    """
+    비동기 세션 저장소
+
+    이벤트 루프를 막지 않는 redis.asyncio 클라이언트로 세션 정보와 대화 기록을 관리합니다.
+    """
+
+    def __init__(self, redis_url: str = REDIS_URL, client=None):
+        """
+        Args:
+            redis_url: Redis URL
+            client: 주입할 redis.asyncio 호환 클라이언트 (테스트용)
+        """
+        self.redis_url = redis_url
+        self._redis_client = client
+        self._use_fallback = False
+
+    async def _get_redis_client(self):
+        """비동기 Redis 클라이언트 가져오기 (연결 실패 시 None)"""
+        if self._redis_client is None and not self._use_fallback:
+            try:
+                import redis.asyncio as aioredis
+
+                client = aioredis.from_url(self.redis_url, decode_responses=False)
+                await client.ping()
+                self._redis_client = client
+                logger.info("✅ Redis connected for async session store")
+            except ImportError:
+                self._use_fallback = True
+                logger.warning("⚠️ redis package not installed, using fallback")
+            except Exception as e:
+                self._use_fallback = True
+                logger.warning(f"⚠️ Redis connection failed: {e}, using fallback")
+
+        if self._use_fallback:
+            return None
+        return self._redis_client
+
+    async def create_session(self) -> str:
+        """
+        새 세션 생성
+
+        Returns:
+            생성된 세션 ID
+        """
+        session_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                session_key = f"{SESSION_PREFIX}{session_id}"
+                pipe = redis.pipeline(transaction=True)
+                pipe.hset(
+                    session_key,
+                    mapping={
+                        "created_at": now,
+                        "message_count": "0",
+                        "last_activity": now,
+                    }
+                )
+                pipe.expire(session_key, SESSION_TTL)
+                await pipe.execute()
+                logger.debug(f"Created session: {session_id}")
+            except Exception as e:
+                logger.error(f"Failed to create session: {e}")
+
+        return session_id
+
+    async def add_message(self, session_id: str, role: str, content: str) -> bool:
+        """
+        대화 기록에 메시지 추가 (추가/자르기/메타데이터/TTL을 트랜잭션 1회로 처리)
+
+        Args:
+            session_id: 세션 ID
+            role: "user" 또는 "assistant"
+            content: 메시지 내용
+
+        Returns:
+            성공 여부
+        """
+        redis = await self._get_redis_client()
+        if not redis:
+            return False
+
+        try:
+            now = datetime.now()
+            history_key = f"{HISTORY_PREFIX}{session_id}"
+            session_key = f"{SESSION_PREFIX}{session_id}"
+
+            pipe = redis.pipeline(transaction=True)
+            pipe.lpush(history_key, encode_message(role, content, now.timestamp()))
+            pipe.ltrim(history_key, 0, MAX_HISTORY_MESSAGES - 1)
+            pipe.expire(history_key, SESSION_TTL)
+            pipe.hsetnx(session_key, "created_at", now.isoformat())
+            pipe.hincrby(session_key, "message_count", 1)
+            pipe.hset(session_key, "last_activity", now.isoformat())
+            pipe.expire(session_key, SESSION_TTL)
+            await pipe.execute()
+
+            logger.debug(f"Added message to session {session_id}: {role}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to add message: {e}")
+            return False
+
+    async def _get_raw_history(self, session_id: str, limit: int) -> List[bytes]:
+        """최신순 원본 메시지 목록"""
+        redis = await self._get_redis_client()
+        if not redis:
+            return []
+        return await redis.lrange(f"{HISTORY_PREFIX}{session_id}", 0, limit - 1)
+
+    async def get_history(self, session_id: str, limit: int = MAX_HISTORY_MESSAGES) -> List[Dict]:
+        """
+        대화 기록 조회
+
+        Args:
+            session_id: 세션 ID
+            limit: 최대 조회 수
+
+        Returns:
+            메시지 리스트 (최신순)
+        """
+        try:
+            raw_messages = await self._get_raw_history(session_id, limit)
+        except Exception as e:
+            logger.error(f"Failed to get history: {e}")
+            return []
+
+        messages = []
+        for raw in raw_messages:
+            try:
+                message = decode_message(raw)
+            except (struct.error, zlib.error, UnicodeDecodeError, IndexError):
+                continue
+            message.pop("tokens")
+            messages.append(message)
+        return messages
+
+    async def get_history_formatted(self, session_id: str) -> List[Dict]:
+        """
+        대화 기록을 시간 순서대로 반환 (오래된 순)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            시간 순서대로 정렬된 메시지 리스트
+        """
+        return list(reversed(await self.get_history(session_id)))
+
+    async def get_history_window(
+        self,
+        session_id: str,
+        token_budget: int = HISTORY_TOKEN_BUDGET,
+    ) -> List[Dict]:
+        """
+        토큰 예산 안에 들어가는 최근 대화 기록 (오래된 순)
+
+        최신 메시지부터 헤더의 토큰 수를 더해 예산을 넘기기 직전까지만 본문을 디코딩합니다.
+        최신 메시지 하나는 예산을 넘더라도 항상 포함합니다.
+
+        Args:
+            session_id: 세션 ID
+            token_budget: 토큰 예산
+
+        Returns:
+            시간 순서대로 정렬된 메시지 리스트
+        """
+        try:
+            raw_messages = await self._get_raw_history(session_id, MAX_HISTORY_MESSAGES)
+        except Exception as e:
+            logger.error(f"Failed to get history: {e}")
+            return []
+
+        window = []
+        used = 0
+        for raw in raw_messages:
+            try:
+                tokens = _message_tokens(raw)
+                if window and used + tokens > token_budget:
+                    break
+                message = decode_message(raw)
+            except (struct.error, zlib.error, UnicodeDecodeError, IndexError):
+                continue
+            used += tokens
+            message.pop("tokens")
+            window.append(message)
+
+        return list(reversed(window))
+
+    async def clear_session(self, session_id: str) -> bool:
+        """
+        세션 삭제
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            성공 여부
+        """
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                await redis.delete(f"{SESSION_PREFIX}{session_id}", f"{HISTORY_PREFIX}{session_id}")
+                logger.debug(f"Cleared session: {session_id}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to clear session: {e}")
+
+        return False
+
+    async def get_session_info(self, session_id: str) -> Optional[Dict]:
+        """
+        세션 정보 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            세션 정보 또는 None
+        """
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                data = await redis.hgetall(f"{SESSION_PREFIX}{session_id}")
+                if not data:
+                    return None
+
+                return {
+                    "created_at": data.get(b"created_at", b"").decode(),
+                    "message_count": int(data.get(b"message_count", b"0").decode()),
+                    "last_activity": data.get(b"last_activity", b"").decode(),
+                }
+
+            except Exception as e:
+                logger.error(f"Failed to get session info: {e}")
+
+        return None
+
+    async def get_message_count(self, session_id: str) -> int:
+        """
+        세션 메시지 수 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            메시지 수
+        """
+        info = await self.get_session_info(session_id)
+        if info:
+            return info.get("message_count", 0)
+        return 0
+
+    async def update_activity(self, session_id: str) -> bool:
+        """
+        세션 활동 시간 업데이트 (세션/기록 TTL 연장)
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            성공 여부
+        """
+        redis = await self._get_redis_client()
+        if redis:
+            try:
+                session_key = f"{SESSION_PREFIX}{session_id}"
+                pipe = redis.pipeline(transaction=True)
+                pipe.hset(session_key, "last_activity", datetime.now().isoformat())
+                pipe.expire(session_key, SESSION_TTL)
+                pipe.expire(f"{HISTORY_PREFIX}{session_id}", SESSION_TTL)
+                await pipe.execute()
+                return True
+            except Exception as e:
+                logger.error(f"Failed to update activity: {e}")
+
+        return False
+
+
+# 싱글톤 인스턴스
+_session_store: Optional[AsyncSessionStore] = None
+
+
+def get_session_store() -> AsyncSessionStore:
+    """비동기 세션 저장소 싱글톤 반환"""
+    global _session_store
+    if _session_store is None:
+        _session_store = AsyncSessionStore()
+    return _session_store
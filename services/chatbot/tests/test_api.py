@@ -28,7 +28,7 @@ class TestHealthEndpoint:
 class TestChatEndpoint:
     """채팅 엔드포인트 테스트"""
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     @patch('services.chatbot.main.get_retriever')
     @patch('services.chatbot.main.get_llm_client')
     def test_chat_endpoint(self, mock_llm, mock_retriever, mock_session):
@@ -38,15 +38,16 @@ class TestChatEndpoint:
         from services.chatbot.llm_client import LLMResponse
 
         # Mock 설정
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.create_session.return_value = "test-session-123"
         mock_session_mgr.add_message.return_value = None
-        mock_session_mgr.get_history_formatted.return_value = []
+        mock_session_mgr.get_history_window.return_value = []
         mock_session.return_value = mock_session_mgr
 
         mock_ret = Mock()
-        mock_ret.retrieve_context.return_value = {"stocks": [], "signals": [], "news": []}
-        mock_ret.enrich_with_kiwoom_data = AsyncMock(return_value={"stocks": []})
+        mock_ret.retrieve_context_async = AsyncMock(
+            return_value={"stocks": [], "signals": [], "news": []}
+        )
         mock_retriever.return_value = mock_ret
 
         mock_llm_client = Mock()
@@ -67,7 +68,7 @@ class TestChatEndpoint:
         assert "reply" in data
         assert "session_id" in data
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     @patch('services.chatbot.main.get_retriever')
     @patch('services.chatbot.main.get_llm_client')
     def test_chat_with_existing_session(self, mock_llm, mock_retriever, mock_session):
@@ -76,16 +77,17 @@ class TestChatEndpoint:
         from services.chatbot.llm_client import LLMResponse
 
         # Mock 설정
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.add_message.return_value = None
-        mock_session_mgr.get_history_formatted.return_value = [
+        mock_session_mgr.get_history_window.return_value = [
             {"role": "user", "content": "이전 메시지"}
         ]
         mock_session.return_value = mock_session_mgr
 
         mock_ret = Mock()
-        mock_ret.retrieve_context.return_value = {"stocks": [], "signals": [], "news": []}
-        mock_ret.enrich_with_kiwoom_data = AsyncMock(return_value={"stocks": []})
+        mock_ret.retrieve_context_async = AsyncMock(
+            return_value={"stocks": [], "signals": [], "news": []}
+        )
         mock_retriever.return_value = mock_ret
 
         mock_llm_client = Mock()
@@ -109,12 +111,12 @@ class TestChatEndpoint:
 class TestContextEndpoint:
     """컨텍스트 엔드포인트 테스트"""
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_context(self, mock_session):
         """세션 컨텍스트 조회 테스트"""
         from services.chatbot.main import app
 
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.get_history_formatted.return_value = [
             {"role": "user", "content": "안녕"},
             {"role": "assistant", "content": "안녕하세요!"}
@@ -131,12 +133,12 @@ class TestContextEndpoint:
         assert data["message_count"] == 2
         assert len(data["history"]) == 2
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_delete_context(self, mock_session):
         """세션 삭제 테스트"""
         from services.chatbot.main import app
 
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.clear_session.return_value = True
         mock_session.return_value = mock_session_mgr
 
@@ -149,12 +151,12 @@ class TestContextEndpoint:
         message = data["message"].lower()
         assert "삭제" in message or "deleted" in message
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_delete_context_not_found(self, mock_session):
         """없는 세션 삭제 시 404 반환"""
         from services.chatbot.main import app
 
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.clear_session.return_value = False
         mock_session.return_value = mock_session_mgr
 
@@ -209,12 +211,12 @@ class TestRecommendationsEndpoint:
 class TestSessionEndpoint:
     """세션 엔드포인트 테스트"""
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session(self, mock_session):
         """세션 정보 조회 테스트"""
         from services.chatbot.main import app
 
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.get_session_info.return_value = {
             "created_at": "2026-01-31T10:00:00",
             "last_activity": "2026-01-31T10:05:00",
@@ -233,12 +235,12 @@ class TestSessionEndpoint:
         assert data["session_id"] == "test-session"
         assert data["message_count"] == 3
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_not_found(self, mock_session):
         """없는 세션 조회 시 404 반환"""
         from services.chatbot.main import app
 
-        mock_session_mgr = Mock()
+        mock_session_mgr = AsyncMock()
         mock_session_mgr.get_session_info.return_value = None
         mock_session.return_value = mock_session_mgr
 
@@ -257,7 +259,7 @@ class TestQueryContextEndpoint:
         from services.chatbot.main import app
 
         mock_ret = Mock()
-        mock_ret.retrieve_context.return_value = {
+        mock_ret.retrieve_context_async = AsyncMock(return_value={
             "query": "삼성전자 추천해줘",
             "query_type": "stock",
             "stocks": [{"ticker": "005930", "name": "삼성전자"}],
@@ -265,7 +267,7 @@ class TestQueryContextEndpoint:
             "news": [],
             "market_status": None,
             "timestamp": "2026-01-31T10:00:00",
-        }
+        })
         mock_retriever.return_value = mock_ret
 
         client = TestClient(app)
@@ -64,12 +64,7 @@ async def broadcast_price_update(
     message = {
         "type": "price_update",
         "ticker": ticker,
-        "data": {
-            "price": price_data.get("price"),
-            "change": price_data.get("change"),
-            "change_rate": price_data.get("change_rate"),
-            "volume": price_data.get("volume", 0)
-        },
+        "data": _price_payload(price_data),
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
@@ -80,6 +75,72 @@ async def broadcast_price_update(
     logger.debug(f"Broadcasted price update for {ticker} to topic '{topic}'")
 
 
+def _price_payload(price_data: Dict[str, Any]) -> Dict[str, Any]:
+    """가격 메시지 data 필드"""
+    return {
+        "price": price_data.get("price"),
+        "change": price_data.get("change"),
+        "change_rate": price_data.get("change_rate"),
+        "volume": price_data.get("volume", 0)
+    }
+
+
+async def broadcast_price_batch(
+    prices: Dict[str, Dict[str, Any]],
+    connection_manager,
+) -> int:
+    """
+    가격 일괄 브로드캐스트
+
+    한 사이클에 수집한 가격을 클라이언트별로 묶어 price_batch 프레임 하나로 전송합니다.
+    각 클라이언트는 구독 중인 price:{ticker} 토픽의 종목만 받습니다.
+
+    Args:
+        prices: {ticker: 가격 데이터}
+        connection_manager: WebSocket ConnectionManager 인스턴스
+
+    Returns:
+        전송한 프레임 수
+    """
+    if not connection_manager:
+        logger.warning("ConnectionManager not available, skipping broadcast")
+        return 0
+
+    if not prices:
+        return 0
+
+    # 구독 정보를 노출하지 않는 매니저는 종목별 전송으로 대체
+    subscriptions = getattr(connection_manager, "subscriptions", None)
+    if not isinstance(subscriptions, dict):
+        for ticker, price_data in prices.items():
+            await broadcast_price_update(ticker, price_data, connection_manager)
+        return len(prices)
+
+    # client_id -> {ticker: payload}
+    frames: Dict[str, Dict[str, Any]] = {}
+    for ticker, price_data in prices.items():
+        payload = _price_payload(price_data)
+        for client_id in subscriptions.get(f"price:{ticker}", ()):
+            frames.setdefault(client_id, {})[ticker] = payload
+
+    timestamp = datetime.now(timezone.utc).isoformat()
+    for client_id, client_prices in frames.items():
+        await connection_manager.send_personal_message(
+            {
+                "type": "price_batch",
+                "data": {
+                    "count": len(client_prices),
+                    "prices": client_prices,
+                },
+                "timestamp": timestamp,
+            },
+            client_id,
+        )
+
+    logger.debug(f"Broadcasted {len(prices)} prices as {len(frames)} batch frames")
+    return len(frames)
+
+
 class DaytradingBroadcaster:
     """
     단타 브로드캐스터
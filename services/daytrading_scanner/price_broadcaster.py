@@ -7,7 +7,8 @@
 import asyncio
 import logging
 from typing import Set, Optional
-from datetime import datetime, timezone
+
+from src.websocket.price_snapshot import PriceSnapshot, get_price_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -17,30 +18,47 @@ class DaytradingPriceBroadcaster:
     단타 가격 브로드캐스터
 
     단타 시그널 종목들의 실시간 가격 업데이트를 관리합니다.
-    기존 price_broadcaster 패턴을 활용하되어 daytrading 종목만 따로 관리합니다.
+    가격은 DB를 직접 조회하지 않고 공유 PriceSnapshot(Kiwoom 실시간/Redis/PriceUpdateBroadcaster
+    피드)에서 읽으며, 주기마다 마지막 전송 이후 바뀐 종목만 전송합니다.
     """
 
-    def __init__(self, interval_seconds: int = 5):
+    # PriceSnapshot 관심 종목 등록 owner
+    SNAPSHOT_OWNER = "daytrading"
+
+    def __init__(self, interval_seconds: int = 5, snapshot: Optional[PriceSnapshot] = None):
         """
         초기화
 
         Args:
-            interval_seconds: 가격 조회 간격 (기본 5초)
+            interval_seconds: 전송 간격 (기본 5초)
+            snapshot: 가격 스냅샷 (None이면 전역 스냅샷)
         """
         self._interval = interval_seconds
         self._tickers: Set[str] = set()
         self._is_running = False
         self._broadcast_task: Optional[asyncio.Task] = None
         self._connection_manager = None
+        self._snapshot = snapshot or get_price_snapshot()
+
+        # 마지막으로 전송한 스냅샷 버전
+        self._last_version = 0
+
+        # 새로 추가되어 아직 현재가를 보내지 않은 종목
+        self._pending: Set[str] = set()
 
     def add_ticker(self, ticker: str) -> None:
         """종목 추가"""
+        if ticker not in self._tickers:
+            self._pending.add(ticker)
         self._tickers.add(ticker)
+        self._snapshot.watch(ticker, owner=self.SNAPSHOT_OWNER)
         logger.debug(f"Added ticker to daytrading price broadcaster: {ticker}")
 
     def remove_ticker(self, ticker: str) -> None:
         """종목 제거"""
         self._tickers.discard(ticker)
+        self._pending.discard(ticker)
+        self._snapshot.unwatch(ticker, owner=self.SNAPSHOT_OWNER)
         logger.debug(f"Removed ticker from daytrading price broadcaster: {ticker}")
 
     def set_connection_manager(self, connection_manager) -> None:
@@ -94,57 +112,36 @@ class DaytradingPriceBroadcaster:
                 logger.error(f"Error in daytrading broadcast loop: {e}")
                 await asyncio.sleep(self._interval)
 
-    async def _fetch_and_broadcast_prices(self) -> None:
-        """가격 조회 및 브로드캐스트"""
+    async def _fetch_and_broadcast_prices(self) -> int:
+        """
+        스냅샷 변경분 브로드캐스트
+
+        Returns:
+            전송한 종목 수
+        """
         if not self._connection_manager:
-            return
+            return 0
 
-        from services.daytrading_scanner.broadcaster import broadcast_price_update
+        from services.daytrading_scanner.broadcaster import broadcast_price_batch
 
-        for ticker in self._tickers:
-            try:
-                # DB에서 가격 조회
-                price_data = await self._fetch_price_from_db(ticker)
-                if price_data:
-                    await broadcast_price_update(ticker, price_data, self._connection_manager)
-            except Exception as e:
-                logger.debug(f"Error broadcasting price for {ticker}: {e}")
+        version, changed = self._snapshot.changed_since(self._last_version, self._tickers)
+
+        # 새로 추가된 종목은 변경 여부와 무관하게 현재가를 한 번 전송
+        if self._pending:
+            initial = self._snapshot.get_many(self._pending & self._tickers)
+            changed = {**initial, **changed}
+            self._pending -= set(initial)
+
+        self._last_version = version
 
-    async def _fetch_price_from_db(self, ticker: str) -> Optional[dict]:
-        """DB에서 최신 가격 조회"""
-        from src.database.session import get_db_session_sync
-        from src.database.models import DailyPrice
-        from sqlalchemy import select
+        if not changed:
+            return 0
 
         try:
-            with get_db_session_sync() as db:
-                # 최근 일봉 데이터 조회
-                query = select(DailyPrice).where(
-                    DailyPrice.ticker == ticker
-                ).order_by(DailyPrice.date.desc()).limit(2)
-
-                result = db.execute(query)
-                prices = list(result.scalars().all())
-
-                if not prices or len(prices) < 2:
-                    return None
-
-                current = prices[0]
-                prev = prices[1]
-
-                # 등락률 계산
-                change = current.close_price - prev.close_price
-                change_rate = (change / prev.close_price * 100) if prev.close_price > 0 else 0.0
-
-                return {
-                    "price": current.close_price,
-                    "change": change,
-                    "change_rate": round(change_rate, 2),
-                    "volume": current.volume
-                }
+            await broadcast_price_batch(changed, self._connection_manager)
         except Exception as e:
-            logger.error(f"Error fetching price for {ticker}: {e}")
-            return None
+            logger.debug(f"Error broadcasting daytrading prices: {e}")
+        return len(changed)
 
     @property
     def active_tickers(self) -> Set[str]:
@@ -4,13 +4,141 @@
 Kiwoom REST API를 사용하여 일봉 데이터와 실시간 가격을 수집합니다.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timezone, timedelta
-from sqlalchemy import text
+import os
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import date, datetime, timezone, timedelta
+
+from src.utils.rate_limiter import AsyncTokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Kiwoom REST API 조회 한도 (초당 요청 수)
+KIWOOM_REQUESTS_PER_SECOND = float(os.getenv("KIWOOM_REQUESTS_PER_SECOND", "5"))
+
+# 백필 동시 조회 종목 수 / UPSERT 배치 크기
+BACKFILL_CONCURRENCY = int(os.getenv("DAILY_PRICE_BACKFILL_CONCURRENCY", "4"))
+BACKFILL_BATCH_SIZE = 50
+
+# 다중 행 UPSERT 한 번에 보내는 최대 행 수 (행당 파라미터 7개)
+UPSERT_CHUNK_ROWS = 2000
+
+# 현재가 개별 조회 동시 실행 수 (일괄 조회 누락분)
+QUOTE_CONCURRENCY = 4
+
+# 백필 커서 유지 기간 (초)
+BACKFILL_CURSOR_TTL = 2 * 24 * 3600
+
+
+def latest_trading_day(base_date: Optional[str] = None) -> date:
+    """
+    기준일 이전의 가장 최근 평일 (휴장일은 고려하지 않음)
+
+    Args:
+        base_date: 기준일자 (YYYYMMDD, None이면 오늘)
+    """
+    day = datetime.strptime(base_date, "%Y%m%d").date() if base_date else date.today()
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def upsert_daily_prices(db, rows: List[Dict[str, Any]]) -> int:
+    """
+    일봉 다중 행 UPSERT (INSERT ... ON CONFLICT (ticker, date) DO UPDATE)
+
+    같은 (ticker, date) 행은 마지막 값만 남기고, 바인드 파라미터 한도를 넘지 않도록
+    UPSERT_CHUNK_ROWS 단위로 나눠 실행합니다.
+
+    Args:
+        db: DB 세션
+        rows: daily_prices 행 딕셔너리 리스트
+
+    Returns:
+        처리한 행 수
+    """
+    if not rows:
+        return 0
+
+    from src.database.models import DailyPrice
+
+    bind = db.get_bind() if hasattr(db, "get_bind") else None
+    if getattr(getattr(bind, "dialect", None), "name", None) == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    unique_rows = list({(row["ticker"], row["date"]): row for row in rows}.values())
+
+    for start in range(0, len(unique_rows), UPSERT_CHUNK_ROWS):
+        stmt = insert(DailyPrice).values(unique_rows[start:start + UPSERT_CHUNK_ROWS])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyPrice.ticker, DailyPrice.date],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("open_price", "high_price", "low_price", "close_price", "volume")
+            },
+        )
+        db.execute(stmt)
+    return len(unique_rows)
+
+
+@dataclass
+class BackfillResult:
+    """일봉 백필 결과"""
+    collected: Dict[str, int] = field(default_factory=dict)  # 종목별 저장 행 수
+    skipped: List[str] = field(default_factory=list)  # 최신 봉 보유로 건너뛴 종목
+    failed: List[str] = field(default_factory=list)  # 조회/저장 실패 종목
+    resumed_from: Optional[str] = None  # 재개 시작 커서
+
+
+class BackfillCursor:
+    """
+    일봉 백필 진행 커서 (Redis)
+
+    마지막으로 커밋된 배치의 종목코드를 저장합니다. Redis를 사용할 수 없으면
+    커서 없이 동작하며, 이 경우에도 gap 감지로 이미 저장된 종목은 건너뜁니다.
+    """
+
+    def __init__(self, key: str, redis_url: Optional[str] = None, ttl: int = BACKFILL_CURSOR_TTL):
+        self.key = key
+        self.ttl = ttl
+        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._client = None
+
+    @classmethod
+    def for_run(cls, market: str, base_date: Optional[str] = None) -> "BackfillCursor":
+        """시장/기준 거래일별 커서"""
+        day = latest_trading_day(base_date)
+        return cls(f"daily_price_backfill:cursor:{market}:{day.isoformat()}")
+
+    def _get_client(self):
+        if self._client is None:
+            import redis
+            self._client = redis.from_url(self._redis_url, decode_responses=True)
+        return self._client
+
+    def load(self) -> Optional[str]:
+        try:
+            return self._get_client().get(self.key)
+        except Exception as e:
+            logger.warning(f"Backfill cursor load failed ({self.key}): {e}")
+            return None
+
+    def save(self, ticker: str) -> None:
+        try:
+            self._get_client().set(self.key, ticker, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Backfill cursor save failed ({self.key}): {e}")
+
+    def clear(self) -> None:
+        try:
+            self._get_client().delete(self.key)
+        except Exception as e:
+            logger.warning(f"Backfill cursor clear failed ({self.key}): {e}")
+
 
 class RealtimeDataCollector:
     """
@@ -56,62 +184,14 @@ class RealtimeDataCollector:
         Returns:
             수집된 데이터 수
         """
-        api = await self._get_api()
-
         try:
-            # Kiwoom API에서 일봉 차트 데이터 조회
-            chart_data = await api.get_stock_daily_chart(
-                ticker=ticker,
-                days=days,
-                base_date=base_date,
-                adjusted_price=adjusted_price,
-            )
-
-            if not chart_data:
+            rows = await self._fetch_daily_rows(ticker, days, base_date, adjusted_price)
+
+            if not rows:
                 logger.debug(f"No daily chart data for {ticker}")
                 return 0
 
-            # DB에 저장
-            count = 0
-            for item in chart_data:
-                try:
-                    # 날짜 변환 (YYYYMMDD -> YYYY-MM-DD)
-                    date_str = item.get("date", "")
-                    if len(date_str) == 8:
-                        formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                    else:
-                        formatted_date = date_str
-
-                    # UPSERT 사용 (ON CONFLICT)
-                    db.execute(
-                        text("""
-                            INSERT INTO daily_prices (
-                                ticker, date, open_price, high_price, low_price,
-                                close_price, volume
-                            ) VALUES (
-                                :ticker, :date, :open, :high, :low, :close, :volume
-                            )
-                            ON CONFLICT (ticker, date) DO UPDATE SET
-                                open_price = EXCLUDED.open_price,
-                                high_price = EXCLUDED.high_price,
-                                low_price = EXCLUDED.low_price,
-                                close_price = EXCLUDED.close_price,
-                                volume = EXCLUDED.volume
-                        """),
-                        {
-                            "ticker": ticker,
-                            "date": formatted_date,
-                            "open": item.get("open", 0),
-                            "high": item.get("high", 0),
-                            "low": item.get("low", 0),
-                            "close": item.get("close", 0),
-                            "volume": item.get("volume", 0),
-                        },
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error inserting daily price for {ticker} {date_str}: {e}")
-
+            count = upsert_daily_prices(db, rows)
             db.commit()
             logger.info(f"Collected {count} daily prices for {ticker}")
             return count
@@ -121,6 +201,45 @@ class RealtimeDataCollector:
             db.rollback()
             return 0
 
+    async def _fetch_daily_rows(
+        self,
+        ticker: str,
+        days: int,
+        base_date: Optional[str] = None,
+        adjusted_price: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Kiwoom 일봉 차트 조회 후 daily_prices 행으로 변환"""
+        api = await self._get_api()
+
+        chart_data = await api.get_stock_daily_chart(
+            ticker=ticker,
+            days=days,
+            base_date=base_date,
+            adjusted_price=adjusted_price,
+        )
+
+        rows = []
+        for item in chart_data or []:
+            # 날짜 변환 (YYYYMMDD -> date)
+            date_str = item.get("date", "")
+            try:
+                bar_date = datetime.strptime(date_str, "%Y%m%d").date() if len(date_str) == 8 \
+                    else date.fromisoformat(date_str)
+            except ValueError:
+                logger.error(f"Invalid daily bar date for {ticker}: {date_str}")
+                continue
+
+            rows.append({
+                "ticker": ticker,
+                "date": bar_date,
+                "open_price": item.get("open", 0),
+                "high_price": item.get("high", 0),
+                "low_price": item.get("low", 0),
+                "close_price": item.get("close", 0),
+                "volume": item.get("volume", 0),
+            })
+        return rows
+
     async def collect_daily_prices_for_tickers(
         self,
         tickers: List[str],
@@ -131,6 +250,8 @@ class RealtimeDataCollector:
         """
         다중 종목 일봉 데이터 수집
 
+        backfill_daily_prices의 간단 버전으로, 최신 봉이 이미 있는 종목은 0을 반환합니다.
+
         Args:
             tickers: 종목 코드 리스트
             db: DB 세션
@@ -140,27 +261,145 @@ class RealtimeDataCollector:
         Returns:
             종목별 수집된 데이터 수 딕셔너리
         """
-        results = {}
+        result = await self.backfill_daily_prices(
+            tickers=tickers,
+            db=db,
+            days=days,
+            base_date=base_date,
+        )
+        return {ticker: result.collected.get(ticker, 0) for ticker in tickers}
+
+    async def backfill_daily_prices(
+        self,
+        tickers: List[str],
+        db,
+        days: int = 30,
+        base_date: Optional[str] = None,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        cursor: Optional["BackfillCursor"] = None,
+    ) -> "BackfillResult":
+        """
+        다중 종목 일봉 백필
 
-        for ticker in tickers:
-            try:
-                count = await self.collect_daily_prices(
-                    ticker=ticker,
-                    db=db,
-                    days=days,
-                    base_date=base_date,
-                )
-                results[ticker] = count
+        1. 최신 봉 보유 여부를 한 번에 조회해 이미 최신인 종목은 건너뜀 (gap 감지)
+        2. 배치 단위로 최대 concurrency개 종목을 동시 조회 (토큰 버킷으로 API 호출 속도 제한)
+        3. 배치 결과를 다중 행 UPSERT 한 번으로 저장 후 커밋
+        4. 커밋된 배치의 마지막 종목을 커서로 저장 (재시작 시 이어서 수집)
+           실패 종목이 있는 배치부터는 커서를 더 진행하지 않아 재시작 시 다시 수집
+
+        Args:
+            tickers: 종목 코드 리스트
+            db: DB 세션
+            days: 조회 일수 (기존 봉이 있으면 누락 구간만 조회)
+            base_date: 기준일자 (YYYYMMDD, None이면 오늘)
+            concurrency: 동시 조회 종목 수
+            batch_size: UPSERT/커밋 단위 종목 수
+            rate_limiter: API 호출 토큰 버킷 (None이면 KIWOOM_REQUESTS_PER_SECOND 기준 생성)
+            cursor: 진행 커서 (None이면 재개 기능 미사용)
+
+        Returns:
+            BackfillResult
+        """
+        result = BackfillResult()
+        tickers = sorted(set(tickers))
 
-                # Rate Limiting 방지를 위한 딜레이
-                import asyncio
-                await asyncio.sleep(0.1)
+        # 재시작 시 커서 이후 종목부터 수집
+        resume_after = cursor.load() if cursor else None
+        if resume_after:
+            result.resumed_from = resume_after
+            tickers = [t for t in tickers if t > resume_after]
+            logger.info(f"Resuming daily price backfill after {resume_after} ({len(tickers)} remaining)")
 
+        target_date = latest_trading_day(base_date)
+        latest_bars = self._get_latest_bar_dates(db, tickers)
+
+        pending: List[Tuple[str, int]] = []
+        for ticker in tickers:
+            last = latest_bars.get(ticker)
+            if last is not None and last >= target_date:
+                result.skipped.append(ticker)
+                continue
+            # 기존 봉이 있으면 누락 구간만 조회 (달력일 기준이므로 거래일보다 넉넉함)
+            fetch_days = days if last is None else max(1, min(days, (target_date - last).days + 1))
+            pending.append((ticker, fetch_days))
+
+        limiter = rate_limiter or AsyncTokenBucket(KIWOOM_REQUESTS_PER_SECOND)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        # 앞선 배치가 모두 성공한 동안에만 커서 진행
+        cursor_advancing = cursor is not None
+
+        async def fetch(ticker: str, fetch_days: int) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            async with semaphore:
+                await limiter.acquire()
+                try:
+                    return ticker, await self._fetch_daily_rows(ticker, fetch_days, base_date)
+                except Exception as e:
+                    logger.error(f"Error collecting daily prices for {ticker}: {e}")
+                    return ticker, None
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            fetched = await asyncio.gather(*(fetch(ticker, fetch_days) for ticker, fetch_days in batch))
+
+            rows: List[Dict[str, Any]] = []
+            batch_counts: Dict[str, int] = {}
+            for ticker, ticker_rows in fetched:
+                if not ticker_rows:
+                    result.failed.append(ticker)
+                    continue
+                rows.extend(ticker_rows)
+                batch_counts[ticker] = len(ticker_rows)
+
+            try:
+                if rows:
+                    upsert_daily_prices(db, rows)
+                    db.commit()
             except Exception as e:
-                logger.error(f"Error collecting daily prices for {ticker}: {e}")
-                results[ticker] = 0
+                logger.error(f"Error upserting daily price batch ({len(rows)} rows): {e}")
+                db.rollback()
+                result.failed.extend(batch_counts)
+                batch_counts = {}
+
+            result.collected.update(batch_counts)
+            if len(batch_counts) < len(batch):
+                cursor_advancing = False
+            if cursor_advancing:
+                cursor.save(batch[-1][0])
+
+        if cursor:
+            cursor.clear()
+
+        logger.info(
+            f"Daily price backfill done: {len(result.collected)} collected, "
+            f"{len(result.skipped)} up to date, {len(result.failed)} failed"
+        )
+        return result
+
+    @staticmethod
+    def _get_latest_bar_dates(db, tickers: List[str]) -> Dict[str, date]:
+        """종목별 최신 일봉 날짜 (조회 실패 시 빈 딕셔너리 → 전 종목 수집)"""
+        if not tickers:
+            return {}
+
+        from sqlalchemy import func, select
+        from src.database.models import DailyPrice
 
-        return results
+        try:
+            rows = db.execute(
+                select(DailyPrice.ticker, func.max(DailyPrice.date).label("last_date"))
+                .where(DailyPrice.ticker.in_(tickers))
+                .group_by(DailyPrice.ticker)
+            ).all()
+            return {
+                row.ticker: row.last_date
+                for row in rows
+                if isinstance(row.last_date, date)
+            }
+        except Exception as e:
+            logger.warning(f"Latest bar lookup failed, collecting all tickers: {e}")
+            return {}
 
     async def collect_current_price(
         self,
@@ -184,16 +423,7 @@ class RealtimeDataCollector:
                 logger.debug(f"No current price data for {ticker}")
                 return None
 
-            return {
-                "ticker": ticker,
-                "price": price_data.price,
-                "change": price_data.change,
-                "change_rate": price_data.change_rate,
-                "volume": price_data.volume,
-                "bid_price": price_data.bid_price,
-                "ask_price": price_data.ask_price,
-                "timestamp": price_data.timestamp,
-            }
+            return self._quote_to_dict(ticker, price_data)
 
         except Exception as e:
             logger.error(f"Error collecting current price for {ticker}: {e}")
@@ -217,25 +447,73 @@ class RealtimeDataCollector:
         # 먼저 Redis에서 실시간 가격 조회
         results = await self._get_prices_from_redis(tickers)
 
-        # Redis에서 가져오지 못한 종목은 Kiwoom API로 조회
+        # Redis에서 가져오지 못한 종목은 Kiwoom API로 일괄 조회
         missing_tickers = [t for t in tickers if t not in results or results[t] is None]
         if missing_tickers:
             logger.info(f"Redis에 없는 종목 {len(missing_tickers)}개를 Kiwoom API로 조회")
-            for ticker in missing_tickers:
-                try:
-                    price_data = await self.collect_current_price(ticker)
-                    results[ticker] = price_data
+            results.update(await self._collect_quotes(missing_tickers))
 
-                    # Rate Limiting 방지
-                    import asyncio
-                    await asyncio.sleep(0.05)
+        return results
 
-                except Exception as e:
-                    logger.error(f"Error collecting current price for {ticker}: {e}")
-                    results[ticker] = None
+    async def _collect_quotes(
+        self,
+        tickers: List[str],
+        concurrency: int = QUOTE_CONCURRENCY,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Kiwoom 현재가 조회 (다중 종목 요청 우선, 누락 종목은 동시 개별 조회)
+
+        Args:
+            tickers: 종목 코드 리스트
+            concurrency: 개별 조회 동시 실행 수
+
+        Returns:
+            종목별 현재가 정보 딕셔너리 (실패 시 None)
+        """
+        api = await self._get_api()
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        # 1. 관심종목 일괄 조회 (100종목당 1회 요청)
+        batch_quote = getattr(api, "get_current_prices", None)
+        if batch_quote is not None:
+            try:
+                quotes = await batch_quote(tickers)
+                if isinstance(quotes, dict):
+                    for ticker, price in quotes.items():
+                        results[ticker] = self._quote_to_dict(ticker, price)
+            except Exception as e:
+                logger.warning(f"Batch quote failed, falling back to single quotes: {e}")
+
+        # 2. 일괄 조회에서 빠진 종목은 동시 개별 조회
+        remaining = [t for t in tickers if results.get(t) is None]
+        if remaining:
+            limiter = AsyncTokenBucket(KIWOOM_REQUESTS_PER_SECOND)
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def fetch(ticker: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+                async with semaphore:
+                    await limiter.acquire()
+                    return ticker, await self.collect_current_price(ticker)
+
+            for ticker, price_data in await asyncio.gather(*(fetch(t) for t in remaining)):
+                results[ticker] = price_data
 
         return results
 
+    @staticmethod
+    def _quote_to_dict(ticker: str, price) -> Dict[str, Any]:
+        """RealtimePrice -> 현재가 정보 딕셔너리"""
+        return {
+            "ticker": ticker,
+            "price": price.price,
+            "change": price.change,
+            "change_rate": price.change_rate,
+            "volume": price.volume,
+            "bid_price": price.bid_price,
+            "ask_price": price.ask_price,
+            "timestamp": price.timestamp,
+        }
+
     async def _get_prices_from_redis(
         self,
         tickers: List[str],
@@ -312,19 +590,16 @@ class RealtimeDataCollector:
         # 현재가 수집
         prices = await self.collect_current_prices_for_tickers(tickers)
 
-        # 브로드캐스트
+        # 한 사이클의 가격을 클라이언트별 단일 프레임으로 브로드캐스트
         if connection_manager:
-            from services.daytrading_scanner.broadcaster import broadcast_price_update
-
-            for ticker, price_data in prices.items():
-                if price_data:
-                    try:
-                        await broadcast_price_update(
-                            ticker=ticker,
-                            price_data=price_data,
-                            connection_manager=connection_manager,
-                        )
-                    except Exception as e:
-                        logger.error(f"Error broadcasting price for {ticker}: {e}")
+            from services.daytrading_scanner.broadcaster import broadcast_price_batch
+
+            try:
+                await broadcast_price_batch(
+                    {ticker: data for ticker, data in prices.items() if data},
+                    connection_manager=connection_manager,
+                )
+            except Exception as e:
+                logger.error(f"Error broadcasting price batch: {e}")
 
         return prices
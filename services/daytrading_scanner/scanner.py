@@ -93,8 +93,8 @@ class DaytradingScanner:
         try:
             from src.kiwoom.rest_api import KiwoomRestAPI
             kiwoom_api = KiwoomRestAPI.from_env()
-            await kiwoom_api.issue_token()
-            logger.info("Kiwoom API token issued successfully")
+            await kiwoom_api.ensure_token_valid()
+            logger.info("Kiwoom API token ready")
 
             # 거래정지 종목 목록 조회
             suspended_stocks = await self._get_suspended_stocks(kiwoom_api)
@@ -1,8 +1,9 @@
 """
 Event Bus Package
-Redis Pub/Sub 기반 이벤트 버스
+Redis Pub/Sub 기반 이벤트 버스 / Redis Streams 기반 내구성 이벤트 버스
 """
 
 from services.event_bus.event_bus import EventBus, publish_event, subscribe_event
+from services.event_bus.streams import StreamEventBus
 
-__all__ = ["EventBus", "publish_event", "subscribe_event"]
+__all__ = ["EventBus", "StreamEventBus", "publish_event", "subscribe_event"]
@@ -0,0 +1,118 @@
+"""
+Event Codec - 이벤트 직렬화
+
+- JsonCodec: 기존 pub/sub과 같은 JSON (사람이 읽기 쉬움)
+- BinaryCodec: 길이 접두 UTF-8 필드 + 압축 JSON 데이터 (긴 페이로드는 zlib)
+
+Event 하위 클래스(SignalEvent 등)의 추가 필드는 디코딩 시 data에 병합되어
+기본 Event 하나로 복원됩니다 (data에 같은 키가 있으면 data 값 우선).
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import asdict
+from typing import Any, Dict
+
+from services.event_bus.event_bus import Event
+
+# 압축 기준 (바이트)
+COMPRESS_MIN_BYTES = 256
+
+_BASE_FIELDS = ("event_type", "data", "timestamp", "source")
+
+# 헤더: 버전/플래그(1) + event_type/source/timestamp 길이(2 x 3) + 본문 길이(4)
+_VERSION = 1
+_FLAG_COMPRESSED = 0x80
+_HEADER = struct.Struct("!BHHHI")
+
+
+def _to_event(fields: Dict[str, Any]) -> Event:
+    extras = {k: v for k, v in fields.items() if k not in _BASE_FIELDS}
+    data = fields.get("data") or {}
+    if extras:
+        data = {**extras, **data}
+    return Event(
+        event_type=fields["event_type"],
+        data=data,
+        timestamp=fields["timestamp"],
+        source=fields["source"],
+    )
+
+
+class JsonCodec:
+    """JSON 코덱"""
+
+    name = "json"
+
+    def encode(self, event: Event) -> bytes:
+        return json.dumps(asdict(event), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, payload: bytes) -> Event:
+        return _to_event(json.loads(payload))
+
+
+class BinaryCodec:
+    """
+    바이너리 코덱
+
+    고정 헤더 뒤에 event_type, source, timestamp(UTF-8)와
+    data+추가 필드(압축 JSON)를 이어 붙입니다. JSON 대비 키 이름/따옴표가 빠지고
+    긴 데이터는 zlib으로 압축됩니다.
+    """
+
+    name = "binary"
+
+    def encode(self, event: Event) -> bytes:
+        fields = asdict(event)
+        body = {k: v for k, v in fields.items() if k not in ("event_type", "timestamp", "source")}
+        event_type = fields["event_type"].encode("utf-8")
+        source = fields["source"].encode("utf-8")
+        timestamp = fields["timestamp"].encode("utf-8")
+        payload = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        flags = _VERSION
+        if len(payload) >= COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= _FLAG_COMPRESSED
+
+        header = _HEADER.pack(flags, len(event_type), len(source), len(timestamp), len(payload))
+        return header + event_type + source + timestamp + payload
+
+    def decode(self, payload: bytes) -> Event:
+        flags, type_len, source_len, ts_len, body_len = _HEADER.unpack_from(payload)
+        if flags & 0x7F != _VERSION:
+            raise ValueError(f"Unsupported binary event version: {flags & 0x7F}")
+
+        offset = _HEADER.size
+        event_type = payload[offset:offset + type_len].decode("utf-8")
+        offset += type_len
+        source = payload[offset:offset + source_len].decode("utf-8")
+        offset += source_len
+        timestamp = payload[offset:offset + ts_len].decode("utf-8")
+        offset += ts_len
+        body = payload[offset:offset + body_len]
+        if flags & _FLAG_COMPRESSED:
+            body = zlib.decompress(body)
+
+        fields = json.loads(body)
+        fields.update(event_type=event_type, source=source, timestamp=timestamp)
+        return _to_event(fields)
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), BinaryCodec())}
+
+
+def get_codec(name: str):
+    """
+    이름으로 코덱 조회
+
+    Raises:
+        ValueError: 알 수 없는 코덱
+    """
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown event codec: {name}") from None
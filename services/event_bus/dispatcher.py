@@ -0,0 +1,210 @@
+"""
+Event Dispatcher - 핸들러별 큐 / 워커 기반 이벤트 분배
+
+리스너 루프는 이벤트를 핸들러별 bounded 큐에 넣기만 하고 바로 다음 메시지를 읽습니다.
+각 핸들러는 자신의 워커 태스크에서 실행되므로 느린 구독자가 다른 채널/핸들러를 막지 않습니다.
+
+순서 보장 (ordering):
+- "channel": 채널 단위 순서 보장 (같은 채널 이벤트는 한 레인에서 순차 처리)
+- "key": 키 단위 순서 보장 (key 함수 결과가 같은 이벤트는 한 레인에서 순차 처리)
+- "none": 순서 보장 없음 (공유 큐 하나를 concurrency개 워커가 처리)
+
+큐가 가득 차면 overflow 정책에 따라 가장 오래된 이벤트("drop_oldest") 또는
+새 이벤트("drop_new")를 버리고 dropped 지표를 올립니다.
+"""
+
+import asyncio
+import logging
+import time
+import zlib
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 핸들러별 기본 큐 크기 (레인 전체 합계)
+DEFAULT_QUEUE_SIZE = 10000
+
+ORDERING_CHANNEL = "channel"
+ORDERING_KEY = "key"
+ORDERING_NONE = "none"
+ORDERINGS = (ORDERING_CHANNEL, ORDERING_KEY, ORDERING_NONE)
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEW = "drop_new"
+OVERFLOWS = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEW)
+
+
+@dataclass
+class HandlerStats:
+    """핸들러별 처리 지표"""
+    enqueued: int = 0
+    processed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    queue_depth: int = 0
+    last_lag: float = 0.0  # 큐 대기 시간 (초)
+    max_lag: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _lane_hash(value: Any) -> int:
+    """프로세스 간 일정한 레인 해시 (str hash는 실행마다 달라짐)"""
+    return zlib.crc32(str(value).encode("utf-8"))
+
+
+class HandlerDispatcher:
+    """
+    단일 핸들러용 디스패처
+
+    레인(큐 + 워커 1개)을 concurrency개 만들고, ordering에 따라 이벤트를 레인에 배정합니다.
+    동기 핸들러는 executor에서 실행되어 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable,
+        name: Optional[str] = None,
+        concurrency: int = 1,
+        ordering: str = ORDERING_CHANNEL,
+        key: Optional[Callable[[Any], Any]] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            handler: 이벤트 핸들러 (async 또는 sync)
+            name: 지표용 이름 (기본값: 핸들러 qualname)
+            concurrency: 동시 처리 워커 수
+            ordering: 순서 보장 단위 ("channel", "key", "none")
+            key: ordering="key"일 때 이벤트에서 순서 키를 뽑는 함수
+            queue_size: 큐 크기 (레인 전체 합계)
+            overflow: 큐가 가득 찼을 때 정책 ("drop_oldest", "drop_new")
+            executor: 동기 핸들러 실행용 executor (None이면 루프 기본 executor)
+
+        Raises:
+            ValueError: 잘못된 설정
+        """
+        if ordering not in ORDERINGS:
+            raise ValueError(f"Unknown ordering: {ordering}")
+        if overflow not in OVERFLOWS:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if ordering == ORDERING_KEY and key is None:
+            raise ValueError("ordering='key' requires a key function")
+        if concurrency < 1 or queue_size < 1:
+            raise ValueError("concurrency and queue_size must be positive")
+
+        self.handler = handler
+        self.name = name or getattr(handler, "__qualname__", repr(handler))
+        self.concurrency = concurrency
+        self.ordering = ordering
+        self.key = key
+        self.overflow = overflow
+        self.executor = executor
+        self.stats = HandlerStats()
+
+        self._is_async = asyncio.iscoroutinefunction(handler)
+        lane_count = 1 if ordering == ORDERING_NONE else concurrency
+        self._lane_size = max(1, queue_size // lane_count)
+        self._lane_count = lane_count
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """워커 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue(maxsize=self._lane_size) for _ in range(self._lane_count)]
+        workers_per_lane = self.concurrency if self.ordering == ORDERING_NONE else 1
+        for lane, queue in enumerate(self._queues):
+            for i in range(workers_per_lane):
+                self._workers.append(asyncio.create_task(
+                    self._worker(queue), name=f"event-handler:{self.name}:{lane}:{i}"
+                ))
+
+    def submit(self, channel: str, event: Any) -> bool:
+        """
+        이벤트를 큐에 넣기 (대기하지 않음)
+
+        Returns:
+            큐에 들어갔는지 여부 (drop_new로 버려지면 False)
+        """
+        if not self._workers:
+            self.start()
+
+        queue = self._queues[self._lane(channel, event)]
+        item = (time.monotonic(), channel, event)
+
+        if queue.full():
+            if self.overflow == OVERFLOW_DROP_NEW:
+                self.stats.dropped += 1
+                return False
+            try:
+                queue.get_nowait()
+                queue.task_done()
+                self.stats.dropped += 1
+                self.stats.queue_depth -= 1
+            except asyncio.QueueEmpty:
+                pass
+
+        queue.put_nowait(item)
+        self.stats.enqueued += 1
+        self.stats.queue_depth += 1
+        return True
+
+    def _lane(self, channel: str, event: Any) -> int:
+        if self._lane_count == 1:
+            return 0
+        if self.ordering == ORDERING_KEY:
+            try:
+                return _lane_hash(self.key(event)) % self._lane_count
+            except Exception:
+                return 0
+        return _lane_hash(channel) % self._lane_count
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            enqueued_at, channel, event = await queue.get()
+            self.stats.queue_depth -= 1
+            lag = time.monotonic() - enqueued_at
+            self.stats.last_lag = lag
+            if lag > self.stats.max_lag:
+                self.stats.max_lag = lag
+
+            try:
+                if self._is_async:
+                    await self.handler(event)
+                else:
+                    await loop.run_in_executor(self.executor, self.handler, event)
+                self.stats.processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.failed += 1
+                logger.error(f"Handler error ({self.name}, {channel}): {e}")
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        """큐에 쌓인 이벤트가 모두 처리될 때까지 대기"""
+        for queue in self._queues:
+            await queue.join()
+
+    async def stop(self) -> None:
+        """워커 태스크 중지 (남은 이벤트는 버림)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queues = []
+        self.stats.queue_depth = 0
+
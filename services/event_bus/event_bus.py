@@ -5,18 +5,28 @@ Event Bus - Redis Pub/Sub 기반 이벤트 버스
 
 import json
 import logging
-import asyncio
 from typing import Callable, Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import redis.asyncio as redis
 
+from services.event_bus.dispatcher import (
+    DEFAULT_QUEUE_SIZE,
+    ORDERING_CHANNEL,
+    OVERFLOW_DROP_OLDEST,
+    HandlerDispatcher,
+)
+
 logger = logging.getLogger(__name__)
 
 
 # Redis 연결 설정
 REDIS_URL = "redis://localhost:6379/1"
 
+# 동기 핸들러 실행용 스레드 수
+SYNC_HANDLER_WORKERS = 8
+
 
 @dataclass
 class Event:
@@ -59,32 +69,54 @@ class EventBus:
 
     - 이벤트 발행 (publish)
     - 이벤트 구독 (subscribe)
-    - 핸들러 등록/실행
+    - 핸들러 등록/실행 (핸들러별 큐/워커로 분리 실행, dispatcher 모듈 참고)
     """
 
-    def __init__(self, redis_url: str = REDIS_URL):
+    def __init__(
+        self,
+        redis_url: str = REDIS_URL,
+        sync_handler_workers: int = SYNC_HANDLER_WORKERS,
+    ):
         """
         Args:
             redis_url: Redis URL
+            sync_handler_workers: 동기 핸들러 실행 스레드 수
         """
         self.redis_url = redis_url
         self._redis: Optional[redis.Redis] = None
         self._pubsub: Optional[redis.PubSub] = None
         self._handlers: Dict[str, List[Callable]] = {}
+        self._dispatchers: Dict[str, List[HandlerDispatcher]] = {}
+        self._sync_handler_workers = sync_handler_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._listening = False
 
     async def connect(self):
-        """Redis 연결"""
+        """Redis 연결 (재연결 시 등록된 핸들러에 새 executor 연결)"""
         self._redis = await redis.from_url(self.redis_url, decode_responses=True)
         self._pubsub = self._redis.pubsub()
+        if self._dispatchers:
+            # disconnect에서 종료된 executor 대신 새 executor를 기존 디스패처에 전달
+            executor = self._get_executor()
+            for dispatchers in self._dispatchers.values():
+                for dispatcher in dispatchers:
+                    dispatcher.executor = executor
         logger.info("Event Bus connected to Redis")
 
     async def disconnect(self):
-        """Redis 연결 해제"""
+        """Redis 연결 해제 (핸들러 워커 중지)"""
+        for dispatchers in self._dispatchers.values():
+            for dispatcher in dispatchers:
+                await dispatcher.stop()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         if self._pubsub:
             await self._pubsub.close()
+            self._pubsub = None
         if self._redis:
             await self._redis.close()
+            self._redis = None
         logger.info("Event Bus disconnected")
 
     async def publish(self, channel: str, event: Event):
@@ -107,19 +139,74 @@ class EventBus:
             logger.error(f"Failed to publish event: {e}")
             raise
 
-    async def subscribe(self, channel: str, handler: Callable):
+    async def subscribe(
+        self,
+        channel: str,
+        handler: Callable,
+        *,
+        concurrency: int = 1,
+        ordering: str = ORDERING_CHANNEL,
+        key: Optional[Callable[[Event], Any]] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+    ):
         """
         채널 구독 및 핸들러 등록
 
         Args:
             channel: 채널명
-            handler: 이벤트 핸들러 함수
+            handler: 이벤트 핸들러 함수 (async 또는 sync)
+            concurrency: 핸들러 동시 처리 수
+            ordering: 순서 보장 단위 ("channel", "key", "none")
+            key: ordering="key"일 때 순서 키 함수 (예: lambda e: e.data["ticker"])
+            queue_size: 핸들러 큐 크기
+            overflow: 큐가 가득 찼을 때 정책 ("drop_oldest", "drop_new")
         """
+        dispatcher = HandlerDispatcher(
+            handler,
+            concurrency=concurrency,
+            ordering=ordering,
+            key=key,
+            queue_size=queue_size,
+            overflow=overflow,
+            executor=self._get_executor(),
+        )
+
         if channel not in self._handlers:
             self._handlers[channel] = []
+            self._dispatchers[channel] = []
         self._handlers[channel].append(handler)
+        self._dispatchers[channel].append(dispatcher)
         logger.debug(f"Handler registered for channel: {channel}")
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """동기 핸들러 실행용 executor"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._sync_handler_workers,
+                thread_name_prefix="event-handler",
+            )
+        return self._executor
+
+    def get_handler_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        핸들러별 처리 지표
+
+        Returns:
+            {"채널:핸들러": {enqueued, processed, failed, dropped, queue_depth, last_lag, max_lag}}
+        """
+        return {
+            f"{channel}:{dispatcher.name}": dispatcher.stats.to_dict()
+            for channel, dispatchers in self._dispatchers.items()
+            for dispatcher in dispatchers
+        }
+
+    async def drain(self):
+        """큐에 쌓인 이벤트가 모두 처리될 때까지 대기"""
+        for dispatchers in self._dispatchers.values():
+            for dispatcher in dispatchers:
+                await dispatcher.join()
+
     async def start_listening(self):
         """이벤트 리스닝 시작"""
         if not self._pubsub:
@@ -151,16 +238,9 @@ class EventBus:
             # 이벤트 역직렬화
             event = Event.from_json(data)
 
-            # 등록된 핸들러 실행
-            handlers = self._handlers.get(channel, [])
-            for handler in handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(event)
-                    else:
-                        handler(event)
-                except Exception as e:
-                    logger.error(f"Handler error: {e}")
+            # 핸들러별 큐에 넣기만 하고 바로 반환 (실행은 각 핸들러 워커)
+            for dispatcher in self._dispatchers.get(channel, []):
+                dispatcher.submit(channel, event)
 
         except Exception as e:
             logger.error(f"Failed to handle message: {e}")
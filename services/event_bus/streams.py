@@ -0,0 +1,499 @@
+"""
+Stream Event Bus - Redis Streams 기반 내구성 이벤트 버스
+
+Pub/Sub EventBus는 구독자가 없는 동안 발행된 이벤트가 사라집니다.
+StreamEventBus는 채널마다 스트림 하나를 두고 컨슈머 그룹으로 소비합니다.
+
+- 발행: XADD (MAXLEN ~ 로 보관 개수 제한), publish_many는 파이프라인 1회 왕복
+- 소비: XREADGROUP으로 배치 수신 → 핸들러 실행 → 성공한 항목만 XACK 일괄 처리
+- 수평 확장: 같은 group의 consumer를 여러 프로세스에서 띄우면 항목이 나눠서 전달됨
+- 장애 복구: 처리되지 않고 claim_idle_ms 이상 머문 pending 항목을 XCLAIM으로 가져와 재처리
+  (max_deliveries 이상 전달된 항목은 dead-letter 스트림으로 옮기고 ACK)
+
+전달 보장은 at-least-once이므로 핸들러는 같은 이벤트를 두 번 받아도 안전해야 합니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from services.event_bus.codec import get_codec
+from services.event_bus.event_bus import REDIS_URL, SYNC_HANDLER_WORKERS, Event
+
+logger = logging.getLogger(__name__)
+
+# 스트림 키 Prefix (채널명 앞에 붙음)
+STREAM_PREFIX = "events:stream:"
+
+# dead-letter 스트림 접미사
+DEAD_LETTER_SUFFIX = ":dead"
+
+# 기본 컨슈머 그룹
+DEFAULT_GROUP = "default"
+
+# 스트림별 보관 개수 (MAXLEN ~, 근사 트리밍)
+STREAM_MAXLEN = 100_000
+
+# XREADGROUP 배치 크기 / 블로킹 대기 (ms)
+READ_BATCH_SIZE = 100
+READ_BLOCK_MS = 1000
+
+# pending 항목 재처리 기준 유휴 시간 (ms) / 점검 주기 (초)
+CLAIM_IDLE_MS = 60_000
+CLAIM_INTERVAL = 30.0
+
+# 최대 전달 횟수 (초과 시 dead-letter)
+MAX_DELIVERIES = 5
+
+# 스트림 항목 필드
+FIELD_PAYLOAD = "e"
+FIELD_CODEC = "c"
+
+
+@dataclass
+class StreamStats:
+    """채널별 소비 지표"""
+    delivered: int = 0
+    acked: int = 0
+    failed: int = 0
+    reclaimed: int = 0
+    dead_lettered: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _field(fields: Dict[Any, Any], name: str) -> Any:
+    """decode_responses 설정과 무관하게 필드 값 조회"""
+    value = fields.get(name.encode("utf-8"))
+    if value is None:
+        value = fields.get(name)
+    return value
+
+
+def default_consumer_name() -> str:
+    """호스트명-PID 형식의 컨슈머 이름"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class StreamEventBus:
+    """
+    Redis Streams 기반 이벤트 버스
+
+    EventBus와 같은 publish/subscribe/start_listening API를 제공합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = REDIS_URL,
+        group: str = DEFAULT_GROUP,
+        consumer: Optional[str] = None,
+        codec: str = "json",
+        maxlen: Optional[int] = STREAM_MAXLEN,
+        batch_size: int = READ_BATCH_SIZE,
+        block_ms: int = READ_BLOCK_MS,
+        claim_idle_ms: int = CLAIM_IDLE_MS,
+        claim_interval: float = CLAIM_INTERVAL,
+        max_deliveries: int = MAX_DELIVERIES,
+        group_start_id: str = "$",
+        stream_prefix: str = STREAM_PREFIX,
+        sync_handler_workers: int = SYNC_HANDLER_WORKERS,
+        client=None,
+    ):
+        """
+        Args:
+            redis_url: Redis URL
+            group: 컨슈머 그룹명 (서비스 단위)
+            consumer: 컨슈머 이름 (기본값: 호스트명-PID)
+            codec: 발행 코덱 ("json", "binary"), 소비는 항목에 기록된 코덱으로 디코딩
+            maxlen: 스트림 보관 개수 (None이면 제한 없음)
+            batch_size: XREADGROUP / XCLAIM 배치 크기
+            block_ms: XREADGROUP 블로킹 대기 시간
+            claim_idle_ms: 이 시간 이상 ACK되지 않은 항목을 재처리
+            claim_interval: pending 점검 주기 (초)
+            max_deliveries: 최대 전달 횟수 (초과 시 dead-letter)
+            group_start_id: 그룹을 새로 만들 때 시작 위치 ("$": 새 이벤트부터, "0": 보관된 전체)
+            stream_prefix: 스트림 키 Prefix
+            sync_handler_workers: 동기 핸들러 실행 스레드 수
+            client: 주입할 redis.asyncio 호환 클라이언트 (테스트용)
+
+        Raises:
+            ValueError: 알 수 없는 코덱
+        """
+        self.redis_url = redis_url
+        self.group = group
+        self.consumer = consumer or default_consumer_name()
+        self.codec = get_codec(codec)
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval
+        self.max_deliveries = max_deliveries
+        self.group_start_id = group_start_id
+        self.stream_prefix = stream_prefix
+
+        self._redis = client
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._concurrency: Dict[str, int] = {}
+        self._stats: Dict[str, StreamStats] = {}
+        self._groups_ready: set = set()
+        self._sync_handler_workers = sync_handler_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._listening = False
+        self._last_claim = 0.0
+
+    async def connect(self):
+        """Redis 연결"""
+        if self._redis is None:
+            self._redis = await redis.from_url(self.redis_url, decode_responses=False)
+            logger.info("Stream Event Bus connected to Redis")
+
+    async def disconnect(self):
+        """Redis 연결 해제"""
+        self._listening = False
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._redis:
+            await self._redis.close()
+            self._redis = None
+        logger.info("Stream Event Bus disconnected")
+
+    def stream_key(self, channel: str) -> str:
+        """채널의 스트림 키"""
+        return f"{self.stream_prefix}{channel}"
+
+    def _entry_fields(self, event: Event) -> Dict[str, Any]:
+        return {FIELD_PAYLOAD: self.codec.encode(event), FIELD_CODEC: self.codec.name}
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    async def publish(self, channel: str, event: Event) -> str:
+        """
+        이벤트 발행
+
+        Args:
+            channel: 채널명
+            event: 이벤트 객체
+
+        Returns:
+            스트림 항목 ID
+        """
+        try:
+            if not self._redis:
+                await self.connect()
+
+            entry_id = await self._redis.xadd(
+                self.stream_key(channel),
+                self._entry_fields(event),
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+            logger.debug(f"Event appended: {channel} - {event.event_type}")
+            return _text(entry_id)
+
+        except Exception as e:
+            logger.error(f"Failed to publish event: {e}")
+            raise
+
+    async def publish_many(self, events: Iterable[Tuple[str, Event]]) -> List[str]:
+        """
+        이벤트 여러 개를 파이프라인 1회 왕복으로 발행
+
+        Args:
+            events: (채널명, 이벤트) 목록
+
+        Returns:
+            스트림 항목 ID 목록 (입력 순서)
+        """
+        events = list(events)
+        if not events:
+            return []
+
+        try:
+            if not self._redis:
+                await self.connect()
+
+            pipe = self._redis.pipeline(transaction=False)
+            for channel, event in events:
+                pipe.xadd(
+                    self.stream_key(channel),
+                    self._entry_fields(event),
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+            entry_ids = await pipe.execute()
+            logger.debug(f"Events appended: {len(events)}")
+            return [_text(entry_id) for entry_id in entry_ids]
+
+        except Exception as e:
+            logger.error(f"Failed to publish events: {e}")
+            raise
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+
+    async def subscribe(self, channel: str, handler: Callable, *, concurrency: int = 1):
+        """
+        채널 구독 및 핸들러 등록
+
+        Args:
+            channel: 채널명
+            handler: 이벤트 핸들러 함수 (async 또는 sync)
+            concurrency: 배치 안에서 동시에 처리할 항목 수 (1이면 스트림 순서대로 처리)
+
+        Raises:
+            ValueError: concurrency가 1 미만
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
+        if channel not in self._handlers:
+            self._handlers[channel] = []
+            self._stats[channel] = StreamStats()
+        self._handlers[channel].append(handler)
+        self._concurrency[channel] = max(self._concurrency.get(channel, 1), concurrency)
+        logger.debug(f"Handler registered for stream: {channel}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        채널별 소비 지표
+
+        Returns:
+            {"채널": {delivered, acked, failed, reclaimed, dead_lettered}}
+        """
+        return {channel: stats.to_dict() for channel, stats in self._stats.items()}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """동기 핸들러 실행용 executor"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._sync_handler_workers,
+                thread_name_prefix="stream-handler",
+            )
+        return self._executor
+
+    async def ensure_groups(self):
+        """구독 채널마다 컨슈머 그룹 생성 (이미 있으면 무시)"""
+        if not self._redis:
+            await self.connect()
+
+        for channel in self._handlers:
+            if channel in self._groups_ready:
+                continue
+            try:
+                await self._redis.xgroup_create(
+                    self.stream_key(channel), self.group, id=self.group_start_id, mkstream=True
+                )
+                logger.info(f"Consumer group created: {channel} / {self.group}")
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._groups_ready.add(channel)
+
+    # ------------------------------------------------------------------
+    # 소비
+    # ------------------------------------------------------------------
+
+    async def read_batch(self, block_ms: Optional[int] = None) -> int:
+        """
+        XREADGROUP 1회로 새 항목을 읽어 처리하고 성공한 항목을 ACK
+
+        Args:
+            block_ms: 블로킹 대기 시간 (None이면 설정값)
+
+        Returns:
+            ACK한 항목 수
+        """
+        if not self._handlers:
+            return 0
+        await self.ensure_groups()
+
+        response = await self._redis.xreadgroup(
+            self.group,
+            self.consumer,
+            streams={self.stream_key(channel): ">" for channel in self._handlers},
+            count=self.batch_size,
+            block=self.block_ms if block_ms is None else block_ms,
+        )
+        if not response:
+            return 0
+
+        results = await asyncio.gather(*(
+            self._process_entries(self._channel_of(stream), entries)
+            for stream, entries in response
+        ))
+        return sum(results)
+
+    async def reclaim_pending(self) -> int:
+        """
+        오래 ACK되지 않은 pending 항목(중단된 컨슈머 몫 포함)을 가져와 재처리
+
+        max_deliveries 이상 전달된 항목은 재처리하지 않고 dead-letter 스트림으로 옮깁니다.
+
+        Returns:
+            재처리 후 ACK한 항목 수
+        """
+        if not self._handlers:
+            return 0
+        await self.ensure_groups()
+
+        acked = 0
+        for channel in self._handlers:
+            stream = self.stream_key(channel)
+            pending = await self._redis.xpending_range(
+                stream, self.group, min="-", max="+",
+                count=self.batch_size, idle=self.claim_idle_ms,
+            )
+            if not pending:
+                continue
+
+            dead_ids = [p["message_id"] for p in pending if p["times_delivered"] >= self.max_deliveries]
+            retry_ids = [p["message_id"] for p in pending if p["times_delivered"] < self.max_deliveries]
+
+            if dead_ids:
+                claimed = await self._redis.xclaim(
+                    stream, self.group, self.consumer, self.claim_idle_ms, dead_ids
+                )
+                await self._dead_letter(channel, await self._ack_trimmed(channel, claimed))
+
+            if retry_ids:
+                claimed = await self._redis.xclaim(
+                    stream, self.group, self.consumer, self.claim_idle_ms, retry_ids
+                )
+                claimed = await self._ack_trimmed(channel, claimed)
+                self._stats[channel].reclaimed += len(claimed)
+                if claimed:
+                    logger.info(f"Reclaimed {len(claimed)} pending events: {channel}")
+                acked += await self._process_entries(channel, claimed)
+
+        return acked
+
+    async def start_listening(self):
+        """이벤트 리스닝 시작 (stop_listening 호출 전까지 반복)"""
+        await self.ensure_groups()
+        self._listening = True
+
+        while self._listening:
+            try:
+                if time.monotonic() - self._last_claim >= self.claim_interval:
+                    self._last_claim = time.monotonic()
+                    await self.reclaim_pending()
+                await self.read_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stream listening error: {e}")
+                await asyncio.sleep(1)
+
+    async def stop_listening(self):
+        """이벤트 리스닝 중지 (진행 중인 배치는 마저 처리)"""
+        self._listening = False
+        logger.info("Stream Event Bus listening stopped")
+
+    def _channel_of(self, stream: Any) -> str:
+        return _text(stream)[len(self.stream_prefix):]
+
+    async def _process_entries(self, channel: str, entries: List[Tuple[Any, Dict]]) -> int:
+        """항목 처리 후 성공/디코딩 불가 항목을 XACK 1회로 확인"""
+        if not entries:
+            return 0
+
+        stats = self._stats[channel]
+        stats.delivered += len(entries)
+        semaphore = asyncio.Semaphore(self._concurrency.get(channel, 1))
+        undecodable = []
+
+        async def handle(entry_id, fields) -> bool:
+            try:
+                event = self._decode(fields)
+            except Exception as e:
+                logger.error(f"Failed to decode event {_text(entry_id)} ({channel}): {e}")
+                undecodable.append((entry_id, fields))
+                return False
+            async with semaphore:
+                return await self._run_handlers(channel, event)
+
+        results = await asyncio.gather(*(handle(entry_id, fields) for entry_id, fields in entries))
+        ack_ids = [entry_id for (entry_id, _), ok in zip(entries, results) if ok]
+        stats.failed += len(entries) - len(ack_ids) - len(undecodable)
+
+        if undecodable:
+            await self._dead_letter(channel, undecodable)
+        if ack_ids:
+            await self._redis.xack(self.stream_key(channel), self.group, *ack_ids)
+            stats.acked += len(ack_ids)
+        return len(ack_ids)
+
+    def _decode(self, fields: Dict[Any, Any]) -> Event:
+        payload = _field(fields, FIELD_PAYLOAD)
+        codec_name = _field(fields, FIELD_CODEC)
+        codec = get_codec(_text(codec_name)) if codec_name is not None else self.codec
+        return codec.decode(payload)
+
+    async def _run_handlers(self, channel: str, event: Event) -> bool:
+        """채널 핸들러 전체 실행 (모두 성공해야 True)"""
+        loop = asyncio.get_running_loop()
+        calls = []
+        for handler in self._handlers.get(channel, []):
+            if asyncio.iscoroutinefunction(handler):
+                calls.append(handler(event))
+            else:
+                calls.append(loop.run_in_executor(self._get_executor(), handler, event))
+
+        ok = True
+        for handler, result in zip(self._handlers[channel], await asyncio.gather(*calls, return_exceptions=True)):
+            if isinstance(result, BaseException):
+                ok = False
+                name = getattr(handler, "__qualname__", repr(handler))
+                logger.error(f"Handler error ({name}, {channel}): {result}")
+        return ok
+
+    async def _ack_trimmed(self, channel: str, entries: List[Tuple[Any, Dict]]) -> List[Tuple[Any, Dict]]:
+        """
+        XCLAIM 결과 중 본문이 없는(maxlen으로 잘려 나간) 항목을 ACK해 PEL에서 제거
+
+        Returns:
+            본문이 남아 있는 항목
+        """
+        trimmed = [entry_id for entry_id, fields in entries if not fields]
+        if trimmed:
+            await self._redis.xack(self.stream_key(channel), self.group, *trimmed)
+            logger.warning(f"Acked {len(trimmed)} trimmed pending entries: {channel}")
+        return [(entry_id, fields) for entry_id, fields in entries if fields]
+
+    async def _dead_letter(self, channel: str, entries: List[Tuple[Any, Dict]]):
+        """항목을 dead-letter 스트림에 옮기고 원본 스트림에서 ACK"""
+        if not entries:
+            return
+
+        stream = self.stream_key(channel)
+        pipe = self._redis.pipeline(transaction=False)
+        for entry_id, fields in entries:
+            pipe.xadd(
+                f"{stream}{DEAD_LETTER_SUFFIX}",
+                {**fields, "source_id": entry_id, "group": self.group},
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        pipe.xack(stream, self.group, *[entry_id for entry_id, _ in entries])
+        await pipe.execute()
+
+        self._stats[channel].dead_lettered += len(entries)
+        logger.warning(f"Dead-lettered {len(entries)} events: {channel}")
@@ -4,7 +4,7 @@ Signal Scorer - 종가베팅 V2 점수 계산
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, TYPE_CHECKING
 from enum import Enum
 import logging
 
@@ -116,26 +116,67 @@ class SignalScorer:
                 return None
         return self._vcp_analyzer
 
-    def calculate(self, ticker: str, name: str, price: int) -> Optional[JonggaSignal]:
+    def _get_recent_prices(
+        self,
+        ticker: str,
+        days: int,
+        prices: Optional[List[Any]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        최근 days일 일봉 (날짜 오름차순)
+
+        prices가 주어지면 그 안에서 기간만 잘라 사용하고, 없으면 Repository에서 조회합니다.
+        Repository를 사용할 수 없으면 None을 반환합니다.
+        """
+        from datetime import date, timedelta
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+
+        if prices is not None:
+            return [p for p in prices if start_date <= p.date <= end_date]
+
+        repo = self._get_daily_price_repo()
+        if repo is None:
+            return None
+        return repo.get_by_ticker_and_date_range(ticker, start_date, end_date)
+
+    def calculate(
+        self,
+        ticker: str,
+        name: str,
+        price: int,
+        prices: Optional[List[Any]] = None,
+        flow: Optional[Any] = None,
+        news_score: Optional[int] = None,
+        capital: int = 10_000_000,
+    ) -> Optional[JonggaSignal]:
         """
         시그널 점수 계산
 
+        prices/flow/news_score를 넘기면 종목별 DB 조회와 뉴스 수집 없이 계산합니다
+        (전 종목 스캔 시 샤드 단위로 미리 일괄 조회한 데이터 사용).
+
         Args:
             ticker: 종목코드
             name: 종목명
             price: 현재가
+            prices: 최근 일봉 목록 (날짜 오름차순, 최소 14일)
+            flow: 최신 InstitutionalFlow (외국인/기관 순매수)
+            news_score: 뉴스 점수 (0-3)
+            capital: 포지션 사이징 기준 자본
 
         Returns:
             JonggaSignal 또는 None
         """
         try:
             # 각 항목 점수 계산
-            news_score = self._calculate_news_score(ticker)
-            volume_score = self._calculate_volume_score(ticker, price)
+            if news_score is None:
+                news_score = self._calculate_news_score(ticker)
+            volume_score = self._calculate_volume_score(ticker, price, prices)
             chart_score = self._calculate_chart_score(ticker)
-            candle_score = self._calculate_candle_score(ticker)
-            period_score = self._calculate_period_score(ticker)
-            flow_score = self._calculate_flow_score(ticker)
+            candle_score = self._calculate_candle_score(ticker, prices)
+            period_score = self._calculate_period_score(ticker, prices)
+            flow_score = self._calculate_flow_score(ticker, prices, flow)
 
             # 총점 계산
             total = news_score + volume_score + chart_score + candle_score + period_score + flow_score
@@ -154,7 +195,6 @@ class SignalScorer:
             grade = self._calculate_grade(total)
 
             # 포지션 사이징
-            capital = 10_000_000  # 1000만원 기준
             position_size = self._calculate_position_size(capital, price, grade)
 
             # 가격 목표 설정
@@ -233,7 +273,9 @@ class SignalScorer:
             # 실패 시 기본 점수 0점
             return 0
 
-    def _calculate_volume_score(self, ticker: str, price: int) -> int:
+    def _calculate_volume_score(
+        self, ticker: str, price: int, prices: Optional[List[Any]] = None
+    ) -> int:
         """
         거래대금 점수 (0-3점)
 
@@ -246,22 +288,18 @@ class SignalScorer:
         Args:
             ticker: 종목코드
             price: 현재가 (향후 확장성 고려)
+            prices: 미리 조회한 일봉 (선택)
 
         Returns:
             점수 (0-3)
         """
         try:
-            repo = self._get_daily_price_repo()
-            if repo is None:
+            # 최신 거래대금 조회
+            prices = self._get_recent_prices(ticker, 7, prices)
+            if prices is None:
                 self.logger.warning(f"{ticker} Repository 없음, 기본 점수 0점")
                 return 0
 
-            # 최신 거래대금 조회
-            from datetime import date, timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=7)
-
-            prices = repo.get_by_ticker_and_date_range(ticker, start_date, end_date)
             if not prices:
                 self.logger.warning(f"{ticker} 가격 데이터 없음, 기본 점수 0점")
                 return 0
@@ -322,7 +360,7 @@ class SignalScorer:
             self.logger.error(f"{ticker} 차트 점수 계산 실패: {e}")
             return 0
 
-    def _calculate_candle_score(self, ticker: str) -> int:
+    def _calculate_candle_score(self, ticker: str, prices: Optional[List[Any]] = None) -> int:
         """
         캔들 점수 (0-1점)
 
@@ -331,22 +369,15 @@ class SignalScorer:
 
         Args:
             ticker: 종목코드
+            prices: 미리 조회한 일봉 (선택)
 
         Returns:
             점수 (0-1)
         """
         try:
-            repo = self._get_daily_price_repo()
-            if repo is None:
-                return 0
-
             # 최근 3일 데이터 조회
-            from datetime import date, timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=5)
-
-            prices = repo.get_by_ticker_and_date_range(ticker, start_date, end_date)
-            if len(prices) < 2:
+            prices = self._get_recent_prices(ticker, 5, prices)
+            if prices is None or len(prices) < 2:
                 return 0
 
             # 최신 양봉 확인: 오늘 양봉이고 어제 종가보다 상승
@@ -365,7 +396,7 @@ class SignalScorer:
             self.logger.error(f"{ticker} 캔들 점수 계산 실패: {e}")
             return 0
 
-    def _calculate_period_score(self, ticker: str) -> int:
+    def _calculate_period_score(self, ticker: str, prices: Optional[List[Any]] = None) -> int:
         """
         기간조정 점수 (0-1점)
 
@@ -374,22 +405,15 @@ class SignalScorer:
 
         Args:
             ticker: 종목코드
+            prices: 미리 조회한 일봉 (선택)
 
         Returns:
             점수 (0-1)
         """
         try:
-            repo = self._get_daily_price_repo()
-            if repo is None:
-                return 0
-
             # 최근 10일 데이터 조회
-            from datetime import date, timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=14)
-
-            prices = repo.get_by_ticker_and_date_range(ticker, start_date, end_date)
-            if len(prices) < 5:
+            prices = self._get_recent_prices(ticker, 14, prices)
+            if prices is None or len(prices) < 5:
                 return 0
 
             # 하락 후 반등 패턴 찾기
@@ -413,7 +437,12 @@ class SignalScorer:
             self.logger.error(f"{ticker} 기간 점수 계산 실패: {e}")
             return 0
 
-    def _calculate_flow_score(self, ticker: str) -> int:
+    def _calculate_flow_score(
+        self,
+        ticker: str,
+        prices: Optional[List[Any]] = None,
+        flow: Optional[Any] = None,
+    ) -> int:
         """
         수급 점수 (0-2점)
 
@@ -423,26 +452,23 @@ class SignalScorer:
 
         Args:
             ticker: 종목코드
+            prices: 미리 조회한 일봉 (선택)
+            flow: 미리 조회한 최신 InstitutionalFlow (선택, 있으면 우선 사용)
 
         Returns:
             점수 (0-2)
         """
         try:
-            repo = self._get_daily_price_repo()
-            if repo is None:
-                return 0
-
-            # 최근 3일 데이터 조회
-            from datetime import date, timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=7)
-
-            prices = repo.get_by_ticker_and_date_range(ticker, start_date, end_date)
-            if not prices:
-                return 0
+            if flow is not None:
+                latest = flow
+            else:
+                # 최근 3일 데이터 조회
+                prices = self._get_recent_prices(ticker, 7, prices)
+                if not prices:
+                    return 0
 
-            # 최신 데이터 확인
-            latest = prices[-1]
+                # 최신 데이터 확인
+                latest = prices[-1]
 
             # 외국인, 기관 수급 확인 (DailyPrice 테이블의 foreign_net_buy, inst_net_buy)
             foreign_buying = latest.foreign_net_buy or 0
@@ -9,6 +9,7 @@ from datetime import date
 from dataclasses import dataclass
 
 from src.analysis.sentiment_analyzer import SentimentAnalyzer, Sentiment
+from src.analysis.sentiment_pipeline import fallback_result
 
 logger = logging.getLogger(__name__)
 
@@ -74,26 +75,13 @@ class NewsScorer:
                 details=[],
             )
 
-        # 감성 분석
-        results = []
-        for article in articles:
-            try:
-                result = self.analyzer.analyze(
-                    title=article["title"],
-                    content=article.get("content", ""),
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"❌ 뉴스 감성 분석 실패: {e}, title={article['title']}")
-                # 실패 시 중립 결과로 처리 (폴백)
-                from src.analysis.sentiment_analyzer import SentimentResult
-                results.append(SentimentResult(
-                    sentiment=Sentiment.NEUTRAL,
-                    confidence=0.0,
-                    keywords=[],
-                    summary=f"[분석 실패] {article['title'][:30]}...",
-                    score=0.0,
-                ))
+        # 감성 분석 (배치 + 캐시, 기사별 실패는 파이프라인에서 중립 처리)
+        try:
+            results = self.analyzer.analyze_batch(articles)
+        except Exception as e:
+            logger.error(f"❌ 뉴스 감성 분석 실패: {e}, ticker={ticker}")
+            # 실패 시 중립 결과로 처리 (폴백)
+            results = [fallback_result(article["title"]) for article in articles]
 
         # 통계 집계
         positive_count = sum(1 for r in results if r.sentiment == Sentiment.POSITIVE)
@@ -188,12 +176,7 @@ class NewsScorer:
         """
         keyword_freq = {}
 
-        for article in articles:
-            result = self.analyzer.analyze(
-                title=article["title"],
-                content=article.get("content", ""),
-            )
-
+        for result in self.analyzer.analyze_batch(articles):
             for keyword in result.keywords:
                 keyword_freq[keyword] = keyword_freq.get(keyword, 0) + 1
 
@@ -4,8 +4,9 @@ Sentiment Analyzer
 """
 
 import os
+import json
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,6 +30,50 @@ class SentimentResult:
     score: float  # 감성 점수 (-1.0 ~ 1.0)
 
 
+def parse_llm_json(text: str) -> Any:
+    """
+    LLM 응답 텍스트에서 JSON 파싱 (마크다운 코드 블록 제거)
+
+    Raises:
+        json.JSONDecodeError: JSON이 아닌 경우
+    """
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
+    return json.loads(text)
+
+
+def result_from_dict(result: Dict[str, Any]) -> SentimentResult:
+    """
+    LLM JSON 결과를 SentimentResult로 변환
+
+    감성 점수: 긍정 = +신뢰도, 부정 = -신뢰도, 중립 = 0
+    """
+    sentiment_map = {
+        "positive": Sentiment.POSITIVE,
+        "negative": Sentiment.NEGATIVE,
+        "neutral": Sentiment.NEUTRAL,
+    }
+    sentiment = sentiment_map.get(result["sentiment"], Sentiment.NEUTRAL)
+    confidence = float(result.get("confidence", 0.5))
+
+    if sentiment == Sentiment.POSITIVE:
+        score = confidence
+    elif sentiment == Sentiment.NEGATIVE:
+        score = -confidence
+    else:
+        score = 0.0
+
+    return SentimentResult(
+        sentiment=sentiment,
+        confidence=confidence,
+        keywords=result.get("keywords", []),
+        summary=result.get("summary", ""),
+        score=score,
+    )
+
+
 class SentimentAnalyzer:
     """
     뉴스 감성 분석기
@@ -36,6 +81,9 @@ class SentimentAnalyzer:
     Gemini API를 사용하여 뉴스 감성 분석
     """
 
+    # Gemini 모델
+    MODEL_NAME = "gemini-3-flash-preview"
+
     # 감성 분석 프롬프트 템플릿
     SENTIMENT_PROMPT = """
 다음 뉴스 기사를 분석하여 주식 시장 관점에서 감성을 분석해주세요.
@@ -70,6 +118,7 @@ class SentimentAnalyzer:
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self._client = None
+        self._pipeline = None
 
         if not self.api_key:
             raise RuntimeError("GEMINI_API_KEY가 설정되지 않았습니다. 감성 분석을 사용하려면 API 키가 필요합니다.")
@@ -77,7 +126,7 @@ class SentimentAnalyzer:
         try:
             import google.generativeai as genai
             genai.configure(api_key=self.api_key)
-            self._client = genai.GenerativeModel("gemini-3-flash-preview")
+            self._client = genai.GenerativeModel(self.MODEL_NAME)
             logger.info("✅ Gemini API initialized")
         except ImportError:
             raise RuntimeError("google-generativeai 라이브러리가 설치되지 않았습니다. pip install google-generativeai로 설치하세요.")
@@ -102,59 +151,41 @@ class SentimentAnalyzer:
             prompt = self.SENTIMENT_PROMPT.format(title=title, content=content)
 
             response = self._client.generate_content(prompt)
-            result_text = response.text
-
-            # JSON 파싱
-            import json
-
-            # 마크다운 코드 블록 제거
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(result_text)
-
-            # 감성 라벨 변환
-            sentiment_map = {
-                "positive": Sentiment.POSITIVE,
-                "negative": Sentiment.NEGATIVE,
-                "neutral": Sentiment.NEUTRAL,
-            }
-            sentiment = sentiment_map.get(result["sentiment"], Sentiment.NEUTRAL)
-
-            # 감성 점수 계산 (-1.0 ~ 1.0)
-            if sentiment == Sentiment.POSITIVE:
-                score = result["confidence"]
-            elif sentiment == Sentiment.NEGATIVE:
-                score = -result["confidence"]
-            else:
-                score = 0.0
-
-            return SentimentResult(
-                sentiment=sentiment,
-                confidence=result.get("confidence", 0.5),
-                keywords=result.get("keywords", []),
-                summary=result.get("summary", ""),
-                score=score,
-            )
+            return result_from_dict(parse_llm_json(response.text))
 
         except Exception as e:
             logger.error(f"❌ 감성 분석 실패: {e}")
             raise RuntimeError(f"감성 분석 실패: {e}")
 
-    def analyze_batch(self, articles: List[Dict[str, str]]) -> List[SentimentResult]:
+    @property
+    def pipeline(self):
+        """배치 감성 분석 파이프라인 (지연 생성)"""
+        if self._pipeline is None:
+            from src.analysis.sentiment_pipeline import BatchSentimentPipeline, GeminiRestClient
+
+            self._pipeline = BatchSentimentPipeline(
+                client=GeminiRestClient(self.api_key, model=self.MODEL_NAME),
+            )
+        return self._pipeline
+
+    def analyze_batch(
+        self,
+        articles: List[Dict[str, str]],
+        raise_on_failure: bool = False,
+    ) -> List[SentimentResult]:
         """
         여러 뉴스 일괄 분석
 
+        BatchSentimentPipeline으로 캐시 조회 → 어휘 사전 중립 판정 →
+        다건 프롬프트 동시 요청 순으로 처리합니다. 실패한 기사는 신뢰도 0 중립입니다.
+
         Args:
             articles: 뉴스 리스트 [{title, content}, ...]
+            raise_on_failure: 실패한 기사가 있으면 중립 대신 SentimentBatchError 발생
 
         Returns:
-            감성 분석 결과 리스트
+            감성 분석 결과 리스트 (입력 순서 유지)
         """
-        results = []
-        for article in articles:
-            result = self.analyze(article["title"], article.get("content", ""))
-            results.append(result)
-        return results
+        if not articles:
+            return []
+        return self.pipeline.analyze(articles, raise_on_failure=raise_on_failure)
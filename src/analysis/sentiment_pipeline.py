@@ -0,0 +1,461 @@
+"""
+Sentiment Pipeline
+배치 감성 분석 파이프라인 - 다건 프롬프트 + 결과 캐시 + 어휘 사전 필터
+
+처리 순서:
+1. 정규화된 제목/본문 해시로 캐시 조회 (Redis, 실패 시 프로세스 메모리)
+2. 어휘 사전에 감성 단어가 하나도 없는 기사는 LLM 없이 중립 처리
+3. 남은 기사를 BATCH_SIZE건씩 하나의 프롬프트로 묶어 구조화(JSON) 출력 요청
+   - 동시 요청 수는 MAX_IN_FLIGHT로 제한
+4. LLM 결과를 캐시에 저장
+
+Usage:
+    pipeline = BatchSentimentPipeline(client=GeminiRestClient(api_key))
+    results = pipeline.analyze([{"title": "...", "content": "..."}, ...])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence
+
+import httpx
+
+from src.analysis.sentiment_analyzer import (
+    Sentiment,
+    SentimentResult,
+    parse_llm_json,
+    result_from_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+# 한 프롬프트에 담는 기사 수
+BATCH_SIZE = 10
+
+# 동시 LLM 요청 수
+MAX_IN_FLIGHT = 4
+
+# 프롬프트에 포함할 본문 최대 길이
+MAX_CONTENT_CHARS = 500
+
+# 캐시 유효 기간 (초)
+SENTIMENT_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Redis 오류 후 다시 시도하기까지 메모리 캐시만 쓰는 시간 (초)
+CACHE_REDIS_RETRY_INTERVAL = 60
+
+# 캐시 키 버전 (프롬프트/스키마 변경 시 증가)
+CACHE_KEY_PREFIX = "sentiment:v1:"
+
+# 어휘 사전 중립 판정 신뢰도
+LEXICON_NEUTRAL_CONFIDENCE = 0.5
+
+POSITIVE_TERMS = (
+    "호조", "상승", "급등", "강세", "상향", "사상 최대", "최대 실적", "호실적",
+    "흑자", "수주", "공급계약", "신고가", "돌파", "성장", "개선", "매수",
+    "증가", "기대", "수혜", "반등",
+)
+
+NEGATIVE_TERMS = (
+    "하락", "급락", "약세", "하향", "적자", "손실", "감소", "부진", "악화",
+    "우려", "리콜", "소송", "횡령", "배임", "상장폐지", "거래정지", "유상증자",
+    "제재", "매도", "쇼크",
+)
+
+BATCH_PROMPT = """
+다음 뉴스 기사들을 주식 시장 관점에서 각각 감성 분석해주세요.
+각 기사는 JSON 한 줄이며 id로 구분됩니다.
+
+{articles}
+
+**분석 요청 (기사마다):**
+1. 감성 분류 (긍정/부정/중립)
+2. 신뢰도 (0~1 사이 값)
+3. 핵심 키워드 (3~5개)
+4. 1문장 요약
+
+**출력 형식 (JSON 배열, 입력 기사 수와 동일):**
+[
+    {{"id": 0, "sentiment": "positive|negative|neutral", "confidence": 0.8, "keywords": ["키워드1"], "summary": "뉴스 요약 1문장"}}
+]
+"""
+
+# Gemini responseSchema (OpenAPI 부분집합)
+RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "id": {"type": "INTEGER"},
+            "sentiment": {"type": "STRING", "enum": ["positive", "negative", "neutral"]},
+            "confidence": {"type": "NUMBER"},
+            "keywords": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "summary": {"type": "STRING"},
+        },
+        "required": ["id", "sentiment", "confidence"],
+    },
+}
+
+
+def normalize_article(title: str, content: str = "") -> str:
+    """공백/대소문자 차이를 제거한 기사 텍스트"""
+    text = f"{title or ''}\n{content or ''}"
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def article_key(title: str, content: str = "") -> str:
+    """정규화된 기사 텍스트 해시 (캐시 키)"""
+    digest = hashlib.sha1(normalize_article(title, content).encode("utf-8")).hexdigest()
+    return CACHE_KEY_PREFIX + digest
+
+
+def result_to_dict(result: SentimentResult) -> Dict[str, Any]:
+    return {
+        "sentiment": result.sentiment.value,
+        "confidence": result.confidence,
+        "keywords": list(result.keywords),
+        "summary": result.summary,
+    }
+
+
+class SentimentBatchError(RuntimeError):
+    """LLM 배치 실패로 일부 기사를 분석하지 못함 (raise_on_failure=True일 때)"""
+
+    def __init__(self, failed: int, total: int):
+        super().__init__(f"감성 분석 실패 {failed}/{total}건 (LLM 배치 오류)")
+        self.failed = failed
+        self.total = total
+
+
+def fallback_result(title: str) -> SentimentResult:
+    """분석 실패 시 중립 결과 (캐시하지 않음)"""
+    return SentimentResult(
+        sentiment=Sentiment.NEUTRAL,
+        confidence=0.0,
+        keywords=[],
+        summary=f"[분석 실패] {title[:30]}...",
+        score=0.0,
+    )
+
+
+class LexiconPreClassifier:
+    """
+    어휘 사전 기반 사전 분류기
+
+    긍정/부정 단어가 하나도 없는 기사는 명백한 중립으로 보고 LLM 호출을 생략합니다.
+    감성 단어가 있으면 판단을 LLM에 맡깁니다 (None 반환).
+    """
+
+    def __init__(
+        self,
+        positive_terms: Iterable[str] = POSITIVE_TERMS,
+        negative_terms: Iterable[str] = NEGATIVE_TERMS,
+    ):
+        terms = sorted(set(positive_terms) | set(negative_terms), key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(t) for t in terms))
+
+    def classify(self, title: str, content: str = "") -> Optional[SentimentResult]:
+        if self._pattern.search(f"{title}\n{content}"):
+            return None
+
+        return SentimentResult(
+            sentiment=Sentiment.NEUTRAL,
+            confidence=LEXICON_NEUTRAL_CONFIDENCE,
+            keywords=[],
+            summary="",
+            score=0.0,
+        )
+
+
+class SentimentCache:
+    """
+    감성 분석 결과 캐시
+
+    Redis에 TTL과 함께 저장하고, Redis를 사용할 수 없으면 프로세스 메모리에만 보관합니다.
+    Redis 오류가 나면 retry_interval 동안 Redis를 건너뛴 뒤 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl: int = SENTIMENT_CACHE_TTL,
+        client=None,
+        retry_interval: float = CACHE_REDIS_RETRY_INTERVAL,
+    ):
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._client = client
+        self._redis_retry_at = 0.0
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_client(self):
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._client is None:
+            import redis
+            self._client = redis.from_url(self._redis_url, decode_responses=True)
+        return self._client
+
+    def _redis_failed(self) -> None:
+        self._redis_retry_at = time.monotonic() + self.retry_interval
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """캐시된 결과 {key: result_dict}"""
+        with self._lock:
+            found = {k: self._memory[k] for k in keys if k in self._memory}
+
+        missing = [k for k in keys if k not in found]
+        if not missing:
+            return found
+
+        try:
+            client = self._get_client()
+            if client is not None:
+                for key, raw in zip(missing, client.mget(missing)):
+                    if raw:
+                        found[key] = json.loads(raw)
+        except Exception as e:
+            logger.warning(f"감성 캐시 조회 실패, {self.retry_interval:.0f}초간 메모리 캐시만 사용: {e}")
+            self._redis_failed()
+
+        return found
+
+    def set_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """결과 저장"""
+        if not items:
+            return
+
+        with self._lock:
+            self._memory.update(items)
+
+        try:
+            client = self._get_client()
+            if client is not None:
+                pipe = client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"감성 캐시 저장 실패: {e}")
+            self._redis_failed()
+
+
+class JSONCompletionClient(Protocol):
+    """구조화(JSON) 출력 LLM 클라이언트"""
+
+    def generate_json(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        ...
+
+
+class GeminiRestClient:
+    """
+    Gemini generateContent REST 클라이언트
+
+    responseMimeType/responseSchema로 JSON 배열 출력을 강제합니다.
+    GEMINI_API_BASE_URL로 엔드포인트를 바꿀 수 있어 로컬 대역 서버로 테스트할 수 있습니다.
+    """
+
+    DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3-flash-preview",
+        base_url: Optional[str] = None,
+        timeout: float = 60.0,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = (base_url or os.getenv("GEMINI_API_BASE_URL") or self.DEFAULT_BASE_URL).rstrip("/")
+        self._client = httpx.Client(timeout=timeout)
+
+    def generate_json(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        generation_config: Dict[str, Any] = {"responseMimeType": "application/json"}
+        if schema:
+            generation_config["responseSchema"] = schema
+
+        response = self._client.post(
+            f"{self.base_url}/v1beta/models/{self.model}:generateContent",
+            params={"key": self.api_key},
+            json={
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "generationConfig": generation_config,
+            },
+        )
+        response.raise_for_status()
+
+        candidates = response.json().get("candidates") or []
+        if not candidates:
+            raise RuntimeError("Gemini 응답에 candidates가 없습니다")
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+@dataclass
+class PipelineStats:
+    """파이프라인 처리 통계 (최근 analyze 호출 기준)"""
+    total: int = 0
+    cache_hits: int = 0
+    lexicon_neutral: int = 0
+    llm_items: int = 0
+    llm_requests: int = 0
+    failed: int = 0
+
+
+class BatchSentimentPipeline:
+    """
+    배치 감성 분석 파이프라인
+
+    SentimentAnalyzer.analyze_batch / NewsScorer에서 사용합니다.
+    """
+
+    def __init__(
+        self,
+        client: JSONCompletionClient,
+        cache: Optional[SentimentCache] = None,
+        pre_classifier: Optional[LexiconPreClassifier] = None,
+        batch_size: int = BATCH_SIZE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        self.client = client
+        self.cache = cache if cache is not None else get_sentiment_cache()
+        self.pre_classifier = pre_classifier if pre_classifier is not None else LexiconPreClassifier()
+        self.batch_size = max(1, batch_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.stats = PipelineStats()
+
+    def analyze(
+        self,
+        articles: Sequence[Dict[str, str]],
+        raise_on_failure: bool = False,
+    ) -> List[SentimentResult]:
+        """
+        기사 목록 감성 분석
+
+        Args:
+            articles: 뉴스 리스트 [{title, content}, ...]
+            raise_on_failure: 분석하지 못한 기사가 있으면 SentimentBatchError 발생
+                (성공한 결과는 캐시에 저장되므로 재시도 시 실패분만 다시 요청)
+
+        Returns:
+            입력 순서와 같은 감성 분석 결과 리스트 (실패 기사는 신뢰도 0 중립)
+
+        Raises:
+            SentimentBatchError: raise_on_failure=True이고 실패 기사가 있는 경우
+        """
+        stats = PipelineStats(total=len(articles))
+        self.stats = stats
+
+        keys = [article_key(a.get("title", ""), a.get("content", "")) for a in articles]
+        results: Dict[str, SentimentResult] = {}
+
+        # 1. 캐시
+        for key, data in self.cache.get_many(list(dict.fromkeys(keys))).items():
+            results[key] = result_from_dict(data)
+        stats.cache_hits = sum(1 for key in keys if key in results)
+
+        # 2. 어휘 사전 중립 판정 + LLM 대상 수집 (동일 기사 1회)
+        pending: Dict[str, Dict[str, str]] = {}
+        for key, article in zip(keys, articles):
+            if key in results or key in pending:
+                continue
+            neutral = self.pre_classifier.classify(article.get("title", ""), article.get("content", ""))
+            if neutral is not None:
+                results[key] = neutral
+                stats.lexicon_neutral += 1
+            else:
+                pending[key] = article
+
+        # 3. 배치 LLM 요청
+        if pending:
+            llm_results = self._run_batches(list(pending.items()))
+            stats.llm_items = len(llm_results)
+            results.update(llm_results)
+            self.cache.set_many({key: result_to_dict(r) for key, r in llm_results.items()})
+
+        output = []
+        for key, article in zip(keys, articles):
+            result = results.get(key)
+            if result is None:
+                stats.failed += 1
+                result = fallback_result(article.get("title", ""))
+            output.append(result)
+
+        logger.debug(
+            f"감성 분석 {stats.total}건: 캐시 {stats.cache_hits}, 사전 중립 {stats.lexicon_neutral}, "
+            f"LLM {stats.llm_items}건/{stats.llm_requests}회, 실패 {stats.failed}"
+        )
+        if raise_on_failure and stats.failed:
+            raise SentimentBatchError(stats.failed, stats.total)
+        return output
+
+    def _run_batches(self, items: List[tuple]) -> Dict[str, SentimentResult]:
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        self.stats.llm_requests = len(batches)
+
+        results: Dict[str, SentimentResult] = {}
+        workers = min(self.max_in_flight, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sentiment") as executor:
+            for batch_results in executor.map(self._analyze_batch, batches):
+                results.update(batch_results)
+        return results
+
+    def _analyze_batch(self, batch: List[tuple]) -> Dict[str, SentimentResult]:
+        lines = [
+            json.dumps(
+                {
+                    "id": i,
+                    "title": article.get("title", ""),
+                    "content": (article.get("content") or "")[:MAX_CONTENT_CHARS],
+                },
+                ensure_ascii=False,
+            )
+            for i, (_, article) in enumerate(batch)
+        ]
+        prompt = BATCH_PROMPT.format(articles="\n".join(lines))
+
+        try:
+            parsed = parse_llm_json(self.client.generate_json(prompt, RESPONSE_SCHEMA))
+        except Exception as e:
+            logger.error(f"❌ 배치 감성 분석 실패 ({len(batch)}건): {e}")
+            return {}
+
+        if isinstance(parsed, dict):
+            parsed = parsed.get("results", [])
+
+        results: Dict[str, SentimentResult] = {}
+        for item in parsed if isinstance(parsed, list) else []:
+            try:
+                index = int(item["id"])
+                if 0 <= index < len(batch):
+                    results[batch[index][0]] = result_from_dict(item)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"배치 감성 결과 항목 무시: {item} ({e})")
+
+        if len(results) < len(batch):
+            logger.warning(f"배치 감성 분석 누락: {len(batch) - len(results)}/{len(batch)}건")
+        return results
+
+
+# 프로세스 공용 감성 캐시
+_sentiment_cache: Optional[SentimentCache] = None
+
+
+def get_sentiment_cache() -> SentimentCache:
+    """전역 SentimentCache 인스턴스 반환"""
+    global _sentiment_cache
+    if _sentiment_cache is None:
+        _sentiment_cache = SentimentCache()
+    return _sentiment_cache
@@ -1,7 +1,7 @@
 """
 Redis Cache Module
 
-캐시 클라이언트, 메트릭, 데코레이터 제공
+캐시 클라이언트, 2계층(L1/L2) 캐시, 메트릭, 데코레이터 제공
 """
 from .cache_client import (
     CacheClient,
@@ -11,6 +11,8 @@ from .cache_client import (
     get_cache_metrics,
     cached,
 )
+from .local_cache import CacheEntry, LocalCache, SingleFlight
+from .tiered_cache import TieredCache, get_tiered_cache, make_cache_key
 
 __all__ = [
     "CacheClient",
@@ -19,4 +21,10 @@ __all__ = [
     "get_cache",
     "get_cache_metrics",
     "cached",
+    "CacheEntry",
+    "LocalCache",
+    "SingleFlight",
+    "TieredCache",
+    "get_tiered_cache",
+    "make_cache_key",
 ]
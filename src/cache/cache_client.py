@@ -40,13 +40,15 @@ class CacheTTL:
 
 
 class CacheMetrics:
-    """캐시 적중률 모니터링"""
+    """캐시 적중률 모니터링 (전체 + 네임스페이스별)"""
 
     def __init__(self):
         self._hits = 0
+        self._l1_hits = 0
         self._misses = 0
         self._sets = 0
         self._deletes = 0
+        self._namespaces: dict[str, dict[str, int]] = {}
 
     @property
     def hit_rate(self) -> float:
@@ -60,6 +62,10 @@ class CacheMetrics:
     def hits(self) -> int:
         return self._hits
 
+    @property
+    def l1_hits(self) -> int:
+        return self._l1_hits
+
     @property
     def misses(self) -> int:
         return self._misses
@@ -72,13 +78,36 @@ class CacheMetrics:
     def deletes(self) -> int:
         return self._deletes
 
-    def record_hit(self) -> None:
-        """캐시 적중 기록"""
-        self._hits += 1
+    def _namespace(self, namespace: str) -> dict[str, int]:
+        """네임스페이스 카운터 조회/생성"""
+        counters = self._namespaces.get(namespace)
+        if counters is None:
+            counters = {"hits": 0, "l1_hits": 0, "misses": 0}
+            self._namespaces[namespace] = counters
+        return counters
+
+    def record_hit(self, namespace: Optional[str] = None, tier: str = "l2") -> None:
+        """
+        캐시 적중 기록
 
-    def record_miss(self) -> None:
+        Args:
+            namespace: 캐시 네임스페이스 (예: "price")
+            tier: 적중 계층 ("l1" 프로세스 메모리, "l2" Redis)
+        """
+        self._hits += 1
+        if tier == "l1":
+            self._l1_hits += 1
+        if namespace:
+            counters = self._namespace(namespace)
+            counters["hits"] += 1
+            if tier == "l1":
+                counters["l1_hits"] += 1
+
+    def record_miss(self, namespace: Optional[str] = None) -> None:
         """캐시 미스 기록"""
         self._misses += 1
+        if namespace:
+            self._namespace(namespace)["misses"] += 1
 
     def record_set(self) -> None:
         """캐시 저장 기록"""
@@ -91,19 +120,34 @@ class CacheMetrics:
     def reset(self) -> None:
         """통계 초기화"""
         self._hits = 0
+        self._l1_hits = 0
         self._misses = 0
         self._sets = 0
         self._deletes = 0
+        self._namespaces = {}
+
+    def namespace_stats(self) -> dict[str, dict[str, Any]]:
+        """네임스페이스별 적중/미스 통계"""
+        stats = {}
+        for namespace, counters in self._namespaces.items():
+            total = counters["hits"] + counters["misses"]
+            stats[namespace] = {
+                **counters,
+                "hit_rate": round(counters["hits"] / total * 100, 2) if total else 0.0,
+            }
+        return stats
 
     def to_dict(self) -> dict[str, Any]:
         """통계 dict 반환"""
         return {
             "hits": self._hits,
+            "l1_hits": self._l1_hits,
             "misses": self._misses,
             "sets": self._sets,
             "deletes": self._deletes,
             "hit_rate": self.hit_rate,
             "total_requests": self._hits + self._misses,
+            "namespaces": self.namespace_stats(),
         }
 
 
@@ -167,16 +211,40 @@ class CacheClient:
             await self._client.close()
             logger.info("Redis cache connection closed")
 
+    @property
+    def available(self) -> bool:
+        """Redis 연결 여부"""
+        return self._client is not None
+
+    @property
+    def client(self) -> Optional[Redis]:
+        """내부 Redis 클라이언트 (pub/sub, pipeline 용)"""
+        return self._client
+
     def _make_key(self, key: str) -> str:
         """키에 접두사 추가"""
         return f"{self._key_prefix}{key}"
 
-    async def get(self, key: str) -> Optional[Any]:
+    def _serialize(self, value: Any) -> str:
+        """값 직렬화"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return str(value)
+
+    def _deserialize(self, value: str) -> Any:
+        """값 역직렬화 (JSON이 아니면 원문 반환)"""
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+
+    async def get(self, key: str, namespace: Optional[str] = None) -> Optional[Any]:
         """
         캐시 조회
 
         Args:
             key: 캐시 키
+            namespace: 메트릭 집계용 네임스페이스
 
         Returns:
             캐시된 값 또는 None
@@ -189,20 +257,45 @@ class CacheClient:
             value = await self._client.get(full_key)
 
             if value is not None:
-                self._metrics.record_hit()
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
+                self._metrics.record_hit(namespace)
+                return self._deserialize(value)
             else:
-                self._metrics.record_miss()
+                self._metrics.record_miss(namespace)
                 return None
 
         except Exception as e:
             logger.warning(f"Cache get error: {e}")
-            self._metrics.record_miss()
+            self._metrics.record_miss(namespace)
             return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        일괄 캐시 조회 (MGET 1회)
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            {키: 값} 딕셔너리 (미스 키는 제외)
+        """
+        if not self._client or not keys:
+            return {}
+
+        try:
+            values = await self._client.mget([self._make_key(k) for k in keys])
+            result = {}
+            for key, value in zip(keys, values):
+                if value is None:
+                    self._metrics.record_miss()
+                    continue
+                self._metrics.record_hit()
+                result[key] = self._deserialize(value)
+            return result
+
+        except Exception as e:
+            logger.warning(f"Cache get_many error: {e}")
+            return {}
+
     async def set(
         self,
         key: str,
@@ -225,11 +318,7 @@ class CacheClient:
 
         try:
             full_key = self._make_key(key)
-
-            if isinstance(value, (dict, list)):
-                serialized = json.dumps(value)
-            else:
-                serialized = str(value)
+            serialized = self._serialize(value)
 
             if ttl:
                 await self._client.setex(full_key, ttl, serialized)
@@ -243,6 +332,43 @@ class CacheClient:
             logger.warning(f"Cache set error: {e}")
             return False
 
+    async def set_many(
+        self,
+        mapping: dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        일괄 캐시 저장 (pipeline 1회)
+
+        Args:
+            mapping: {키: 값} 딕셔너리
+            ttl: 만료 시간(초), None이면 영구
+
+        Returns:
+            성공 여부
+        """
+        if not self._client:
+            return False
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                full_key = self._make_key(key)
+                serialized = self._serialize(value)
+                if ttl:
+                    pipe.setex(full_key, ttl, serialized)
+                else:
+                    pipe.set(full_key, serialized)
+            await pipe.execute()
+
+            for _ in mapping:
+                self._metrics.record_set()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Cache set_many error: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         캐시 삭제
@@ -305,6 +431,103 @@ class CacheClient:
             logger.warning(f"Cache clear pattern error: {e}")
             return 0
 
+    def tag_key(self, tag: str) -> str:
+        """태그 역인덱스(Set) 키"""
+        return self._make_key(f"tag:{tag}")
+
+    async def add_tags(self, key: str, tags: list[str], ttl: int) -> bool:
+        """
+        키를 태그 역인덱스에 등록
+
+        태그 Set의 TTL은 소속 키 중 가장 긴 TTL을 따르도록 연장만 합니다.
+
+        Args:
+            key: 캐시 키
+            tags: 태그 목록
+            ttl: 키 TTL(초)
+
+        Returns:
+            성공 여부
+        """
+        if not self._client or not tags:
+            return False
+
+        try:
+            full_key = self._make_key(key)
+            pipe = self._client.pipeline(transaction=False)
+            for tag in tags:
+                tag_key = self.tag_key(tag)
+                pipe.sadd(tag_key, full_key)
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.warning(f"Cache add_tags error: {e}")
+            return False
+
+    async def delete_tags(self, tags: list[str]) -> int:
+        """
+        태그에 속한 모든 키와 태그 역인덱스 삭제
+
+        Args:
+            tags: 태그 목록
+
+        Returns:
+            삭제된 캐시 키 수
+        """
+        if not self._client or not tags:
+            return 0
+
+        try:
+            tag_keys = [self.tag_key(tag) for tag in tags]
+            pipe = self._client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+
+            keys = set()
+            for member_set in members:
+                keys.update(member_set or ())
+
+            if keys:
+                await self._client.delete(*keys)
+            await self._client.delete(*tag_keys)
+
+            for _ in keys:
+                self._metrics.record_delete()
+            return len(keys)
+
+        except Exception as e:
+            logger.warning(f"Cache delete_tags error: {e}")
+            return 0
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> bool:
+        """
+        Pub/Sub 메시지 발행
+
+        Args:
+            channel: 채널명 (접두사 자동 추가)
+            message: JSON 직렬화 가능한 메시지
+
+        Returns:
+            성공 여부
+        """
+        if not self._client:
+            return False
+
+        try:
+            await self._client.publish(
+                self._make_key(channel),
+                json.dumps(message, ensure_ascii=False),
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Cache publish error: {e}")
+            return False
+
     async def warm_up(
         self,
         data: dict[str, tuple[Any, int]],
@@ -354,47 +577,50 @@ async def get_cache() -> Optional[CacheClient]:
 def cached(
     ttl: int = CacheTTL.SIGNAL,
     key_prefix: str = "",
+    tags: Optional[list[str]] = None,
+    namespace: Optional[str] = None,
 ):
     """
     함수 결과 캐싱 데코레이터
 
+    L1(프로세스 메모리) → L2(Redis) 순으로 조회하고, 동시 미스는 한 번만
+    계산합니다. 값은 JSON 형식으로 보관되므로 datetime 등은 문자열로, 첫 호출을
+    포함해 항상 같은 형식의 새 객체로 반환됩니다. 자세한 동작은 TieredCache 참고.
+
     ## 사용 예시
     ```python
-    @cached(ttl=CacheTTL.PRICE, key_prefix="price:")
+    @cached(ttl=CacheTTL.PRICE, key_prefix="price:", tags=["prices"])
     async def get_stock_price(ticker: str) -> dict:
         # 비싼 계산...
         return {"price": 50000}
+
+    # 태그 단위 무효화 (모든 워커의 L1 포함)
+    await (await get_tiered_cache()).invalidate_tags(["prices"])
     ```
 
     Args:
         ttl: 캐시 만료 시간(초)
         key_prefix: 캐시 키 접두사
+        tags: 무효화 태그 목록
+        namespace: 메트릭 네임스페이스 (기본값: key_prefix 또는 함수명)
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        from src.cache.tiered_cache import get_tiered_cache, make_cache_key
+
+        metrics_namespace = namespace or key_prefix.rstrip(":") or func.__name__
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            # 캐시 키 생성
-            func_name = func.__name__
-            args_str = "_".join(str(a) for a in args)
-            kwargs_str = "_".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            cache_key = f"{key_prefix}{func_name}:{args_str}:{kwargs_str}"
-
-            # 캐시 시도
-            cache = await get_cache()
-            if cache:
-                cached_value = await cache.get(cache_key)
-                if cached_value is not None:
-                    return cached_value
-
-            # 캐시 미스 - 함수 실행
-            result = await func(*args, **kwargs)
-
-            # 결과 캐싱
-            if cache:
-                await cache.set(cache_key, result, ttl=ttl)
-
-            return result
+            cache_key = make_cache_key(f"{key_prefix}{func.__name__}", args, kwargs)
+            tiered = await get_tiered_cache()
+            return await tiered.get_or_compute(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                namespace=metrics_namespace,
+                tags=tags,
+            )
 
         return wrapper
 
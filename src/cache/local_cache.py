@@ -0,0 +1,198 @@
+"""
+In-Process Cache Primitives
+
+프로세스 내부 L1 캐시(LRU + TTL)와 동시 미스 병합(singleflight) 제공
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+
+@dataclass
+class CacheEntry:
+    """L1/L2 공통 캐시 엔트리"""
+    value: Any
+    # 절대 만료 시각 (epoch seconds)
+    expires_at: float
+    # 값 재계산에 걸린 시간 (probabilistic early refresh 용)
+    delta: float = 0.0
+    tags: Set[str] = field(default_factory=set)
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        """남은 TTL(초)"""
+        return self.expires_at - (now if now is not None else time.time())
+
+
+class LocalCache:
+    """
+    크기/TTL 제한 L1 캐시
+
+    OrderedDict 기반 LRU. 엔트리 수가 max_entries를 넘으면 가장 오래
+    사용되지 않은 엔트리부터 제거합니다. 태그 역인덱스를 유지하여
+    태그 단위 무효화를 O(태그에 속한 키 수)로 처리합니다.
+
+    ## 사용 예시
+    ```python
+    l1 = LocalCache(max_entries=1024, ttl=30)
+    l1.set("price:005930", CacheEntry(value={...}, expires_at=time.time() + 60))
+    entry = l1.get("price:005930")
+    l1.invalidate_tags(["prices"])
+    ```
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        """
+        Args:
+            max_entries: 최대 엔트리 수
+            ttl: L1 최대 보관 시간(초), L2 만료 시각보다 길게 보관하지 않음
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, CacheEntry]]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> list[str]:
+        """저장된 키 목록 (만료 여부 미확인)"""
+        return list(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        엔트리 조회 (만료 시 제거 후 None)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            CacheEntry 또는 None
+        """
+        item = self._entries.get(key)
+        if item is None:
+            return None
+
+        local_expiry, entry = item
+        now = time.time()
+        if now >= local_expiry or now >= entry.expires_at:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        엔트리 저장
+
+        Args:
+            key: 캐시 키
+            entry: 캐시 엔트리
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        local_expiry = min(time.time() + self.ttl, entry.expires_at)
+        self._entries[key] = (local_expiry, entry)
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def delete(self, key: str) -> bool:
+        """엔트리 삭제"""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        태그에 속한 모든 엔트리 삭제
+
+        Returns:
+            삭제된 엔트리 수
+        """
+        removed = 0
+        for tag in tags:
+            for key in list(self._tag_index.get(tag, ())):
+                if self.delete(key):
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._entries.clear()
+        self._tag_index.clear()
+
+    def _remove(self, key: str) -> None:
+        """엔트리와 태그 역인덱스 정리"""
+        _, entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tag_index[tag]
+
+
+class SingleFlight:
+    """
+    동일 키 동시 계산 병합
+
+    같은 키로 동시에 들어온 호출은 첫 호출의 결과(또는 예외)를 공유합니다.
+    캐시 미스가 몰릴 때 원본(DB/외부 API) 호출이 한 번만 일어나도록 합니다.
+
+    ## 사용 예시
+    ```python
+    flight = SingleFlight()
+    value = await flight.do("signals:latest", load_signals)
+    ```
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 계산이 진행 중인지 여부"""
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키 단위로 fn 실행을 병합
+
+        Args:
+            key: 병합 키
+            fn: 인자 없는 코루틴 함수
+
+        Returns:
+            fn 결과 (대기자들도 동일한 결과를 받음)
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            # shield: 대기자 취소가 진행 중인 계산을 취소하지 않도록
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # 대기자가 없으면 "exception never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
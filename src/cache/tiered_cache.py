@@ -0,0 +1,464 @@
+"""
+Tiered Cache
+
+L1(프로세스 메모리) + L2(Redis) 2계층 캐시
+
+- 동시 미스 병합(singleflight): 같은 키의 재계산은 프로세스당 1회
+- 확률적 조기 갱신(XFetch): 만료 직전 요청 일부가 백그라운드로 미리 재계산
+- 태그 무효화: Redis 태그 역인덱스 삭제 + Pub/Sub로 모든 워커의 L1 제거
+- 네임스페이스별 적중/미스 메트릭 (CacheMetrics)
+
+값은 L1/L2 모두 같은 JSON 텍스트로 보관하고 조회할 때마다 역직렬화하므로, 어느 계층에서
+적중하든 같은 타입(datetime 등은 문자열)의 새 객체가 반환됩니다.
+"""
+import asyncio
+import fnmatch
+import hashlib
+import json
+import logging
+import math
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from src.cache.cache_client import CacheClient, CacheMetrics, get_cache, get_cache_metrics
+from src.cache.local_cache import CacheEntry, LocalCache, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 무효화 브로드캐스트 채널 (CacheClient 키 접두사가 붙음)
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# L2에 저장되는 envelope 식별자 / 버전 (2: "v"가 JSON 텍스트)
+_ENVELOPE_MARKER = "__tc__"
+_ENVELOPE_VERSION = 2
+
+# Redis 재연결 / 무효화 채널 재구독 백오프 (초)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+
+
+def _encode(value: Any) -> str:
+    """캐시 보관 형식 (CacheClient 직렬화와 동일한 규칙)"""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _decode(payload: str) -> Any:
+    return json.loads(payload)
+
+
+def make_cache_key(prefix: str, args: tuple, kwargs: dict) -> str:
+    """
+    인자 기반 안정적 캐시 키 생성
+
+    인자를 정렬된 JSON으로 직렬화한 뒤 해시하므로 kwargs 순서나
+    긴 인자 문자열에 영향받지 않습니다.
+
+    Args:
+        prefix: 키 접두사 (예: "price:get_stock_price")
+        args: 위치 인자
+        kwargs: 키워드 인자
+
+    Returns:
+        "{prefix}:{digest}" 형태의 캐시 키
+    """
+    payload = json.dumps(
+        [list(args), kwargs],
+        sort_keys=True,
+        default=repr,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+class TieredCache:
+    """
+    L1 + L2 캐시 조합
+
+    ## 사용 예시
+    ```python
+    tiered = TieredCache(await get_cache())
+    await tiered.start()
+
+    signals = await tiered.get_or_compute(
+        "signals:latest",
+        load_latest_signals,
+        ttl=CacheTTL.SIGNAL,
+        namespace="signals",
+        tags=["signals"],
+    )
+
+    await tiered.invalidate_tags(["signals"])
+    ```
+    """
+
+    def __init__(
+        self,
+        l2: Optional[CacheClient] = None,
+        max_entries: int = 1024,
+        l1_ttl: float = 30.0,
+        beta: float = 1.0,
+        metrics: Optional[CacheMetrics] = None,
+    ):
+        """
+        Args:
+            l2: Redis 캐시 클라이언트 (None이면 L1 단독 동작)
+            max_entries: L1 최대 엔트리 수
+            l1_ttl: L1 최대 보관 시간(초)
+            beta: 조기 갱신 강도 (클수록 일찍 갱신, 0이면 비활성)
+            metrics: 메트릭 인스턴스 (기본값: 전역 CacheMetrics)
+        """
+        self._l2 = l2
+        self._l1 = LocalCache(max_entries=max_entries, ttl=l1_ttl)
+        self._flight = SingleFlight()
+        self._beta = beta
+        self._metrics = metrics or get_cache_metrics()
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+        self._pubsub = None
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._reconnect_delay = RECONNECT_MIN_DELAY
+        self._next_reconnect = 0.0
+
+    @property
+    def l1(self) -> LocalCache:
+        """L1 캐시"""
+        return self._l1
+
+    @property
+    def _l2_available(self) -> bool:
+        return self._l2 is not None and self._l2.available
+
+    # ==================== 조회/계산 ====================
+
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        namespace: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """
+        캐시 조회 후 미스 시 loader 실행
+
+        Args:
+            key: 캐시 키
+            loader: 값을 계산하는 인자 없는 코루틴 함수
+            ttl: 만료 시간(초)
+            namespace: 메트릭 네임스페이스
+            tags: 무효화 태그
+
+        Returns:
+            캐시된 값 또는 새로 계산된 값
+        """
+        tag_set = set(tags or ())
+        self._maybe_reconnect()
+
+        entry = self._l1.get(key)
+        if entry is not None:
+            self._metrics.record_hit(namespace, tier="l1")
+            self._maybe_refresh_early(key, entry, loader, ttl, tag_set)
+            return _decode(entry.value)
+
+        entry = await self._get_l2(key, namespace)
+        if entry is not None:
+            self._l1.set(key, entry)
+            self._maybe_refresh_early(key, entry, loader, ttl, tag_set)
+            return _decode(entry.value)
+
+        if not self._l2_available:
+            # L2가 있으면 CacheClient.get()에서 이미 미스가 기록됨
+            self._metrics.record_miss(namespace)
+
+        return await self._flight.do(
+            key, lambda: self._compute(key, loader, ttl, tag_set)
+        )
+
+    async def _compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: set[str],
+    ) -> Any:
+        """loader 실행 후 L1/L2 저장 (반환값도 캐시 적중 시와 같은 형식)"""
+        started = time.perf_counter()
+        value = await loader()
+        delta = time.perf_counter() - started
+
+        # None은 실패 결과일 수 있으므로 캐싱하지 않음
+        if value is None:
+            return value
+
+        payload = _encode(value)
+        entry = CacheEntry(
+            value=payload,
+            expires_at=time.time() + ttl,
+            delta=delta,
+            tags=tags,
+        )
+        self._l1.set(key, entry)
+        await self._set_l2(key, entry, ttl)
+        return _decode(payload)
+
+    def _should_refresh_early(self, entry: CacheEntry) -> bool:
+        """
+        XFetch 조기 갱신 판정
+
+        now - delta * beta * ln(U) >= expiry 이면 갱신합니다. 재계산이 오래
+        걸리는 값일수록, 만료가 가까울수록 갱신 확률이 높아집니다.
+        """
+        if self._beta <= 0 or entry.delta <= 0:
+            return False
+        rand = 1.0 - random.random()  # (0, 1]
+        return time.time() - entry.delta * self._beta * math.log(rand) >= entry.expires_at
+
+    def _maybe_refresh_early(
+        self,
+        key: str,
+        entry: CacheEntry,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: set[str],
+    ) -> None:
+        """조기 갱신 대상이면 백그라운드 재계산 (현재 요청은 기존 값 반환)"""
+        if self._flight.in_flight(key) or not self._should_refresh_early(entry):
+            return
+
+        task = asyncio.create_task(
+            self._flight.do(key, lambda: self._compute(key, loader, ttl, tags or entry.tags))
+        )
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._on_refresh_done)
+
+    def _on_refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Cache early refresh failed: {task.exception()}")
+
+    # ==================== L2 ====================
+
+    async def _get_l2(self, key: str, namespace: Optional[str]) -> Optional[CacheEntry]:
+        """L2 envelope 조회"""
+        if not self._l2_available:
+            return None
+
+        raw = await self._l2.get(key, namespace=namespace)
+        if not isinstance(raw, dict) or not raw.get(_ENVELOPE_MARKER):
+            return None
+
+        # 이전 버전 envelope는 값 자체가 저장되어 있으므로 보관 형식으로 변환
+        payload = raw.get("v")
+        if raw.get(_ENVELOPE_MARKER) != _ENVELOPE_VERSION or not isinstance(payload, str):
+            payload = _encode(payload)
+
+        return CacheEntry(
+            value=payload,
+            expires_at=float(raw.get("e", 0)),
+            delta=float(raw.get("d", 0)),
+            tags=set(raw.get("t", ())),
+        )
+
+    async def _set_l2(self, key: str, entry: CacheEntry, ttl: int) -> None:
+        """L2 envelope 저장 + 태그 등록"""
+        if not self._l2_available:
+            return
+
+        envelope = {
+            _ENVELOPE_MARKER: _ENVELOPE_VERSION,
+            "v": entry.value,
+            "e": entry.expires_at,
+            "d": round(entry.delta, 6),
+            "t": sorted(entry.tags),
+        }
+        await self._l2.set(key, envelope, ttl=ttl)
+        if entry.tags:
+            await self._l2.add_tags(key, sorted(entry.tags), ttl)
+
+    # ==================== 무효화 ====================
+
+    async def invalidate(self, *keys: str) -> int:
+        """
+        키 단위 무효화 (모든 워커의 L1 포함)
+
+        Returns:
+            삭제된 L1 엔트리 수
+        """
+        removed = sum(1 for key in keys if self._l1.delete(key))
+        if self._l2_available:
+            for key in keys:
+                await self._l2.delete(key)
+            await self._broadcast({"keys": list(keys)})
+        return removed
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        태그 단위 무효화 (모든 워커의 L1 포함)
+
+        Returns:
+            삭제된 키 수 (L2 기준, L2가 없으면 L1 기준)
+        """
+        tag_list = list(tags)
+        removed = self._l1.invalidate_tags(tag_list)
+        if self._l2_available:
+            removed = await self._l2.delete_tags(tag_list)
+            await self._broadcast({"tags": tag_list})
+        return removed
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """
+        패턴 무효화 (모든 워커의 L1 포함)
+
+        Returns:
+            삭제된 키 수 (L2 기준, L2가 없으면 L1 기준)
+        """
+        removed = self._clear_local_pattern(pattern)
+        if self._l2_available:
+            removed = await self._l2.clear_pattern(pattern)
+            await self._broadcast({"pattern": pattern})
+        return removed
+
+    def _clear_local_pattern(self, pattern: str) -> int:
+        if pattern == "*":
+            count = len(self._l1)
+            self._l1.clear()
+            return count
+        matched = [k for k in self._l1.keys() if fnmatch.fnmatchcase(k, pattern)]
+        for key in matched:
+            self._l1.delete(key)
+        return len(matched)
+
+    async def _broadcast(self, message: dict[str, Any]) -> None:
+        message["origin"] = self._instance_id
+        await self._l2.publish(INVALIDATION_CHANNEL, message)
+
+    def _apply_invalidation(self, message: dict[str, Any]) -> None:
+        """다른 워커에서 받은 무효화 메시지 적용"""
+        if message.get("origin") == self._instance_id:
+            return
+        for key in message.get("keys", ()):
+            self._l1.delete(key)
+        if message.get("tags"):
+            self._l1.invalidate_tags(message["tags"])
+        if message.get("pattern"):
+            self._clear_local_pattern(message["pattern"])
+
+    # ==================== 수명 주기 ====================
+
+    async def start(self) -> None:
+        """무효화 채널 구독 시작 (L2 없으면 무시)"""
+        if self._listener_task is not None or not self._l2_available:
+            return
+
+        self._listener_task = asyncio.create_task(self._listen())
+
+    def _maybe_reconnect(self) -> None:
+        """L2가 끊겨 있으면 백오프 간격으로 백그라운드 재연결"""
+        if self._l2 is None or self._l2.available or self._reconnect_task is not None:
+            return
+        if time.monotonic() < self._next_reconnect:
+            return
+
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        try:
+            await self._l2.initialize()
+            if self._l2.available:
+                logger.info("Tiered cache L2 reconnected")
+                self._reconnect_delay = RECONNECT_MIN_DELAY
+                # 끊긴 동안 놓친 무효화가 있을 수 있으므로 L1 비움
+                self._l1.clear()
+                await self.start()
+                return
+        except Exception as e:
+            logger.warning(f"Tiered cache L2 reconnect failed: {e}")
+        finally:
+            self._reconnect_task = None
+
+        self._next_reconnect = time.monotonic() + self._reconnect_delay
+        self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _subscribe(self) -> None:
+        self._pubsub = self._l2.client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self._l2._make_key(INVALIDATION_CHANNEL))
+
+    async def _close_pubsub(self) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+
+    async def _listen(self) -> None:
+        """무효화 메시지 수신 (연결 오류 시 백오프 후 재구독)"""
+        delay = RECONNECT_MIN_DELAY
+        resubscribed = False
+        while True:
+            try:
+                if not self._l2_available:
+                    raise ConnectionError("L2 unavailable")
+                await self._subscribe()
+                if resubscribed:
+                    # 구독이 끊긴 동안 놓친 무효화가 있을 수 있으므로 L1 비움
+                    self._l1.clear()
+                delay = RECONNECT_MIN_DELAY
+
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self._apply_invalidation(json.loads(message["data"]))
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Invalid cache invalidation message: {e}")
+                raise ConnectionError("subscription closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e} (retry in {delay:.0f}s)")
+                await self._close_pubsub()
+                resubscribed = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def stop(self) -> None:
+        """구독 및 백그라운드 갱신 종료"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        await self._close_pubsub()
+
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        for task in list(self._refresh_tasks):
+            task.cancel()
+
+
+# 전역 TieredCache 인스턴스
+_tiered_cache: Optional[TieredCache] = None
+
+
+async def get_tiered_cache() -> TieredCache:
+    """
+    전역 TieredCache 반환
+
+    Redis 연결 실패 시에도 L1 단독으로 동작하며, 이후 조회 시 백오프 간격으로 재연결합니다.
+    """
+    global _tiered_cache
+    if _tiered_cache is None:
+        _tiered_cache = TieredCache(await get_cache())
+        await _tiered_cache.start()
+    return _tiered_cache
@@ -0,0 +1,363 @@
+"""
+Article Index
+뉴스 피드 기사 → 종목 역색인
+
+피드를 폴링 주기마다 한 번만 수집하고, stocks 테이블의 모든 종목명/별칭을
+다중 패턴 오토마톤(Aho–Corasick)으로 한 번에 매칭해 ticker → 기사 목록을 만듭니다.
+종목별 조회는 피드 재다운로드/전체 스캔 없이 매칭된 기사만 읽습니다.
+
+Usage:
+    index = get_article_index()
+
+    # TTL이 지난 경우에만 피드 수집 후 재색인
+    index.refresh("yonhap", lambda: collector.fetch_all_news(days=30, max_articles=100))
+
+    articles = index.lookup("005930", source="yonhap", days=7, max_articles=10)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 피드 색인 유효 시간 (폴링 주기, 초)
+ARTICLE_INDEX_TTL = 300
+
+# 종목명 사전 유효 시간 (초)
+ALIAS_REFRESH_TTL = 6 * 60 * 60
+
+# 종목명 사전 로드 실패/빈 결과 시 재시도 간격 (초)
+ALIAS_RETRY_TTL = 60
+
+# 매칭 대상 최소 별칭 길이 (한 글자 별칭은 오탐이 많음)
+MIN_ALIAS_LENGTH = 2
+
+# 기본 별칭 (DB에 없는 약칭/영문명/ETF 상품명)
+DEFAULT_ALIASES: Dict[str, List[str]] = {
+    "005930": ["삼성전자", "TIGER 삼성", "KODEX 삼성"],
+    "000660": ["SK하이닉스", "하이닉스", "TIGER 하이닉스"],
+    "035420": ["NAVER", "네이버", "TIGER 네이버"],
+    "035720": ["카카오", "TIGER 카카오"],
+    "005380": ["현대차", "현대자동차"],
+}
+
+
+def _normalize(text: str) -> str:
+    """영문만 대문자로 변환 (문자 위치 보존)"""
+    return "".join(c.upper() if c.isascii() else c for c in text)
+
+
+def _is_ascii_word(c: str) -> bool:
+    return c.isascii() and c.isalnum()
+
+
+class AhoCorasickMatcher:
+    """
+    다중 패턴 문자열 매처 (Aho–Corasick)
+
+    패턴 수와 무관하게 텍스트 길이에 비례하는 시간으로 모든 출현 위치를 찾습니다.
+    겹치는 매칭은 가장 왼쪽·가장 긴 패턴만 남기므로 "LG전자"가 "LG"로 중복 태깅되지 않습니다.
+    """
+
+    def __init__(self, patterns: Dict[str, Iterable[str]]):
+        """
+        Args:
+            patterns: {패턴: 연결할 키(ticker) 목록}
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Tuple[str, ...]]]] = [[]]
+
+        for pattern, keys in patterns.items():
+            self._add(_normalize(pattern), tuple(keys))
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def _add(self, pattern: str, keys: Tuple[str, ...]) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append((len(pattern), keys))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _iter_matches(self, text: str):
+        node = 0
+        for end, char in enumerate(text, start=1):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length, keys in self._output[node]:
+                yield end - length, end, keys
+
+    def find(self, text: str) -> Set[str]:
+        """
+        텍스트에 등장한 패턴의 키 집합
+
+        영문 패턴은 앞뒤가 영문/숫자가 아닐 때만 인정합니다 ("SK" ⊄ "SKY").
+        """
+        if not text:
+            return set()
+
+        normalized = _normalize(text)
+        candidates = []
+        for start, end, keys in self._iter_matches(normalized):
+            if _is_ascii_word(normalized[start]) and start > 0 and _is_ascii_word(normalized[start - 1]):
+                continue
+            if _is_ascii_word(normalized[end - 1]) and end < len(normalized) and _is_ascii_word(normalized[end]):
+                continue
+            candidates.append((start, end, keys))
+
+        # leftmost-longest, 겹치지 않는 매칭만 채택
+        candidates.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        found: Set[str] = set()
+        covered = 0
+        for start, end, keys in candidates:
+            if start < covered:
+                continue
+            found.update(keys)
+            covered = end
+        return found
+
+
+def build_stock_aliases(names: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """
+    (ticker, 종목명) 목록 → {별칭: [ticker]} 사전
+
+    종목명 외에 "(주)" 제거, 공백 제거 형태와 DEFAULT_ALIASES를 함께 등록합니다.
+    """
+    aliases: Dict[str, Set[str]] = {}
+
+    def add(alias: str, ticker: str) -> None:
+        alias = alias.strip()
+        if len(alias) >= MIN_ALIAS_LENGTH:
+            aliases.setdefault(alias, set()).add(ticker)
+
+    for ticker, name in names:
+        add(name, ticker)
+        stripped = name.replace("(주)", "").replace("㈜", "")
+        add(stripped, ticker)
+        add(stripped.replace(" ", ""), ticker)
+
+    for ticker, extra in DEFAULT_ALIASES.items():
+        for alias in extra:
+            add(alias, ticker)
+
+    return {alias: sorted(tickers) for alias, tickers in aliases.items()}
+
+
+def load_stock_aliases() -> Dict[str, List[str]]:
+    """
+    stocks 테이블 기반 {별칭: [ticker]} 사전
+
+    stocks 테이블이 비어 있으면 빈 사전을 반환하고, DB 조회 실패는 예외로 전파합니다.
+    (기본 별칭 대체 및 재시도는 ArticleIndex가 담당)
+    """
+    from sqlalchemy import select
+    from src.database.session import get_db_session_sync
+    from src.database.models import Stock
+
+    with get_db_session_sync() as db:
+        names = [
+            (ticker, name)
+            for ticker, name in db.execute(select(Stock.ticker, Stock.name)).all()
+            if name
+        ]
+
+    if not names:
+        return {}
+    return build_stock_aliases(names)
+
+
+def _published_at(article: Dict[str, Any]) -> Optional[datetime]:
+    value = article.get("published_at")
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return value if isinstance(value, datetime) else None
+
+
+class ArticleIndex:
+    """
+    소스별 ticker → 기사 역색인 (프로세스 내 메모리)
+
+    색인 갱신은 잠금으로 직렬화되어 동시에 여러 종목을 조회해도 피드는 한 번만 수집됩니다.
+    """
+
+    def __init__(
+        self,
+        alias_loader: Callable[[], Dict[str, List[str]]] = load_stock_aliases,
+        ttl: float = ARTICLE_INDEX_TTL,
+        alias_ttl: float = ALIAS_REFRESH_TTL,
+        alias_retry_ttl: float = ALIAS_RETRY_TTL,
+    ):
+        self._alias_loader = alias_loader
+        self.ttl = ttl
+        self.alias_ttl = alias_ttl
+        self.alias_retry_ttl = alias_retry_ttl
+
+        self._matcher: Optional[AhoCorasickMatcher] = None
+        self._matcher_expires_at = 0.0
+
+        # source -> ticker -> [(published_at, article)] (최신순)
+        self._postings: Dict[str, Dict[str, List[Tuple[Optional[datetime], Dict[str, Any]]]]] = {}
+        self._indexed_at: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def matcher(self) -> AhoCorasickMatcher:
+        """
+        종목명 매처 (alias_ttl 경과 시 재구성)
+
+        사전 로드가 실패하거나 비어 있으면 기본 별칭으로 매처를 만들고
+        alias_retry_ttl 뒤에 다시 로드합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._matcher is None or now >= self._matcher_expires_at:
+                try:
+                    aliases = self._alias_loader()
+                except Exception as e:
+                    logger.warning(f"종목명 사전 로드 실패, 기본 별칭 사용: {e}")
+                    aliases = {}
+
+                if aliases:
+                    ttl = self.alias_ttl
+                else:
+                    aliases = build_stock_aliases([])
+                    ttl = self.alias_retry_ttl
+
+                self._matcher = AhoCorasickMatcher(aliases)
+                self._matcher_expires_at = now + ttl
+                logger.debug(f"종목명 매처 구성: 별칭 {len(aliases)}개")
+            return self._matcher
+
+    def is_stale(self, source: str) -> bool:
+        """소스 색인이 없거나 TTL이 지났는지 여부"""
+        indexed_at = self._indexed_at.get(source)
+        return indexed_at is None or time.monotonic() - indexed_at > self.ttl
+
+    def index_articles(self, source: str, articles: Iterable[Dict[str, Any]]) -> int:
+        """
+        소스 색인 교체
+
+        Args:
+            source: 피드 구분 (yonhap, etf, ...)
+            articles: 기사 목록 (title, content, published_at)
+
+        Returns:
+            종목이 하나 이상 매칭된 기사 수
+        """
+        matcher = self.matcher
+        postings: Dict[str, List[Tuple[Optional[datetime], Dict[str, Any]]]] = {}
+        matched = 0
+
+        for article in articles:
+            text = f"{article.get('title', '')}\n{article.get('content', '')}"
+            tickers = matcher.find(text)
+            if not tickers:
+                continue
+            matched += 1
+            entry = (_published_at(article), article)
+            for ticker in tickers:
+                postings.setdefault(ticker, []).append(entry)
+
+        for entries in postings.values():
+            entries.sort(key=lambda e: e[0] or datetime.min, reverse=True)
+
+        with self._lock:
+            self._postings[source] = postings
+            self._indexed_at[source] = time.monotonic()
+
+        logger.debug(f"[{source}] 기사 색인: {matched}건, 종목 {len(postings)}개")
+        return matched
+
+    def refresh(self, source: str, fetch: Callable[[], List[Dict[str, Any]]]) -> bool:
+        """
+        TTL이 지난 경우에만 fetch()로 피드를 수집해 색인
+
+        Returns:
+            실제로 수집했는지 여부
+        """
+        if not self.is_stale(source):
+            return False
+
+        with self._lock:
+            # 잠금 대기 중 다른 호출자가 갱신했을 수 있음
+            if not self.is_stale(source):
+                return False
+            self.index_articles(source, fetch())
+            return True
+
+    def lookup(
+        self,
+        ticker: str,
+        source: str,
+        days: int = 7,
+        max_articles: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        종목 관련 기사 조회 (최신순)
+
+        Args:
+            ticker: 종목 코드
+            source: 피드 구분
+            days: 허용 날짜 범위
+            max_articles: 최대 기사 수
+        """
+        entries = self._postings.get(source, {}).get(ticker, [])
+        now = datetime.now()
+
+        result = []
+        for published_at, article in entries:
+            if published_at is not None and (now - published_at).days > days:
+                # 최신순 정렬이므로 이후 기사는 모두 범위 밖
+                break
+            result.append(article)
+            if len(result) >= max_articles:
+                break
+        return result
+
+    def clear(self) -> None:
+        """색인 초기화 (테스트용)"""
+        with self._lock:
+            self._postings.clear()
+            self._indexed_at.clear()
+            self._matcher = None
+            self._matcher_expires_at = 0.0
+
+
+# 전역 기사 색인 인스턴스
+article_index = ArticleIndex()
+
+
+def get_article_index() -> ArticleIndex:
+    """전역 ArticleIndex 인스턴스 반환"""
+    return article_index
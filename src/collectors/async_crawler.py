@@ -0,0 +1,440 @@
+"""
+Async News Crawler
+비동기 뉴스 크롤러
+
+- 호스트별 동시 요청 수 제한 + 요청 간격(politeness delay) 준수
+- ETag / Last-Modified 기반 조건부 GET (304 응답 시 캐시 본문 재사용)
+- URL / 본문 해시 중복 제거: 같은 기사는 한 번만 요청·파싱
+- lxml 기반 기사 추출 (BeautifulSoup html.parser 대비 빠름)
+
+Usage:
+    async with AsyncNewsCrawler() as crawler:
+        listing = await crawler.fetch(listing_url, revalidate=True)
+        articles = await crawler.fetch_articles(article_urls)
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+import lxml.html
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 동시 요청 수
+PER_HOST_CONCURRENCY = 2
+
+# 같은 호스트 요청 시작 간 최소 간격 (초)
+POLITENESS_DELAY = 0.5
+
+# 중복 제거 저장소 최대 항목 수 (LRU)
+DEDUP_MAX_ENTRIES = 10000
+
+# 본문 최대 길이
+MAX_CONTENT_LENGTH = 5000
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+# 기사 필드별 XPath (우선순위 순) - NewsCollector._fetch_article_details 선택자와 동일
+_TITLE_XPATHS = (
+    "//h2[@id='title_area']",
+    "//h3[contains(concat(' ', normalize-space(@class), ' '), ' title ')]",
+    "//meta[@property='og:title']",
+)
+_SOURCE_XPATHS = (
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' media_end_head_top_link_text ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' press_name ')]",
+    "//meta[@property='og:article:author']",
+)
+_DATE_XPATHS = (
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' media_end_head_info_datestamp_bunch ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' date ')]",
+    "//meta[@property='article:published_time']",
+)
+_CONTENT_XPATHS = (
+    "//*[@id='newsct_article']",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article_body ')]",
+    "//div[@id='articleBody']",
+)
+_NOISE_XPATH = (
+    ".//script | .//style"
+    " | .//*[contains(concat(' ', normalize-space(@class), ' '), ' ad ')]"
+    " | .//*[contains(concat(' ', normalize-space(@class), ' '), ' caption ')]"
+)
+
+_NEWS_DATE_FORMATS = (
+    "%Y.%m.%d. %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y%m%d%H%M",
+)
+
+
+def parse_news_date(date_str: str) -> Optional[datetime]:
+    """
+    다양한 뉴스 날짜 포맷 파싱
+
+    Args:
+        date_str: 날짜 문자열 (예: "2024.01.30. 10:00")
+
+    Returns:
+        datetime 객체 또는 None
+    """
+    try:
+        date_str = date_str.strip()
+        for fmt in _NEWS_DATE_FORMATS:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+
+        # "2024.01.30." 형식 처리
+        if re.match(r"\d{4}\.\d{2}\.\d{2}\.", date_str):
+            date_str = date_str.rstrip(".") + " 00:00"
+            return datetime.strptime(date_str, "%Y.%m.%d %H:%M")
+
+    except Exception as e:
+        logger.debug(f"날짜 파싱 실패 ({date_str}): {e}")
+
+    return None
+
+
+def _first(tree, xpaths: Tuple[str, ...]):
+    for xpath in xpaths:
+        found = tree.xpath(xpath)
+        if found:
+            return found[0]
+    return None
+
+
+def _element_text(elem, separator: str = "") -> str:
+    if elem is None:
+        return ""
+    if elem.tag == "meta":
+        return (elem.get("content") or "").strip()
+    parts = (text.strip() for text in elem.itertext())
+    return separator.join(part for part in parts if part)
+
+
+def extract_article(html: str, url: str) -> Optional[Dict[str, Any]]:
+    """
+    기사 HTML에서 제목/언론사/날짜/본문 추출
+
+    Args:
+        html: 기사 HTML
+        url: 기사 URL
+
+    Returns:
+        기사 정보 딕셔너리 또는 None (파싱 불가)
+    """
+    if not html or not html.strip():
+        return None
+
+    try:
+        tree = lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError) as e:
+        logger.debug(f"기사 HTML 파싱 실패 ({url}): {e}")
+        return None
+
+    title = _element_text(_first(tree, _TITLE_XPATHS))
+    source = _element_text(_first(tree, _SOURCE_XPATHS))
+
+    published_at = None
+    date_elem = _first(tree, _DATE_XPATHS)
+    if date_elem is not None:
+        date_text = _element_text(date_elem)
+        if date_elem.tag == "meta":
+            try:
+                published_at = datetime.fromisoformat(date_text.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+        else:
+            published_at = parse_news_date(date_text)
+
+    if published_at is None:
+        published_at = datetime.now()
+    elif published_at.tzinfo is not None:
+        published_at = published_at.replace(tzinfo=None)
+
+    content = ""
+    content_elem = _first(tree, _CONTENT_XPATHS)
+    if content_elem is not None:
+        for noise in content_elem.xpath(_NOISE_XPATH):
+            noise.drop_tree()
+        content = _element_text(content_elem, separator="\n")[:MAX_CONTENT_LENGTH]
+
+    return {
+        "title": title,
+        "url": url,
+        "source": source,
+        "published_at": published_at.isoformat(),
+        "content": content,
+    }
+
+
+def content_hash(article: Dict[str, Any]) -> str:
+    """제목 + 본문 기준 해시 (공백 차이 무시)"""
+    text = f"{article.get('title', '')}\n{article.get('content', '')}"
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CrawlResult:
+    """단일 URL 요청 결과"""
+    url: str
+    status: int
+    text: Optional[str] = None
+    not_modified: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.text is not None
+
+
+class DedupStore:
+    """
+    크롤링 중복 제거 저장소 (프로세스 내 LRU)
+
+    - URL → 파싱된 기사 (재요청/재파싱 방지)
+    - 본문 해시 → 최초 URL (다른 URL로 배포된 동일 기사 제거)
+    - URL → (ETag, Last-Modified, 본문) 조건부 GET 검증자
+    """
+
+    def __init__(self, max_entries: int = DEDUP_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._articles: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._hashes: "OrderedDict[str, str]" = OrderedDict()
+        self._validators: "OrderedDict[str, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+
+    def _put(self, store: OrderedDict, key: str, value: Any) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def has_url(self, url: str) -> bool:
+        return url in self._articles
+
+    def get_article(self, url: str) -> Optional[Dict[str, Any]]:
+        return self._articles.get(url)
+
+    def add_article(self, url: str, article: Optional[Dict[str, Any]]) -> bool:
+        """
+        파싱 결과 등록
+
+        Returns:
+            새 기사이면 True, 본문 해시가 이미 있으면(중복 배포) False
+        """
+        if article is None:
+            self._put(self._articles, url, None)
+            return False
+
+        digest = content_hash(article)
+        first_url = self._hashes.get(digest)
+        if first_url is not None and first_url != url:
+            # 동일 본문은 최초 URL 기사로만 노출
+            self._put(self._articles, url, None)
+            return False
+
+        self._put(self._hashes, digest, url)
+        self._put(self._articles, url, article)
+        return True
+
+    def get_validators(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], str]]:
+        return self._validators.get(url)
+
+    def set_validators(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str) -> None:
+        if etag or last_modified:
+            self._put(self._validators, url, (etag, last_modified, body))
+
+    def clear(self) -> None:
+        self._articles.clear()
+        self._hashes.clear()
+        self._validators.clear()
+
+
+class _HostSlot:
+    """호스트별 동시성 제한 + 요청 간격"""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.delay = delay
+        self._lock = asyncio.Lock()
+        self._last_start = 0.0
+
+    async def wait_turn(self) -> None:
+        async with self._lock:
+            wait = self._last_start + self.delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start = time.monotonic()
+
+
+class AsyncNewsCrawler:
+    """
+    비동기 뉴스 크롤러
+
+    httpx.AsyncClient 하나로 여러 호스트를 동시에 요청하되,
+    호스트마다 PER_HOST_CONCURRENCY / POLITENESS_DELAY를 지킵니다.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        dedup: Optional[DedupStore] = None,
+        per_host_concurrency: int = PER_HOST_CONCURRENCY,
+        politeness_delay: float = POLITENESS_DELAY,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            client: 공유 HTTP 클라이언트 (None이면 컨텍스트 진입 시 생성)
+            dedup: 중복 제거 저장소 (None이면 인스턴스 전용 저장소)
+            per_host_concurrency: 호스트별 동시 요청 수
+            politeness_delay: 같은 호스트 요청 간 최소 간격 (초)
+            timeout: 요청 타임아웃 (초)
+        """
+        self._client = client
+        self._owns_client = client is None
+        self.dedup = dedup or DedupStore()
+        self.per_host_concurrency = per_host_concurrency
+        self.politeness_delay = politeness_delay
+        self.timeout = timeout
+        self._hosts: Dict[str, _HostSlot] = {}
+
+    async def __aenter__(self) -> "AsyncNewsCrawler":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self._owns_client = True
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """직접 생성한 클라이언트 종료"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    def _slot(self, url: str) -> _HostSlot:
+        host = urlparse(url).netloc
+        slot = self._hosts.get(host)
+        if slot is None:
+            slot = _HostSlot(self.per_host_concurrency, self.politeness_delay)
+            self._hosts[host] = slot
+        return slot
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        revalidate: bool = False,
+    ) -> CrawlResult:
+        """
+        단일 URL 요청
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더 (Referer 등)
+            revalidate: ETag/Last-Modified 조건부 GET 사용 여부
+                (304 응답이면 이전 본문을 not_modified=True로 반환)
+
+        Returns:
+            CrawlResult
+        """
+        if self._client is None:
+            await self.__aenter__()
+
+        request_headers = dict(headers or {})
+        cached = self.dedup.get_validators(url) if revalidate else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        slot = self._slot(url)
+        async with slot.semaphore:
+            await slot.wait_turn()
+            try:
+                response = await self._client.get(url, headers=request_headers)
+            except httpx.HTTPError as e:
+                logger.debug(f"요청 실패 ({url}): {e}")
+                return CrawlResult(url=url, status=0, error=str(e))
+
+        if response.status_code == 304 and cached:
+            return CrawlResult(url=url, status=304, text=cached[2], not_modified=True)
+
+        if response.status_code >= 400:
+            return CrawlResult(url=url, status=response.status_code, error=f"HTTP {response.status_code}")
+
+        text = response.text
+        if revalidate:
+            self.dedup.set_validators(
+                url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                text,
+            )
+        return CrawlResult(url=url, status=response.status_code, text=text)
+
+    async def _fetch_article(self, url: str) -> None:
+        result = await self.fetch(url)
+        if not result.ok:
+            # 일시 오류는 다음 호출에서 재시도하도록 등록하지 않음
+            return
+        self.dedup.add_article(url, extract_article(result.text, url))
+
+    async def fetch_articles(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        기사 URL 목록을 동시에 수집·파싱
+
+        이미 파싱한 URL은 요청하지 않고 저장된 결과를 사용하며,
+        본문 해시가 같은 기사는 하나만 반환합니다.
+
+        Args:
+            urls: 기사 URL 리스트
+
+        Returns:
+            기사 정보 딕셔너리 리스트 (입력 순서 유지)
+        """
+        ordered = list(dict.fromkeys(urls))
+        pending = [url for url in ordered if not self.dedup.has_url(url)]
+
+        if pending:
+            await asyncio.gather(*(self._fetch_article(url) for url in pending))
+            logger.debug(f"기사 {len(pending)}건 요청 (캐시 {len(ordered) - len(pending)}건)")
+
+        return [
+            article
+            for article in (self.dedup.get_article(url) for url in ordered)
+            if article is not None
+        ]
+
+
+# 프로세스 공용 중복 제거 저장소
+dedup_store = DedupStore()
+
+
+def get_dedup_store() -> DedupStore:
+    """전역 DedupStore 인스턴스 반환"""
+    return dedup_store
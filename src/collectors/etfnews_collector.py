@@ -11,10 +11,15 @@ from datetime import datetime
 import requests
 from bs4 import BeautifulSoup
 
+from src.collectors.article_index import ArticleIndex, get_article_index
 from src.collectors.base_collector import BaseNewsCollector
 
 logger = logging.getLogger(__name__)
 
+# 색인용 피드 수집 범위
+INDEX_WINDOW_DAYS = 30
+INDEX_MAX_ARTICLES = 100
+
 
 class ETFNewsCollector(BaseNewsCollector):
     """
@@ -36,6 +41,17 @@ class ETFNewsCollector(BaseNewsCollector):
         "https://www.fnnews.com/news/etf",
     ]
 
+    # 공유 기사 색인 소스 키
+    INDEX_SOURCE = "etf"
+
+    def __init__(self, article_index: Optional[ArticleIndex] = None):
+        """
+        Args:
+            article_index: 종목별 기사 색인 (None이면 전역 색인 사용)
+        """
+        super().__init__()
+        self.article_index = article_index or get_article_index()
+
     def fetch_news(
         self,
         days: int = 7,
@@ -300,6 +316,9 @@ class ETFNewsCollector(BaseNewsCollector):
         """
         종목 관련 ETF 뉴스 검색
 
+        ETF 뉴스는 공유 기사 색인 TTL마다 한 번만 수집하고,
+        종목명/ETF 상품명 별칭으로 매칭된 기사만 조회합니다.
+
         Args:
             ticker: 종목 코드
             days: 수집할 날짜 범위
@@ -308,27 +327,10 @@ class ETFNewsCollector(BaseNewsCollector):
         Returns:
             기사 정보 리스트
         """
-        all_articles = self.fetch_etf_news(days=days, max_articles=50)
-
-        # 종목 관련 ETF 뉴스 필터링
-        ticker_names = {
-            "005930": ["삼성전자", "TIGER 삼성", "KODEX 삼성"],
-            "000660": ["SK하이닉스", "TIGER 하이닉스"],
-            "035420": ["NAVER", "TIGER 네이버"],
-            "035720": ["카카오", "TIGER 카카오"],
-        }
-
-        search_keywords = ticker_names.get(ticker, [ticker])
-
-        filtered = []
-        for article in all_articles:
-            title = article.get("title", "")
-
-            # 검색 키워드 포함 확인
-            if any(keyword in title for keyword in search_keywords):
-                filtered.append(article)
-
-                if len(filtered) >= max_articles:
-                    break
+        index = self.article_index
+        index.refresh(
+            self.INDEX_SOURCE,
+            lambda: self.fetch_etf_news(days=INDEX_WINDOW_DAYS, max_articles=INDEX_MAX_ARTICLES),
+        )
 
-        return filtered
+        return index.lookup(ticker, self.INDEX_SOURCE, days=days, max_articles=max_articles)
@@ -13,6 +13,13 @@ import time
 import requests
 from bs4 import BeautifulSoup
 
+from src.collectors.async_crawler import (
+    AsyncNewsCrawler,
+    extract_article,
+    get_dedup_store,
+    parse_news_date,
+)
+
 logger = logging.getLogger(__name__)
 
 # ELW 티커 타입 체크를 위한 지연 import
@@ -118,7 +125,95 @@ class NewsCollector:
             additional = self._fetch_yonhap_news(ticker, days, max_articles - len(articles))
             articles.extend(additional)
 
-        # 날짜순 정렬 및 중복 제거
+        unique_articles = self._dedupe_articles(articles, max_articles)
+
+        logger.info(f"✅ {ticker} 뉴스 {len(unique_articles)}건 수집 완료")
+        return unique_articles
+
+    async def fetch_stock_news_async(
+        self,
+        ticker: str,
+        days: int = 7,
+        max_articles: int = 50,
+        crawler: Optional[AsyncNewsCrawler] = None,
+    ) -> List[NewsArticle]:
+        """
+        종목 관련 뉴스 비동기 수집
+
+        AsyncNewsCrawler로 목록/검색 페이지는 조건부 GET, 기사 본문은 호스트별
+        동시 요청으로 수집합니다. 이미 파싱한 URL·본문은 전역 DedupStore에서 재사용합니다.
+
+        Args:
+            ticker: 종목코드
+            days: 수집할 날짜 범위 (기본 7일)
+            max_articles: 최대 기사 수 (기본 50건)
+            crawler: 공유 크롤러 (None이면 호출 동안만 생성)
+
+        Returns:
+            뉴스 기사 리스트
+        """
+        owns_crawler = crawler is None
+        if crawler is None:
+            crawler = AsyncNewsCrawler(dedup=get_dedup_store())
+
+        try:
+            if _get_ticker_parser().is_elw(ticker):
+                articles = await self._fetch_elw_news_async(crawler, ticker, days, max_articles)
+            else:
+                articles = await self._fetch_naver_news_async(crawler, ticker, days, max_articles)
+        finally:
+            if owns_crawler:
+                await crawler.close()
+
+        unique_articles = self._dedupe_articles(articles, max_articles)
+        logger.info(f"✅ {ticker} 뉴스 {len(unique_articles)}건 비동기 수집 완료")
+        return unique_articles
+
+    async def _fetch_naver_news_async(
+        self,
+        crawler: AsyncNewsCrawler,
+        ticker: str,
+        days: int,
+        max_articles: int,
+    ) -> List[NewsArticle]:
+        """네이버 금융 종목 뉴스 목록 비동기 수집 (조건부 GET)"""
+        url = f"https://finance.naver.com/item/news_news.naver?code={ticker}&page=1&clusterId="
+        result = await crawler.fetch(
+            url,
+            headers={"Referer": f"https://finance.naver.com/item/news.naver?code={ticker}"},
+            revalidate=True,
+        )
+        if not result.ok:
+            logger.error(f"네이버 뉴스 수집 실패: {result.error}")
+            return []
+
+        return self._parse_naver_listing(result.text, ticker, days, max_articles)
+
+    async def _fetch_elw_news_async(
+        self,
+        crawler: AsyncNewsCrawler,
+        ticker: str,
+        days: int,
+        max_articles: int,
+    ) -> List[NewsArticle]:
+        """ELW 뉴스 비동기 수집 (검색 결과 → 기사 본문 동시 수집)"""
+        result = await crawler.fetch(self._naver_search_url(ticker), revalidate=True)
+        if not result.ok:
+            logger.error(f"ELW 뉴스 수집 실패: {result.error}")
+            return []
+
+        urls = self._parse_search_result_urls(result.text, max_articles)
+        details = await crawler.fetch_articles(urls)
+
+        articles = []
+        for article_data in details:
+            article = self._to_news_article(article_data, article_data["url"], ticker, days)
+            if article is not None:
+                articles.append(article)
+        return articles
+
+    def _dedupe_articles(self, articles: List[NewsArticle], max_articles: int) -> List[NewsArticle]:
+        """날짜순 정렬 및 URL 중복 제거"""
         seen_urls = set()
         unique_articles = []
         for article in sorted(articles, key=lambda x: x.published_at, reverse=True):
@@ -129,7 +224,6 @@ class NewsCollector:
             if len(unique_articles) >= max_articles:
                 break
 
-        logger.info(f"✅ {ticker} 뉴스 {len(unique_articles)}건 수집 완료")
         return unique_articles[:max_articles]
 
     def _fetch_naver_news(
@@ -158,81 +252,106 @@ class NewsCollector:
             )
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            articles = self._parse_naver_listing(response.text, ticker, days, max_articles)
 
-            # 뉴스 링크 추출 - table 내의 td.title > a 구조
-            for a_tag in soup.find_all("a", href=True):
-                href = a_tag.get("href", "")
-                # news_read.naver 링크인지 확인
-                if "/item/news_read.naver" not in href:
-                    continue
+            logger.debug(f"네이버 뉴스 {len(articles)}건 수집")
 
-                # URL 파라미터에서 article_id와 office_id 추출
-                if "article_id=" not in href or "office_id=" not in href:
-                    continue
+        except Exception as e:
+            logger.error(f"네이버 뉴스 수집 실패: {e}")
 
-                try:
-                    from urllib.parse import parse_qs, urlparse
-                    parsed = urlparse(href)
-                    params = parse_qs(parsed.query)
-                    article_id = params.get("article_id", [""])[0]
-                    office_id = params.get("office_id", [""])[0]
+        return articles
 
-                    if not article_id or not office_id:
-                        continue
+    def _parse_naver_listing(
+        self,
+        html: str,
+        ticker: str,
+        days: int,
+        max_articles: int,
+    ) -> List[NewsArticle]:
+        """
+        네이버 금융 종목 뉴스 목록 HTML 파싱
 
-                    # 실제 네이버 뉴스 기사 URL 생성
-                    article_url = f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
+        Args:
+            html: news_news.naver 응답 HTML
+            ticker: 종목코드
+            days: 수집할 날짜 범위
+            max_articles: 최대 기사 수
 
-                    title = a_tag.get_text(strip=True)
-                    if not title or len(title) < 10:
-                        continue
+        Returns:
+            뉴스 기사 리스트
+        """
+        articles = []
 
-                    # 날짜 정보 추출 (같은 행의 date 셀)
-                    date_str = ""
-                    row = a_tag.find_parent("tr")
-                    if row:
-                        date_cell = row.find("td", class_="date")
-                        if date_cell:
-                            date_str = date_cell.get_text(strip=True)
+        soup = BeautifulSoup(html, "html.parser")
 
-                    # 날짜 파싱
-                    published_at = self._parse_naver_date(date_str) if date_str else datetime.now()
+        # 뉴스 링크 추출 - table 내의 td.title > a 구조
+        for a_tag in soup.find_all("a", href=True):
+            href = a_tag.get("href", "")
+            # news_read.naver 링크인지 확인
+            if "/item/news_read.naver" not in href:
+                continue
 
-                    # 날짜 범위 확인
-                    if (datetime.now() - published_at).days > days:
-                        continue
+            # URL 파라미터에서 article_id와 office_id 추출
+            if "article_id=" not in href or "office_id=" not in href:
+                continue
 
-                    # 소스 추출 (같은 행의 info 셀)
-                    source = "네이버뉴스"
-                    if row:
-                        info_cell = row.find("td", class_="info")
-                        if info_cell:
-                            source = info_cell.get_text(strip=True)
-
-                    # 본문 수집 (별도 요청 - 선택사항으로 빈 문자열 허용)
-                    content = ""  # 본문 수집은 API 호출로 대체
-
-                    articles.append(NewsArticle(
-                        title=title,
-                        content=content,
-                        source=source,
-                        url=article_url,
-                        published_at=published_at,
-                        ticker=ticker,
-                    ))
+            try:
+                from urllib.parse import parse_qs, urlparse
+                parsed = urlparse(href)
+                params = parse_qs(parsed.query)
+                article_id = params.get("article_id", [""])[0]
+                office_id = params.get("office_id", [""])[0]
 
-                    if len(articles) >= max_articles:
-                        break
+                if not article_id or not office_id:
+                    continue
 
-                except Exception as e:
-                    logger.debug(f"네이버 뉴스 파싱 오류: {e}")
+                # 실제 네이버 뉴스 기사 URL 생성
+                article_url = f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
+
+                title = a_tag.get_text(strip=True)
+                if not title or len(title) < 10:
                     continue
 
-            logger.debug(f"네이버 뉴스 {len(articles)}건 수집")
+                # 날짜 정보 추출 (같은 행의 date 셀)
+                date_str = ""
+                row = a_tag.find_parent("tr")
+                if row:
+                    date_cell = row.find("td", class_="date")
+                    if date_cell:
+                        date_str = date_cell.get_text(strip=True)
 
-        except Exception as e:
-            logger.error(f"네이버 뉴스 수집 실패: {e}")
+                # 날짜 파싱
+                published_at = self._parse_naver_date(date_str) if date_str else datetime.now()
+
+                # 날짜 범위 확인
+                if (datetime.now() - published_at).days > days:
+                    continue
+
+                # 소스 추출 (같은 행의 info 셀)
+                source = "네이버뉴스"
+                if row:
+                    info_cell = row.find("td", class_="info")
+                    if info_cell:
+                        source = info_cell.get_text(strip=True)
+
+                # 본문 수집 (별도 요청 - 선택사항으로 빈 문자열 허용)
+                content = ""  # 본문 수집은 API 호출로 대체
+
+                articles.append(NewsArticle(
+                    title=title,
+                    content=content,
+                    source=source,
+                    url=article_url,
+                    published_at=published_at,
+                    ticker=ticker,
+                ))
+
+                if len(articles) >= max_articles:
+                    break
+
+            except Exception as e:
+                logger.debug(f"네이버 뉴스 파싱 오류: {e}")
+                continue
 
         return articles
 
@@ -272,28 +391,11 @@ class NewsCollector:
                     if not article_data:
                         continue
 
-                    # 날짜 범위 확인
-                    published_at_str = article_data.get("published_at")
-                    if published_at_str:
-                        try:
-                            if isinstance(published_at_str, str):
-                                published_at = datetime.fromisoformat(published_at_str.replace("Z", "+00:00"))
-                            else:
-                                published_at = published_at_str
-
-                            if (datetime.now() - published_at).days > days:
-                                continue
-                        except:
-                            pass  # 날짜 파싱 실패 시 무시
-
-                    articles.append(NewsArticle(
-                        title=article_data.get("title", ""),
-                        content=article_data.get("content", ""),
-                        source=article_data.get("source", "네이버뉴스"),
-                        url=article_data.get("url", url),
-                        published_at=published_at if 'published_at' in locals() else datetime.now(),
-                        ticker=ticker,
-                    ))
+                    article = self._to_news_article(article_data, url, ticker, days)
+                    if article is None:
+                        continue
+
+                    articles.append(article)
 
                     if len(articles) >= max_articles:
                         break
@@ -309,6 +411,49 @@ class NewsCollector:
 
         return articles
 
+    def _to_news_article(
+        self,
+        article_data: Dict[str, Any],
+        url: str,
+        ticker: str,
+        days: int,
+    ) -> Optional[NewsArticle]:
+        """
+        기사 상세 딕셔너리를 NewsArticle로 변환 (날짜 범위 밖이면 None)
+
+        Args:
+            article_data: _fetch_article_details / extract_article 결과
+            url: 요청 URL
+            ticker: 종목코드
+            days: 수집할 날짜 범위
+
+        Returns:
+            NewsArticle 또는 None
+        """
+        published_at = article_data.get("published_at")
+        if isinstance(published_at, str):
+            try:
+                published_at = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+            except ValueError:
+                published_at = None  # 날짜 파싱 실패 시 무시
+
+        if isinstance(published_at, datetime):
+            if published_at.tzinfo is not None:
+                published_at = published_at.replace(tzinfo=None)
+            if (datetime.now() - published_at).days > days:
+                return None
+        else:
+            published_at = datetime.now()
+
+        return NewsArticle(
+            title=article_data.get("title", ""),
+            content=article_data.get("content", ""),
+            source=article_data.get("source", "네이버뉴스"),
+            url=article_data.get("url", url),
+            published_at=published_at,
+            ticker=ticker,
+        )
+
     def _fetch_daum_news(
         self,
         ticker: str,
@@ -467,28 +612,13 @@ class NewsCollector:
 
         try:
             # 네이버 뉴스 검색 URL
-            search_url = (
-                f"https://search.naver.com/search.naver"
-                f"?where=news&sm=tab_pge&query={query}&sort=1&start=1"
-            )
+            search_url = self._naver_search_url(query)
 
             self._wait_for_rate_limit()
             response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 뉴스 검색 결과에서 링크 추출
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-
-                # 올바른 네이버 뉴스 URL인지 확인
-                if self._is_valid_naver_news_url(href):
-                    if href not in urls:  # 중복 제거
-                        urls.append(href)
-
-                    if len(urls) >= max_results:
-                        break
+            urls = self._parse_search_result_urls(response.text, max_results)
 
             logger.debug(f"검색 '{query}'에서 {len(urls)}개의 뉴스 URL 추출")
 
@@ -497,6 +627,41 @@ class NewsCollector:
 
         return urls
 
+    def _naver_search_url(self, query: str) -> str:
+        """네이버 뉴스 검색 URL (최신순)"""
+        return (
+            f"https://search.naver.com/search.naver"
+            f"?where=news&sm=tab_pge&query={query}&sort=1&start=1"
+        )
+
+    def _parse_search_result_urls(self, html: str, max_results: int) -> List[str]:
+        """
+        네이버 뉴스 검색 결과 HTML에서 기사 URL 추출
+
+        Args:
+            html: 검색 결과 HTML
+            max_results: 최대 결과 수
+
+        Returns:
+            네이버 뉴스 기사 URL 리스트 (중복 제거됨)
+        """
+        urls = []
+        soup = BeautifulSoup(html, "html.parser")
+
+        # 뉴스 검색 결과에서 링크 추출
+        for link in soup.find_all("a", href=True):
+            href = link["href"]
+
+            # 올바른 네이버 뉴스 URL인지 확인
+            if self._is_valid_naver_news_url(href):
+                if href not in urls:  # 중복 제거
+                    urls.append(href)
+
+                if len(urls) >= max_results:
+                    break
+
+        return urls
+
     def _fetch_naver_news_with_urls(
         self,
         query: str,
@@ -583,61 +748,7 @@ class NewsCollector:
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 제목 추출
-            title_elem = soup.select_one("h2#title_area") or soup.select_one("h3.title") or soup.select_one("meta[property='og:title']")
-            title = ""
-            if title_elem:
-                if title_elem.name == "meta":
-                    title = title_elem.get("content", "")
-                else:
-                    title = title_elem.get_text(strip=True)
-
-            # 언론사 추출
-            source_elem = soup.select_one(".media_end_head_top_link_text") or soup.select_one(".press_name") or soup.select_one("meta[property='og:article:author']")
-            source = ""
-            if source_elem:
-                if source_elem.name == "meta":
-                    source = source_elem.get("content", "")
-                else:
-                    source = source_elem.get_text(strip=True)
-
-            # 날짜 추출
-            date_elem = soup.select_one(".media_end_head_info_datestamp_bunch") or soup.select_one(".date") or soup.select_one("meta[property='article:published_time']")
-            published_at = None
-            if date_elem:
-                if date_elem.name == "meta":
-                    date_str = date_elem.get("content", "")
-                    try:
-                        published_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    except:
-                        pass
-                else:
-                    date_text = date_elem.get_text(strip=True)
-                    # 여러 날짜 포맷 시도
-                    published_at = self._parse_news_date(date_text)
-
-            if not published_at:
-                published_at = datetime.now()
-
-            # 본문 추출
-            content_elem = soup.select_one("#newsct_article") or soup.select_one(".article_body") or soup.select_one("div#articleBody")
-            content = ""
-            if content_elem:
-                # 불필요한 요소 제거
-                for elem in content_elem.select("script, style, .ad, .caption"):
-                    elem.decompose()
-
-                content = content_elem.get_text(separator="\n", strip=True)[:5000]
-
-            return {
-                "title": title,
-                "url": url,
-                "source": source,
-                "published_at": published_at.isoformat() if isinstance(published_at, datetime) else published_at,
-                "content": content,
-            }
+            return extract_article(response.text, url)
 
         except Exception as e:
             logger.debug(f"기사 상세 수집 실패 ({url}): {e}")
@@ -653,31 +764,7 @@ class NewsCollector:
         Returns:
             datetime 객체 또는 None
         """
-        try:
-            # 다양한 포맷 시도
-            formats = [
-                "%Y.%m.%d. %H:%M",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y%m%d%H%M",
-            ]
-
-            date_str = date_str.strip()
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-
-            # "2024.01.30." 형식 처리
-            if re.match(r"\d{4}\.\d{2}\.\d{2}\.", date_str):
-                date_str = date_str.rstrip(".") + " 00:00"
-                return datetime.strptime(date_str, "%Y.%m.%d %H:%M")
-
-        except Exception as e:
-            logger.debug(f"날짜 파싱 실패 ({date_str}): {e}")
-
-        return None
+        return parse_news_date(date_str)
 
     # ==========================================================================
     # 기존 메서드
@@ -11,10 +11,15 @@ from datetime import datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
 
+from src.collectors.article_index import ArticleIndex, get_article_index
 from src.collectors.base_collector import BaseNewsCollector
 
 logger = logging.getLogger(__name__)
 
+# 색인용 피드 수집 범위
+INDEX_WINDOW_DAYS = 30
+INDEX_MAX_ARTICLES = 100
+
 
 class YonhapCollector(BaseNewsCollector):
     """
@@ -27,6 +32,17 @@ class YonhapCollector(BaseNewsCollector):
     YONHAP_ECONOMY_RSS = "https://www.yonhapnewstv.co.kr/category/economy/feed"
     YONHAP_FINANCE_RSS = "https://www.yonhapnewstv.co.kr/category/finance/feed"
 
+    # 공유 기사 색인 소스 키
+    INDEX_SOURCE = "yonhap"
+
+    def __init__(self, article_index: Optional[ArticleIndex] = None):
+        """
+        Args:
+            article_index: 종목별 기사 색인 (None이면 전역 색인 사용)
+        """
+        super().__init__()
+        self.article_index = article_index or get_article_index()
+
     def fetch_news(
         self,
         days: int = 7,
@@ -134,6 +150,9 @@ class YonhapCollector(BaseNewsCollector):
         """
         종목별 연합뉴스 검색
 
+        피드는 공유 기사 색인 TTL마다 한 번만 수집하고,
+        종목별 조회는 색인에서 매칭된 기사만 읽습니다.
+
         Args:
             ticker: 종목 코드
             days: 수집할 날짜 범위
@@ -142,44 +161,13 @@ class YonhapCollector(BaseNewsCollector):
         Returns:
             기사 정보 딕셔너리 리스트
         """
-        # 종목명 매핑 (간단 버전)
-        ticker_names = {
-            "005930": "삼성전자",
-            "000660": "SK하이닉스",
-            "035420": "NAVER",
-            "035720": "카카오",
-            "005380": "현대차",
-        }
-
-        search_name = ticker_names.get(ticker, ticker)
-
-        # 전체 RSS 가져오기
-        all_articles = self.fetch_rss_news(max_articles=50)
-
-        # 종목 관련 기사 필터링
-        filtered = []
-        for article in all_articles:
-            # 제목이나 내용에 종목명이 포함된 경우
-            if search_name in article["title"] or search_name in article.get("content", ""):
-                # 날짜 범위 확인
-                published_at = article.get("published_at")
-                if published_at:
-                    if isinstance(published_at, str):
-                        published_at = datetime.fromisoformat(published_at)
-
-                    # timezone-aware datetime을 naive로 변환
-                    if published_at.tzinfo is not None:
-                        published_at = published_at.replace(tzinfo=None)
-
-                    if (datetime.now() - published_at).days > days:
-                        continue
-
-                filtered.append(article)
-
-                if len(filtered) >= max_articles:
-                    break
+        index = self.article_index
+        index.refresh(
+            self.INDEX_SOURCE,
+            lambda: self.fetch_all_news(days=INDEX_WINDOW_DAYS, max_articles=INDEX_MAX_ARTICLES),
+        )
 
-        return filtered
+        return index.lookup(ticker, self.INDEX_SOURCE, days=days, max_articles=max_articles)
 
     def _parse_rss_date(self, date_str: str) -> Optional[datetime]:
         """
@@ -13,11 +13,15 @@ from src.database.models.models import (
     InstitutionalFlow,
     AIAnalysis,
     BacktestResult,
+    SignalPerformanceDaily,
 )
 
 # daytrading_signal.py에서 DaytradingSignal import
 from src.database.models.daytrading_signal import DaytradingSignal
 
+# history.py에서 시그널 이력 테이블 import
+from src.database.models.history import signals_history, daytrading_signals_history
+
 __all__ = [
     "Base",
     "Stock",
@@ -27,5 +31,8 @@ __all__ = [
     "InstitutionalFlow",
     "AIAnalysis",
     "BacktestResult",
+    "SignalPerformanceDaily",
     "DaytradingSignal",
+    "signals_history",
+    "daytrading_signals_history",
 ]
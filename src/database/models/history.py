@@ -0,0 +1,40 @@
+"""
+Signal History Tables
+보관 기간이 지난 시그널을 옮겨 두는 이력(아카이브) 테이블
+
+원본 테이블과 같은 컬럼 + archived_at을 가지며, 기본 키는 (id, signal_date)입니다.
+PostgreSQL에서는 migrations/add_signal_history_tables.py가 signal_date 기준 월 단위
+RANGE 파티션 테이블로 생성하고, 월 파티션은 SignalArchiveRepository가 이관 전에 만듭니다.
+(create_all로 만들어지는 SQLite 등에서는 일반 테이블)
+"""
+
+from sqlalchemy import Column, DateTime, Index, Table
+
+from src.database.session import Base
+from src.database.models.models import Signal, _now_utc
+from src.database.models.daytrading_signal import DaytradingSignal
+
+
+def _history_table(source: Table, name: str) -> Table:
+    """원본 테이블 컬럼을 복사한 이력 테이블 정의 (FK/인덱스/기본값 제외)"""
+    columns = [
+        Column(
+            column.name,
+            column.type,
+            primary_key=column.name in ("id", "signal_date"),
+            autoincrement=False,
+            nullable=column.nullable,
+        )
+        for column in source.columns
+    ]
+    return Table(
+        name,
+        Base.metadata,
+        *columns,
+        Column("archived_at", DateTime, default=_now_utc),
+        Index(f"ix_{name}_ticker_date", "ticker", "signal_date"),
+    )
+
+
+signals_history = _history_table(Signal.__table__, "signals_history")
+daytrading_signals_history = _history_table(DaytradingSignal.__table__, "daytrading_signals_history")
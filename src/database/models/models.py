@@ -238,6 +238,30 @@ class BacktestResult(Base):
         return f"<BacktestResult(id={self.id}, config={self.config_name}, return={self.total_return_pct}%)"
 
 
+class SignalPerformanceDaily(Base):
+    """
+    시그널 타입별 일별 실현 수익률 집계
+
+    PerformanceRepository.refresh_daily_series()가 증분 갱신하며,
+    누적 수익률/MDD/샤프 비율 조회는 이 테이블만 읽습니다.
+    """
+    __tablename__ = "signal_performance_daily"
+
+    signal_type = Column(String(20), primary_key=True)  # VCP, JONGGA_V2
+    signal_date = Column(Date, primary_key=True)
+
+    signal_count = Column(Integer, nullable=False, default=0)  # 수익률 계산된 시그널 수
+    win_count = Column(Integer, nullable=False, default=0)  # 수익 시그널 수
+    return_sum = Column(Float, nullable=False, default=0.0)  # 수익률 합계 (%)
+    best_return = Column(Float, nullable=True)  # 최고 수익률 (%)
+    worst_return = Column(Float, nullable=True)  # 최저 수익률 (%)
+
+    updated_at = Column(DateTime, default=_now_utc, onupdate=_now_utc, index=True)
+
+    def __repr__(self):
+        return f"<SignalPerformanceDaily(type={self.signal_type}, date={self.signal_date}, count={self.signal_count})>"
+
+
 class AIAnalysis(Base):
     """AI 종목 분석 결과"""
     __tablename__ = "ai_analyses"
@@ -26,6 +26,7 @@ class APIKey(Base):
     - is_active: 활성 상태
     - expires_at: 만료일자
     - last_used_at: 마지막 사용 시간
+    - usage_count: 누적 사용 횟수 (미들웨어에서 일괄 기록)
     - created_by: 생성자 정보
     """
     __tablename__ = "api_keys"
@@ -37,6 +38,7 @@ class APIKey(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     expires_at = Column(DateTime, nullable=True)
     last_used_at = Column(DateTime, nullable=True)
+    usage_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=_now_utc, nullable=False)
     created_by = Column(String(100), nullable=True)
     description = Column(Text, nullable=True)
@@ -80,6 +82,7 @@ class APIKey(Base):
             "is_active": self.is_active,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
             "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
+            "usage_count": self.usage_count or 0,
             "created_at": self.created_at.isoformat(),
             "created_by": self.created_by,
             "description": self.description,
@@ -2,18 +2,29 @@
 서비스 헬스체크 시스템
 
 모든 서비스의 상태를 확인하고 상세 정보를 제공합니다.
+
+- 모든 체크는 동시에 실행되며 전체 마감 시간(timeout) 안에 끝나지 않은 체크는 unhealthy로 처리
+- Redis / HTTP 클라이언트는 체크마다 새로 만들지 않고 재사용 (커넥션 풀 유지)
+- liveness / readiness 결과는 cache_ttl 동안 캐시하고, 만료되면 이전 결과를 반환하면서
+  백그라운드에서 갱신 (고빈도 로드밸런서 프로브가 의존 서비스로 퍼지지 않음)
+- readiness는 핵심 의존성(DB, Redis)만 확인 (다운스트림 장애가 게이트웨이를 로테이션에서 빼지 않음)
 """
 
+import asyncio
+import logging
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 import httpx
 
+logger = logging.getLogger(__name__)
+
 
 class HealthStatus(str, Enum):
     """헬스 상태"""
@@ -65,22 +76,54 @@ class SystemHealth:
         }
 
 
+# 헬스체크 결과 캐시 유지 시간 (초)
+DEFAULT_CACHE_TTL = 2.0
+
+# 이 시간보다 오래된 캐시는 반환하지 않고 갱신을 기다림 (초)
+DEFAULT_MAX_STALE = 30.0
+
+# readiness에 포함되는 핵심 의존성
+CORE_DEPENDENCIES = ("database", "redis")
+
+# 다운스트림 HTTP 체크용 커넥션 풀 크기
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+
 class HealthChecker:
     """
     헬스체크 코디네이터
 
-    모든 서비스의 헬스체크를 수행하고 집계합니다.
+    모든 서비스의 헬스체크를 동시에 수행하고 집계합니다.
     """
 
-    def __init__(self, start_time: float, timeout: float = 5.0):
+    def __init__(
+        self,
+        start_time: float,
+        timeout: float = 5.0,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_stale: float = DEFAULT_MAX_STALE,
+    ):
         """
         Args:
             start_time: 애플리케이션 시작 시간 (time.time())
-            timeout: 외부 서비스 체크 타임아웃 (초)
+            timeout: 전체 헬스체크 마감 시간 (초)
+            cache_ttl: liveness / readiness 캐시 유지 시간 (초)
+            max_stale: 만료 후에도 캐시를 반환할 수 있는 최대 나이 (초)
         """
         self.start_time = start_time
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.max_stale = max_stale
         self._checkers: Dict[str, Callable] = {}
+        self._http_services: Dict[str, Tuple[str, str]] = {}
+
+        # 재사용 클라이언트
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._redis_client = None
+
+        # 캐시: {키: (측정 시각(monotonic), 결과)}
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
 
     def register_checker(self, name: str, checker: Callable) -> None:
         """
@@ -92,52 +135,46 @@ class HealthChecker:
         """
         self._checkers[name] = checker
 
+    def register_http_service(self, name: str, base_url: str, health_path: str = "/health") -> None:
+        """
+        다운스트림 HTTP 서비스 등록 (check_all에 포함됨)
+
+        Args:
+            name: 서비스 이름
+            base_url: 서비스 베이스 URL
+            health_path: 헬스체크 경로
+        """
+        self._http_services[name] = (base_url, health_path)
+
     async def check_all(self, session: Optional[AsyncSession] = None) -> SystemHealth:
         """
-        모든 서비스 헬스체크 수행
+        모든 서비스 헬스체크를 동시에 수행
 
         Args:
-            session: 데이터베이스 세션 (可选)
+            session: 데이터베이스 세션 (선택)
 
         Returns:
             SystemHealth: 전체 시스템 헬스 정보
         """
-        services: Dict[str, ServiceHealth] = {}
-
-        # 기본 체커 실행
-        basic_checks = {
-            "database": self._check_database,
+        checks: Dict[str, Callable[[], Awaitable[ServiceHealth]]] = {
+            "database": lambda: self._check_database(session),
             "redis": self._check_redis,
             "api_gateway": self._check_api_gateway,
         }
 
-        # 기본 체커 실행
-        for name, checker in basic_checks.items():
-            try:
-                if name == "database" and session:
-                    health = await checker(session)
-                else:
-                    health = await checker()
-                services[name] = health
-            except Exception as e:
-                services[name] = ServiceHealth(
-                    name=name,
-                    status=HealthStatus.UNKNOWN,
-                    message=f"Health check failed: {str(e)}",
-                )
+        # 등록된 HTTP 서비스
+        for name, (base_url, health_path) in self._http_services.items():
+            checks.setdefault(
+                name,
+                lambda name=name, base_url=base_url, health_path=health_path:
+                    self._check_http_service(name, base_url, health_path),
+            )
 
-        # 등록된 커스텀 체커 실행
+        # 등록된 커스텀 체커
         for name, checker in self._checkers.items():
-            if name not in services:
-                try:
-                    health = await checker()
-                    services[name] = health
-                except Exception as e:
-                    services[name] = ServiceHealth(
-                        name=name,
-                        status=HealthStatus.UNKNOWN,
-                        message=f"Health check failed: {str(e)}",
-                    )
+            checks.setdefault(name, checker)
+
+        services = await self._run_checks(checks)
 
         # 전체 상태 판정
         overall_status = self._determine_overall_status(services)
@@ -151,6 +188,177 @@ class HealthChecker:
             uptime_seconds=uptime,
         )
 
+    async def check_core(self) -> SystemHealth:
+        """
+        핵심 의존성(CORE_DEPENDENCIES)만 동시에 확인
+
+        Returns:
+            SystemHealth: database / redis 헬스 정보
+        """
+        checks: Dict[str, Callable[[], Awaitable[ServiceHealth]]] = {
+            "database": lambda: self._check_database(None),
+            "redis": self._check_redis,
+        }
+        services = await self._run_checks(checks)
+
+        return SystemHealth(
+            status=self._determine_overall_status(services),
+            services=services,
+            uptime_seconds=time.time() - self.start_time,
+        )
+
+    async def _run_checks(
+        self,
+        checks: Dict[str, Callable[[], Awaitable[ServiceHealth]]],
+    ) -> Dict[str, ServiceHealth]:
+        """
+        체크를 동시에 실행하고 마감 시간이 지나면 남은 체크를 취소
+
+        Returns:
+            {서비스 이름: ServiceHealth} (등록 순서 유지)
+        """
+        tasks = {
+            name: asyncio.create_task(self._run_check(name, checker))
+            for name, checker in checks.items()
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+
+        services: Dict[str, ServiceHealth] = {}
+        for name, task in tasks.items():
+            if task in done:
+                services[name] = task.result()
+            else:
+                services[name] = ServiceHealth(
+                    name=name,
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Health check timed out after {self.timeout}s",
+                )
+        return services
+
+    async def _run_check(
+        self,
+        name: str,
+        checker: Callable[[], Awaitable[ServiceHealth]],
+    ) -> ServiceHealth:
+        """체커 실행 (예외는 UNKNOWN 상태로 변환)"""
+        try:
+            return await checker()
+        except Exception as e:
+            return ServiceHealth(
+                name=name,
+                status=HealthStatus.UNKNOWN,
+                message=f"Health check failed: {str(e)}",
+            )
+
+    async def liveness(self) -> ServiceHealth:
+        """
+        프로세스 생존 여부 (캐시됨, 의존 서비스는 확인하지 않음)
+
+        Returns:
+            ServiceHealth: API Gateway 자체 헬스 정보
+        """
+        return await self._get_cached("liveness", self._check_api_gateway)
+
+    async def readiness(self) -> SystemHealth:
+        """
+        트래픽 처리 가능 여부 (캐시된 check_core 결과)
+
+        다운스트림 서비스는 포함하지 않습니다 (system_health 참고).
+
+        Returns:
+            SystemHealth: 핵심 의존성 헬스 정보
+        """
+        return await self._get_cached("readiness", self.check_core)
+
+    async def system_health(self) -> SystemHealth:
+        """
+        전체 시스템 헬스 (캐시된 check_all 결과, 다운스트림 서비스 포함)
+
+        Returns:
+            SystemHealth: 전체 시스템 헬스 정보
+        """
+        return await self._get_cached("system", self.check_all)
+
+    async def _get_cached(self, key: str, producer: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 결과 반환
+
+        - cache_ttl 이내: 캐시 반환
+        - cache_ttl ~ max_stale: 캐시 반환 + 백그라운드 갱신 (동시에 하나만)
+        - 캐시 없음 / max_stale 초과: 갱신 완료까지 대기 (동시 요청은 같은 갱신을 공유)
+        """
+        entry = self._cache.get(key)
+        if entry is not None:
+            checked_at, value = entry
+            age = time.monotonic() - checked_at
+            if age < self.cache_ttl:
+                return value
+            if age < self.max_stale:
+                self._refresh(key, producer)
+                return value
+
+        return await asyncio.shield(self._refresh(key, producer))
+
+    def _refresh(self, key: str, producer: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """캐시 갱신 태스크 (이미 진행 중이면 그 태스크 반환)"""
+        task = self._refresh_tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._store(key, producer))
+            task.add_done_callback(lambda t: self._log_refresh_failure(key, t))
+            self._refresh_tasks[key] = task
+        return task
+
+    @staticmethod
+    def _log_refresh_failure(key: str, task: asyncio.Task) -> None:
+        """갱신 태스크 예외 회수 (백그라운드 갱신은 아무도 await하지 않음)"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(f"헬스체크 캐시 갱신 실패 ({key}): {error}")
+
+    async def _store(self, key: str, producer: Callable[[], Awaitable[Any]]) -> Any:
+        value = await producer()
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_cache(self) -> None:
+        """liveness / readiness / system 캐시 삭제"""
+        self._cache.clear()
+
+    async def close(self) -> None:
+        """재사용 클라이언트 및 갱신 태스크 정리"""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._redis_client is not None:
+            await self._redis_client.close()
+            self._redis_client = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """다운스트림 체크용 HTTP 클라이언트 (커넥션 풀 재사용)"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, limits=HTTP_POOL_LIMITS)
+        return self._http_client
+
+    def _get_redis_client(self):
+        """헬스체크용 Redis 클라이언트 (커넥션 풀 재사용)"""
+        if self._redis_client is None:
+            from redis import asyncio as aioredis
+
+            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6380/0")
+            self._redis_client = aioredis.from_url(
+                redis_url,
+                socket_connect_timeout=self.timeout,
+                socket_timeout=self.timeout,
+            )
+        return self._redis_client
+
     async def check_service(self, name: str) -> ServiceHealth:
         """
         단일 서비스 헬스체크
@@ -178,6 +386,11 @@ class HealthChecker:
                     message=f"Health check failed: {str(e)}",
                 )
 
+        # 등록된 HTTP 서비스
+        if name in self._http_services:
+            base_url, health_path = self._http_services[name]
+            return await self._check_http_service(name, base_url, health_path)
+
         # 등록된 커스텀 체커
         if name in self._checkers:
             try:
@@ -237,11 +450,8 @@ class HealthChecker:
 
         try:
             if session is None:
-                # 동기 세션 생성 시도
-                from src.database.session import get_sync_session
-                with get_sync_session() as sync_session:
-                    result = sync_session.execute(text("SELECT 1"))
-                    result.fetchone()
+                # 동기 세션은 스레드에서 실행 (이벤트 루프 차단 방지)
+                await asyncio.to_thread(self._ping_database_sync)
             else:
                 # 비동기 세션 사용
                 await session.execute(text("SELECT 1"))
@@ -270,47 +480,46 @@ class HealthChecker:
                 message=f"Connection failed: {str(e)}",
             )
 
+    @staticmethod
+    def _ping_database_sync() -> None:
+        from src.database.session import get_db_session_sync
+
+        with get_db_session_sync() as sync_session:
+            sync_session.execute(text("SELECT 1")).fetchone()
+
     async def _check_redis(self) -> ServiceHealth:
         """Redis 헬스체크"""
         start_time = time.time()
 
         try:
-            import os
-            from redis import asyncio as aioredis
-
-            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6380/0")
-            client = await aioredis.from_url(redis_url)
-
-            try:
-                await client.ping()
-                response_time = (time.time() - start_time) * 1000
+            client = self._get_redis_client()
 
-                # 메모리 사용량 확인
-                info = await client.info("memory")
-                used_memory = info.get("used_memory", 0)
-                used_memory_human = info.get("used_memory_human", "unknown")
+            await client.ping()
+            response_time = (time.time() - start_time) * 1000
 
-                # 응답 시간에 따른 상태
-                if response_time > 500:  # 500ms 이상
-                    status = HealthStatus.DEGRADED
-                    message = f"Slow response: {response_time:.2f}ms"
-                else:
-                    status = HealthStatus.HEALTHY
-                    message = "OK"
+            # 메모리 사용량 확인
+            info = await client.info("memory")
+            used_memory = info.get("used_memory", 0)
+            used_memory_human = info.get("used_memory_human", "unknown")
 
-                return ServiceHealth(
-                    name="redis",
-                    status=status,
-                    response_time_ms=round(response_time, 2),
-                    message=message,
-                    details={
-                        "used_memory": used_memory,
-                        "used_memory_human": used_memory_human,
-                    },
-                )
+            # 응답 시간에 따른 상태
+            if response_time > 500:  # 500ms 이상
+                status = HealthStatus.DEGRADED
+                message = f"Slow response: {response_time:.2f}ms"
+            else:
+                status = HealthStatus.HEALTHY
+                message = "OK"
 
-            finally:
-                await client.close()
+            return ServiceHealth(
+                name="redis",
+                status=status,
+                response_time_ms=round(response_time, 2),
+                message=message,
+                details={
+                    "used_memory": used_memory,
+                    "used_memory_human": used_memory_human,
+                },
+            )
 
         except Exception as e:
             return ServiceHealth(
@@ -389,8 +598,7 @@ class HealthChecker:
 
         try:
             url = f"{base_url}{health_path}"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
+            response = await self._get_http_client().get(url)
 
             response_time = (time.time() - start_time) * 1000
 
@@ -451,17 +659,22 @@ def get_health_checker() -> Optional[HealthChecker]:
     return _health_checker
 
 
-def init_health_checker(start_time: float, timeout: float = 5.0) -> HealthChecker:
+def init_health_checker(
+    start_time: float,
+    timeout: float = 5.0,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+) -> HealthChecker:
     """
     헬스체커 초기화
 
     Args:
         start_time: 애플리케이션 시작 시간
-        timeout: 외부 서비스 체크 타임아웃
+        timeout: 전체 헬스체크 마감 시간
+        cache_ttl: liveness / readiness 캐시 유지 시간
 
     Returns:
         HealthChecker: 헬스체커 인스턴스
     """
     global _health_checker
-    _health_checker = HealthChecker(start_time, timeout)
+    _health_checker = HealthChecker(start_time, timeout, cache_ttl)
     return _health_checker
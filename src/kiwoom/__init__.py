@@ -17,6 +17,11 @@ from src.kiwoom.rest_api import (
     TokenExpiredError,
     OrderResult,
 )
+from src.kiwoom.token_broker import (
+    KiwoomToken,
+    KiwoomTokenBroker,
+    get_token_broker,
+)
 from src.kiwoom.websocket import KiwoomWebSocket
 from src.kiwoom.ohlc_collector import (
     OHLCCollector,
@@ -25,6 +30,10 @@ from src.kiwoom.ohlc_collector import (
     collect_ohlc_for_tickers,
     collect_ohlc_main,
 )
+from src.kiwoom.flow_collector import (
+    InstitutionalFlowCollector,
+    FlowCollectionResult,
+)
 
 __all__ = [
     # Base
@@ -38,6 +47,10 @@ __all__ = [
     "KiwoomAPIError",
     "TokenExpiredError",
     "OrderResult",
+    # Token Broker
+    "KiwoomToken",
+    "KiwoomTokenBroker",
+    "get_token_broker",
     # WebSocket
     "KiwoomWebSocket",
     # OHLC Collector
@@ -46,4 +59,7 @@ __all__ = [
     "OHLCBar",
     "collect_ohlc_for_tickers",
     "collect_ohlc_main",
+    # Institutional Flow Collector
+    "InstitutionalFlowCollector",
+    "FlowCollectionResult",
 ]
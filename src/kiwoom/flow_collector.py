@@ -0,0 +1,597 @@
+"""
+키움 REST API 기반 기관/외국인 수급 수집기
+
+institutional_flows 하이퍼테이블을 시장 단위로 채웁니다.
+
+1. 종목별 최신 수급 날짜를 한 번에 조회해 누락된 날짜만 수집 (gap 감지)
+2. 기준일 하루만 빠진 종목은 투자자별 매매 종목 조회(ka10058)로 시장 단위 일괄 수집
+3. 나머지 종목(여러 날 누락, 일괄 조회 누락분)은 종목별 투자자 차트(ka10060)를
+   토큰 버킷으로 페이싱하며 동시 조회
+4. 배치마다 파생 컬럼(5/20/60일 합계, 연속 순매수일, 추세, 수급 점수)을 다시 계산해
+   다중 행 UPSERT 한 번으로 저장 후 커밋
+
+순매수는 두 API 모두 수량(주)으로 저장합니다 (vcp_analyzer 등 소비 측 기준).
+기준일을 지정하지 않으면 수급이 확정된(FLOW_FINALIZED_AT 이후) 마지막 거래일까지만 수집합니다.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from src.utils.logging_config import get_logger
+from src.utils.rate_limiter import AsyncTokenBucket
+
+logger = get_logger(__name__)
+
+# Kiwoom REST API 조회 한도 (초당 요청 수)
+KIWOOM_REQUESTS_PER_SECOND = float(os.getenv("KIWOOM_REQUESTS_PER_SECOND", "5"))
+
+# 종목별 조회 동시 실행 수 / UPSERT 배치 크기 (종목 수)
+FLOW_CONCURRENCY = int(os.getenv("INSTITUTIONAL_FLOW_CONCURRENCY", "4"))
+FLOW_BATCH_SIZE = 50
+
+# 신규 종목 최대 수집 기간 (달력일)
+FLOW_LOOKBACK_DAYS = 30
+
+# 다중 행 UPSERT 한 번에 보내는 최대 행 수
+UPSERT_CHUNK_ROWS = 2000
+
+# 일괄 조회 설정: 시장 코드 / 투자자 코드 / 연속조회 최대 페이지
+RANKING_MARKETS = {"KOSPI": "001", "KOSDAQ": "101"}
+INVESTOR_FOREIGN = "9000"
+INVESTOR_INSTITUTION = "9999"
+RANKING_MAX_PAGES = 30
+
+# 장 마감 후 투자자별 수급이 확정되는 시각 (KST) - 이전에는 당일을 수집하지 않음
+MARKET_TIMEZONE = ZoneInfo("Asia/Seoul")
+FLOW_FINALIZED_AT = time(18, 0)
+
+# 파생 컬럼 합계 기간 (거래일) / 재계산 시 읽는 이전 이력 (달력일, 60거래일 + 휴장일 여유)
+FLOW_SUM_WINDOWS = (5, 20, 60)
+DERIVED_HISTORY_DAYS = 100
+
+# 수급 단계 기준 점수
+STAGE_ACCUMULATION_SCORE = 70.0
+STAGE_DISTRIBUTION_SCORE = 35.0
+
+# UPSERT 시 갱신하는 컬럼
+FLOW_UPDATE_COLUMNS = (
+    "foreign_net_buy", "inst_net_buy", "is_double_buy",
+    "foreign_consecutive_days", "foreign_trend", "inst_consecutive_days", "inst_trend",
+    "foreign_net_5d", "foreign_net_20d", "foreign_net_60d",
+    "inst_net_5d", "inst_net_20d", "inst_net_60d",
+    "supply_demand_score", "supply_demand_stage",
+)
+
+
+def latest_weekday(base_date: Optional[str] = None) -> date:
+    """
+    기준일 이전의 가장 최근 평일 (휴장일은 고려하지 않음)
+
+    Args:
+        base_date: 기준일자 (YYYYMMDD, None이면 오늘)
+    """
+    day = datetime.strptime(base_date, "%Y%m%d").date() if base_date else date.today()
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def previous_weekday(day: date) -> date:
+    """직전 평일"""
+    day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def latest_completed_session(now: Optional[datetime] = None) -> date:
+    """
+    수급이 확정된 마지막 평일 (FLOW_FINALIZED_AT 이전이면 전 평일, 휴장일은 고려하지 않음)
+
+    Args:
+        now: 현재 시각 (None이면 KST 현재 시각, naive면 KST로 간주)
+    """
+    now = now or datetime.now(MARKET_TIMEZONE)
+    if now.tzinfo is not None:
+        now = now.astimezone(MARKET_TIMEZONE)
+    day = now.date()
+    if day.weekday() < 5 and now.time() < FLOW_FINALIZED_AT:
+        return previous_weekday(day)
+    return latest_weekday(day.strftime("%Y%m%d"))
+
+
+def parse_signed_number(value: Any) -> int:
+    """키움 부호 포함 숫자 문자열("+1,234", "-56") → int"""
+    text = str(value if value is not None else "0").replace(",", "").replace("+", "").strip()
+    try:
+        return int(float(text or 0))
+    except ValueError:
+        return 0
+
+
+def normalize_ticker(code: Any) -> str:
+    """키움 종목코드("A005930", "005930_AL") → 6자리 종목코드"""
+    return str(code or "").strip().lstrip("A")[:6]
+
+
+def build_flow_row(ticker: str, day: date, foreign: int, institution: int) -> Dict[str, Any]:
+    """institutional_flows 행 딕셔너리 (파생 컬럼은 derive_flow_metrics에서 채움)"""
+    return {
+        "ticker": ticker,
+        "date": day,
+        "foreign_net_buy": foreign,
+        "inst_net_buy": institution,
+        "is_double_buy": foreign > 0 and institution > 0,
+    }
+
+
+def _trend(total: int) -> str:
+    if total > 0:
+        return "buying"
+    if total < 0:
+        return "selling"
+    return "neutral"
+
+
+def _supply_demand_score(row: Dict[str, Any]) -> float:
+    """
+    수급 점수 (0~100, 중립 50)
+
+    5일 순매수 방향(외국인 ±15, 기관 ±10) + 연속 순매수일(각 최대 5일 x 2점) + 동반 순매수(5점)
+    """
+    score = 50.0
+    score += 15.0 * ((row["foreign_net_5d"] > 0) - (row["foreign_net_5d"] < 0))
+    score += 10.0 * ((row["inst_net_5d"] > 0) - (row["inst_net_5d"] < 0))
+    score += 2.0 * min(row["foreign_consecutive_days"], 5)
+    score += 2.0 * min(row["inst_consecutive_days"], 5)
+    if row["is_double_buy"]:
+        score += 5.0
+    return max(0.0, min(100.0, score))
+
+
+def derive_flow_metrics(rows: List[Dict[str, Any]]) -> None:
+    """
+    한 종목의 수급 행(날짜 오름차순)에 파생 컬럼 채우기
+
+    각 행 기준으로 직전 N거래일(행) 합계, 연속 순매수일, 5일 추세, 수급 점수/단계를 계산합니다.
+    """
+    streaks = {"foreign": 0, "inst": 0}
+    for i, row in enumerate(rows):
+        for investor in ("foreign", "inst"):
+            net = row[f"{investor}_net_buy"] or 0
+            streaks[investor] = streaks[investor] + 1 if net > 0 else 0
+            row[f"{investor}_consecutive_days"] = streaks[investor]
+            for window in FLOW_SUM_WINDOWS:
+                row[f"{investor}_net_{window}d"] = sum(
+                    r[f"{investor}_net_buy"] or 0 for r in rows[max(0, i - window + 1):i + 1]
+                )
+            row[f"{investor}_trend"] = _trend(row[f"{investor}_net_5d"])
+
+        score = _supply_demand_score(row)
+        row["supply_demand_score"] = score
+        if score >= STAGE_ACCUMULATION_SCORE:
+            row["supply_demand_stage"] = "accumulation"
+        elif score <= STAGE_DISTRIBUTION_SCORE:
+            row["supply_demand_stage"] = "distribution"
+        else:
+            row["supply_demand_stage"] = "neutral"
+
+
+def upsert_institutional_flows(db, rows: List[Dict[str, Any]]) -> int:
+    """
+    수급 다중 행 UPSERT (INSERT ... ON CONFLICT (ticker, date) DO UPDATE)
+
+    같은 (ticker, date) 행은 마지막 값만 남기고, 바인드 파라미터 한도를 넘지 않도록
+    UPSERT_CHUNK_ROWS 단위로 나눠 실행합니다.
+
+    Args:
+        db: DB 세션
+        rows: institutional_flows 행 딕셔너리 리스트
+
+    Returns:
+        처리한 행 수
+    """
+    if not rows:
+        return 0
+
+    from src.database.models import InstitutionalFlow
+
+    bind = db.get_bind() if hasattr(db, "get_bind") else None
+    if getattr(getattr(bind, "dialect", None), "name", None) == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    unique_rows = list({(row["ticker"], row["date"]): row for row in rows}.values())
+    # 행에 없는 컬럼은 갱신하지 않음 (기본값으로 덮어쓰지 않도록)
+    update_columns = [column for column in FLOW_UPDATE_COLUMNS if column in unique_rows[0]]
+
+    for start in range(0, len(unique_rows), UPSERT_CHUNK_ROWS):
+        stmt = insert(InstitutionalFlow).values(unique_rows[start:start + UPSERT_CHUNK_ROWS])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InstitutionalFlow.ticker, InstitutionalFlow.date],
+            set_={column: stmt.excluded[column] for column in update_columns},
+        )
+        db.execute(stmt)
+    return len(unique_rows)
+
+
+@dataclass
+class FlowCollectionResult:
+    """수급 수집 결과"""
+    collected: Dict[str, int] = field(default_factory=dict)  # 종목별 저장 행 수
+    skipped: List[str] = field(default_factory=list)  # 최신 수급 보유로 건너뛴 종목
+    failed: List[str] = field(default_factory=list)  # 조회/저장 실패 종목
+    bulk_tickers: int = 0  # 일괄 조회로 채운 종목 수
+    api_calls: int = 0  # Kiwoom API 호출 수
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": len(self.collected),
+            "rows": sum(self.collected.values()),
+            "skipped": len(self.skipped),
+            "failed": len(self.failed),
+            "bulk_tickers": self.bulk_tickers,
+            "api_calls": self.api_calls,
+        }
+
+
+@dataclass
+class _InvestorRanking:
+    """투자자 한 유형의 일괄 조회 결과"""
+    values: Dict[str, int] = field(default_factory=dict)
+    complete: bool = True  # 모든 시장/방향을 끝까지 받았는지 (미포함 종목 = 순매수 0)
+
+    @property
+    def usable(self) -> bool:
+        """미포함 종목을 순매수 0으로 볼 수 있는지 (빈 목록 = 휴장일/미확정 → 불가)"""
+        return self.complete and bool(self.values)
+
+
+class InstitutionalFlowCollector:
+    """
+    기관/외국인 수급 수집기
+
+    Kiwoom REST API로 수급 데이터를 수집해 institutional_flows에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        kiwoom_api=None,
+        rate_limiter: Optional[AsyncTokenBucket] = None,
+        concurrency: int = FLOW_CONCURRENCY,
+        batch_size: int = FLOW_BATCH_SIZE,
+    ):
+        """
+        초기화
+
+        Args:
+            kiwoom_api: KiwoomRestAPI 인스턴스 (선택, 없으면 환경변수에서 생성)
+            rate_limiter: API 호출 토큰 버킷 (None이면 KIWOOM_REQUESTS_PER_SECOND 기준 생성)
+            concurrency: 종목별 조회 동시 실행 수
+            batch_size: UPSERT/커밋 단위 종목 수
+        """
+        self._api = kiwoom_api
+        self._limiter = rate_limiter or AsyncTokenBucket(KIWOOM_REQUESTS_PER_SECOND)
+        self._concurrency = max(1, concurrency)
+        self._batch_size = max(1, batch_size)
+
+    async def _get_api(self):
+        """API 인스턴스 가져오기 (lazy init)"""
+        if self._api is None:
+            from src.kiwoom.rest_api import KiwoomRestAPI
+            self._api = KiwoomRestAPI.from_env()
+        return self._api
+
+    async def collect(
+        self,
+        tickers: List[str],
+        db,
+        days: int = FLOW_LOOKBACK_DAYS,
+        base_date: Optional[str] = None,
+        use_bulk: bool = True,
+    ) -> FlowCollectionResult:
+        """
+        다중 종목 수급 수집
+
+        Args:
+            tickers: 종목 코드 리스트
+            db: DB 세션
+            days: 수급 이력이 없는 종목의 수집 기간 (달력일)
+            base_date: 기준일자 (YYYYMMDD, None이면 수급이 확정된 마지막 평일)
+            use_bulk: 기준일 하루만 빠진 종목에 일괄 조회(ka10058) 사용 여부
+
+        Returns:
+            FlowCollectionResult
+        """
+        result = FlowCollectionResult()
+        tickers = sorted(set(tickers))
+        target_date = latest_weekday(base_date) if base_date else latest_completed_session()
+        # 동기 DB 작업은 스레드에서 실행해 이벤트 루프를 막지 않음
+        latest_flows = await asyncio.to_thread(self._get_latest_flow_dates, db, tickers)
+
+        # gap 감지: 종목별 수집 시작일 (이 날짜 이후만 저장)
+        pending: Dict[str, date] = {}
+        for ticker in tickers:
+            last = latest_flows.get(ticker)
+            if last is not None and last >= target_date:
+                result.skipped.append(ticker)
+                continue
+            pending[ticker] = last if last is not None else target_date - timedelta(days=days)
+
+        # 기준일 하루만 빠진 종목은 시장 단위 일괄 조회로 채움
+        prev_day = previous_weekday(target_date)
+        daily_gap = [t for t, since in pending.items() if since >= prev_day]
+        if use_bulk and daily_gap:
+            bulk_rows = await self._collect_bulk(daily_gap, target_date, result)
+            if bulk_rows is None:
+                # 기준일 거래 내역 없음 (휴장일/미확정) → 채울 날짜가 없음
+                logger.info(f"No investor ranking for {target_date}, treating as non-trading day")
+                for ticker in daily_gap:
+                    pending.pop(ticker)
+                    result.skipped.append(ticker)
+            elif bulk_rows:
+                await asyncio.to_thread(self._save_batch, db, bulk_rows, result)
+                for row in bulk_rows:
+                    pending.pop(row["ticker"], None)
+                result.bulk_tickers = len(bulk_rows)
+
+        # 나머지는 종목별 차트 조회 (페이싱 + 동시 조회)
+        await self._collect_per_ticker(pending, target_date, db, result)
+
+        logger.info(
+            f"Institutional flow collection done: {len(result.collected)} collected "
+            f"({result.bulk_tickers} bulk), {len(result.skipped)} up to date, "
+            f"{len(result.failed)} failed, {result.api_calls} API calls"
+        )
+        return result
+
+    # ------------------------------------------------------------------
+    # 일괄 조회 (ka10058)
+    # ------------------------------------------------------------------
+
+    async def _collect_bulk(
+        self,
+        tickers: List[str],
+        target_date: date,
+        result: FlowCollectionResult,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        투자자별 매매 종목 일괄 조회로 기준일 수급 행 생성
+
+        외국인/기관 각각 순매수·순매도 목록을 끝까지 받고 목록이 비어 있지 않으면
+        목록에 없는 종목은 순매수 0입니다. 목록을 끝까지 받지 못했거나 빈 투자자 유형이 있으면
+        해당 유형에 없는 종목은 종목별 조회로 넘깁니다.
+
+        Returns:
+            수급 행 리스트 (두 목록 모두 끝까지 받았는데 비어 있으면 None - 휴장일/미확정)
+        """
+        day_str = target_date.strftime("%Y%m%d")
+        foreign = await self._fetch_investor_ranking(INVESTOR_FOREIGN, day_str, result)
+        institution = await self._fetch_investor_ranking(INVESTOR_INSTITUTION, day_str, result)
+
+        if foreign.complete and institution.complete and not foreign.values and not institution.values:
+            return None
+
+        rows = []
+        for ticker in tickers:
+            covered = (foreign.usable or ticker in foreign.values) and \
+                (institution.usable or ticker in institution.values)
+            if not covered:
+                continue
+            rows.append(build_flow_row(
+                ticker,
+                target_date,
+                foreign.values.get(ticker, 0),
+                institution.values.get(ticker, 0),
+            ))
+        return rows
+
+    async def _fetch_investor_ranking(
+        self,
+        investor_type: str,
+        day_str: str,
+        result: FlowCollectionResult,
+    ) -> _InvestorRanking:
+        """한 투자자 유형의 시장별 순매수/순매도 종목 전체 조회"""
+        api = await self._get_api()
+        ranking = _InvestorRanking()
+
+        for market_type in RANKING_MARKETS.values():
+            for trade_type, sign in (("2", 1), ("1", -1)):
+                cont_yn, next_key = "N", ""
+                for _ in range(RANKING_MAX_PAGES):
+                    await self._limiter.acquire()
+                    result.api_calls += 1
+                    page = await api.get_investor_daily_trade_stocks(
+                        start_date=day_str,
+                        end_date=day_str,
+                        investor_type=investor_type,
+                        market_type=market_type,
+                        trade_type=trade_type,
+                        cont_yn=cont_yn,
+                        next_key=next_key,
+                    )
+                    if page is None:
+                        ranking.complete = False
+                        break
+
+                    for item in page.get("data", []):
+                        ticker = normalize_ticker(item.get("stk_cd"))
+                        if ticker:
+                            quantity = abs(parse_signed_number(item.get("netslmt_qty")))
+                            ranking.values[ticker] = sign * quantity
+
+                    cont_yn, next_key = page.get("cont_yn", "N"), page.get("next_key", "")
+                    if cont_yn != "Y" or not next_key:
+                        break
+                else:
+                    # 최대 페이지 도달 → 목록이 잘렸을 수 있음
+                    ranking.complete = False
+
+        return ranking
+
+    # ------------------------------------------------------------------
+    # 종목별 조회 (ka10060)
+    # ------------------------------------------------------------------
+
+    async def _collect_per_ticker(
+        self,
+        pending: Dict[str, date],
+        target_date: date,
+        db,
+        result: FlowCollectionResult,
+    ) -> None:
+        """종목별 투자자 차트를 페이싱하며 동시 조회하고 배치마다 저장"""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def fetch(ticker: str, since: date) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            async with semaphore:
+                await self._limiter.acquire()
+                result.api_calls += 1
+                try:
+                    return ticker, await self._fetch_ticker_rows(ticker, since, target_date)
+                except Exception as e:
+                    logger.error(f"Error collecting institutional flow for {ticker}: {e}")
+                    return ticker, None
+
+        items = list(pending.items())
+        for start in range(0, len(items), self._batch_size):
+            batch = items[start:start + self._batch_size]
+            fetched = await asyncio.gather(*(fetch(ticker, since) for ticker, since in batch))
+
+            rows: List[Dict[str, Any]] = []
+            for ticker, ticker_rows in fetched:
+                if ticker_rows is None:
+                    result.failed.append(ticker)
+                    continue
+                rows.extend(ticker_rows)
+            await asyncio.to_thread(self._save_batch, db, rows, result)
+
+    async def _fetch_ticker_rows(
+        self,
+        ticker: str,
+        since: date,
+        target_date: date,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """종목별 투자자 차트 조회 후 (since, target_date] 구간의 수급 행으로 변환"""
+        api = await self._get_api()
+        chart = await api.get_investor_chart(
+            ticker=ticker,
+            date=target_date.strftime("%Y%m%d"),
+            amt_qty_tp="2",  # 수량
+            unit_tp="1",  # 단주
+        )
+        if chart is None:
+            return None
+
+        rows = []
+        for item in chart.get("data", []):
+            try:
+                day = datetime.strptime(str(item.get("dt", "")), "%Y%m%d").date()
+            except ValueError:
+                continue
+            if since < day <= target_date:
+                rows.append(build_flow_row(
+                    ticker,
+                    day,
+                    parse_signed_number(item.get("frgnr_invsr")),
+                    parse_signed_number(item.get("orgn")),
+                ))
+        return rows
+
+    # ------------------------------------------------------------------
+    # DB
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _save_batch(cls, db, rows: List[Dict[str, Any]], result: FlowCollectionResult) -> None:
+        """배치 UPSERT + 커밋 (실패 시 배치 종목을 failed로 기록)"""
+        if not rows:
+            return
+
+        counts: Dict[str, int] = {}
+        for row in rows:
+            counts[row["ticker"]] = counts.get(row["ticker"], 0) + 1
+
+        try:
+            upsert_institutional_flows(db, cls._with_derived_metrics(db, rows))
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error upserting institutional flow batch ({len(rows)} rows): {e}")
+            db.rollback()
+            result.failed.extend(counts)
+            return
+
+        for ticker, count in counts.items():
+            result.collected[ticker] = result.collected.get(ticker, 0) + count
+
+    @staticmethod
+    def _with_derived_metrics(db, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        새 행과 저장된 이력을 합쳐 파생 컬럼 재계산
+
+        새 행보다 뒤 날짜의 저장된 행도 합계 구간이 바뀌므로 함께 반환해 같은 UPSERT로 갱신합니다.
+        이력 조회에 실패하면 새 행만으로 계산합니다.
+        """
+        from sqlalchemy import select
+        from src.database.models import InstitutionalFlow
+
+        by_ticker: Dict[str, Dict[date, Dict[str, Any]]] = {}
+        for row in rows:
+            by_ticker.setdefault(row["ticker"], {})[row["date"]] = dict(row)
+        first_new = {ticker: min(days) for ticker, days in by_ticker.items()}
+        cutoff = min(first_new.values()) - timedelta(days=DERIVED_HISTORY_DAYS)
+
+        try:
+            stored = db.execute(
+                select(
+                    InstitutionalFlow.ticker,
+                    InstitutionalFlow.date,
+                    InstitutionalFlow.foreign_net_buy,
+                    InstitutionalFlow.inst_net_buy,
+                )
+                .where(InstitutionalFlow.ticker.in_(list(by_ticker)))
+                .where(InstitutionalFlow.date >= cutoff)
+            ).all()
+        except Exception as e:
+            logger.warning(f"Flow history lookup failed, deriving from new rows only: {e}")
+            stored = []
+
+        for ticker, day, foreign, institution in stored:
+            by_ticker[ticker].setdefault(day, build_flow_row(ticker, day, foreign or 0, institution or 0))
+
+        derived = []
+        for ticker, days in by_ticker.items():
+            history = [days[day] for day in sorted(days)]
+            derive_flow_metrics(history)
+            derived.extend(row for row in history if row["date"] >= first_new[ticker])
+        return derived
+
+    @staticmethod
+    def _get_latest_flow_dates(db, tickers: List[str]) -> Dict[str, date]:
+        """종목별 최신 수급 날짜 (조회 실패 시 빈 딕셔너리 → 전 구간 수집)"""
+        if not tickers:
+            return {}
+
+        from sqlalchemy import func, select
+        from src.database.models import InstitutionalFlow
+
+        try:
+            rows = db.execute(
+                select(InstitutionalFlow.ticker, func.max(InstitutionalFlow.date).label("last_date"))
+                .where(InstitutionalFlow.ticker.in_(tickers))
+                .group_by(InstitutionalFlow.ticker)
+            ).all()
+            return {
+                row.ticker: row.last_date
+                for row in rows
+                if isinstance(row.last_date, date)
+            }
+        except Exception as e:
+            logger.warning(f"Latest flow lookup failed, collecting full range: {e}")
+            return {}
@@ -15,6 +15,7 @@ import httpx
 from httpx import HTTPStatusError, RequestError
 
 from src.kiwoom.base import KiwoomConfig, RealtimePrice
+from src.kiwoom.token_broker import KiwoomToken, KiwoomTokenBroker, get_token_broker
 
 
 logger = logging.getLogger(__name__)
@@ -82,14 +83,16 @@ class KiwoomRestAPI:
     # 계좌 정보 (환경변수 또는 설정)
     DEFAULT_ACCOUNT_NO: Optional[str] = None
 
-    def __init__(self, config: KiwoomConfig):
+    def __init__(self, config: KiwoomConfig, token_broker: Optional[KiwoomTokenBroker] = None):
         """
         초기화
 
         Args:
             config: 키움 API 설정
+            token_broker: 토큰 브로커 (기본: 프로세스 공용 브로커)
         """
         self._config = config
+        self._token_broker = token_broker
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
@@ -133,15 +136,37 @@ class KiwoomRestAPI:
 
     # ==================== OAuth2 토큰 관리 ====================
 
+    @property
+    def token_broker(self) -> KiwoomTokenBroker:
+        """토큰 브로커 (프로세스/서비스 간 토큰 공유)"""
+        if self._token_broker is None:
+            self._token_broker = get_token_broker()
+        return self._token_broker
+
     async def issue_token(self) -> bool:
         """
         토큰 발급 (Kiwoom OAuth2 client_credentials)
 
+        항상 새 토큰을 발급하고 토큰 브로커에 공유합니다.
+        일반적인 경우에는 캐시된 토큰을 재사용하는 ensure_token_valid()를 사용하세요.
+
         참조: https://github.com/ralph0830/kiwoom_stock_telegram
 
         Returns:
             발급 성공 여부
         """
+        token = await self._request_new_token()
+        self._apply_token(token)
+        await self.token_broker.store(self._config.app_key, token)
+        return True
+
+    async def _request_new_token(self) -> KiwoomToken:
+        """
+        토큰 발급 API 호출
+
+        Returns:
+            KiwoomToken
+        """
         try:
             client = await self._get_client()
 
@@ -181,30 +206,26 @@ class KiwoomRestAPI:
                     f"Token field not found in response: {result}"
                 )
 
-            self._access_token = access_token
-
-            # 토큰 만료 시간 저장
+            # 토큰 만료 시간
             # 키움 API 응답 형식: expires_dt = "YYYYMMDDHHMMSS"
             expires_dt_str = result.get('expires_dt')
+            expires_at = None
             if expires_dt_str:
                 try:
                     # 키움 API 응답 형식: YYYYMMDDHHMMSS
                     token_expiry = datetime.strptime(expires_dt_str, "%Y%m%d%H%M%S")
-                    self._token_expires_at = token_expiry.timestamp()
+                    expires_at = token_expiry.timestamp()
                     logger.info(f"Token expires at: {expires_dt_str}")
                 except ValueError:
                     logger.warning(f"Failed to parse token expiry: {expires_dt_str}, using default (23 hours)")
-                    self._token_expires_at = (
-                        datetime.now(timezone.utc) + timedelta(hours=23)
-                    ).timestamp()
             else:
                 logger.warning("No token expiry in response, using default (23 hours)")
-                self._token_expires_at = (
-                    datetime.now(timezone.utc) + timedelta(hours=23)
-                ).timestamp()
+
+            if expires_at is None:
+                expires_at = (datetime.now(timezone.utc) + timedelta(hours=23)).timestamp()
 
             logger.info("Kiwoom token issued successfully")
-            return True
+            return KiwoomToken(access_token=access_token, expires_at=expires_at)
 
         except HTTPStatusError as e:
             logger.error(f"Token issue failed: {e.response.status_code}")
@@ -216,6 +237,20 @@ class KiwoomRestAPI:
             logger.error(f"Token issue error: {e}")
             raise KiwoomAPIError(f"Token issue error: {e}") from e
 
+    def _apply_token(self, token: KiwoomToken) -> None:
+        """브로커에서 받은 토큰을 인스턴스 상태에 반영"""
+        self._access_token = token.access_token
+        self._token_expires_at = token.expires_at
+
+    async def _acquire_shared_token(self, stale_token: Optional[str] = None) -> None:
+        """토큰 브로커에서 토큰 획득 (캐시 우선, 필요 시 single-flight 발급)"""
+        token = await self.token_broker.get_token(
+            self._config.app_key,
+            self._request_new_token,
+            stale_token=stale_token,
+        )
+        self._apply_token(token)
+
     async def refresh_token(self) -> bool:
         """
         토큰 갱신 (Kiwoom OAuth2)
@@ -302,13 +337,35 @@ class KiwoomRestAPI:
         유효한 토큰 보장
 
         토큰이 없거나 만료되었으면 갱신합니다.
+        refresh token이 없으면 토큰 브로커를 통해 공유 토큰을 사용하고,
+        만료 refresh_margin초 전부터 미리 갱신합니다.
         """
         async with self._token_lock:
-            if not self.is_token_valid():
-                if self._refresh_token:
+            if self._refresh_token:
+                if not self.is_token_valid():
                     await self.refresh_token()
-                else:
-                    await self.issue_token()
+                return
+
+            if self.is_token_valid() and not self.is_token_expiring_soon(
+                int(self.token_broker.refresh_margin)
+            ):
+                return
+            await self._acquire_shared_token()
+
+    async def _handle_unauthorized(self, rejected_token: Optional[str]) -> None:
+        """
+        401 응답 처리
+
+        같은 토큰이 동시에 여러 요청에서 거부되어도 재발급은 한 번만 일어납니다.
+        """
+        async with self._token_lock:
+            if self._refresh_token:
+                await self.refresh_token()
+                return
+            if self._access_token != rejected_token and self.is_token_valid():
+                # 다른 요청이 이미 갱신함
+                return
+            await self._acquire_shared_token(stale_token=rejected_token)
 
     async def reauthenticate(self) -> bool:
         """
@@ -318,10 +375,13 @@ class KiwoomRestAPI:
             재인증 성공 여부
         """
         try:
+            stale_token = self._access_token
             self._access_token = None
             self._refresh_token = None
             self._token_expires_at = None
-            return await self.issue_token()
+            async with self._token_lock:
+                await self._acquire_shared_token(stale_token=stale_token)
+            return True
         except Exception as e:
             logger.error(f"Reauthentication failed: {e}")
             return False
@@ -352,8 +412,9 @@ class KiwoomRestAPI:
         await self.ensure_token_valid()
 
         client = await self._get_client()
+        sent_token = self._access_token
         headers = {
-            "Authorization": f"Bearer {self._access_token}",
+            "Authorization": f"Bearer {sent_token}",
         }
 
         last_error = None
@@ -370,8 +431,9 @@ class KiwoomRestAPI:
 
                 # 401 에러 시 토큰 갱신 후 재시도
                 if response.status_code == 401 and attempt < retry_count:
-                    await self.refresh_token()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
+                    await self._handle_unauthorized(sent_token)
+                    sent_token = self._access_token
+                    headers["Authorization"] = f"Bearer {sent_token}"
                     continue
 
                 response.raise_for_status()
@@ -491,6 +553,86 @@ class KiwoomRestAPI:
             logger.error(f"Get current price error: {e}")
             return None
 
+    async def get_current_prices(
+        self,
+        tickers: List[str],
+        chunk_size: int = 100,
+    ) -> Dict[str, RealtimePrice]:
+        """
+        다중 종목 현재가 조회 (ka10095 관심종목정보요청)
+
+        종목코드를 '|'로 연결해 chunk_size개씩 한 번에 조회합니다.
+        응답에 없는 종목은 결과에서 빠지므로 호출 측에서 개별 조회로 보완해야 합니다.
+
+        Args:
+            tickers: 종목코드 리스트
+            chunk_size: 요청당 최대 종목 수
+
+        Returns:
+            {ticker: RealtimePrice}
+        """
+        def parse_number(value: Any, signed: bool = False) -> float:
+            """숫자 문자열 파싱 (가격은 부호 제거, 대비/등락률은 부호 유지)"""
+            text = str(value or "0").replace(",", "").strip()
+            if not signed:
+                text = text.lstrip("+-")
+            try:
+                return float(text or 0)
+            except ValueError:
+                return 0.0
+
+        results: Dict[str, RealtimePrice] = {}
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        for start in range(0, len(tickers), chunk_size):
+            chunk = tickers[start:start + chunk_size]
+            try:
+                await self.ensure_token_valid()
+                client = await self._get_client()
+
+                headers = {
+                    "Authorization": f"Bearer {self._access_token}",
+                    "api-id": "ka10095",  # 관심종목정보요청 API ID
+                    "Content-Type": "application/json;charset=UTF-8",
+                }
+
+                response = await client.post(
+                    self.STOCK_LIST_URL,
+                    json={"stk_cd": "|".join(chunk)},
+                    headers=headers,
+                )
+                response.raise_for_status()
+                result = response.json()
+
+                return_code = result.get("return_code", -1)
+                if return_code != 0:
+                    logger.warning(f"Batch quote API returned code {return_code}: {result.get('return_msg')}")
+                    continue
+
+                for item in result.get("atn_stk_infr", []):
+                    ticker = str(item.get("stk_cd", "")).replace("A", "")[:6]
+                    price = parse_number(item.get("cur_prc"))
+                    if not ticker or price == 0:
+                        continue
+
+                    results[ticker] = RealtimePrice(
+                        ticker=ticker,
+                        price=price,
+                        change=parse_number(item.get("pred_pre"), signed=True),
+                        change_rate=parse_number(item.get("flu_rt"), signed=True),
+                        volume=int(parse_number(item.get("trde_qty"))),
+                        bid_price=parse_number(item.get("buy_bid")),
+                        ask_price=parse_number(item.get("sel_bid")),
+                        timestamp=timestamp,
+                    )
+
+            except HTTPStatusError as e:
+                logger.error(f"Batch quote failed: {e.response.status_code}")
+            except Exception as e:
+                logger.error(f"Batch quote error: {e}")
+
+        return results
+
     # ==================== 차트 데이터 조회 ====================
 
     async def get_investor_chart(
@@ -609,6 +751,83 @@ class KiwoomRestAPI:
             logger.error(f"Get investor chart error: {e}")
             return None
 
+    async def get_investor_daily_trade_stocks(
+        self,
+        start_date: str,
+        end_date: str,
+        investor_type: str,
+        market_type: str = "001",  # 001:코스피, 101:코스닥
+        trade_type: str = "2",     # 1:순매도, 2:순매수
+        exchange_type: str = "3",  # 1:KRX, 2:NXT, 3:통합
+        cont_yn: str = "N",
+        next_key: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        투자자별 일별 매매 종목 조회 (ka10058)
+
+        한 투자자 유형의 순매수(또는 순매도) 종목을 시장 단위로 한 번에 조회합니다.
+        연속조회로 끝까지 받으면 해당 기간 순매수/순매도가 있는 전 종목이 포함됩니다.
+
+        Args:
+            start_date: 시작일자 (YYYYMMDD)
+            end_date: 종료일자 (YYYYMMDD)
+            investor_type: 투자자 구분 (9000:외국인, 9999:기관계, 8000:개인 등)
+            market_type: 시장 구분 (001:코스피, 101:코스닥)
+            trade_type: 매매 구분 (1:순매도, 2:순매수)
+            exchange_type: 거래소 구분
+            cont_yn: 연속조회여부 (Y:연속, N:최초)
+            next_key: 연속조회키
+
+        Returns:
+            {"data": [...], "cont_yn": str, "next_key": str} 또는 None (실패/429)
+        """
+        try:
+            await self.ensure_token_valid()
+            client = await self._get_client()
+
+            headers = {
+                "Authorization": f"Bearer {self._access_token}",
+                "api-id": "ka10058",
+                "Content-Type": "application/json;charset=UTF-8",
+            }
+            if cont_yn == "Y" and next_key:
+                headers["cont-yn"] = "Y"
+                headers["next-key"] = next_key
+
+            response = await client.post(
+                self.STOCK_LIST_URL,
+                json={
+                    "strt_dt": start_date,
+                    "end_dt": end_date,
+                    "trde_tp": trade_type,
+                    "mrkt_tp": market_type,
+                    "invsr_tp": investor_type,
+                    "stex_tp": exchange_type,
+                },
+                headers=headers,
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            return_code = result.get("return_code", -1)
+            if return_code != 0:
+                logger.warning(f"Investor trade API returned code {return_code}: {result.get('return_msg')}")
+                return None
+
+            # 연속조회 정보는 응답 헤더로 전달됨 (본문 값은 하위 호환용)
+            return {
+                "data": result.get("invsr_daly_trde_stk", []),
+                "cont_yn": response.headers.get("cont-yn") or result.get("cont-yn", "N"),
+                "next_key": response.headers.get("next-key") or result.get("next-key", ""),
+            }
+
+        except HTTPStatusError as e:
+            logger.warning(f"Get investor daily trade stocks failed: {e.response.status_code}")
+            return None
+        except Exception as e:
+            logger.error(f"Get investor daily trade stocks error: {e}")
+            return None
+
     async def get_daily_prices(
         self,
         ticker: str,
@@ -913,13 +1132,13 @@ class KiwoomRestAPI:
 
     async def connect(self) -> bool:
         """
-        API 연결 (토큰 발급)
+        API 연결 (토큰 확보, 유효한 공유 토큰이 있으면 발급하지 않음)
 
         Returns:
             연결 성공 여부
         """
         try:
-            await self.issue_token()
+            await self.ensure_token_valid()
             return True
         except Exception as e:
             logger.error(f"Connect failed: {e}")
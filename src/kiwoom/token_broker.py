@@ -0,0 +1,384 @@
+"""
+키움 액세스 토큰 브로커
+
+키움은 토큰 발급 횟수를 제한하므로 프로세스/서비스마다 토큰을 새로 발급하지 않고 공유합니다.
+
+- 프로세스 메모리 캐시 → Redis 공유 캐시 → 발급 순서로 조회
+  (유효한 토큰이 Redis에 있으면 워커 콜드 스타트에서도 발급 요청 0회)
+- 발급은 Redis 분산 락(SET NX PX)을 잡은 프로세스 하나만 수행하고,
+  나머지는 기존 토큰을 계속 쓰거나 새 토큰이 Redis에 올라올 때까지 대기
+- 만료 refresh_margin초 전부터 미리 갱신 (갱신 중에도 기존 토큰은 계속 사용)
+- 401 응답 시 stale_token을 넘기면 같은 토큰에 대한 재발급은 한 번만 일어남
+
+Redis 호출은 동기 클라이언트를 스레드에서 실행합니다.
+Celery 태스크처럼 호출마다 이벤트 루프가 달라져도 커넥션이 특정 루프에 묶이지 않습니다.
+Redis에 연결할 수 없으면 프로세스 메모리 캐시만으로 동작합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+import redis
+from redis.exceptions import WatchError
+
+logger = logging.getLogger(__name__)
+
+# Redis 연결 설정
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6380/0")
+
+# Redis 키 Prefix (앱 키 원문 대신 해시 사용)
+TOKEN_KEY_PREFIX = "kiwoom:token:"
+LOCK_KEY_SUFFIX = ":lock"
+
+# 만료 몇 초 전부터 미리 갱신할지
+REFRESH_MARGIN_SECONDS = 600
+
+# 분산 락 유지 시간 (ms) / 다른 프로세스의 발급을 기다리는 최대 시간 (초)
+LOCK_TTL_MS = 30_000
+LOCK_WAIT_SECONDS = 35.0
+LOCK_POLL_INTERVAL = 0.2
+
+# Redis 연결 실패 후 재시도까지 대기 (초)
+REDIS_RETRY_INTERVAL = 30.0
+
+
+@dataclass(frozen=True)
+class KiwoomToken:
+    """키움 액세스 토큰"""
+    access_token: str
+    expires_at: float  # 만료 시각 (epoch 초)
+
+    def ttl(self) -> float:
+        """남은 유효 시간 (초)"""
+        return self.expires_at - time.time()
+
+    def is_valid(self, margin: float = 0.0) -> bool:
+        """margin초 이후에도 유효한지 여부"""
+        return bool(self.access_token) and self.ttl() > margin
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw) -> "KiwoomToken":
+        data = json.loads(raw)
+        return cls(access_token=data["access_token"], expires_at=float(data["expires_at"]))
+
+
+TokenIssuer = Callable[[], Awaitable[KiwoomToken]]
+
+
+class KiwoomTokenBroker:
+    """
+    프로세스/서비스 공용 키움 토큰 브로커
+
+    앱 키별로 토큰을 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = REDIS_URL,
+        refresh_margin: float = REFRESH_MARGIN_SECONDS,
+        lock_ttl_ms: int = LOCK_TTL_MS,
+        lock_wait: float = LOCK_WAIT_SECONDS,
+        client=None,
+    ):
+        """
+        Args:
+            redis_url: Redis URL (None이면 Redis 없이 프로세스 메모리 캐시만 사용)
+            refresh_margin: 만료 몇 초 전부터 미리 갱신할지
+            lock_ttl_ms: 분산 락 유지 시간 (ms)
+            lock_wait: 다른 프로세스의 발급을 기다리는 최대 시간 (초)
+            client: 주입할 동기 redis 호환 클라이언트 (테스트용)
+        """
+        self.redis_url = redis_url
+        self.refresh_margin = refresh_margin
+        self.lock_ttl_ms = lock_ttl_ms
+        self.lock_wait = lock_wait
+
+        self._redis_client = client
+        self._owns_client = client is None
+        self._redis_down_until = 0.0
+        self._local: Dict[str, KiwoomToken] = {}
+        self._guard = threading.Lock()
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {"local_hits": 0, "shared_hits": 0, "issued": 0, "waited": 0}
+
+    @staticmethod
+    def cache_key(app_key: Optional[str]) -> str:
+        """앱 키별 Redis 키 (원문 노출 방지용 해시)"""
+        digest = hashlib.sha256((app_key or "").encode("utf-8")).hexdigest()[:16]
+        return f"{TOKEN_KEY_PREFIX}{digest}"
+
+    # ------------------------------------------------------------------
+    # 조회 / 발급
+    # ------------------------------------------------------------------
+
+    async def get_token(
+        self,
+        app_key: Optional[str],
+        issuer: TokenIssuer,
+        stale_token: Optional[str] = None,
+    ) -> KiwoomToken:
+        """
+        유효한 토큰 반환 (필요할 때만 발급)
+
+        Args:
+            app_key: 키움 앱 키
+            issuer: 새 토큰 발급 함수
+            stale_token: 서버에서 거부된 토큰 (401), 이 토큰은 다시 반환하지 않음
+
+        Returns:
+            KiwoomToken
+
+        Raises:
+            issuer가 발생시킨 예외
+        """
+        key = self.cache_key(app_key)
+
+        def usable(token: Optional[KiwoomToken]) -> bool:
+            return token is not None and token.is_valid() and token.access_token != stale_token
+
+        def fresh(token: Optional[KiwoomToken]) -> bool:
+            return usable(token) and token.is_valid(self.refresh_margin)
+
+        token = self._local.get(key)
+        if fresh(token):
+            self.stats["local_hits"] += 1
+            return token
+
+        async with self._lock_for(key):
+            # 대기하는 동안 같은 프로세스의 다른 요청이 갱신했을 수 있음
+            token = self._local.get(key)
+            if fresh(token):
+                self.stats["local_hits"] += 1
+                return token
+
+            shared = await asyncio.to_thread(self._read_shared, key)
+            if fresh(shared):
+                self._local[key] = shared
+                self.stats["shared_hits"] += 1
+                return shared
+
+            if usable(shared):
+                current = shared
+            elif usable(token):
+                current = token
+            else:
+                current = None
+            return await self._refresh(key, issuer, usable, fresh, current)
+
+    async def _refresh(self, key, issuer, usable, fresh, current) -> KiwoomToken:
+        """분산 락을 잡고 발급하거나, 다른 프로세스의 발급 결과를 대기"""
+        deadline = time.monotonic() + self.lock_wait
+
+        while True:
+            lock_id = await asyncio.to_thread(self._acquire_lock, key)
+            if lock_id is not None:
+                try:
+                    if lock_id:
+                        # 락을 잡기 직전에 다른 프로세스가 발급했을 수 있음
+                        shared = await asyncio.to_thread(self._read_shared, key)
+                        if fresh(shared):
+                            self._local[key] = shared
+                            self.stats["shared_hits"] += 1
+                            return shared
+                    return await self._issue(key, issuer)
+                finally:
+                    if lock_id:
+                        await asyncio.to_thread(self._release_lock, key, lock_id)
+
+            # 다른 프로세스가 발급 중: 아직 유효한 토큰이 있으면 그대로 사용
+            if current is not None:
+                self._local[key] = current
+                return current
+
+            if time.monotonic() >= deadline:
+                logger.warning("Timed out waiting for shared Kiwoom token, issuing locally")
+                return await self._issue(key, issuer)
+
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            shared = await asyncio.to_thread(self._read_shared, key)
+            if usable(shared):
+                self._local[key] = shared
+                self.stats["waited"] += 1
+                return shared
+
+    async def _issue(self, key: str, issuer: TokenIssuer) -> KiwoomToken:
+        token = await issuer()
+        self.stats["issued"] += 1
+        self._local[key] = token
+        await asyncio.to_thread(self._write_shared, key, token)
+        logger.info(f"Kiwoom token issued and shared (expires in {token.ttl():.0f}s)")
+        return token
+
+    async def store(self, app_key: Optional[str], token: KiwoomToken) -> None:
+        """직접 발급한 토큰을 공유 캐시에 저장"""
+        key = self.cache_key(app_key)
+        self._local[key] = token
+        await asyncio.to_thread(self._write_shared, key, token)
+
+    async def peek(self, app_key: Optional[str]) -> Optional[KiwoomToken]:
+        """발급 없이 캐시된 유효 토큰만 조회"""
+        key = self.cache_key(app_key)
+        token = self._local.get(key)
+        if token is not None and token.is_valid():
+            return token
+        if self._redis_client is None and self.redis_url is None:
+            return None
+        shared = await asyncio.to_thread(self._read_shared, key)
+        if shared is not None and shared.is_valid():
+            self._local[key] = shared
+            return shared
+        return None
+
+    def reset(self) -> None:
+        """프로세스 메모리 캐시 초기화 (Redis 공유 캐시는 유지)"""
+        self._local.clear()
+
+    def _lock_for(self, key: str) -> asyncio.Lock:
+        """이벤트 루프별 in-process single-flight 락"""
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            locks = self._loop_locks.get(loop)
+            if locks is None:
+                locks = {}
+                self._loop_locks[loop] = locks
+            lock = locks.get(key)
+            if lock is None:
+                lock = asyncio.Lock()
+                locks[key] = lock
+            return lock
+
+    # ------------------------------------------------------------------
+    # Redis (동기, 스레드에서 실행)
+    # ------------------------------------------------------------------
+
+    def _get_redis(self):
+        """동기 Redis 클라이언트 (최근 연결 실패 시 None)"""
+        if self._redis_client is not None:
+            return self._redis_client
+        if self.redis_url is None or time.monotonic() < self._redis_down_until:
+            return None
+        try:
+            client = redis.Redis.from_url(
+                self.redis_url, socket_connect_timeout=1.0, socket_timeout=2.0
+            )
+            client.ping()
+            self._redis_client = client
+            return client
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None
+
+    def _mark_redis_down(self, error: Exception) -> None:
+        logger.warning(f"Kiwoom token broker Redis unavailable: {error}, using process cache")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+        if self._owns_client:
+            self._redis_client = None
+
+    def _read_shared(self, key: str) -> Optional[KiwoomToken]:
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+            return KiwoomToken.from_json(raw) if raw else None
+        except (ValueError, KeyError, TypeError):
+            return None
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None
+
+    def _write_shared(self, key: str, token: KiwoomToken) -> None:
+        client = self._get_redis()
+        ttl_ms = int(token.ttl() * 1000)
+        if client is None or ttl_ms <= 0:
+            return
+        try:
+            client.set(key, token.to_json(), px=ttl_ms)
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    def _acquire_lock(self, key: str) -> Optional[str]:
+        """
+        분산 락 획득
+
+        Returns:
+            락 ID (획득), "" (Redis 없음, 락 없이 진행), None (다른 프로세스가 보유)
+        """
+        client = self._get_redis()
+        if client is None:
+            return ""
+        lock_id = uuid.uuid4().hex
+        try:
+            if client.set(f"{key}{LOCK_KEY_SUFFIX}", lock_id, nx=True, px=self.lock_ttl_ms):
+                return lock_id
+            return None
+        except Exception as e:
+            self._mark_redis_down(e)
+            return ""
+
+    def _release_lock(self, key: str, lock_id: str) -> None:
+        client = self._get_redis()
+        if client is None:
+            return
+        lock_key = f"{key}{LOCK_KEY_SUFFIX}"
+        try:
+            # 락 소유자만 해제 (WATCH 기반 compare-and-delete)
+            with client.pipeline() as pipe:
+                pipe.watch(lock_key)
+                current = pipe.get(lock_key)
+                if isinstance(current, bytes):
+                    current = current.decode()
+                if current == lock_id:
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+        except WatchError:
+            # 락이 만료되어 다른 프로세스가 가져감
+            pass
+        except Exception as e:
+            self._mark_redis_down(e)
+
+
+# 싱글톤 인스턴스
+_token_broker: Optional[KiwoomTokenBroker] = None
+_token_broker_guard = threading.Lock()
+
+
+def get_token_broker() -> KiwoomTokenBroker:
+    """프로세스 공용 토큰 브로커 반환"""
+    global _token_broker
+    if _token_broker is None:
+        with _token_broker_guard:
+            if _token_broker is None:
+                _token_broker = KiwoomTokenBroker()
+    return _token_broker
+
+
+def set_token_broker(broker: Optional[KiwoomTokenBroker]) -> None:
+    """프로세스 공용 토큰 브로커 교체 (테스트/커스텀 설정용)"""
+    global _token_broker
+    with _token_broker_guard:
+        _token_broker = broker
+
+
+def reset_token_broker() -> None:
+    """토큰 브로커 싱글톤 초기화 (테스트용)"""
+    global _token_broker
+    with _token_broker_guard:
+        _token_broker = None
@@ -20,6 +20,7 @@ from src.kiwoom.base import (
     IndexRealtimePrice,
     IKiwoomBridge
 )
+from src.kiwoom.token_broker import get_token_broker
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -95,7 +96,7 @@ class KiwoomWebSocket(IKiwoomBridge):
         WebSocket 연결 및 로그인 (키움 프로토콜)
 
         Args:
-            access_token: OAuth2 액세스 토큰 (없으면 REST API에서 발급)
+            access_token: OAuth2 액세스 토큰 (없으면 토큰 브로커의 공유 토큰 사용, 필요 시 발급)
 
         Returns:
             연결 성공 여부
@@ -106,18 +107,20 @@ class KiwoomWebSocket(IKiwoomBridge):
 
         self._stop_requested = False
 
-        # 액세스 토큰이 없으면 REST API에서 발급 시도
+        # 액세스 토큰이 없으면 토큰 브로커에서 공유 토큰 확보 (유효한 토큰이 있으면 발급하지 않음)
         if access_token is None:
             from src.kiwoom.rest_api import KiwoomRestAPI
             rest_api = KiwoomRestAPI(self._config)
             try:
-                await rest_api.issue_token()
+                await rest_api.ensure_token_valid()
                 access_token = rest_api._access_token
-                logger.info("Token obtained from REST API")
+                logger.info("Token obtained from token broker")
             except Exception as e:
                 logger.warning(f"Failed to get token from REST API: {e}")
                 logger.warning("Attempting WebSocket connection without token (may fail)")
                 # 토큰 없이 연결 시도 - WebSocket 서버에서 에러 반환 확인용
+            finally:
+                await rest_api.close()
 
         self._access_token = access_token
 
@@ -512,6 +515,17 @@ class KiwoomWebSocket(IKiwoomBridge):
             if self._stop_requested:
                 break
 
+    async def _adopt_shared_token(self) -> None:
+        """다른 프로세스가 갱신한 공유 토큰이 있으면 재연결에 사용"""
+        try:
+            shared = await get_token_broker().peek(self._config.app_key)
+        except Exception as e:
+            logger.debug(f"Shared token lookup failed: {e}")
+            return
+        if shared is not None and shared.access_token != self._access_token:
+            logger.info("Using refreshed shared token for reconnection")
+            self._access_token = shared.access_token
+
     async def _reconnect(self, max_attempts: Optional[int] = None) -> bool:
         """
         재연결 시도 (지수 백오프 적용)
@@ -526,6 +540,8 @@ class KiwoomWebSocket(IKiwoomBridge):
             logger.error("Cannot reconnect: no access token")
             return False
 
+        await self._adopt_shared_token()
+
         attempts = max_attempts if max_attempts is not None else self._max_reconnect_attempts
         delay = self._reconnect_delay
 
@@ -3,13 +3,22 @@ API Key Authentication Middleware
 
 X-API-Key 헤더를 통한 API 인증
 """
+import asyncio
 import logging
+import time
 from typing import Callable, Optional
 from fastapi import Request, Response, HTTPException, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.database.session import get_db_session
 from src.database.models_api_key import APIKey
+from src.middleware.api_key_cache import (
+    APIKeyUsageRecorder,
+    APIKeyValidationCache,
+    ValidatedAPIKey,
+    hash_api_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +32,17 @@ PUBLIC_PATHS = {
     "/api/system/health",
 }
 
+# 무효화 구독이 끊겼을 때 재시작 시도 최소 간격 (초)
+LISTENER_RETRY_INTERVAL = 30.0
+
 
 class APIKeyAuthMiddleware(BaseHTTPMiddleware):
     """
     API Key 인증 미들웨어
 
     X-API-Key 헤더를 검증하여 API 접근을 제어합니다.
+    검증 결과는 키 해시 기준으로 캐시되어 DB 조회는 캐시 미스일 때만 발생하고,
+    사용량은 메모리에 누적된 뒤 주기적으로 일괄 기록됩니다.
 
     ## 사용법
     ```python
@@ -44,48 +58,79 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         app,
         excluded_paths: Optional[set[str]] = None,
         require_auth: bool = False,  # True면 모든 경로 인증 필요
+        cache: Optional[APIKeyValidationCache] = None,
+        usage_recorder: Optional[APIKeyUsageRecorder] = None,
     ):
         super().__init__(app)
         self._excluded_paths = excluded_paths or PUBLIC_PATHS
         self._require_auth = require_auth
+        self._cache = cache or APIKeyValidationCache()
+        self._usage = usage_recorder or APIKeyUsageRecorder()
+        self._next_listener_start = 0.0
+
+    async def _ensure_started(self) -> None:
+        """
+        무효화 구독 및 사용량 flush 태스크 지연 시작 (이벤트 루프 필요)
+
+        구독 태스크가 종료되어 있으면 LISTENER_RETRY_INTERVAL 간격으로 다시 시작합니다.
+        """
+        self._usage.start()
+        if self._cache.listening or time.monotonic() < self._next_listener_start:
+            return
+        self._next_listener_start = time.monotonic() + LISTENER_RETRY_INTERVAL
+        await self._cache.start()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        error_response = await self.authenticate(request)
+        if error_response is not None:
+            return error_response
+        return await call_next(request)
+
+    async def authenticate(self, request: Request) -> Optional[Response]:
+        """
+        요청 인증
+
+        성공 시 request.state에 키 정보를 저장하고 None을 반환합니다.
+        (BaseHTTPMiddleware 밖의 ASGI 파이프라인에서도 재사용)
+
+        Returns:
+            인증 실패 시 401/403 응답, 통과 시 None
+        """
         path = request.url.path
 
         # 공개 경로는 인증 스킵
         if self._is_public_path(path):
-            return await call_next(request)
+            return None
 
         # API 키 확인
         api_key = request.headers.get("X-API-Key")
 
         if not api_key:
             if self._require_auth:
-                raise HTTPException(
+                return JSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="API Key required. Include X-API-Key header.",
+                    content={"detail": "API Key required. Include X-API-Key header."},
                 )
-            else:
-                # 인증이 선택사항인 경우 계속 진행
-                return await call_next(request)
+            # 인증이 선택사항인 경우 계속 진행
+            return None
 
-        # API 키 검증
+        # API 키 검증 (캐시 우선)
+        await self._ensure_started()
         key_validity = await self._validate_api_key(api_key)
 
         if not key_validity["valid"]:
-            raise HTTPException(
+            return JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=key_validity["error"],
+                content={"detail": key_validity["error"]},
             )
 
         # 요청 상태에 권한 정보 저장
         request.state.api_key = key_validity["key"]
         request.state.api_scope = key_validity["scope"]
 
-        # 마지막 사용 시간 업데이트 (비동기로 처리하여 지연 방지)
-        # await self._update_last_used(api_key)
-
-        return await call_next(request)
+        # 사용량은 메모리에 누적 후 주기적으로 일괄 기록
+        self._usage.record(key_validity["key"].id)
+        return None
 
     def _is_public_path(self, path: str) -> bool:
         """공개 경로 확인"""
@@ -105,8 +150,21 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         API 키 검증
 
         Returns:
-            {"valid": bool, "key": APIKey, "scope": str, "error": str}
+            {"valid": bool, "key": ValidatedAPIKey, "scope": str, "error": str}
         """
+        key_hash = hash_api_key(api_key)
+        cached = self._cache.get(key_hash)
+        if cached is not None:
+            return cached
+
+        # 동기 DB 조회는 스레드에서 실행하여 이벤트 루프 차단 방지
+        result = await asyncio.to_thread(self._query_api_key, api_key)
+        self._cache.put(key_hash, result)
+        return result
+
+    @staticmethod
+    def _query_api_key(api_key: str) -> dict:
+        """DB에서 API 키 조회 (캐시 미스 시)"""
         try:
             db = next(get_db_session())
 
@@ -127,10 +185,11 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
                         "error": "API Key is inactive or expired",
                     }
 
+                validated = ValidatedAPIKey.from_model(key_obj)
                 return {
                     "valid": True,
-                    "key": key_obj,
-                    "scope": key_obj.scope,
+                    "key": validated,
+                    "scope": validated.scope,
                 }
 
             finally:
@@ -141,27 +200,10 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
             return {
                 "valid": False,
                 "error": "Authentication failed",
+                # DB 장애 결과는 캐싱하지 않음
+                "transient": True,
             }
 
-    async def _update_last_used(self, api_key: str) -> None:
-        """마지막 사용 시간 업데이트"""
-        try:
-            db = next(get_db_session())
-
-            try:
-                key_obj = db.query(APIKey).filter(
-                    APIKey.key == api_key
-                ).first()
-
-                if key_obj:
-                    key_obj.update_last_used()
-                    db.commit()
-            finally:
-                db.close()
-
-        except Exception as e:
-            logger.error(f"Failed to update last_used: {e}")
-
 
 def require_scope(required_scope: str):
     """
@@ -0,0 +1,330 @@
+"""
+API Key Validation Cache
+
+API 키 검증 결과 캐시, Redis Pub/Sub 무효화, 사용량 배치 기록
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from src.cache.local_cache import CacheEntry, LocalCache
+
+logger = logging.getLogger(__name__)
+
+# 키 변경/폐기 이벤트 채널
+API_KEY_EVENTS_CHANNEL = "ralph_stock:api_keys:events"
+
+# 검증 캐시 TTL (초)
+POSITIVE_TTL = 60.0
+NEGATIVE_TTL = 10.0
+
+
+def hash_api_key(api_key: str) -> str:
+    """API 키 SHA-256 해시 (원문 키를 캐시/메시지에 남기지 않기 위함)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _redis_url() -> str:
+    return os.getenv("REDIS_URL", "redis://localhost:6380/0")
+
+
+@dataclass(frozen=True)
+class ValidatedAPIKey:
+    """
+    검증된 API 키 스냅샷
+
+    세션이 닫힌 ORM 객체 대신 요청 처리에 필요한 필드만 보관합니다.
+    """
+    id: int
+    name: str
+    scope: str
+    expires_at: Optional[datetime] = None
+
+    @classmethod
+    def from_model(cls, key_obj: Any) -> "ValidatedAPIKey":
+        return cls(
+            id=key_obj.id,
+            name=key_obj.name,
+            scope=key_obj.scope,
+            expires_at=key_obj.expires_at,
+        )
+
+    def is_expired(self) -> bool:
+        if self.expires_at is None:
+            return False
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at < datetime.now(timezone.utc)
+
+
+class APIKeyValidationCache:
+    """
+    API 키 검증 결과 캐시
+
+    키 해시 → 검증 결과. 유효 키는 POSITIVE_TTL(만료일이 더 가까우면 만료일까지),
+    무효 키는 NEGATIVE_TTL 동안 보관합니다. 키 폐기/변경은 Redis Pub/Sub로
+    모든 게이트웨이 워커에 전파되어 즉시 제거됩니다.
+
+    ## 사용 예시
+    ```python
+    cache = APIKeyValidationCache()
+    await cache.start()
+
+    result = cache.get(key_hash)
+    if result is None:
+        result = await validate_from_db(api_key)
+        cache.put(key_hash, result)
+    ```
+    """
+
+    def __init__(
+        self,
+        positive_ttl: float = POSITIVE_TTL,
+        negative_ttl: float = NEGATIVE_TTL,
+        max_entries: int = 10000,
+        redis_url: Optional[str] = None,
+    ):
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._entries = LocalCache(max_entries=max_entries, ttl=max(positive_ttl, negative_ttl))
+        self._redis_url = redis_url
+        self._redis = None
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    def get(self, key_hash: str) -> Optional[dict]:
+        """캐시된 검증 결과 (없거나 만료 시 None)"""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+
+        result = entry.value
+        key = result.get("key")
+        if result.get("valid") and key is not None and key.is_expired():
+            self._entries.delete(key_hash)
+            return None
+        return result
+
+    def put(self, key_hash: str, result: dict) -> None:
+        """검증 결과 저장 (DB 오류 결과는 캐싱하지 않음)"""
+        if result.get("transient"):
+            return
+
+        ttl = self.positive_ttl if result.get("valid") else self.negative_ttl
+        self._entries.set(key_hash, CacheEntry(value=result, expires_at=time.time() + ttl))
+
+    def invalidate(self, key_hash: Optional[str] = None) -> None:
+        """키 단위 또는 전체 무효화"""
+        if key_hash is None:
+            self._entries.clear()
+        else:
+            self._entries.delete(key_hash)
+
+    def _apply_event(self, event: dict) -> None:
+        if event.get("all"):
+            self.invalidate()
+        elif event.get("key_hash"):
+            self.invalidate(event["key_hash"])
+
+    @property
+    def listening(self) -> bool:
+        return self._listener_task is not None and not self._listener_task.done()
+
+    async def start(self) -> None:
+        """무효화 채널 구독 시작 (Redis 연결 실패 시 TTL 만료에만 의존)"""
+        if self.listening:
+            return
+
+        # 종료된 이전 구독의 연결 정리 후 재구독
+        await self._close_redis()
+        try:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                self._redis_url or _redis_url(),
+                encoding="utf-8",
+                decode_responses=True,
+            )
+            self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(API_KEY_EVENTS_CHANNEL)
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info("API key invalidation listener started")
+        except Exception as e:
+            logger.warning(f"API key invalidation listener unavailable: {e}")
+            await self._close_redis()
+
+    async def _listen(self) -> None:
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    self._apply_event(json.loads(message["data"]))
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Invalid API key event: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 구독이 끊기면 캐시를 비워 오래된 결과가 남지 않게 함
+            logger.warning(f"API key invalidation listener stopped: {e}")
+            self.invalidate()
+
+    async def stop(self) -> None:
+        """구독 종료"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        await self._close_redis()
+
+    async def _close_redis(self) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception:
+                pass
+            self._redis = None
+
+
+async def publish_api_key_change(
+    api_key: Optional[str] = None,
+    key_hash: Optional[str] = None,
+    redis_url: Optional[str] = None,
+) -> bool:
+    """
+    API 키 변경/폐기 이벤트 발행
+
+    키를 지정하지 않으면 모든 워커의 검증 캐시를 비웁니다.
+
+    Args:
+        api_key: 원문 API 키
+        key_hash: API 키 해시 (api_key 대신 사용)
+        redis_url: Redis URL (기본값: REDIS_URL 환경변수)
+
+    Returns:
+        발행 성공 여부
+    """
+    if api_key is not None:
+        key_hash = hash_api_key(api_key)
+    event = {"key_hash": key_hash} if key_hash else {"all": True}
+
+    try:
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(redis_url or _redis_url(), decode_responses=True)
+        try:
+            await client.publish(API_KEY_EVENTS_CHANNEL, json.dumps(event))
+        finally:
+            await client.close()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to publish API key change: {e}")
+        return False
+
+
+class APIKeyUsageRecorder:
+    """
+    API 키 사용량 배치 기록
+
+    요청 경로에서는 메모리 카운터만 증가시키고, flush_interval마다
+    누적된 사용량을 executemany UPDATE 한 번으로 기록합니다.
+    """
+
+    def __init__(self, flush_interval: float = 30.0):
+        self.flush_interval = flush_interval
+        # key_id -> (사용 횟수, 마지막 사용 시각)
+        self._pending: Dict[int, Tuple[int, datetime]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def record(self, key_id: int) -> None:
+        """사용 1회 기록 (I/O 없음)"""
+        count, _ = self._pending.get(key_id, (0, None))
+        self._pending[key_id] = (count + 1, datetime.now(timezone.utc))
+
+    @property
+    def pending(self) -> Dict[int, Tuple[int, datetime]]:
+        return dict(self._pending)
+
+    def start(self) -> None:
+        """주기적 flush 태스크 시작"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """flush 태스크 종료 후 남은 사용량 기록"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        누적 사용량 DB 기록
+
+        Returns:
+            기록된 키 수
+        """
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        try:
+            await asyncio.to_thread(self._write_batch, batch)
+            return len(batch)
+        except Exception as e:
+            logger.error(f"Failed to flush API key usage: {e}")
+            # 실패한 배치는 다음 flush에 합산
+            for key_id, (count, last_used) in batch.items():
+                pending_count, pending_last = self._pending.get(key_id, (0, last_used))
+                self._pending[key_id] = (count + pending_count, max(last_used, pending_last))
+            return 0
+
+    @staticmethod
+    def _write_batch(batch: Dict[int, Tuple[int, datetime]]) -> None:
+        from sqlalchemy import bindparam, update
+
+        from src.database.models_api_key import APIKey
+        from src.database.session import get_db_session_sync
+
+        stmt = (
+            update(APIKey)
+            .where(APIKey.id == bindparam("b_id"))
+            .values(
+                usage_count=APIKey.usage_count + bindparam("b_count"),
+                last_used_at=bindparam("b_last_used"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        params = [
+            {"b_id": key_id, "b_count": count, "b_last_used": last_used}
+            for key_id, (count, last_used) in batch.items()
+        ]
+
+        with get_db_session_sync() as db:
+            db.connection().execute(stmt, params)
+            db.commit()
@@ -0,0 +1,388 @@
+"""
+Gateway ASGI Pipeline
+
+요청 ID / 로깅 / 메트릭 / 느린 엔드포인트 추적을 하나의 순수 ASGI 미들웨어로 처리
+
+BaseHTTPMiddleware를 여러 겹 쌓으면 계층마다 태스크와 메모리 스트림이 추가되고
+StreamingResponse가 계층마다 다시 감싸집니다. 이 파이프라인은 요청당 한 번만
+RequestContext를 만들어 각 단계(stage)가 공유하며, 응답은 send 래핑으로
+http.response.start 시점에만 관찰하므로 바디를 버퍼링하지 않습니다.
+"""
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.middleware.logging_middleware import get_client_ip, sanitize_headers
+from src.middleware.metrics_middleware import (
+    api_active_connections,
+    api_errors_total,
+    api_requests_total,
+    api_response_time,
+)
+from src.middleware.slow_endpoint import SLOW_ENDPOINT_THRESHOLD, get_slow_endpoint_tracker
+from src.utils.logging_config import bind_request_id, get_logger
+
+logger = get_logger(__name__)
+
+# 파이프라인을 거치지 않는 경로 접두사 (WebSocket 엔드포인트)
+WEBSOCKET_PATH_PREFIX = "/ws"
+
+
+@dataclass
+class RequestContext:
+    """
+    요청 단위 공유 컨텍스트
+
+    파이프라인이 요청당 한 번 생성하며 request.state.request_context로도 접근할 수 있습니다.
+    route_template은 라우팅 이후(응답 시작 시점)에 채워집니다.
+    """
+    request_id: str
+    method: str
+    path: str
+    started_at: float
+    client: Optional[str] = None
+    route_template: Optional[str] = None
+    status_code: Optional[int] = None
+    response_size: Optional[str] = None
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    # 단계별 소요 시간 (초) 및 ttfb
+    timings: Dict[str, float] = field(default_factory=dict)
+    # 단계 간 전달 데이터 (예: rate limit 헤더)
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def endpoint(self) -> str:
+        """집계용 엔드포인트 (라우트 템플릿 우선, 없으면 실제 경로)"""
+        return self.route_template or self.path
+
+
+def _resolve_route_template(scope: Scope) -> Optional[str]:
+    """라우팅 후 scope["route"]에서 경로 템플릿 추출 (예: /api/kr/stocks/{ticker})"""
+    route = scope.get("route")
+    return getattr(route, "path", None) if route is not None else None
+
+
+class PipelineStage:
+    """
+    파이프라인 단계 기본 클래스
+
+    - on_request: 앱 호출 전 실행. Response를 반환하면 이후 단계와 앱을 건너뜀
+    - on_response_start: 응답 헤더 전송 직전 실행 (헤더 추가용)
+    - on_complete: 요청 종료 후 실행 (예외 발생 시 ctx.error 설정)
+
+    on_request가 실행된 단계만 on_response_start/on_complete가 호출됩니다.
+    """
+
+    name = "stage"
+
+    async def on_request(self, ctx: RequestContext, request: Request) -> Optional[Response]:
+        return None
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        pass
+
+    def on_complete(self, ctx: RequestContext) -> None:
+        pass
+
+
+class RequestIDStage(PipelineStage):
+    """응답에 X-Request-ID 헤더 추가 (RequestIDMiddleware 대체)"""
+
+    name = "request_id"
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        headers["X-Request-ID"] = ctx.request_id
+
+
+class LoggingStage(PipelineStage):
+    """요청/응답 구조화 로깅 (RequestLoggingMiddleware 대체)"""
+
+    name = "logging"
+
+    def __init__(self, skip_paths: Optional[Sequence[str]] = None):
+        self.skip_paths = set(skip_paths or ["/health", "/metrics", "/readiness"])
+
+    async def on_request(self, ctx: RequestContext, request: Request) -> Optional[Response]:
+        if ctx.path in self.skip_paths:
+            return None
+
+        logger.info(
+            "Incoming request",
+            extra={
+                "request_id": ctx.request_id,
+                "method": ctx.method,
+                "path": ctx.path,
+                "query_params": str(request.query_params) if request.query_params else None,
+                "client": ctx.client,
+                "user_agent": request.headers.get("user-agent"),
+                "headers": sanitize_headers(dict(request.headers)),
+            },
+        )
+        return None
+
+    def on_complete(self, ctx: RequestContext) -> None:
+        if ctx.path in self.skip_paths:
+            return
+
+        if ctx.error is not None and ctx.status_code is None:
+            logger.error(
+                "Request failed",
+                extra={
+                    "request_id": ctx.request_id,
+                    "method": ctx.method,
+                    "path": ctx.path,
+                    "client": ctx.client,
+                    "process_time": ctx.duration,
+                    "error_type": type(ctx.error).__name__,
+                    "error_message": str(ctx.error),
+                },
+            )
+            return
+
+        log_data = {
+            "request_id": ctx.request_id,
+            "method": ctx.method,
+            "path": ctx.path,
+            "route": ctx.route_template,
+            "status_code": ctx.status_code,
+            "process_time": round(ctx.duration, 4),
+            "response_size": ctx.response_size,
+        }
+
+        # 상태 코드에 따른 로그 레벨 분리
+        if ctx.status_code >= 500:
+            logger.error("Request completed with server error", extra=log_data)
+        elif ctx.status_code >= 400:
+            logger.warning("Request completed with client error", extra=log_data)
+        else:
+            logger.info("Request completed", extra=log_data)
+
+
+class MetricsStage(PipelineStage):
+    """요청 수/응답 시간/에러/활성 연결 메트릭 (MetricsMiddleware 대체)"""
+
+    name = "metrics"
+
+    async def on_request(self, ctx: RequestContext, request: Request) -> Optional[Response]:
+        api_active_connections.inc()
+        return None
+
+    def on_complete(self, ctx: RequestContext) -> None:
+        api_active_connections.dec()
+        api_requests_total.inc()
+        api_response_time.observe(ctx.duration)
+
+        if ctx.error is not None and ctx.status_code is None:
+            api_errors_total.inc()
+            logger.error(
+                f"{ctx.method} {ctx.path} - Exception: {str(ctx.error)}",
+                extra={
+                    "method": ctx.method,
+                    "path": ctx.path,
+                    "error": str(ctx.error),
+                    "duration": ctx.duration,
+                },
+            )
+            return
+
+        if ctx.status_code >= 400:
+            api_errors_total.inc()
+
+        logger.info(
+            f"{ctx.method} {ctx.path} - {ctx.status_code}",
+            extra={
+                "method": ctx.method,
+                "path": ctx.path,
+                "route": ctx.route_template,
+                "status_code": ctx.status_code,
+                "duration": ctx.duration,
+            },
+        )
+
+
+class SlowEndpointStage(PipelineStage):
+    """
+    느린 엔드포인트 기록 (SlowEndpointMiddleware 대체)
+
+    경로 파라미터별로 흩어지지 않도록 라우트 템플릿 기준으로 집계합니다.
+    """
+
+    name = "slow_endpoint"
+
+    def __init__(self, threshold: float = SLOW_ENDPOINT_THRESHOLD):
+        # 전역 트래커는 공유하고 기준은 단계별로 적용 (다른 사용처의 기준을 바꾸지 않음)
+        self._tracker = get_slow_endpoint_tracker()
+        self._threshold = threshold
+
+    def on_complete(self, ctx: RequestContext) -> None:
+        if ctx.status_code is None:
+            return
+        self._tracker.record(
+            ctx.endpoint, ctx.method, ctx.duration, ctx.status_code, threshold=self._threshold,
+        )
+
+
+class APIKeyAuthStage(PipelineStage):
+    """
+    API 키 인증 단계
+
+    APIKeyAuthMiddleware의 검증 로직(캐시 포함)을 그대로 사용합니다.
+    """
+
+    name = "api_key_auth"
+
+    def __init__(self, auth):
+        """
+        Args:
+            auth: APIKeyAuthMiddleware 인스턴스 (app=None으로 생성 가능)
+        """
+        self._auth = auth
+
+    async def on_request(self, ctx: RequestContext, request: Request) -> Optional[Response]:
+        return await self._auth.authenticate(request)
+
+
+class RateLimitStage(PipelineStage):
+    """
+    속도 제한 단계
+
+    RateLimitMiddleware의 판정 로직을 그대로 사용하고 X-RateLimit-* 헤더를 응답에 추가합니다.
+    """
+
+    name = "rate_limit"
+
+    def __init__(self, limiter):
+        """
+        Args:
+            limiter: RateLimitMiddleware 인스턴스 (app=None으로 생성 가능)
+        """
+        self._limiter = limiter
+
+    async def on_request(self, ctx: RequestContext, request: Request) -> Optional[Response]:
+        error_response, headers = await self._limiter.evaluate(request)
+        ctx.extras["rate_limit_headers"] = headers
+        return error_response
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        headers.update(ctx.extras.get("rate_limit_headers") or {})
+
+
+class GatewayPipelineMiddleware:
+    """
+    게이트웨이 공통 처리 순수 ASGI 미들웨어
+
+    단계 순서대로 on_request를 실행한 뒤 앱을 호출하고, 응답 시작 시 헤더 훅,
+    종료 시 역순으로 on_complete를 실행합니다. HTTP 이외의 scope와 /ws 경로는
+    그대로 통과시킵니다.
+
+    ## 사용법
+    ```python
+    app.add_middleware(
+        GatewayPipelineMiddleware,
+        stages=build_default_stages(skip_paths=["/health"], slow_threshold=1.0),
+    )
+    ```
+    """
+
+    def __init__(self, app: ASGIApp, stages: Optional[Sequence[PipelineStage]] = None):
+        self.app = app
+        self.stages: List[PipelineStage] = list(
+            stages if stages is not None else build_default_stages()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(WEBSOCKET_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        ctx = RequestContext(
+            request_id=request.headers.get("X-Request-ID") or str(uuid.uuid4()),
+            method=scope["method"],
+            path=scope["path"],
+            started_at=time.perf_counter(),
+            client=get_client_ip(request),
+        )
+
+        # 라우트 핸들러에서 request.state.request_id / request_context로 접근
+        request.state.request_id = ctx.request_id
+        request.state.request_context = ctx
+        bind_request_id(ctx.request_id)
+
+        entered: List[PipelineStage] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                ctx.status_code = message["status"]
+                ctx.route_template = _resolve_route_template(scope)
+                ctx.timings["ttfb"] = time.perf_counter() - ctx.started_at
+
+                headers = MutableHeaders(scope=message)
+                for stage in entered:
+                    stage.on_response_start(ctx, headers)
+                ctx.response_size = headers.get("content-length")
+            await send(message)
+
+        try:
+            for stage in self.stages:
+                entered.append(stage)
+                stage_start = time.perf_counter()
+                early_response = await stage.on_request(ctx, request)
+                ctx.timings[stage.name] = time.perf_counter() - stage_start
+
+                if early_response is not None:
+                    await early_response(scope, receive, send_wrapper)
+                    return
+
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            ctx.error = e
+            raise
+        finally:
+            ctx.duration = time.perf_counter() - ctx.started_at
+            if ctx.route_template is None:
+                ctx.route_template = _resolve_route_template(scope)
+
+            for stage in reversed(entered):
+                try:
+                    stage.on_complete(ctx)
+                except Exception as e:
+                    logger.error(f"Pipeline stage '{stage.name}' failed: {e}")
+
+
+def build_default_stages(
+    skip_paths: Optional[Sequence[str]] = None,
+    slow_threshold: float = SLOW_ENDPOINT_THRESHOLD,
+    auth=None,
+    rate_limiter=None,
+) -> List[PipelineStage]:
+    """
+    기본 단계 구성
+
+    Args:
+        skip_paths: 요청/응답 로깅을 건너뛸 경로
+        slow_threshold: 느린 엔드포인트 기준 (초)
+        auth: APIKeyAuthMiddleware 인스턴스 (지정 시 인증 단계 추가)
+        rate_limiter: RateLimitMiddleware 인스턴스 (지정 시 속도 제한 단계 추가)
+
+    Returns:
+        단계 목록 (요청 ID → 로깅 → 메트릭 → 느린 엔드포인트 → 인증 → 속도 제한)
+    """
+    stages: List[PipelineStage] = [
+        RequestIDStage(),
+        LoggingStage(skip_paths=skip_paths),
+        MetricsStage(),
+        SlowEndpointStage(threshold=slow_threshold),
+    ]
+    if auth is not None:
+        stages.append(APIKeyAuthStage(auth))
+    if rate_limiter is not None:
+        stages.append(RateLimitStage(rate_limiter))
+    return stages
@@ -0,0 +1,300 @@
+"""
+Distributed Rate Limiter
+
+Redis Lua 스크립트 기반 Sliding Window Log 속도 제한 (워커 간 공유)
+Redis 장애 시 프로세스 로컬 Token Bucket으로 폴백
+"""
+import logging
+import math
+import os
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Redis 장애 후 재연결 시도 간격 (초)
+REDIS_RETRY_INTERVAL = 5.0
+
+# 모든 티어를 한 번에 검사/기록하는 Lua 스크립트
+#
+# KEYS[i]: 티어별 ZSET 키 (score = 요청 시각 ms)
+# ARGV[1]: 요청 식별자 (ZSET member)
+# ARGV[2i], ARGV[2i+1]: 티어 i의 limit, window(ms)
+#
+# 반환: {allowed, remaining_1, reset_ms_1, remaining_2, reset_ms_2, ...}
+# 모든 티어가 허용될 때만 요청을 기록하므로 거부된 요청은 한도를 소모하지 않습니다.
+SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local member = ARGV[1]
+local n = #KEYS
+local allowed = 1
+local counts = {}
+
+for i = 1, n do
+  local window = tonumber(ARGV[2 * i + 1])
+  local limit = tonumber(ARGV[2 * i])
+  redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+  counts[i] = redis.call('ZCARD', KEYS[i])
+  if counts[i] >= limit then
+    allowed = 0
+  end
+end
+
+local result = {allowed}
+for i = 1, n do
+  local limit = tonumber(ARGV[2 * i])
+  local window = tonumber(ARGV[2 * i + 1])
+  local count = counts[i]
+  if allowed == 1 then
+    redis.call('ZADD', KEYS[i], now, member)
+    redis.call('PEXPIRE', KEYS[i], window)
+    count = count + 1
+  end
+
+  local reset = now + window
+  local idx = 0
+  if count >= limit then
+    idx = count - limit
+  end
+  local entry = redis.call('ZRANGE', KEYS[i], idx, idx, 'WITHSCORES')
+  if entry[2] then
+    reset = tonumber(entry[2]) + window
+  end
+
+  result[#result + 1] = math.max(limit - count, 0)
+  result[#result + 1] = reset
+end
+return result
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitTier:
+    """속도 제한 티어 (window 초 동안 limit 회)"""
+    name: str
+    limit: int
+    window: int
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """
+    속도 제한 판정 결과
+
+    limit/remaining/reset_at은 가장 제한적인 티어 기준입니다.
+    """
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_at: float
+    retry_after: int = 0
+    tier: str = ""
+    backend: str = "redis"
+
+    def headers(self) -> dict:
+        """X-RateLimit-* 응답 헤더"""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(int(math.ceil(self.reset_at))),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+def _pick_result(
+    allowed: bool,
+    tiers: Sequence[RateLimitTier],
+    states: Sequence[Tuple[int, float]],
+    backend: str,
+) -> RateLimitResult:
+    """
+    티어별 (remaining, reset_at) 중 응답에 노출할 티어 선택
+
+    거부 시: 가장 늦게 풀리는 소진 티어, 허용 시: 남은 요청 수가 가장 적은 티어
+    """
+    if allowed:
+        index = min(range(len(tiers)), key=lambda i: (states[i][0], -states[i][1]))
+    else:
+        exhausted = [i for i, (remaining, _) in enumerate(states) if remaining <= 0]
+        index = max(exhausted or range(len(tiers)), key=lambda i: states[i][1])
+
+    remaining, reset_at = states[index]
+    retry_after = 0 if allowed else max(1, int(math.ceil(reset_at - time.time())))
+    return RateLimitResult(
+        allowed=allowed,
+        limit=tiers[index].limit,
+        remaining=remaining,
+        reset_at=reset_at,
+        retry_after=retry_after,
+        tier=tiers[index].name,
+        backend=backend,
+    )
+
+
+class LocalTokenBucketLimiter:
+    """
+    프로세스 로컬 Token Bucket (Redis 폴백용)
+
+    티어마다 용량 limit, 초당 limit/window 토큰 충전. 추적하는 버킷 수는
+    max_buckets로 제한되며 가장 오래 사용되지 않은 버킷부터 제거합니다.
+    """
+
+    def __init__(self, max_buckets: int = 10000):
+        self.max_buckets = max_buckets
+        # (client_id, tier) -> (tokens, updated_at)
+        self._buckets: "OrderedDict[Tuple[str, str], Tuple[float, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def hit(self, client_id: str, tiers: Sequence[RateLimitTier]) -> RateLimitResult:
+        """모든 티어에 토큰이 있을 때만 소모"""
+        now = time.time()
+        levels: List[float] = []
+
+        for tier in tiers:
+            key = (client_id, tier.name)
+            tokens, updated_at = self._buckets.get(key, (float(tier.limit), now))
+            rate = tier.limit / tier.window
+            tokens = min(float(tier.limit), tokens + (now - updated_at) * rate)
+            levels.append(tokens)
+
+        allowed = all(tokens >= 1.0 for tokens in levels)
+        states: List[Tuple[int, float]] = []
+
+        for tier, tokens in zip(tiers, levels):
+            if allowed:
+                tokens -= 1.0
+            rate = tier.limit / tier.window
+            key = (client_id, tier.name)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+
+            if tokens < 1.0:
+                reset_at = now + (1.0 - tokens) / rate
+            else:
+                reset_at = now + (tier.limit - tokens) / rate
+            states.append((int(tokens), reset_at))
+
+        while len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+
+        return _pick_result(allowed, tiers, states, backend="local")
+
+
+class DistributedRateLimiter:
+    """
+    워커 간 공유 Sliding Window Log 속도 제한
+
+    여러 티어(예: 엔드포인트별 + 클라이언트 전체 + 초당 burst)를 Lua 스크립트
+    한 번(EVALSHA 1회 왕복)으로 검사합니다. 시각은 Redis 서버 TIME을 사용하므로
+    워커 간 시계 차이의 영향을 받지 않습니다.
+
+    Redis에 연결할 수 없으면 LocalTokenBucketLimiter로 폴백하고,
+    REDIS_RETRY_INTERVAL 이후 다시 Redis를 시도합니다.
+
+    ## 사용 예시
+    ```python
+    limiter = DistributedRateLimiter()
+    result = await limiter.hit(
+        "ip:1.2.3.4",
+        [RateLimitTier("/api/kr/scan", 10, 60), RateLimitTier("default", 100, 60)],
+    )
+    if not result.allowed:
+        return JSONResponse(status_code=429, headers=result.headers(), ...)
+    ```
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        key_prefix: str = "ratelimit:",
+        redis_client=None,
+        fallback: Optional[LocalTokenBucketLimiter] = None,
+    ):
+        """
+        Args:
+            redis_url: Redis URL (기본값: REDIS_URL 환경변수)
+            key_prefix: Redis 키 접두사
+            redis_client: 외부에서 생성한 redis.asyncio 클라이언트 (테스트용)
+            fallback: Redis 장애 시 사용할 로컬 limiter
+        """
+        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6380/0")
+        self._key_prefix = key_prefix
+        self._redis = redis_client
+        self._script = None
+        self._fallback = fallback or LocalTokenBucketLimiter()
+        self._redis_retry_at = 0.0
+
+    @property
+    def fallback(self) -> LocalTokenBucketLimiter:
+        return self._fallback
+
+    def _make_key(self, client_id: str, tier: RateLimitTier) -> str:
+        # {client_id} 해시 태그: Redis Cluster에서도 한 클라이언트의 티어 키가 같은 슬롯에 위치
+        return f"{self._key_prefix}{{{client_id}}}:{tier.name}"
+
+    def _get_script(self):
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                self._redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        if self._script is None:
+            self._script = self._redis.register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    async def hit(self, client_id: str, tiers: Sequence[RateLimitTier]) -> RateLimitResult:
+        """
+        요청 1회 기록 및 허용 여부 판정
+
+        Args:
+            client_id: 클라이언트 식별자
+            tiers: 적용할 티어 목록 (1개 이상)
+
+        Returns:
+            RateLimitResult
+        """
+        if time.time() >= self._redis_retry_at:
+            try:
+                return await self._hit_redis(client_id, tiers)
+            except Exception as e:
+                logger.warning(f"Rate limit Redis unavailable, using local fallback: {e}")
+                self._redis_retry_at = time.time() + REDIS_RETRY_INTERVAL
+
+        return self._fallback.hit(client_id, tiers)
+
+    async def _hit_redis(self, client_id: str, tiers: Sequence[RateLimitTier]) -> RateLimitResult:
+        script = self._get_script()
+        keys = [self._make_key(client_id, tier) for tier in tiers]
+        args: List = [uuid.uuid4().hex]
+        for tier in tiers:
+            args.extend([tier.limit, tier.window * 1000])
+
+        raw = await script(keys=keys, args=args)
+
+        allowed = int(raw[0]) == 1
+        states = [
+            (int(raw[1 + 2 * i]), int(raw[2 + 2 * i]) / 1000.0)
+            for i in range(len(tiers))
+        ]
+        return _pick_result(allowed, tiers, states, backend="redis")
+
+    async def close(self) -> None:
+        """Redis 연결 종료"""
+        if self._redis is not None:
+            try:
+                await self._redis.close()
+            except Exception:
+                pass
+            self._redis = None
+            self._script = None
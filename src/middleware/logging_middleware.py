@@ -153,30 +153,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     def _get_client_ip(self, request: Request) -> str | None:
         """클라이언트 IP 주소 추출 (프록시 환경 고려)"""
-        # 프록시 헤더 체크
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        # 직접 연결의 경우
-        if request.client:
-            return request.client.host
-
-        return None
+        return get_client_ip(request)
 
     def _sanitize_headers(self, headers: dict) -> dict:
         """민감정보가 포함된 헤더 마스킹"""
-        sanitized = {}
-        for key, value in headers.items():
-            if key.lower() in self.SENSITIVE_HEADERS:
-                sanitized[key] = "***REDACTED***"
-            else:
-                sanitized[key] = value
-        return sanitized
+        return sanitize_headers(headers)
 
     def _is_websocket_request(self, request: Request) -> bool:
         """WebSocket 요청인지 확인"""
@@ -206,6 +187,35 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         return sanitized
 
 
+def get_client_ip(request: Request) -> str | None:
+    """클라이언트 IP 주소 추출 (프록시 환경 고려)"""
+    # 프록시 헤더 체크
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip:
+        return real_ip
+
+    # 직접 연결의 경우
+    if request.client:
+        return request.client.host
+
+    return None
+
+
+def sanitize_headers(headers: dict) -> dict:
+    """민감정보가 포함된 헤더 마스킹"""
+    sanitized = {}
+    for key, value in headers.items():
+        if key.lower() in RequestLoggingMiddleware.SENSITIVE_HEADERS:
+            sanitized[key] = "***REDACTED***"
+        else:
+            sanitized[key] = value
+    return sanitized
+
+
 def get_request_id_header(request: Request) -> str:
     """요청에서 Request ID 헤더 값을 가져오는 헬퍼 함수"""
     return request.headers.get("X-Request-ID", "unknown")
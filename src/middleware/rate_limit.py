@@ -7,12 +7,41 @@ import time
 import logging
 from typing import Callable, Optional, Dict
 from collections import defaultdict, deque
-from fastapi import Request, Response, HTTPException, status
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.middleware.distributed_rate_limit import DistributedRateLimiter, RateLimitTier
+
 logger = logging.getLogger(__name__)
 
 
+def rate_limited_response(
+    remaining: int,
+    reset_at: int,
+    retry_after: int,
+    headers: Dict[str, str],
+) -> JSONResponse:
+    """
+    429 응답 생성 (로컬/Redis limiter 공통 본문 형식)
+
+    Returns:
+        {"detail": {"error", "remaining", "reset_at", "retry_after"}} 본문의 JSONResponse
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "detail": {
+                "error": "Too many requests",
+                "remaining": remaining,
+                "reset_at": reset_at,
+                "retry_after": retry_after,
+            },
+        },
+        headers=headers,
+    )
+
+
 class RateLimiter:
     """
     Sliding Window Rate Limiter
@@ -150,7 +179,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         RateLimitMiddleware,
         endpoint_limits={"/api/kr/signals": (10, 60)},
     )
+
+    # 워커 간 공유 (Redis) + 초당 burst 제한
+    app.add_middleware(
+        RateLimitMiddleware,
+        distributed_limiter=DistributedRateLimiter(),
+        burst_limit=(20, 1),
+    )
     ```
+
+    distributed_limiter를 지정하면 엔드포인트 티어, 클라이언트 전체 티어,
+    burst 티어를 Redis에서 한 번에 검사하므로 uvicorn 워커 수와 무관하게
+    설정한 한도가 그대로 적용됩니다.
     """
 
     # 엔드포인트별 제한 설정
@@ -174,6 +214,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         window: int = 60,
         excluded_paths: Optional[set[str]] = None,
         endpoint_limits: Optional[dict[str, tuple[int, int]]] = None,
+        distributed_limiter: Optional[DistributedRateLimiter] = None,
+        burst_limit: Optional[tuple[int, int]] = None,
     ):
         super().__init__(app)
         self._default_limiter = RateLimiter(requests, window)
@@ -181,6 +223,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self._endpoint_limits = endpoint_limits or self.DEFAULT_LIMITS
         # {endpoint: RateLimiter}
         self._limiters: Dict[str, RateLimiter] = {}
+        self._distributed = distributed_limiter
+        self._default_tier = RateLimitTier("default", requests, window)
+        self._burst_tier = RateLimitTier("burst", *burst_limit) if burst_limit else None
 
     def _get_rate_limiter(self, path: str) -> RateLimiter:
         """경로별 Rate Limiter 반환"""
@@ -202,12 +247,34 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # 기본 limiter 사용
         return self._default_limiter
 
+    def _match_endpoint(self, path: str) -> Optional[str]:
+        """경로에 해당하는 엔드포인트 제한 키 반환"""
+        if path in self._endpoint_limits:
+            return path
+        for endpoint in self._endpoint_limits:
+            if path.startswith(endpoint):
+                return endpoint
+        return None
+
+    def _get_tiers(self, path: str) -> list[RateLimitTier]:
+        """경로에 적용할 티어 목록 (엔드포인트 → 클라이언트 전체 → burst)"""
+        tiers = []
+        endpoint = self._match_endpoint(path)
+        if endpoint is not None:
+            requests, window = self._endpoint_limits[endpoint]
+            tiers.append(RateLimitTier(f"ep:{endpoint}", requests, window))
+        tiers.append(self._default_tier)
+        if self._burst_tier is not None:
+            tiers.append(self._burst_tier)
+        return tiers
+
     def _get_client_id(self, request: Request) -> str:
         """클라이언트 식별자 반환"""
-        # API Key가 있으면 API Key 사용
+        # API Key가 있으면 API Key 사용 (ValidatedAPIKey는 id, 기존 객체는 key)
         api_key = getattr(request.state, "api_key", None)
         if api_key:
-            return f"key:{api_key.key}"
+            key_id = getattr(api_key, "id", None) or getattr(api_key, "key", None)
+            return f"key:{key_id}"
 
         # IP 주소 사용
         # X-Forwarded-For 헤더가 있으면 사용 (프록시 환경)
@@ -224,50 +291,88 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if path in self._excluded_paths:
             return True
 
+        # "/"는 정확히 일치할 때만 공개 (접두사로 쓰면 모든 경로가 제외됨)
         for public_path in self._excluded_paths:
-            if path.startswith(public_path):
+            if public_path != "/" and path.startswith(public_path):
                 return True
 
         return False
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        error_response, headers = await self.evaluate(request)
+        if error_response is not None:
+            return error_response
+
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
+
+    async def evaluate(self, request: Request) -> tuple[Optional[Response], dict]:
+        """
+        요청 1회를 기록하고 허용 여부 판정
+
+        (BaseHTTPMiddleware 밖의 ASGI 파이프라인에서도 재사용)
+
+        Returns:
+            (거부 시 429 응답 또는 None, 정상 응답에 붙일 X-RateLimit-* 헤더)
+        """
         path = request.url.path
 
         # 공개 경로는 통과
         if self._is_public_path(path):
-            return await call_next(request)
+            return None, {}
+
+        client_id = self._get_client_id(request)
+
+        if self._distributed is not None:
+            return await self._evaluate_distributed(client_id, path)
 
         # Rate Limiter 확인
         limiter = self._get_rate_limiter(path)
-        client_id = self._get_client_id(request)
 
         if not limiter.is_allowed(client_id):
             remaining = limiter.get_remaining(client_id)
-            reset_time = int(time.time() + self._default_limiter._window)
-
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error": "Too many requests",
-                    "remaining": remaining,
-                    "reset_at": reset_time,
-                },
+            retry_after = limiter._window
+            reset_time = int(time.time() + retry_after)
+
+            return rate_limited_response(
+                remaining,
+                reset_time,
+                retry_after,
                 headers={
+                    "X-RateLimit-Limit": str(limiter._requests),
                     "X-RateLimit-Remaining": str(remaining),
                     "X-RateLimit-Reset": str(reset_time),
-                    "Retry-After": str(self._default_limiter._window),
+                    "Retry-After": str(retry_after),
                 },
-            )
+            ), {}
 
-        # 요청 처리
-        response = await call_next(request)
-
-        # Rate Limit 정보 헤더 추가
-        remaining = limiter.get_remaining(client_id)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Limit"] = str(limiter._requests)
+        # Rate Limit 정보 헤더
+        return None, {
+            "X-RateLimit-Remaining": str(limiter.get_remaining(client_id)),
+            "X-RateLimit-Limit": str(limiter._requests),
+        }
 
-        return response
+    async def _evaluate_distributed(
+        self, client_id: str, path: str
+    ) -> tuple[Optional[Response], dict]:
+        """Redis 공유 limiter 경로 (티어 전체를 1회 왕복으로 검사)"""
+        result = await self._distributed.hit(client_id, self._get_tiers(path))
+
+        if not result.allowed:
+            return rate_limited_response(
+                result.remaining,
+                int(result.reset_at),
+                result.retry_after,
+                headers=result.headers(),
+            ), {}
+
+        return None, result.headers()
+
+    async def close(self) -> None:
+        """공유 limiter Redis 연결 종료"""
+        if self._distributed is not None:
+            await self._distributed.close()
 
 
 # 전역 Rate Limiter 인스턴스
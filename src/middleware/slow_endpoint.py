@@ -5,7 +5,7 @@ Slow Endpoint Tracker
 """
 import time
 import logging
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 from collections import defaultdict
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -28,9 +28,21 @@ class SlowEndpointTracker:
     def threshold(self) -> float:
         return self._threshold
 
-    def record(self, path: str, method: str, duration: float, status_code: int) -> None:
-        """느린 호출 기록"""
-        if duration < self._threshold:
+    def record(
+        self,
+        path: str,
+        method: str,
+        duration: float,
+        status_code: int,
+        threshold: Optional[float] = None,
+    ) -> None:
+        """
+        느린 호출 기록
+
+        Args:
+            threshold: 호출 측 기준 (초, None이면 트래커 기준)
+        """
+        if duration < (self._threshold if threshold is None else threshold):
             return
 
         call_info = {
@@ -1,7 +1,7 @@
 """
 모니터링 패키지
 
-시스템 리소스 모니터링 및 알림 기능을 제공합니다.
+시스템 리소스 / 런타임 지표 모니터링 및 알림 기능을 제공합니다.
 """
 
 from src.monitoring.resource_monitor import (
@@ -10,10 +10,18 @@ from src.monitoring.resource_monitor import (
     MemoryStats,
     get_resource_monitor,
 )
+from src.monitoring.runtime_metrics import (
+    GCPauseTracker,
+    LoopLagProbe,
+    PoolWaitTracker,
+)
 
 __all__ = [
     "ResourceMonitor",
     "ResourceUsage",
     "MemoryStats",
     "get_resource_monitor",
+    "GCPauseTracker",
+    "LoopLagProbe",
+    "PoolWaitTracker",
 ]
@@ -1,17 +1,28 @@
 """
 시스템 리소스 모니터링 모듈
 
-CPU, 메모리 사용량을 실시간으로 모니터링하고
-임계값 초과 시 알림을 발송합니다.
+CPU, 메모리 사용량과 런타임 지표(이벤트 루프 지연, 태스크 수, GC 일시 정지,
+DB 커넥션 풀 대기, 열린 소켓 수)를 모니터링하고 임계값 초과 시 알림을 발송합니다.
+
+샘플링은 이벤트 루프를 막지 않습니다.
+- CPU 사용률은 psutil.cpu_percent(interval=None)으로 직전 호출 이후 값을 읽음
+- psutil 호출은 모니터링 루프에서 스레드로 실행
 """
 
 import asyncio
 import psutil
 import logging
+from collections import deque
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Dict, Any
-
+from typing import Callable, Optional, Dict, Any, Deque, List
+
+from src.monitoring.runtime_metrics import (
+    DEFAULT_HISTORY_SIZE,
+    GCPauseTracker,
+    LoopLagProbe,
+    PoolWaitTracker,
+)
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -32,6 +43,8 @@ class ResourceUsage:
     cpu_percent: float
     memory: MemoryStats
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    open_sockets: Optional[int] = None  # 프로세스의 열린 inet 소켓 수
+    runtime: Dict[str, Any] = field(default_factory=dict)  # 이벤트 루프/GC/DB 풀 지표
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -41,6 +54,8 @@ class ResourceUsage:
             "memory_used": self.memory.used,
             "memory_available": self.memory.available,
             "memory_percent": self.memory.percent,
+            "open_sockets": self.open_sockets,
+            "runtime": self.runtime,
             "timestamp": self.timestamp.isoformat(),
         }
 
@@ -49,13 +64,16 @@ class ResourceMonitor:
     """
     시스템 리소스 모니터
 
-    CPU, 메모리 사용량을 주기적으로 측정하고
+    CPU, 메모리 사용량과 런타임 지표를 주기적으로 측정해 링 버퍼에 보관하고
     임계값 초과 시 알림 콜백을 호출합니다.
 
     Args:
         check_interval_seconds: 모니터링 주기 (기본값: 60초)
         cpu_threshold_percent: CPU 경고 임계값 (기본값: 80%)
         memory_threshold_percent: 메모리 경고 임계값 (기본값: 80%)
+        loop_lag_threshold_ms: 이벤트 루프 지연 p95 경고 임계값 (기본값: 500ms)
+        history_size: 보관할 측정 기록 수 (기본값: 360)
+        lag_probe_interval: 이벤트 루프 지연 측정 주기 (기본값: 0.5초)
 
     Usage:
         monitor = ResourceMonitor()
@@ -66,8 +84,12 @@ class ResourceMonitor:
         # 모니터링 시작
         await monitor.start()
 
-        # 현재 사용량 조회
+        # DB 커넥션 풀 대기 시간 추적 (get_resource_monitor()는 공용 엔진을 "main"으로 등록)
+        monitor.register_db_pool("replica", replica_engine)
+
+        # 현재 사용량 조회 / 기록 조회
         usage = monitor.get_current_usage()
+        history = monitor.get_history(limit=10)
 
         # 모니터링 중지
         await monitor.stop()
@@ -78,6 +100,9 @@ class ResourceMonitor:
         check_interval_seconds: int = 60,
         cpu_threshold_percent: float = 80.0,
         memory_threshold_percent: float = 80.0,
+        loop_lag_threshold_ms: float = 500.0,
+        history_size: int = 360,
+        lag_probe_interval: float = 0.5,
     ):
         """
         리소스 모니터 초기화
@@ -86,17 +111,31 @@ class ResourceMonitor:
             check_interval_seconds: 모니터링 주기 (초)
             cpu_threshold_percent: CPU 경고 임계값 (%)
             memory_threshold_percent: 메모리 경고 임계값 (%)
+            loop_lag_threshold_ms: 이벤트 루프 지연 p95 경고 임계값 (ms)
+            history_size: 보관할 측정 기록 수
+            lag_probe_interval: 이벤트 루프 지연 측정 주기 (초)
         """
         self._check_interval = check_interval_seconds
         self._cpu_threshold = cpu_threshold_percent
         self._memory_threshold = memory_threshold_percent
+        self._loop_lag_threshold = loop_lag_threshold_ms
 
         # 상태 관리
         self._is_running = False
         self._monitor_task: Optional[asyncio.Task] = None
 
-        # 현재 사용량 캐시
+        # 현재 사용량 캐시 / 측정 기록 (링 버퍼)
         self._current_usage: Optional[ResourceUsage] = None
+        self._history: Deque[ResourceUsage] = deque(maxlen=history_size)
+
+        # 런타임 지표
+        self._lag_probe = LoopLagProbe(lag_probe_interval, DEFAULT_HISTORY_SIZE)
+        self._gc_tracker = GCPauseTracker(DEFAULT_HISTORY_SIZE)
+        self._pool_trackers: Dict[str, PoolWaitTracker] = {}
+        self._process = psutil.Process()
+
+        # cpu_percent(interval=None)은 직전 호출 이후 사용률을 반환하므로 기준점 설정
+        psutil.cpu_percent(interval=None)
 
         # 알림 콜백
         self._alert_callbacks: list[Callable[[ResourceUsage], None]] = []
@@ -107,12 +146,14 @@ class ResourceMonitor:
 
     def get_current_usage(self) -> ResourceUsage:
         """
-        현재 리소스 사용량 조회
+        현재 리소스 사용량 조회 (대기 없음, 스레드에서 호출 가능)
+
+        CPU 사용률은 직전 호출 이후 구간의 평균입니다.
 
         Returns:
             ResourceUsage 객체
         """
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         memory = psutil.virtual_memory()
         memory_stats = MemoryStats(
@@ -125,11 +166,80 @@ class ResourceMonitor:
         usage = ResourceUsage(
             cpu_percent=cpu_percent,
             memory=memory_stats,
+            open_sockets=self._count_open_sockets(),
         )
 
         self._current_usage = usage
         return usage
 
+    def _count_open_sockets(self) -> Optional[int]:
+        """프로세스의 열린 inet 소켓 수 (권한 부족 등으로 실패하면 None)"""
+        try:
+            return len(self._process.net_connections(kind="inet"))
+        except (psutil.Error, OSError):
+            return None
+
+    def register_db_pool(self, name: str, engine_or_pool: Any) -> None:
+        """
+        DB 커넥션 풀 체크아웃 대기 시간 추적 등록
+
+        Args:
+            name: 풀 이름
+            engine_or_pool: SQLAlchemy Engine 또는 Pool
+        """
+        if name not in self._pool_trackers:
+            self._pool_trackers[name] = PoolWaitTracker(name, engine_or_pool, DEFAULT_HISTORY_SIZE)
+
+    def get_runtime_stats(self) -> Dict[str, Any]:
+        """
+        런타임 지표 조회
+
+        이벤트 루프 스레드에서 호출하면 태스크 수도 포함됩니다.
+
+        Returns:
+            {"event_loop_lag_ms", "tasks", "gc", "db_pools"}
+        """
+        try:
+            tasks: Optional[int] = len(asyncio.all_tasks())
+        except RuntimeError:
+            tasks = None
+
+        return {
+            "event_loop_lag_ms": self._lag_probe.summary(),
+            "tasks": tasks,
+            "gc": self._gc_tracker.summary(),
+            "db_pools": {name: tracker.summary() for name, tracker in self._pool_trackers.items()},
+        }
+
+    async def sample(self) -> ResourceUsage:
+        """
+        리소스 + 런타임 지표를 측정해 기록에 추가
+
+        psutil 호출은 스레드에서 실행되어 이벤트 루프를 막지 않습니다.
+
+        Returns:
+            ResourceUsage 객체
+        """
+        usage = await asyncio.to_thread(self.get_current_usage)
+        usage.runtime = self.get_runtime_stats()
+        self._history.append(usage)
+        return usage
+
+    def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        측정 기록 조회 (오래된 순)
+
+        Args:
+            limit: 최근 N개만 조회 (None이면 전체)
+
+        Returns:
+            ResourceUsage.to_dict() 리스트
+        """
+        history = list(self._history)
+        if limit is not None:
+            history = history[-limit:] if limit > 0 else []
+        return [usage.to_dict() for usage in history]
+
     def on_alert(self, callback: Callable[[ResourceUsage], None]) -> None:
         """
         알림 콜백 등록
@@ -160,6 +270,13 @@ class ResourceMonitor:
             )
             alerted = True
 
+        loop_lag_p95 = usage.runtime.get("event_loop_lag_ms", {}).get("p95", 0.0)
+        if loop_lag_p95 >= self._loop_lag_threshold:
+            logger.warning(
+                f"Event loop lag alert: p95 {loop_lag_p95:.1f}ms >= {self._loop_lag_threshold}ms"
+            )
+            alerted = True
+
         if alerted:
             self._total_alerts += 1
             for callback in self._alert_callbacks:
@@ -179,7 +296,7 @@ class ResourceMonitor:
         while self._is_running:
             try:
                 self._total_checks += 1
-                usage = self.get_current_usage()
+                usage = await self.sample()
                 self._check_alerts(usage)
 
                 # 주기적 요약 로그 (매 10회 체크마다)
@@ -188,7 +305,8 @@ class ResourceMonitor:
                         f"Resource monitor summary (checks: {self._total_checks}, "
                         f"alerts: {self._total_alerts}, "
                         f"CPU: {usage.cpu_percent:.1f}%, "
-                        f"Memory: {usage.memory.percent:.1f}%)"
+                        f"Memory: {usage.memory.percent:.1f}%, "
+                        f"Loop lag p95: {usage.runtime['event_loop_lag_ms']['p95']:.1f}ms)"
                     )
 
             except Exception as e:
@@ -205,6 +323,8 @@ class ResourceMonitor:
             return
 
         self._is_running = True
+        self._gc_tracker.install()
+        self._lag_probe.start()
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
     async def stop(self) -> None:
@@ -213,6 +333,8 @@ class ResourceMonitor:
             return
 
         self._is_running = False
+        self._gc_tracker.uninstall()
+        await self._lag_probe.stop()
 
         if self._monitor_task:
             self._monitor_task.cancel()
@@ -241,7 +363,9 @@ class ResourceMonitor:
             "cpu_threshold_percent": self._cpu_threshold,
             "memory_threshold_percent": self._memory_threshold,
             "check_interval_seconds": self._check_interval,
+            "history_size": len(self._history),
             "current_usage": self._current_usage.to_dict() if self._current_usage else None,
+            "runtime": self.get_runtime_stats(),
         }
 
 
@@ -259,4 +383,15 @@ def get_resource_monitor() -> ResourceMonitor:
     global _resource_monitor
     if _resource_monitor is None:
         _resource_monitor = ResourceMonitor()
+        _register_main_db_pool(_resource_monitor)
     return _resource_monitor
+
+
+def _register_main_db_pool(monitor: ResourceMonitor) -> None:
+    """프로세스 공용 DB 엔진(src.database.session.engine) 풀 대기 추적 등록"""
+    try:
+        from src.database.session import engine
+    except ImportError as e:
+        logger.warning(f"DB 엔진을 불러올 수 없어 풀 대기 추적을 건너뜁니다: {e}")
+        return
+    monitor.register_db_pool("main", engine)
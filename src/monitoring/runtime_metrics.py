@@ -0,0 +1,233 @@
+"""
+런타임 지표 수집 모듈
+
+지연 급증의 원인이 되는 런타임 신호를 수집합니다.
+- LoopLagProbe: 이벤트 루프 지연 (예약한 sleep보다 늦게 깨어난 시간)
+- GCPauseTracker: GC 일시 정지 시간 (gc.callbacks)
+- PoolWaitTracker: DB 커넥션 풀 체크아웃 대기 시간
+
+모든 샘플은 크기가 고정된 링 버퍼(deque)에 보관되어 메모리 사용량이 일정합니다.
+"""
+
+import asyncio
+import gc
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 기본 링 버퍼 크기
+DEFAULT_HISTORY_SIZE = 600
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """
+    정렬된 값의 백분위수 (nearest-rank)
+
+    Args:
+        sorted_values: 오름차순 정렬된 값
+        q: 백분위 (0~100)
+
+    Returns:
+        백분위수 (값이 없으면 0.0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(min(rank, len(sorted_values))) - 1]
+
+
+def summarize_ms(samples: Iterable[float]) -> Dict[str, Any]:
+    """
+    초 단위 샘플을 ms 단위 요약으로 변환
+
+    Returns:
+        {"count", "avg", "p50", "p95", "p99", "max"} (ms)
+    """
+    values = sorted(samples)
+    if not values:
+        return {"count": 0, "avg": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "avg": round(sum(values) / len(values) * 1000, 3),
+        "p50": round(percentile(values, 50) * 1000, 3),
+        "p95": round(percentile(values, 95) * 1000, 3),
+        "p99": round(percentile(values, 99) * 1000, 3),
+        "max": round(values[-1] * 1000, 3),
+    }
+
+
+class LoopLagProbe:
+    """
+    이벤트 루프 지연 측정
+
+    interval마다 sleep을 예약하고, 실제로 깨어난 시각과 예정 시각의 차이를 기록합니다.
+    루프를 막는 동기 코드가 있으면 이 값이 커집니다.
+    """
+
+    def __init__(self, interval: float = 0.5, history_size: int = DEFAULT_HISTORY_SIZE):
+        """
+        Args:
+            interval: 측정 주기 (초)
+            history_size: 보관할 샘플 수
+        """
+        self._interval = interval
+        self._samples: Deque[float] = deque(maxlen=history_size)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def samples(self) -> Deque[float]:
+        return self._samples
+
+    def start(self) -> None:
+        """측정 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="loop-lag-probe")
+
+    async def stop(self) -> None:
+        """측정 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self._interval)
+            self._samples.append(max(0.0, loop.time() - started - self._interval))
+
+    def summary(self) -> Dict[str, Any]:
+        """지연 요약 (ms)"""
+        return summarize_ms(self._samples)
+
+
+class GCPauseTracker:
+    """
+    GC 일시 정지 시간 측정
+
+    gc.callbacks의 start/stop 사이 시간을 세대별로 기록합니다.
+    """
+
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        """
+        Args:
+            history_size: 보관할 샘플 수
+        """
+        self._samples: Deque[float] = deque(maxlen=history_size)
+        self._started_at: Optional[float] = None
+        self._collections = [0, 0, 0]
+        self._total_pause = 0.0
+        self._installed = False
+
+    def install(self) -> None:
+        """gc 콜백 등록"""
+        if not self._installed:
+            gc.callbacks.append(self._callback)
+            self._installed = True
+
+    def uninstall(self) -> None:
+        """gc 콜백 해제"""
+        if self._installed:
+            try:
+                gc.callbacks.remove(self._callback)
+            except ValueError:
+                pass
+            self._installed = False
+
+    def _callback(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._started_at = time.perf_counter()
+        elif phase == "stop" and self._started_at is not None:
+            pause = time.perf_counter() - self._started_at
+            self._started_at = None
+            self._samples.append(pause)
+            self._total_pause += pause
+            generation = info.get("generation", 0)
+            if 0 <= generation < len(self._collections):
+                self._collections[generation] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """GC 일시 정지 요약 (ms)"""
+        result = summarize_ms(self._samples)
+        result["total_pause_ms"] = round(self._total_pause * 1000, 3)
+        result["collections"] = list(self._collections)
+        return result
+
+
+class PoolWaitTracker:
+    """
+    SQLAlchemy 커넥션 풀 체크아웃 대기 시간 측정
+
+    풀에는 체크아웃 시작 이벤트가 없어 공개 API인 Pool.connect()(Engine.connect()가 호출)를
+    감싸 소요 시간을 기록합니다 (풀 대기 + 신규 연결/pre-ping 포함).
+    Engine을 넘기면 engine_disposed 이벤트로 dispose() 후 새 풀에 다시 설치합니다.
+    """
+
+    def __init__(self, name: str, engine_or_pool: Any, history_size: int = DEFAULT_HISTORY_SIZE):
+        """
+        Args:
+            name: 풀 이름 (지표 키)
+            engine_or_pool: SQLAlchemy Engine 또는 Pool
+            history_size: 보관할 샘플 수
+        """
+        self.name = name
+        self._target = engine_or_pool
+        self._samples: Deque[float] = deque(maxlen=history_size)
+        self._timeouts = 0
+        self._pool = None
+        self.install()
+        if isinstance(engine_or_pool, Engine):
+            event.listen(engine_or_pool, "engine_disposed", self._on_engine_disposed)
+
+    def _current_pool(self):
+        return getattr(self._target, "pool", self._target)
+
+    def _on_engine_disposed(self, engine: Engine) -> None:
+        self.install()
+
+    def install(self) -> None:
+        """현재 풀의 connect() 감싸기"""
+        pool = self._current_pool()
+        if pool is self._pool:
+            return
+
+        original = pool.connect
+        samples = self._samples
+
+        def timed_connect():
+            started = time.perf_counter()
+            try:
+                return original()
+            except PoolTimeoutError:
+                self._timeouts += 1
+                raise
+            finally:
+                samples.append(time.perf_counter() - started)
+
+        pool.connect = timed_connect
+        self._pool = pool
+
+    def summary(self) -> Dict[str, Any]:
+        """체크아웃 대기 요약 (ms) + 풀 상태"""
+        result = summarize_ms(self._samples)
+        result["timeouts"] = self._timeouts
+        for attr in ("size", "checkedout", "overflow"):
+            getter = getattr(self._pool, attr, None)
+            if callable(getter):
+                try:
+                    result[attr] = getter()
+                except Exception:
+                    pass
+        return result
@@ -3,7 +3,7 @@ AI Analysis Repository
 AI 종목 분석 결과 접근 계층
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_, desc
@@ -137,6 +137,7 @@ class AIAnalysisRepository(BaseRepository[AIAnalysis]):
         confidence: float = 0.5,
         news_count: int = 0,
         news_urls: List = None,
+        commit: bool = True,
     ) -> AIAnalysis:
         """
         AI 분석 결과 저장
@@ -152,6 +153,7 @@ class AIAnalysisRepository(BaseRepository[AIAnalysis]):
             confidence: 신뢰도
             news_count: 뉴스 수
             news_urls: 뉴스 링크 리스트 [{"title": "...", "url": "..."}]
+            commit: False면 커밋하지 않고 flush만 수행 (여러 건은 save_analyses() 사용)
 
         Returns:
             생성된 AIAnalysis
@@ -169,10 +171,36 @@ class AIAnalysisRepository(BaseRepository[AIAnalysis]):
             news_urls=news_urls or [],
         )
         self.session.add(analysis)
+        if not commit:
+            self.session.flush()
+            return analysis
+
         self.session.commit()
         self.session.refresh(analysis)
         return analysis
 
+    def save_analyses(self, analyses: List[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        AI 분석 결과 일괄 저장 (다중 행 INSERT)
+
+        Args:
+            analyses: save_analysis() 인자와 같은 키의 딕셔너리 리스트
+            commit: True면 커밋까지 수행
+
+        Returns:
+            저장된 분석 수
+        """
+        rows = [
+            {
+                **analysis,
+                "confidence": analysis.get("confidence", 0.5),
+                "news_count": analysis.get("news_count", 0),
+                "news_urls": analysis.get("news_urls") or [],
+            }
+            for analysis in analyses
+        ]
+        return self.bulk_create(rows, commit=commit)
+
     def get_top_positive(
         self,
         analysis_date: date,
@@ -6,7 +6,7 @@ Backtest Repository
 from typing import List, Optional, Dict, Any
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, func
 from src.repositories.base import BaseRepository
 from src.database.models import BacktestResult
 
@@ -57,15 +57,50 @@ class BacktestRepository(BaseRepository[BacktestResult]):
         Returns:
             통계 정보 딕셔너리
         """
-        query = select(BacktestResult)
+        query = self._summary_query()
 
         if config_name:
             query = query.where(BacktestResult.config_name == config_name)
 
-        result = self.session.execute(query)
-        results = list(result.scalars().all())
+        return self._summary_from_row(self.session.execute(query).one())
 
-        if not results:
+    def get_summaries(self, config_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 설정의 요약 통계를 한 번의 GROUP BY 쿼리로 조회
+
+        Args:
+            config_names: 설정명 목록
+
+        Returns:
+            {설정명: 통계 정보 딕셔너리} (결과가 없는 설정은 0 통계)
+        """
+        query = (
+            self._summary_query()
+            .add_columns(BacktestResult.config_name)
+            .where(BacktestResult.config_name.in_(config_names))
+            .group_by(BacktestResult.config_name)
+        )
+
+        rows = {row.config_name: row for row in self.session.execute(query).all()}
+        return {name: self._summary_from_row(rows.get(name)) for name in config_names}
+
+    @staticmethod
+    def _summary_query():
+        """요약 통계 집계 쿼리 (AVG는 NULL 값을 제외하고 계산)"""
+        return select(
+            func.count(BacktestResult.id).label("total_backtests"),
+            func.avg(BacktestResult.total_return_pct).label("avg_return_pct"),
+            func.avg(BacktestResult.win_rate).label("avg_win_rate"),
+            func.max(BacktestResult.total_return_pct).label("best_return_pct"),
+            func.min(BacktestResult.total_return_pct).label("worst_return_pct"),
+            func.avg(BacktestResult.sharpe_ratio).label("avg_sharpe_ratio"),
+            func.avg(BacktestResult.max_drawdown_pct).label("avg_max_drawdown_pct"),
+        )
+
+    @staticmethod
+    def _summary_from_row(row) -> Dict[str, Any]:
+        """집계 행 -> 요약 통계 딕셔너리"""
+        if row is None or not row.total_backtests:
             return {
                 "total_backtests": 0,
                 "avg_return_pct": 0.0,
@@ -76,33 +111,14 @@ class BacktestRepository(BaseRepository[BacktestResult]):
                 "avg_max_drawdown_pct": 0.0,
             }
 
-        # 통계 계산
-        total_backtests = len(results)
-        avg_return_pct = sum(r.total_return_pct for r in results) / total_backtests
-
-        # win_rate가 있는 결과만 평균 계산
-        win_rates = [r.win_rate for r in results if r.win_rate is not None]
-        avg_win_rate = sum(win_rates) / len(win_rates) if win_rates else 0.0
-
-        best_return_pct = max(r.total_return_pct for r in results)
-        worst_return_pct = min(r.total_return_pct for r in results)
-
-        # sharpe_ratio 평균
-        sharpe_ratios = [r.sharpe_ratio for r in results if r.sharpe_ratio is not None]
-        avg_sharpe_ratio = sum(sharpe_ratios) / len(sharpe_ratios) if sharpe_ratios else 0.0
-
-        # max_drawdown_pct 평균
-        drawdowns = [r.max_drawdown_pct for r in results if r.max_drawdown_pct is not None]
-        avg_max_drawdown_pct = sum(drawdowns) / len(drawdowns) if drawdowns else 0.0
-
         return {
-            "total_backtests": total_backtests,
-            "avg_return_pct": round(avg_return_pct, 2),
-            "avg_win_rate": round(avg_win_rate, 2),
-            "best_return_pct": round(best_return_pct, 2),
-            "worst_return_pct": round(worst_return_pct, 2),
-            "avg_sharpe_ratio": round(avg_sharpe_ratio, 2),
-            "avg_max_drawdown_pct": round(avg_max_drawdown_pct, 2),
+            "total_backtests": row.total_backtests,
+            "avg_return_pct": round(row.avg_return_pct or 0.0, 2),
+            "avg_win_rate": round(row.avg_win_rate or 0.0, 2),
+            "best_return_pct": round(row.best_return_pct, 2),
+            "worst_return_pct": round(row.worst_return_pct, 2),
+            "avg_sharpe_ratio": round(row.avg_sharpe_ratio or 0.0, 2),
+            "avg_max_drawdown_pct": round(row.avg_max_drawdown_pct or 0.0, 2),
         }
 
     def get_best_result(
@@ -3,13 +3,16 @@ Base Repository Pattern
 공통 CRUD 작업을 처리하는 기본 Repository
 """
 
-from typing import Generic, TypeVar, Type, List, Optional
+from typing import Any, Dict, Generic, TypeVar, Type, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert
 from src.database.session import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# 다중 행 INSERT 한 번에 보낼 최대 행 수
+BULK_CHUNK_SIZE = 500
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -42,6 +45,41 @@ class BaseRepository(Generic[ModelType]):
         self.session.refresh(db_obj)
         return db_obj
 
+    def bulk_create(self, rows: List[Dict[str, Any]], commit: bool = True) -> int:
+        """
+        다중 행 INSERT (행마다 flush/refresh 하지 않음)
+
+        Args:
+            rows: 모델 필드값 딕셔너리 리스트
+            commit: True면 커밋까지 수행 (False면 호출자 트랜잭션에 포함)
+
+        Returns:
+            삽입된 행 수
+        """
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            self.session.execute(insert(self.model), rows[start:start + BULK_CHUNK_SIZE])
+        if commit:
+            self.session.commit()
+        return len(rows)
+
+    def bulk_update_where(self, values: Dict[str, Any], *criteria, commit: bool = True) -> int:
+        """
+        조건에 맞는 행 일괄 UPDATE (단일 SQL)
+
+        Args:
+            values: 변경할 필드값
+            *criteria: WHERE 조건 (SQLAlchemy 표현식)
+            commit: True면 커밋까지 수행
+
+        Returns:
+            변경된 행 수
+        """
+        query = update(self.model).where(*criteria).values(**values)
+        count = self.session.execute(query).rowcount
+        if commit:
+            self.session.commit()
+        return count
+
     def get_by_id(self, id: int) -> Optional[ModelType]:
         """ID로 조회"""
         return self.session.get(self.model, id)
@@ -3,11 +3,12 @@ DaytradingSignal Repository
 단타 매수 신호 Repository
 """
 
-from typing import List, Optional
-from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import date, datetime, timezone
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
-from src.repositories.base import BaseRepository
+from src.repositories.base import BaseRepository, BULK_CHUNK_SIZE
 from src.database.models.daytrading_signal import DaytradingSignal
 
 
@@ -21,21 +22,92 @@ class DaytradingSignalRepository(BaseRepository[DaytradingSignal]):
         """
         super().__init__(DaytradingSignal, session)
 
-    def create(self, signal: DaytradingSignal) -> DaytradingSignal:
+    def create(self, signal: DaytradingSignal, commit: bool = True) -> DaytradingSignal:
         """
         신호 생성
 
         Args:
             signal: DaytradingSignal 인스턴스
+            commit: False면 커밋하지 않고 flush만 수행 (호출자 트랜잭션)
 
         Returns:
             생성된 신호
         """
         self.session.add(signal)
+        if not commit:
+            self.session.flush()
+            return signal
+
         self.session.commit()
         self.session.refresh(signal)
         return signal
 
+    def create_many(self, signals: List[DaytradingSignal], commit: bool = True) -> int:
+        """
+        신호 여러 건 생성 (한 번의 flush/commit)
+
+        Args:
+            signals: DaytradingSignal 인스턴스 리스트
+            commit: True면 커밋까지 수행
+
+        Returns:
+            생성된 신호 수
+        """
+        self.session.add_all(signals)
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
+        return len(signals)
+
+    def upsert_open_signals(self, rows: List[Dict[str, Any]], commit: bool = True) -> Dict[str, int]:
+        """
+        종목별 OPEN 신호 일괄 UPSERT
+
+        종목당 OPEN 신호는 하나만 유지합니다. 이미 OPEN 신호가 있는 종목은 갱신하고,
+        없는 종목은 새로 삽입합니다 (기존 행 조회 1회 + 다중 행 UPDATE/INSERT).
+
+        Args:
+            rows: DaytradingSignal 필드값 딕셔너리 리스트 (ticker 필수)
+            commit: True면 커밋까지 수행
+
+        Returns:
+            {"inserted": 삽입 수, "updated": 갱신 수}
+        """
+        by_ticker = {row["ticker"]: row for row in rows}
+        tickers = list(by_ticker)
+
+        existing: Dict[str, int] = {}
+        for start in range(0, len(tickers), BULK_CHUNK_SIZE):
+            result = self.session.execute(
+                select(DaytradingSignal.ticker, DaytradingSignal.id)
+                .where(
+                    DaytradingSignal.status == "OPEN",
+                    DaytradingSignal.ticker.in_(tickers[start:start + BULK_CHUNK_SIZE]),
+                )
+                .order_by(DaytradingSignal.signal_date)
+            )
+            # 같은 종목의 OPEN 신호가 여러 개면 최신 것을 갱신
+            existing.update({ticker: signal_id for ticker, signal_id in result.all()})
+
+        now = datetime.now(timezone.utc)
+        updates = [
+            {**row, "id": existing[ticker], "updated_at": now}
+            for ticker, row in by_ticker.items() if ticker in existing
+        ]
+        inserts = [
+            {"status": "OPEN", **row}
+            for ticker, row in by_ticker.items() if ticker not in existing
+        ]
+
+        for start in range(0, len(updates), BULK_CHUNK_SIZE):
+            self.session.execute(update(DaytradingSignal), updates[start:start + BULK_CHUNK_SIZE])
+        self.bulk_create(inserts, commit=False)
+
+        if commit:
+            self.session.commit()
+        return {"inserted": len(inserts), "updated": len(updates)}
+
     def get_by_ticker(self, ticker: str) -> Optional[DaytradingSignal]:
         """
         종목 코드로 최신 신호 조회
@@ -188,16 +260,20 @@ class DaytradingSignalRepository(BaseRepository[DaytradingSignal]):
         signal_id: int,
         status: str,
         exit_time: Optional[date] = None,
-        exit_reason: Optional[str] = None
+        exit_reason: Optional[str] = None,
+        commit: bool = True,
     ) -> bool:
         """
         신호 상태 업데이트
 
+        여러 건은 bulk_update_status()로 한 번에 처리합니다.
+
         Args:
             signal_id: 신호 ID
             status: 새 상태 (OPEN, CLOSED)
             exit_time: 청산 시간
             exit_reason: 청산 사유
+            commit: False면 커밋하지 않음 (호출자 트랜잭션)
 
         Returns:
             업데이트 성공 여부
@@ -212,9 +288,70 @@ class DaytradingSignalRepository(BaseRepository[DaytradingSignal]):
         if exit_reason:
             signal.exit_reason = exit_reason
 
-        self.session.commit()
+        if commit:
+            self.session.commit()
         return True
 
+    def bulk_update_status(
+        self,
+        status: str,
+        *criteria,
+        signal_ids: Optional[Iterable[int]] = None,
+        exit_time: Optional[datetime] = None,
+        exit_reason: Optional[str] = None,
+        commit: bool = True,
+    ) -> int:
+        """
+        조건에 맞는 신호 상태 일괄 변경 (단일 UPDATE)
+
+        Args:
+            status: 새 상태 (OPEN, CLOSED)
+            *criteria: WHERE 조건 (예: DaytradingSignal.signal_date < date)
+            signal_ids: 대상 신호 ID (None이면 조건만 사용)
+            exit_time: 청산 시간 (CLOSED 전환 시 기본 현재 UTC)
+            exit_reason: 청산 사유
+            commit: True면 커밋까지 수행
+
+        Returns:
+            변경된 신호 수
+        """
+        conditions = list(criteria)
+        if signal_ids is not None:
+            signal_ids = list(signal_ids)
+            if not signal_ids:
+                return 0
+            conditions.append(DaytradingSignal.id.in_(signal_ids))
+
+        values = {"status": status, "updated_at": datetime.now(timezone.utc)}
+        if status == "CLOSED":
+            values["exit_time"] = exit_time or values["updated_at"]
+        elif exit_time:
+            values["exit_time"] = exit_time
+        if exit_reason:
+            values["exit_reason"] = exit_reason
+
+        return self.bulk_update_where(values, *conditions, commit=commit)
+
+    def close_stale(self, before: date, exit_reason: str = "EXPIRED", commit: bool = True) -> int:
+        """
+        signal_date가 before 이전인 OPEN 신호 일괄 청산
+
+        Args:
+            before: 기준 날짜 (이 날짜 미만)
+            exit_reason: 청산 사유
+            commit: True면 커밋까지 수행
+
+        Returns:
+            청산된 신호 수
+        """
+        return self.bulk_update_status(
+            "CLOSED",
+            DaytradingSignal.status == "OPEN",
+            DaytradingSignal.signal_date < before,
+            exit_reason=exit_reason,
+            commit=commit,
+        )
+
     def delete_by_date(self, signal_date: date) -> int:
         """
         날짜별 신호 삭제
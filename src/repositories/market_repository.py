@@ -15,6 +15,85 @@ from src.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Market Gate 섹터 ETF (섹터명 -> KODEX 종목코드)
+# 참고: https://www.krx.co.kr/main/main.jsp
+SECTOR_ETFS = {
+    "반도체": "069500",    # KODEX 반도체
+    "2차전지": "305720",   # KODEX 2차전지
+    "자동차": "116380",    # KODEX 자동차
+    "바이오": "327610",    # KODEX 바이오
+    "금융": "091160",      # KODEX 은행
+    "통신": "327580",      # KODEX 통신
+}
+
+# 강한 움직임 기준 변동률 (%)
+GATE_STRONG_MOVE_PCT = 1.0
+
+# 변동률 구간별 지수 기여 점수 (KOSPI/KOSDAQ 각 ±20점)
+_INDEX_POINTS = {2: 20, 1: 10, 0: 0, -1: -10, -2: -20}
+
+
+def gate_bucket(change_pct: Optional[float]) -> int:
+    """
+    변동률을 Gate 점수 구간으로 분류
+
+    Returns:
+        2(강세), 1(상승), 0(보합/정보 없음), -1(하락), -2(약세)
+    """
+    if not change_pct:
+        return 0
+    if change_pct > GATE_STRONG_MOVE_PCT:
+        return 2
+    if change_pct < -GATE_STRONG_MOVE_PCT:
+        return -2
+    return 1 if change_pct > 0 else -1
+
+
+def calculate_gate_status(
+    kospi_change_pct: Optional[float],
+    kosdaq_change_pct: Optional[float],
+    sector_scores: Optional[List[Dict[str, Any]]] = None,
+) -> tuple[str, int]:
+    """
+    Market Gate 상태 계산
+
+    점수는 각 입력의 gate_bucket 구간에만 의존하므로, 실시간 엔진은 구간이 바뀔 때만
+    다시 계산합니다.
+
+    Args:
+        kospi_change_pct: KOSPI 변동률
+        kosdaq_change_pct: KOSDAQ 변동률
+        sector_scores: 섹터별 점수 ([{"name", "change_pct", ...}])
+
+    Returns:
+        (gate 상태, gate 점수) 튜플
+    """
+    # 기본 점수 계산 (KOSPI 40%, KOSDAQ 40%, 섹터 20%)
+    score = 50  # 기본 점수
+
+    # KOSPI/KOSDAQ 기여 (각 ±20점)
+    score += _INDEX_POINTS[gate_bucket(kospi_change_pct)]
+    score += _INDEX_POINTS[gate_bucket(kosdaq_change_pct)]
+
+    # 섹터 기여 (±20점)
+    if sector_scores:
+        buckets = [gate_bucket(s.get("change_pct", 0)) for s in sector_scores]
+        sector_bonus = (buckets.count(2) - buckets.count(-2)) * 5
+        score += max(-20, min(20, sector_bonus))
+
+    # 점수를 0-100 범위로 제한
+    score = max(0, min(100, score))
+
+    # Gate 상태 결정
+    if score >= 70:
+        gate = "GREEN"
+    elif score >= 40:
+        gate = "YELLOW"
+    else:
+        gate = "RED"
+
+    return gate, score
+
 
 class MarketRepository:
     """Market Status Repository"""
@@ -126,7 +205,7 @@ class MarketRepository:
         sector_scores: Optional[List[Dict[str, Any]]] = None,
     ) -> tuple[str, int]:
         """
-        Market Gate 상태 계산
+        Market Gate 상태 계산 (calculate_gate_status 함수 위임)
 
         Args:
             kospi_change_pct: KOSPI 변동률
@@ -136,44 +215,4 @@ class MarketRepository:
         Returns:
             (gate 상태, gate 점수) 튜플
         """
-        # 기본 점수 계산 (KOSPI 40%, KOSDAQ 40%, 섹터 20%)
-        score = 50  # 기본 점수
-
-        # KOSPI/KOSDAQ 기여 (각 ±20점)
-        if kospi_change_pct > 1.0:
-            score += 20
-        elif kospi_change_pct > 0:
-            score += 10
-        elif kospi_change_pct < -1.0:
-            score -= 20
-        elif kospi_change_pct < 0:
-            score -= 10
-
-        if kosdaq_change_pct > 1.0:
-            score += 20
-        elif kosdaq_change_pct > 0:
-            score += 10
-        elif kosdaq_change_pct < -1.0:
-            score -= 20
-        elif kosdaq_change_pct < 0:
-            score -= 10
-
-        # 섹터 기여 (±20점)
-        if sector_scores:
-            bullish_count = sum(1 for s in sector_scores if s.get("change_pct", 0) > 1.0)
-            bearish_count = sum(1 for s in sector_scores if s.get("change_pct", 0) < -1.0)
-            sector_bonus = (bullish_count - bearish_count) * 5
-            score += max(-20, min(20, sector_bonus))
-
-        # 점수를 0-100 범위로 제한
-        score = max(0, min(100, score))
-
-        # Gate 상태 결정
-        if score >= 70:
-            gate = "GREEN"
-        elif score >= 40:
-            gate = "YELLOW"
-        else:
-            gate = "RED"
-
-        return gate, score
+        return calculate_gate_status(kospi_change_pct, kosdaq_change_pct, sector_scores)
@@ -4,99 +4,227 @@ Performance Repository
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, desc, func, case, delete, insert, union_all
 from src.repositories.base import BaseRepository
-from src.database.models import Signal, DailyPrice
+from src.database.models import Signal, DailyPrice, SignalPerformanceDaily, signals_history
+
+# 증분 갱신 시 마지막 갱신 시각 이전으로 다시 확인할 기간 (청산일 종가 지연 수집 대비)
+SERIES_LOOKBACK_DAYS = 3
+
+# 성과 계산에 필요한 시그널 컬럼
+_SIGNAL_COLUMNS = ("id", "ticker", "signal_type", "signal_date", "status", "entry_price", "exit_time")
+
+
+def _all_signals():
+    """signals + signals_history (이관된 시그널도 성과 집계에 포함)"""
+    return union_all(
+        select(*(Signal.__table__.c[name] for name in _SIGNAL_COLUMNS)),
+        select(*(signals_history.c[name] for name in _SIGNAL_COLUMNS)),
+    ).subquery("all_signals")
+
+
+def _exit_price_join(signals):
+    """시그널 청산일 종가 조인 조건"""
+    return and_(
+        DailyPrice.ticker == signals.c.ticker,
+        DailyPrice.date == func.date(signals.c.exit_time),
+    )
+
+
+def _return_pct(signals):
+    """실현 수익률 (%) - 진입가가 없거나 0이면 NULL"""
+    return (
+        (DailyPrice.close_price - signals.c.entry_price)
+        / func.nullif(signals.c.entry_price, 0)
+        * 100
+    )
 
 
 class PerformanceRepository(BaseRepository[Signal]):
     """
     Performance Repository
     시그널 성과 분석 및 누적 수익률 계산
+
+    시그널별 수익률은 (signals ∪ signals_history) ⨝ daily_prices(청산일) 단일 조인으로 계산하고,
+    누적 수익률/MDD/샤프 비율은 signal_performance_daily 일별 집계를 읽습니다.
     """
 
     def __init__(self, session: Session):
         super().__init__(Signal, session)
 
-    def calculate_cumulative_return(
+    # ========================================================================
+    # 일별 집계 (signal_performance_daily)
+    # ========================================================================
+
+    def refresh_daily_series(self, since: Optional[date] = None) -> int:
+        """
+        일별 수익률 집계 갱신
+
+        since를 지정하지 않으면 마지막 갱신 이후 청산된 시그널이 속한
+        시그널 날짜만 다시 집계합니다 (집계가 비어 있으면 전체 재구축).
+
+        Args:
+            since: 이 날짜 이후 시그널 날짜 전체 재집계
+
+        Returns:
+            갱신된 (signal_type, signal_date) 행 수
+        """
+        signals = _all_signals()
+        return_pct = _return_pct(signals)
+
+        # column -> 재집계 대상 날짜 조건 (None이면 전체 재구축)
+        date_filter = None
+
+        if since is not None:
+            def date_filter(column):
+                return column >= since
+        else:
+            watermark = self.session.execute(
+                select(func.max(SignalPerformanceDaily.updated_at))
+            ).scalar()
+
+            if watermark is not None:
+                if watermark.tzinfo is not None:
+                    watermark = watermark.astimezone(timezone.utc).replace(tzinfo=None)
+                cutoff = watermark - timedelta(days=SERIES_LOOKBACK_DAYS)
+                affected_dates = (
+                    select(signals.c.signal_date)
+                    .where(
+                        and_(
+                            signals.c.status == "CLOSED",
+                            signals.c.exit_time >= cutoff,
+                        )
+                    )
+                    .distinct()
+                )
+
+                def date_filter(column):
+                    return column.in_(affected_dates)
+
+        aggregate = (
+            select(
+                signals.c.signal_type,
+                signals.c.signal_date,
+                func.count(return_pct).label("signal_count"),
+                func.sum(case((return_pct > 0, 1), else_=0)).label("win_count"),
+                func.sum(return_pct).label("return_sum"),
+                func.max(return_pct).label("best_return"),
+                func.min(return_pct).label("worst_return"),
+            )
+            .select_from(signals)
+            .join(DailyPrice, _exit_price_join(signals))
+            .where(
+                and_(
+                    signals.c.status == "CLOSED",
+                    signals.c.entry_price > 0,
+                )
+            )
+            .group_by(signals.c.signal_type, signals.c.signal_date)
+        )
+        stale_rows = delete(SignalPerformanceDaily)
+
+        if date_filter is not None:
+            aggregate = aggregate.where(date_filter(signals.c.signal_date))
+            stale_rows = stale_rows.where(date_filter(SignalPerformanceDaily.signal_date))
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "signal_type": row.signal_type,
+                "signal_date": row.signal_date,
+                "signal_count": row.signal_count,
+                "win_count": row.win_count or 0,
+                "return_sum": row.return_sum or 0.0,
+                "best_return": row.best_return,
+                "worst_return": row.worst_return,
+                "updated_at": now,
+            }
+            for row in self.session.execute(aggregate).all()
+        ]
+
+        # 대상 날짜의 기존 집계를 교체 (한 트랜잭션)
+        self.session.execute(stale_rows)
+        if rows:
+            self.session.execute(insert(SignalPerformanceDaily), rows)
+        self.session.commit()
+
+        return len(rows)
+
+    def get_daily_series(
         self,
         signal_type: Optional[str] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
     ) -> List[Dict[str, Any]]:
         """
-        누적 수익률 계산
-
-        Args:
-            signal_type: 시그널 타입 필터 (VCP/JONGGA_V2)
-            start_date: 시작 날짜
-            end_date: 종료 날짜
+        날짜별 평균 실현 수익률 (일별 집계에서 조회)
 
         Returns:
-            날짜별 누적 수익률 리스트
+            [{"date", "daily_return_pct", "signal_count"}, ...] (날짜 오름차순)
         """
-        # 기본 조건: CLOSED 상태의 시그널만 (실현된 수익률)
-        query = select(Signal).where(Signal.status == "CLOSED")
+        query = (
+            select(
+                SignalPerformanceDaily.signal_date,
+                func.sum(SignalPerformanceDaily.return_sum).label("return_sum"),
+                func.sum(SignalPerformanceDaily.signal_count).label("signal_count"),
+            )
+            .where(SignalPerformanceDaily.signal_count > 0)
+            .group_by(SignalPerformanceDaily.signal_date)
+            .order_by(SignalPerformanceDaily.signal_date)
+        )
 
         if signal_type:
-            query = query.where(Signal.signal_type == signal_type)
+            query = query.where(SignalPerformanceDaily.signal_type == signal_type)
         if start_date:
-            query = query.where(Signal.signal_date >= start_date)
+            query = query.where(SignalPerformanceDaily.signal_date >= start_date)
         if end_date:
-            query = query.where(Signal.signal_date <= end_date)
-
-        query = query.order_by(Signal.signal_date)
-
-        result = self.session.execute(query)
-        signals = list(result.scalars().all())
+            query = query.where(SignalPerformanceDaily.signal_date <= end_date)
 
-        # 날짜별 그룹화 및 수익률 계산
-        daily_returns: Dict[str, List[float]] = {}
-
-        for signal in signals:
-            if not signal.entry_price or not signal.exit_time:
-                continue
-
-            # 종가 데이터에서 exit 시점의 가격 조회
-            exit_date = signal.exit_time.date()
-            price_query = select(DailyPrice).where(
-                and_(
-                    DailyPrice.ticker == signal.ticker,
-                    DailyPrice.date == exit_date
-                )
-            )
-            price_result = self.session.execute(price_query).first()
+        return [
+            {
+                "date": row.signal_date.isoformat(),
+                "daily_return_pct": row.return_sum / row.signal_count,
+                "signal_count": row.signal_count,
+            }
+            for row in self.session.execute(query).all()
+        ]
 
-            if not price_result:
-                continue
+    # ========================================================================
+    # 성과 지표
+    # ========================================================================
 
-            exit_price = price_result.close_price
+    def calculate_cumulative_return(
+        self,
+        signal_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        누적 수익률 계산
 
-            # 수익률 계산
-            return_pct = ((exit_price - signal.entry_price) / signal.entry_price) * 100
+        Args:
+            signal_type: 시그널 타입 필터 (VCP/JONGGA_V2)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
 
-            signal_date_str = signal.signal_date.isoformat()
-            if signal_date_str not in daily_returns:
-                daily_returns[signal_date_str] = []
-            daily_returns[signal_date_str].append(return_pct)
+        Returns:
+            날짜별 누적 수익률 리스트
+        """
+        series = self.get_daily_series(signal_type, start_date, end_date)
 
-        # 누적 수익률 계산
+        # 누적 수익률 계산 (기준 100)
         cumulative_returns = []
-        cumulative_value = 100.0  # 기준 100
-        sorted_dates = sorted(daily_returns.keys())
-
-        for date_str in sorted_dates:
-            returns = daily_returns[date_str]
-            if returns:
-                avg_return = sum(returns) / len(returns)
-                cumulative_value *= (1 + avg_return / 100)
-                cumulative_returns.append({
-                    "date": date_str,
-                    "daily_return_pct": avg_return,
-                    "cumulative_return_pct": cumulative_value - 100,
-                })
+        cumulative_value = 100.0
+
+        for point in series:
+            cumulative_value *= (1 + point["daily_return_pct"] / 100)
+            cumulative_returns.append({
+                "date": point["date"],
+                "daily_return_pct": point["daily_return_pct"],
+                "cumulative_return_pct": cumulative_value - 100,
+            })
 
         return cumulative_returns
 
@@ -118,23 +246,39 @@ class PerformanceRepository(BaseRepository[Signal]):
             성과 지표 딕셔너리
         """
         since_date = date.today() - timedelta(days=days)
-
-        query = select(Signal).where(
-            and_(
-                Signal.signal_date >= since_date,
-                Signal.status == "CLOSED"
+        signals = _all_signals()
+        return_pct = _return_pct(signals)
+
+        # 청산 시그널 전체 수와 수익률 집계를 한 번에 (종가 없는 시그널은 수익률이 NULL)
+        query = (
+            select(
+                func.count(signals.c.id).label("total_signals"),
+                func.count(return_pct).label("closed_signals"),
+                func.sum(case((return_pct > 0, 1), else_=0)).label("wins"),
+                func.avg(return_pct).label("avg_return"),
+                func.max(return_pct).label("best_return"),
+                func.min(return_pct).label("worst_return"),
+            )
+            .select_from(signals)
+            .outerjoin(DailyPrice, _exit_price_join(signals))
+            .where(
+                and_(
+                    signals.c.signal_date >= since_date,
+                    signals.c.status == "CLOSED"
+                )
             )
         )
 
         if ticker:
-            query = query.where(Signal.ticker == ticker)
+            query = query.where(signals.c.ticker == ticker)
         if signal_type:
-            query = query.where(Signal.signal_type == signal_type)
+            query = query.where(signals.c.signal_type == signal_type)
 
-        result = self.session.execute(query)
-        signals = list(result.scalars().all())
+        row = self.session.execute(query).one()
+        total_signals = row.total_signals or 0
+        closed_signals = row.closed_signals or 0
 
-        if not signals:
+        if not total_signals:
             return {
                 "total_signals": 0,
                 "win_rate": 0.0,
@@ -143,46 +287,22 @@ class PerformanceRepository(BaseRepository[Signal]):
                 "worst_return": None,
             }
 
-        # 각 시그널의 수익률 계산
-        returns = []
-        for signal in signals:
-            if not signal.entry_price or not signal.exit_time:
-                continue
-
-            exit_date = signal.exit_time.date()
-            price_query = select(DailyPrice).where(
-                and_(
-                    DailyPrice.ticker == signal.ticker,
-                    DailyPrice.date == exit_date
-                )
-            )
-            price_result = self.session.execute(price_query).first()
-
-            if not price_result:
-                continue
-
-            exit_price = price_result.close_price
-            return_pct = ((exit_price - signal.entry_price) / signal.entry_price) * 100
-            returns.append(return_pct)
-
-        if not returns:
+        if not closed_signals:
             return {
-                "total_signals": len(signals),
+                "total_signals": total_signals,
                 "win_rate": 0.0,
                 "avg_return": 0.0,
                 "best_return": None,
                 "worst_return": None,
             }
 
-        wins = [r for r in returns if r > 0]
-
         return {
-            "total_signals": len(signals),
-            "closed_signals": len(returns),
-            "win_rate": (len(wins) / len(returns) * 100) if returns else 0,
-            "avg_return": sum(returns) / len(returns) if returns else 0,
-            "best_return": max(returns) if returns else None,
-            "worst_return": min(returns) if returns else None,
+            "total_signals": total_signals,
+            "closed_signals": closed_signals,
+            "win_rate": (row.wins or 0) / closed_signals * 100,
+            "avg_return": row.avg_return,
+            "best_return": row.best_return,
+            "worst_return": row.worst_return,
         }
 
     def calculate_sharpe_ratio(
@@ -202,18 +322,16 @@ class PerformanceRepository(BaseRepository[Signal]):
         Returns:
             샤프 비율
         """
-        cumulative_returns = self.calculate_cumulative_return(
+        series = self.get_daily_series(
             signal_type=signal_type,
             start_date=date.today() - timedelta(days=days),
         )
+        return self._sharpe_ratio([p["daily_return_pct"] for p in series], risk_free_rate)
 
-        if len(cumulative_returns) < 2:
-            return 0.0
-
-        # 일일 수익률 추출
-        daily_returns = [r["daily_return_pct"] for r in cumulative_returns]
-
-        if not daily_returns:
+    @staticmethod
+    def _sharpe_ratio(daily_returns: List[float], risk_free_rate: float = 2.0) -> float:
+        """일별 수익률(%) 목록으로 연율화 샤프 비율 계산"""
+        if len(daily_returns) < 2:
             return 0.0
 
         # 평균과 표준편차 계산
@@ -229,9 +347,7 @@ class PerformanceRepository(BaseRepository[Signal]):
 
         # 샤프 비율 = (평균 수익률 - 무위험 이자율) / 표준편차 * sqrt(252)
         sharpe = ((avg_return / 100) - daily_risk_free / 100) / (std_dev / 100)
-        sharpe_annualized = sharpe * (252 ** 0.5)
-
-        return sharpe_annualized
+        return sharpe * (252 ** 0.5)
 
     def get_performance_by_period(
         self,
@@ -288,7 +404,8 @@ class PerformanceRepository(BaseRepository[Signal]):
             "mdd": mdd,
             "best_return": performance["best_return"],
             "worst_return": performance["worst_return"],
-            "sharpe_ratio": self.calculate_sharpe_ratio(signal_type=signal_type, days=days),
+            # 같은 일별 집계로 계산 (추가 조회 없음)
+            "sharpe_ratio": self._sharpe_ratio([c["daily_return_pct"] for c in cumulative]),
         }
 
     def get_top_performers(
@@ -309,49 +426,43 @@ class PerformanceRepository(BaseRepository[Signal]):
             최고 성과 종목 리스트
         """
         since_date = date.today() - timedelta(days=days)
-
-        # 서브쿼리로 수익률 계산 후 정렬 - 더 최적화된 방법
-        query = select(Signal).where(
-            and_(
-                Signal.signal_date >= since_date,
-                Signal.status == "CLOSED",
-                Signal.entry_price.isnot(None),
-                Signal.exit_time.isnot(None)
+        signals = _all_signals()
+        return_pct = _return_pct(signals)
+
+        # 청산일 종가 조인 후 DB에서 정렬/limit
+        query = (
+            select(
+                signals.c.ticker,
+                signals.c.signal_type,
+                signals.c.entry_price,
+                DailyPrice.close_price.label("exit_price"),
+                return_pct.label("return_pct"),
+                signals.c.signal_date,
             )
-        )
-
-        if signal_type:
-            query = query.where(Signal.signal_type == signal_type)
-
-        query = query.order_by(desc(Signal.signal_date))
-
-        result = self.session.execute(query)
-        signals = list(result.scalars().all())
-
-        # 수익률 계산 및 정렬
-        performers = []
-        for signal in signals:
-            exit_date = signal.exit_time.date()
-            price_query = select(DailyPrice.close_price).where(
+            .select_from(signals)
+            .join(DailyPrice, _exit_price_join(signals))
+            .where(
                 and_(
-                    DailyPrice.ticker == signal.ticker,
-                    DailyPrice.date == exit_date
+                    signals.c.signal_date >= since_date,
+                    signals.c.status == "CLOSED",
+                    signals.c.entry_price > 0,
                 )
             )
-            price_result = self.session.execute(price_query).first()
-
-            if price_result and signal.entry_price:
-                return_pct = ((price_result - signal.entry_price) / signal.entry_price) * 100
-                performers.append({
-                    "ticker": signal.ticker,
-                    "signal_type": signal.signal_type,
-                    "entry_price": signal.entry_price,
-                    "exit_price": price_result,
-                    "return_pct": round(return_pct, 2),
-                    "signal_date": signal.signal_date.isoformat(),
-                })
-
-        # 수익률 기준 정렬
-        performers.sort(key=lambda x: x["return_pct"], reverse=True)
-
-        return performers[:limit]
+        )
+
+        if signal_type:
+            query = query.where(signals.c.signal_type == signal_type)
+
+        query = query.order_by(desc(return_pct)).limit(limit)
+
+        return [
+            {
+                "ticker": row.ticker,
+                "signal_type": row.signal_type,
+                "entry_price": row.entry_price,
+                "exit_price": row.exit_price,
+                "return_pct": round(row.return_pct, 2),
+                "signal_date": row.signal_date.isoformat(),
+            }
+            for row in self.session.execute(query).all()
+        ]
@@ -0,0 +1,286 @@
+"""
+Signal Archive Repository
+보관 기간이 지난 시그널을 이력 테이블로 옮기는 데이터 접근 계층
+
+게이트웨이의 "최신" 조회는 signals/daytrading_signals만 읽으므로, 청산 후 보관 기간이
+지난 시그널을 signals_history/daytrading_signals_history로 옮겨 hot 테이블을 작게 유지합니다.
+이관은 ID 배치 단위 INSERT ... SELECT + DELETE를 한 트랜잭션으로 처리합니다.
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import Date, Table, and_, delete, insert, literal, select, text
+from sqlalchemy.orm import Session
+
+from src.database.models import (
+    DaytradingSignal,
+    Signal,
+    daytrading_signals_history,
+    signals_history,
+)
+from src.repositories.daytrading_signal_repository import DaytradingSignalRepository
+from src.repositories.signal_repository import SignalRepository
+
+logger = logging.getLogger(__name__)
+
+# 청산 후 hot 테이블에 남겨 둘 기간 (signal_date 기준, 일)
+SIGNAL_RETENTION_DAYS = 180
+DAYTRADING_RETENTION_DAYS = 30
+
+# OPEN 상태로 이 기간(일)이 지나면 만료 청산
+SIGNAL_OPEN_TTL_DAYS = 60
+DAYTRADING_OPEN_TTL_DAYS = 5
+
+# 한 트랜잭션에서 옮길 최대 행 수
+ARCHIVE_BATCH_SIZE = 2000
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _next_month(value: date) -> date:
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class SignalArchiveRepository:
+    """
+    시그널 보관 주기 관리
+
+    1. 오래된 OPEN 시그널 만료 청산 (expire_open_signals)
+    2. 보관 기간이 지난 CLOSED 시그널 이력 테이블 이관 (archive_*)
+    """
+
+    def __init__(self, session: Session, batch_size: int = ARCHIVE_BATCH_SIZE):
+        self.session = session
+        self.batch_size = batch_size
+        self._partitioned: Dict[str, bool] = {}
+        self._default_partitions: Dict[str, Optional[str]] = {}
+        self._partitions: Set[str] = set()
+
+    # ========================================================================
+    # 만료 / 이관
+    # ========================================================================
+
+    def expire_open_signals(
+        self,
+        today: Optional[date] = None,
+        signal_ttl_days: int = SIGNAL_OPEN_TTL_DAYS,
+        daytrading_ttl_days: int = DAYTRADING_OPEN_TTL_DAYS,
+    ) -> Dict[str, int]:
+        """
+        오래된 OPEN 시그널 일괄 만료 청산
+
+        Returns:
+            {"signals": 청산 수, "daytrading_signals": 청산 수}
+        """
+        today = today or date.today()
+        expired = {
+            "signals": SignalRepository(self.session).expire_signals(
+                today - timedelta(days=signal_ttl_days), commit=False,
+            ),
+            "daytrading_signals": DaytradingSignalRepository(self.session).close_stale(
+                today - timedelta(days=daytrading_ttl_days), commit=False,
+            ),
+        }
+        self.session.commit()
+        return expired
+
+    def archive_signals(self, before: date) -> int:
+        """
+        signal_date가 before 이전인 CLOSED 시그널을 signals_history로 이관
+
+        성과 집계(PerformanceRepository)는 signals와 signals_history를 함께 읽으므로
+        이관 후 전체 재구축에도 이관된 시그널의 실현 수익률이 유지됩니다.
+
+        Returns:
+            이관된 시그널 수
+        """
+        return self._archive(
+            Signal.__table__,
+            signals_history,
+            and_(Signal.status == "CLOSED", Signal.signal_date < before),
+        )
+
+    def archive_daytrading_signals(self, before: date) -> int:
+        """
+        signal_date가 before 이전인 CLOSED 단타 신호를 daytrading_signals_history로 이관
+
+        Returns:
+            이관된 신호 수
+        """
+        return self._archive(
+            DaytradingSignal.__table__,
+            daytrading_signals_history,
+            and_(DaytradingSignal.status == "CLOSED", DaytradingSignal.signal_date < before),
+        )
+
+    def run_retention(
+        self,
+        today: Optional[date] = None,
+        signal_retention_days: int = SIGNAL_RETENTION_DAYS,
+        daytrading_retention_days: int = DAYTRADING_RETENTION_DAYS,
+    ) -> Dict[str, int]:
+        """
+        만료 청산 후 보관 기간이 지난 시그널 이관
+
+        Returns:
+            {"expired_signals", "expired_daytrading_signals", "archived_signals", "archived_daytrading_signals"}
+        """
+        today = today or date.today()
+        expired = self.expire_open_signals(today)
+
+        return {
+            "expired_signals": expired["signals"],
+            "expired_daytrading_signals": expired["daytrading_signals"],
+            "archived_signals": self.archive_signals(
+                today - timedelta(days=signal_retention_days)
+            ),
+            "archived_daytrading_signals": self.archive_daytrading_signals(
+                today - timedelta(days=daytrading_retention_days)
+            ),
+        }
+
+    def _archive(self, source: Table, history: Table, criteria) -> int:
+        """ID 배치 단위로 INSERT ... SELECT + DELETE (배치마다 커밋)"""
+        columns = [column.name for column in source.columns]
+        total = 0
+
+        while True:
+            batch = self.session.execute(
+                select(source.c.id, source.c.signal_date)
+                .where(criteria)
+                .order_by(source.c.id)
+                .limit(self.batch_size)
+            ).all()
+            if not batch:
+                break
+
+            ids = [row.id for row in batch]
+            self._ensure_partitions(history, {row.signal_date for row in batch})
+
+            archived_at = datetime.now(timezone.utc)
+            self.session.execute(
+                insert(history).from_select(
+                    [*columns, "archived_at"],
+                    select(*(source.c[name] for name in columns), literal(archived_at, history.c.archived_at.type))
+                    .where(source.c.id.in_(ids)),
+                )
+            )
+            self.session.execute(delete(source).where(source.c.id.in_(ids)))
+            self.session.commit()
+
+            total += len(ids)
+            logger.info(f"{source.name} → {history.name}: {len(ids)}건 이관 (누적 {total})")
+
+            if len(ids) < self.batch_size:
+                break
+
+        return total
+
+    # ========================================================================
+    # 파티션 (PostgreSQL)
+    # ========================================================================
+
+    def _is_partitioned(self, history: Table) -> bool:
+        """이력 테이블이 PostgreSQL 파티션 테이블인지 확인 (DEFAULT 파티션 이름도 함께 조회)"""
+        if history.name not in self._partitioned:
+            row = None
+            if self.session.get_bind().dialect.name == "postgresql":
+                row = self.session.execute(
+                    text(
+                        "SELECT NULLIF(partdefid, 0::oid)::regclass::text AS default_partition "
+                        "FROM pg_partitioned_table WHERE partrelid = to_regclass(:name)"
+                    ),
+                    {"name": history.name},
+                ).first()
+            self._partitioned[history.name] = row is not None
+            self._default_partitions[history.name] = row.default_partition if row is not None else None
+        return self._partitioned[history.name]
+
+    def _ensure_partitions(self, history: Table, signal_dates: Set[date]) -> None:
+        """
+        이관할 signal_date가 속한 월 파티션 생성 (없을 때만)
+
+        DEFAULT 파티션에 같은 구간 행이 있으면 PARTITION OF 생성이 실패하므로,
+        새 테이블에 해당 행을 옮긴 뒤 ATTACH합니다. 실패는 삼키지 않고 그대로 전파합니다.
+        """
+        if not self._is_partitioned(history):
+            return
+
+        for month in sorted({_month_start(d) for d in signal_dates}):
+            partition = f"{history.name}_{month:%Y%m}"
+            if partition in self._partitions:
+                continue
+
+            exists = self.session.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": partition}
+            ).scalar()
+            if not exists:
+                self._create_partition(history, partition, month)
+            self._partitions.add(partition)
+
+    def _create_partition(self, history: Table, name: str, month: date) -> None:
+        """월 파티션 생성 (DEFAULT 파티션에 걸린 구간 행은 새 파티션으로 옮긴 뒤 ATTACH)"""
+        # DDL은 바인드 파라미터를 쓸 수 없으므로 식별자/경계값을 방언 규칙으로 렌더링
+        dialect = self.session.get_bind().dialect
+        quote = dialect.identifier_preparer.quote
+        parent, partition = quote(history.name), quote(name)
+        bounds = "FROM ({}) TO ({})".format(*(
+            literal(value, Date).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+            for value in (month, _next_month(month))
+        ))
+        default_partition = self._default_partitions.get(history.name)
+        month_range = {"start": month, "end": _next_month(month)}
+
+        stranded = default_partition is not None and self.session.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {default_partition} "
+                "WHERE signal_date >= :start AND signal_date < :end)"
+            ),
+            month_range,
+        ).scalar()
+
+        if not stranded:
+            self.session.execute(text(f"CREATE TABLE {partition} PARTITION OF {parent} FOR VALUES {bounds}"))
+            return
+
+        logger.info(f"{default_partition}의 {month:%Y-%m} 행을 {partition}으로 이동")
+        columns = ", ".join(quote(column.name) for column in history.columns)
+        self.session.execute(text(
+            f"CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        ))
+        self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default_partition} "
+                f"WHERE signal_date >= :start AND signal_date < :end RETURNING {columns}) "
+                f"INSERT INTO {partition} ({columns}) SELECT {columns} FROM moved"
+            ),
+            month_range,
+        )
+        self.session.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {partition} FOR VALUES {bounds}"))
+
+    # ========================================================================
+    # 조회
+    # ========================================================================
+
+    def get_signal_history(self, ticker: str, limit: int = 50) -> List[dict]:
+        """
+        종목의 이관된 시그널 이력 조회
+
+        Args:
+            ticker: 종목 코드
+            limit: 최대 반환 수
+
+        Returns:
+            이력 행 딕셔너리 리스트 (signal_date 내림차순)
+        """
+        result = self.session.execute(
+            select(signals_history)
+            .where(signals_history.c.ticker == ticker)
+            .order_by(signals_history.c.signal_date.desc())
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in result.all()]
@@ -3,13 +3,19 @@ Signal Repository
 VCP/종가베팅 시그널 데이터 접근 계층
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import date, datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, desc
-from src.repositories.base import BaseRepository
+from sqlalchemy import select, and_, desc, func, case, tuple_, update
+from src.repositories.base import BaseRepository, BULK_CHUNK_SIZE
 from src.database.models import Signal
 
+# 시그널 자연 키 (같은 날 같은 종목/타입은 하나)
+SIGNAL_NATURAL_KEY = ("ticker", "signal_type", "signal_date")
+
+# 기간 만료로 일괄 청산된 시그널의 청산 사유
+EXPIRED_EXIT_REASON = "EXPIRED"
+
 
 class SignalRepository(BaseRepository[Signal]):
     """
@@ -91,16 +97,20 @@ class SignalRepository(BaseRepository[Signal]):
         signal_id: int,
         new_status: str,
         exit_price: Optional[float] = None,
-        exit_reason: Optional[str] = None
+        exit_reason: Optional[str] = None,
+        commit: bool = True,
     ) -> Optional[Signal]:
         """
         시그널 상태 업데이트 (OPEN → CLOSED)
 
+        여러 건은 close_signals()로 한 번에 처리합니다.
+
         Args:
             signal_id: 시그널 ID
             new_status: 새 상태 (CLOSED)
             exit_price: 청산 가격
             exit_reason: 청산 사유
+            commit: False면 커밋하지 않고 flush만 수행 (호출자 트랜잭션)
 
         Returns:
             업데이트된 Signal 인스턴스
@@ -118,10 +128,118 @@ class SignalRepository(BaseRepository[Signal]):
         if exit_reason is not None:
             signal.exit_reason = exit_reason
 
+        if not commit:
+            self.session.flush()
+            return signal
+
         self.session.commit()
         self.session.refresh(signal)
         return signal
 
+    # ========================================================================
+    # 일괄 처리 (set-based)
+    # ========================================================================
+
+    def upsert_signals(self, rows: List[Dict[str, Any]], commit: bool = True) -> Dict[str, int]:
+        """
+        시그널 일괄 UPSERT
+
+        (ticker, signal_type, signal_date)가 같은 기존 시그널은 갱신하고 나머지는 삽입합니다.
+        기존 행 조회 1회 + 청크 단위 다중 행 UPDATE/INSERT로 처리합니다.
+
+        Args:
+            rows: Signal 필드값 딕셔너리 리스트 (자연 키 필드 필수)
+            commit: True면 커밋까지 수행
+
+        Returns:
+            {"inserted": 삽입 수, "updated": 갱신 수}
+        """
+        # 입력 내 중복 키는 마지막 값 사용
+        by_key = {tuple(row[k] for k in SIGNAL_NATURAL_KEY): row for row in rows}
+
+        existing: Dict[tuple, int] = {}
+        keys = list(by_key)
+        key_columns = tuple_(*(getattr(Signal, k) for k in SIGNAL_NATURAL_KEY))
+        for start in range(0, len(keys), BULK_CHUNK_SIZE):
+            chunk = keys[start:start + BULK_CHUNK_SIZE]
+            result = self.session.execute(
+                select(Signal.id, *(getattr(Signal, k) for k in SIGNAL_NATURAL_KEY))
+                .where(key_columns.in_(chunk))
+            )
+            for row in result.all():
+                existing[tuple(row[1:])] = row[0]
+
+        updates = [{**row, "id": existing[key]} for key, row in by_key.items() if key in existing]
+        inserts = [row for key, row in by_key.items() if key not in existing]
+
+        for start in range(0, len(updates), BULK_CHUNK_SIZE):
+            # 기본 키 기준 ORM 일괄 UPDATE (executemany)
+            self.session.execute(update(Signal), updates[start:start + BULK_CHUNK_SIZE])
+        self.bulk_create(inserts, commit=False)
+
+        if commit:
+            self.session.commit()
+        return {"inserted": len(inserts), "updated": len(updates)}
+
+    def close_signals(
+        self,
+        *criteria,
+        signal_ids: Optional[Iterable[int]] = None,
+        exit_reason: Optional[str] = None,
+        exit_time: Optional[datetime] = None,
+        commit: bool = True,
+    ) -> int:
+        """
+        조건에 맞는 OPEN 시그널 일괄 청산 (단일 UPDATE)
+
+        Args:
+            *criteria: 추가 WHERE 조건 (예: Signal.signal_type == "VCP")
+            signal_ids: 대상 시그널 ID (None이면 조건만 사용)
+            exit_reason: 청산 사유
+            exit_time: 청산 시간 (기본 현재 UTC)
+            commit: True면 커밋까지 수행
+
+        Returns:
+            청산된 시그널 수
+        """
+        conditions = [Signal.status == "OPEN", *criteria]
+        if signal_ids is not None:
+            signal_ids = list(signal_ids)
+            if not signal_ids:
+                return 0
+            conditions.append(Signal.id.in_(signal_ids))
+
+        values = {
+            "status": "CLOSED",
+            "exit_time": exit_time or datetime.now(timezone.utc),
+        }
+        if exit_reason is not None:
+            values["exit_reason"] = exit_reason
+
+        return self.bulk_update_where(values, *conditions, commit=commit)
+
+    def expire_signals(
+        self,
+        before: date,
+        signal_type: Optional[str] = None,
+        commit: bool = True,
+    ) -> int:
+        """
+        signal_date가 before 이전인 OPEN 시그널을 기간 만료로 일괄 청산
+
+        Args:
+            before: 기준 날짜 (이 날짜 미만)
+            signal_type: 시그널 타입 필터 (None이면 전체)
+            commit: True면 커밋까지 수행
+
+        Returns:
+            청산된 시그널 수
+        """
+        criteria = [Signal.signal_date < before]
+        if signal_type:
+            criteria.append(Signal.signal_type == signal_type)
+        return self.close_signals(*criteria, exit_reason=EXPIRED_EXIT_REASON, commit=commit)
+
     def get_latest_signals(
         self,
         signal_type: str,
@@ -189,7 +307,7 @@ class SignalRepository(BaseRepository[Signal]):
 
     def get_summary_by_date(self, signal_date: date) -> Dict[str, Any]:
         """
-        특정 날짜의 시그널 요약 통계
+        특정 날짜의 시그널 요약 통계 (SQL 집계)
 
         Args:
             signal_date: 대상 날짜
@@ -197,16 +315,27 @@ class SignalRepository(BaseRepository[Signal]):
         Returns:
             통계 정보 딕셔너리
         """
-        signals = self.get_by_date_range(signal_date, signal_date)
+        result = self.session.execute(
+            select(
+                Signal.status,
+                Signal.signal_type,
+                func.count().label("count"),
+                func.coalesce(func.sum(Signal.score), 0).label("score_sum"),
+            )
+            .where(Signal.signal_date == signal_date)
+            .group_by(Signal.status, Signal.signal_type)
+        )
 
-        total = len(signals)
+        total = 0
+        total_score = 0.0
         by_status = {"OPEN": 0, "CLOSED": 0}
         by_type = {"VCP": 0, "JONGGA_V2": 0}
-        total_score = sum(s.score or 0 for s in signals)
 
-        for s in signals:
-            by_status[s.status] = by_status.get(s.status, 0) + 1
-            by_type[s.signal_type] = by_type.get(s.signal_type, 0) + 1
+        for row in result.all():
+            total += row.count
+            total_score += float(row.score_sum)
+            by_status[row.status] = by_status.get(row.status, 0) + row.count
+            by_type[row.signal_type] = by_type.get(row.signal_type, 0) + row.count
 
         avg_score = total_score / total if total > 0 else 0
 
@@ -217,3 +346,49 @@ class SignalRepository(BaseRepository[Signal]):
             "by_type": by_type,
             "avg_score": avg_score,
         }
+
+    def get_daily_summaries(
+        self,
+        start_date: date,
+        end_date: date,
+        signal_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        기간 내 날짜/타입별 시그널 집계 (SQL 집계)
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            signal_type: 시그널 타입 필터
+
+        Returns:
+            [{"date", "signal_type", "total", "open", "closed", "avg_score", "max_score"}, ...] (날짜 내림차순)
+        """
+        query = (
+            select(
+                Signal.signal_date,
+                Signal.signal_type,
+                func.count().label("total"),
+                func.sum(case((Signal.status == "OPEN", 1), else_=0)).label("open"),
+                func.avg(Signal.score).label("avg_score"),
+                func.max(Signal.score).label("max_score"),
+            )
+            .where(and_(Signal.signal_date >= start_date, Signal.signal_date <= end_date))
+            .group_by(Signal.signal_date, Signal.signal_type)
+            .order_by(desc(Signal.signal_date), Signal.signal_type)
+        )
+        if signal_type:
+            query = query.where(Signal.signal_type == signal_type)
+
+        return [
+            {
+                "date": row.signal_date,
+                "signal_type": row.signal_type,
+                "total": row.total,
+                "open": row.open or 0,
+                "closed": row.total - (row.open or 0),
+                "avg_score": float(row.avg_score) if row.avg_score is not None else 0.0,
+                "max_score": row.max_score,
+            }
+            for row in self.session.execute(query).all()
+        ]
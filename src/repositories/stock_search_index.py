@@ -0,0 +1,463 @@
+"""
+Stock Search Index
+종목 티커/이름 인메모리 검색 색인
+
+stocks 테이블 전체를 프로세스 메모리에 올려 두고 다음 키로 색인합니다.
+- 티커, 정규화 종목명("(주)"/공백 제거, 영문 소문자), 별칭
+- 초성 ("ㅅㅅㅈㅈ" → 삼성전자)
+
+조회는 정확 일치 → 접두 일치 → 조사 붙은 단어("삼성전자는") → n-gram 유사도(오타 허용)
+순으로 점수를 매겨 DB 없이 마이크로초 단위로 끝납니다.
+`ilike '%kw%'` 는 B-tree 인덱스를 쓰지 못해 매 조회마다 테이블 전체를 훑기 때문에
+챗봇처럼 메시지마다 여러 번 검색하는 경로는 이 색인을 사용합니다.
+
+Usage:
+    index = get_stock_search_index()
+    index.search("삼성전지")        # 오타 허용 → 삼성전자
+    index.search("ㅅㅅㅈㅈ")         # 초성 → 삼성전자
+    index.get("005930")
+
+    # 종목 마스터 동기화 후 (Redis 버전 키 증가 → 모든 프로세스 색인이 재로드)
+    invalidate_stock_search_index()
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 색인 유효 시간 (초) - 다른 프로세스의 종목 동기화도 이 주기 안에 반영
+STOCK_INDEX_TTL = 60 * 60
+
+# 로드 실패 후 재시도 간격 (초)
+STOCK_INDEX_RETRY_INTERVAL = 60
+
+# 종목 마스터 버전 키 (동기화 태스크가 증가시키면 각 프로세스 색인이 재로드)
+STOCK_INDEX_VERSION_KEY = "stock_search_index:version"
+
+# 버전 키 확인 최소 간격 (초)
+STOCK_INDEX_VERSION_CHECK_INTERVAL = 30
+
+# n-gram 크기 - 한글 음절은 라틴 문자보다 정보량이 많아 2-gram이 영문 trigram 역할
+NGRAM_SIZE = 2
+
+# 오타 허용 최소 유사도 (Dice 계수)
+FUZZY_THRESHOLD = 0.5
+
+# 검색 키 최소 길이
+MIN_QUERY_LENGTH = 2
+
+# 점수 (높을수록 우선)
+SCORE_TICKER = 100.0
+SCORE_EXACT = 95.0
+SCORE_CHOSEONG = 85.0
+SCORE_PREFIX = 80.0
+SCORE_EMBEDDED = 70.0
+SCORE_SUBSTRING = 65.0
+SCORE_FUZZY = 60.0
+
+# 한글 음절 초성 (U+AC00 ~ U+D7A3)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNGSEONG_JONGSEONG = 21 * 28
+
+
+def normalize_key(text: str) -> str:
+    """검색 키 정규화: "(주)" / 공백 제거, 영문 소문자"""
+    return text.replace("(주)", "").replace("㈜", "").replace(" ", "").strip().lower()
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 유지)"""
+    chars = []
+    for c in text:
+        code = ord(c)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_BASE) // _JUNGSEONG_JONGSEONG])
+        else:
+            chars.append(c)
+    return "".join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성만으로 이루어진 검색어인지 확인"""
+    return bool(text) and all(c in _CHOSEONG for c in text)
+
+
+def _ngrams(text: str) -> Set[str]:
+    if len(text) <= NGRAM_SIZE:
+        return {text}
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+@dataclass
+class StockEntry:
+    """색인된 종목"""
+    ticker: str
+    name: str
+    market: str = ""
+    sector: Optional[str] = None
+    market_cap: int = 0
+    aliases: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticker": self.ticker,
+            "name": self.name,
+            "market": self.market,
+            "sector": self.sector,
+        }
+
+
+class _Snapshot:
+    """불변 색인 스냅샷 (재빌드 시 참조만 교체)"""
+
+    def __init__(self, entries: Iterable[StockEntry]):
+        self.entries: List[StockEntry] = list(entries)
+        self.keys: List[List[str]] = []
+        self.by_ticker: Dict[str, int] = {}
+        # 키 → (종목 번호, 점수)
+        self.exact: Dict[str, Dict[int, float]] = {}
+        self.choseong: Dict[str, Set[int]] = {}
+        self.grams: Dict[str, Set[int]] = {}
+        self.gram_counts: Dict[str, int] = {}
+
+        for i, entry in enumerate(self.entries):
+            self.by_ticker[entry.ticker] = i
+            self._add_exact(entry.ticker.lower(), i, SCORE_TICKER)
+
+            keys = [normalize_key(name) for name in [entry.name, *entry.aliases]]
+            keys = [key for key in dict.fromkeys(keys) if len(key) >= MIN_QUERY_LENGTH]
+            self.keys.append(keys)
+            for key in keys:
+                self._add_exact(key, i, SCORE_EXACT)
+                self.choseong.setdefault(to_choseong(key), set()).add(i)
+                grams = _ngrams(key)
+                self.gram_counts[key] = len(grams)
+                for gram in grams:
+                    self.grams.setdefault(gram, set()).add(i)
+
+        self.sorted_keys: List[str] = sorted(self.exact)
+        self.sorted_choseong: List[str] = sorted(self.choseong)
+
+    def _add_exact(self, key: str, index: int, score: float) -> None:
+        bucket = self.exact.setdefault(key, {})
+        bucket[index] = max(bucket.get(index, 0.0), score)
+
+    def keys_with_prefix(self, keys: List[str], prefix: str) -> Iterable[str]:
+        start = bisect.bisect_left(keys, prefix)
+        for key in keys[start:]:
+            if not key.startswith(prefix):
+                break
+            yield key
+
+
+class StockSearchIndex:
+    """
+    종목 검색 색인
+
+    읽기는 잠금 없이 현재 스냅샷을 사용하고, 재빌드는 새 스냅샷을 만든 뒤 참조만 교체합니다.
+    TTL이 지나거나 종목 마스터 버전이 바뀌면 기존 스냅샷으로 계속 응답하면서
+    백그라운드 스레드에서 다시 로드합니다.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], List[StockEntry]]] = None,
+        ttl: float = STOCK_INDEX_TTL,
+        retry_interval: float = STOCK_INDEX_RETRY_INTERVAL,
+        version_reader: Optional[Callable[[], Optional[str]]] = None,
+        version_check_interval: float = STOCK_INDEX_VERSION_CHECK_INTERVAL,
+    ):
+        """
+        Args:
+            loader: 종목 목록 로더 (기본값: stocks 테이블)
+            ttl: 색인 유효 시간 (초)
+            retry_interval: 로드 실패 후 재시도 간격 (초)
+            version_reader: 종목 마스터 버전 조회 함수 (None이면 TTL로만 갱신)
+            version_check_interval: 버전 확인 최소 간격 (초)
+        """
+        self._loader = loader or load_stock_entries
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._version_reader = version_reader
+        self.version_check_interval = version_check_interval
+        self._version: Optional[str] = None
+        self._next_version_check = 0.0
+        self._snapshot: Optional[_Snapshot] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._reloading = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """종목이 한 건 이상 색인되었는지"""
+        snapshot = self._snapshot
+        return snapshot is not None and bool(snapshot.entries)
+
+    def ensure_loaded(self) -> bool:
+        """
+        색인이 아직 없으면 로드 (최초 조회 전 예열)
+
+        종목 마스터 버전이 로드 시점과 다르면 만료 처리해 백그라운드 재로드를 시작합니다.
+
+        Returns:
+            종목이 한 건 이상 색인되었는지
+        """
+        self._check_version()
+        return bool(self._current().entries)
+
+    def _read_version(self) -> Optional[str]:
+        if self._version_reader is None:
+            return None
+        try:
+            return self._version_reader()
+        except Exception as e:
+            logger.debug(f"종목 검색 색인 버전 조회 실패: {e}")
+            return None
+
+    def _check_version(self) -> None:
+        """버전 키가 바뀌었으면 만료 처리 (version_check_interval마다 한 번)"""
+        if self._version_reader is None or self._snapshot is None:
+            return
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return
+        self._next_version_check = now + self.version_check_interval
+
+        version = self._read_version()
+        if version is not None and version != self._version:
+            logger.info(f"종목 마스터 버전 변경 ({self._version} → {version}), 색인 재로드")
+            self.invalidate()
+
+    def __len__(self) -> int:
+        snapshot = self._snapshot
+        return len(snapshot.entries) if snapshot else 0
+
+    def rebuild(self, entries: Iterable[StockEntry]) -> None:
+        """주어진 종목 목록으로 색인 재구성"""
+        snapshot = _Snapshot(entries)
+        self._snapshot = snapshot
+        self._expires_at = time.monotonic() + self.ttl
+        logger.info(f"종목 검색 색인 재구성: {len(snapshot.entries)}개")
+
+    def refresh(self) -> bool:
+        """
+        로더로 종목 목록을 다시 읽어 색인 재구성
+
+        Returns:
+            성공 여부 (실패 시 기존 색인 유지, retry_interval 후 재시도)
+        """
+        # 로드 전에 읽어 두어야 로드 중 바뀐 버전을 다음 확인에서 놓치지 않음
+        version = self._read_version()
+        try:
+            entries = self._loader()
+        except Exception as e:
+            logger.warning(f"종목 검색 색인 로드 실패: {e}")
+            self._expires_at = time.monotonic() + self.retry_interval
+            return False
+
+        self.rebuild(entries)
+        self._version = version
+        return True
+
+    def invalidate(self) -> None:
+        """다음 조회 시 다시 로드하도록 만료 처리"""
+        self._expires_at = 0.0
+
+    def _current(self) -> _Snapshot:
+        if self._snapshot is None:
+            # 최초 로드는 동기 (동시 호출은 한 번만 로드)
+            with self._lock:
+                if self._snapshot is None:
+                    if not self.refresh():
+                        self._snapshot = _Snapshot([])
+            return self._snapshot
+
+        if time.monotonic() >= self._expires_at and not self._reloading:
+            with self._lock:
+                if not self._reloading:
+                    self._reloading = True
+                    threading.Thread(
+                        target=self._background_refresh,
+                        name="stock-index-refresh",
+                        daemon=True,
+                    ).start()
+
+        return self._snapshot
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._reloading = False
+
+    def get(self, ticker: str) -> Optional[StockEntry]:
+        """티커로 종목 조회"""
+        snapshot = self._current()
+        index = snapshot.by_ticker.get(ticker.upper())
+        return snapshot.entries[index] if index is not None else None
+
+    def search(self, query: str, limit: int = 5) -> List[StockEntry]:
+        """
+        종목 검색 (점수순)
+
+        Args:
+            query: 티커, 종목명, 별칭, 초성 또는 오타가 섞인 종목명
+            limit: 최대 결과 수
+
+        Returns:
+            점수 → 시가총액 → 이름 길이 순으로 정렬된 종목 리스트
+        """
+        snapshot = self._current()
+        key = normalize_key(query or "")
+        if len(key) < MIN_QUERY_LENGTH or not snapshot.entries:
+            return []
+
+        scores: Dict[int, float] = {}
+
+        def hit(index: int, score: float) -> None:
+            if score > scores.get(index, 0.0):
+                scores[index] = score
+
+        # 1) 정확 일치
+        for index, score in snapshot.exact.get(key, {}).items():
+            hit(index, score)
+
+        # 2) 초성 검색 (정확 / 접두)
+        if is_choseong_query(key):
+            for cho in snapshot.keys_with_prefix(snapshot.sorted_choseong, key):
+                ratio = len(key) / len(cho)
+                for index in snapshot.choseong[cho]:
+                    hit(index, SCORE_CHOSEONG * ratio)
+            return self._ranked(snapshot, scores, limit)
+
+        # 3) 접두 일치 ("삼성" → 삼성전자, 삼성SDI ... 시가총액 순)
+        for name in snapshot.keys_with_prefix(snapshot.sorted_keys, key):
+            for index in snapshot.exact[name]:
+                hit(index, SCORE_PREFIX)
+
+        # 4) 종목명 뒤에 조사/어미가 붙은 단어 ("삼성전자는", "카카오랑")
+        for end in range(len(key) - 1, MIN_QUERY_LENGTH - 1, -1):
+            bucket = snapshot.exact.get(key[:end])
+            if bucket:
+                ratio = end / len(key)
+                for index in bucket:
+                    hit(index, SCORE_EMBEDDED + 10 * ratio)
+                break
+
+        # 5) 부분 일치 / n-gram 유사도 (오타 허용)
+        grams = _ngrams(key)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for index in snapshot.grams.get(gram, ()):
+                shared[index] = shared.get(index, 0) + 1
+
+        for index, count in shared.items():
+            if index in scores and scores[index] >= SCORE_SUBSTRING:
+                continue
+            best = 0.0
+            for name_key in snapshot.keys[index]:
+                if key in name_key:
+                    best = max(best, SCORE_SUBSTRING)
+                    continue
+                total = len(grams) + snapshot.gram_counts.get(name_key, 0)
+                if total:
+                    dice = 2 * count / total
+                    if dice >= FUZZY_THRESHOLD:
+                        best = max(best, SCORE_FUZZY * dice)
+            if best:
+                hit(index, best)
+
+        return self._ranked(snapshot, scores, limit)
+
+    @staticmethod
+    def _ranked(snapshot: _Snapshot, scores: Dict[int, float], limit: int) -> List[StockEntry]:
+        def rank(item: Tuple[int, float]) -> Tuple[float, int, int]:
+            entry = snapshot.entries[item[0]]
+            return (-item[1], -(entry.market_cap or 0), len(entry.name))
+
+        return [snapshot.entries[i] for i, _ in sorted(scores.items(), key=rank)[:limit]]
+
+
+def load_stock_entries() -> List[StockEntry]:
+    """stocks 테이블 전체를 StockEntry 목록으로 로드 (별칭 포함)"""
+    from sqlalchemy import select
+    from src.collectors.article_index import DEFAULT_ALIASES
+    from src.database.session import get_db_session_sync
+    from src.database.models import Stock
+
+    with get_db_session_sync() as db:
+        rows = db.execute(
+            select(Stock.ticker, Stock.name, Stock.market, Stock.sector, Stock.market_cap)
+        ).all()
+
+    return [
+        StockEntry(
+            ticker=ticker,
+            name=name,
+            market=market or "",
+            sector=sector,
+            market_cap=market_cap or 0,
+            aliases=[a for a in DEFAULT_ALIASES.get(ticker, []) if a != name],
+        )
+        for ticker, name, market, sector, market_cap in rows
+        if name
+    ]
+
+
+def _redis_url() -> str:
+    # Celery 태스크와 같은 Redis (동기화 태스크와 조회 프로세스가 같은 키를 봐야 함)
+    return os.getenv("CELERY_BROKER_URL") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+_version_client = None
+
+
+def _get_version_client():
+    global _version_client
+    if _version_client is None:
+        import redis
+
+        _version_client = redis.Redis.from_url(_redis_url(), socket_connect_timeout=1.0, socket_timeout=1.0)
+    return _version_client
+
+
+def read_stock_index_version() -> Optional[str]:
+    """Redis의 종목 마스터 버전 조회 (키가 없으면 None)"""
+    value = _get_version_client().get(STOCK_INDEX_VERSION_KEY)
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# 전역 색인 (프로세스 단위)
+_stock_search_index: Optional[StockSearchIndex] = None
+
+
+def get_stock_search_index() -> StockSearchIndex:
+    """전역 종목 검색 색인 반환"""
+    global _stock_search_index
+    if _stock_search_index is None:
+        _stock_search_index = StockSearchIndex(version_reader=read_stock_index_version)
+    return _stock_search_index
+
+
+def invalidate_stock_search_index() -> None:
+    """
+    종목 마스터 동기화 후 색인 만료 처리
+
+    Redis 버전 키를 증가시켜 다른 프로세스 색인도 다음 버전 확인 시 재로드합니다.
+    Redis에 연결할 수 없으면 현재 프로세스 색인만 만료되고 나머지는 TTL로 반영됩니다.
+    """
+    try:
+        _get_version_client().incr(STOCK_INDEX_VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"종목 검색 색인 버전 증가 실패: {e}")
+
+    if _stock_search_index is not None:
+        _stock_search_index.invalidate()
@@ -12,6 +12,7 @@ from sqlalchemy import text
 
 from src.database.session import SessionLocal
 from src.repositories.stock_repository import StockRepository
+from src.repositories.stock_search_index import invalidate_stock_search_index
 from src.collectors.krx_collector import KRXCollector
 from src.kiwoom.rest_api import KiwoomRestAPI
 from src.kiwoom.base import KiwoomConfig
@@ -59,6 +60,10 @@ def collect_stock_list(market: str = "KOSPI") -> int:
             except Exception as e:
                 logger.error(f"❌ 종목 저장 실패 {stock_data['ticker']}: {e}")
 
+    # 모든 프로세스의 종목 검색 색인이 새 목록으로 재구성되도록 버전 증가
+    if count:
+        invalidate_stock_search_index()
+
     logger.info(f"✅ {market} 종목 {count}개 수집 완료")
     return count
 
@@ -3,6 +3,7 @@ Rate Limiter (속도 제한)
 슬라이딩 윈도우 알고리즘 기반 요청 속도 제한
 """
 
+import asyncio
 import time
 from typing import Dict, Optional
 from collections import deque
@@ -83,6 +84,54 @@ class RateLimiter:
         self._count = 0
 
 
+class AsyncTokenBucket:
+    """
+    비동기 토큰 버킷 (외부 API 호출 페이싱)
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 누적됩니다.
+    acquire()는 토큰이 생길 때까지 대기하므로, 동시 실행 중인 여러 코루틴이
+    하나의 버킷을 공유하면 전체 호출 속도가 rate 이하로 유지됩니다.
+
+    Args:
+        rate: 초당 토큰 보충 수
+        capacity: 최대 토큰 수 (버스트 허용량, 기본값 rate)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+
 class RateLimiterRegistry:
     """
     Rate Limiter 레지스트리
@@ -8,6 +8,7 @@ from typing import Optional, Set, Dict, Any
 
 from src.kiwoom.base import KiwoomEventType, RealtimePrice, IndexRealtimePrice
 from src.websocket.server import connection_manager
+from src.websocket.price_snapshot import price_snapshot
 
 
 logger = logging.getLogger(__name__)
@@ -109,6 +110,20 @@ class KiwoomWebSocketBridge:
 
         ticker = price.ticker
 
+        # 공유 가격 스냅샷 갱신 (구독 여부와 무관)
+        price_snapshot.update(
+            ticker,
+            {
+                "price": price.price,
+                "change": price.change,
+                "change_rate": price.change_rate,
+                "volume": price.volume,
+                "bid_price": price.bid_price,
+                "ask_price": price.ask_price,
+            },
+            source="kiwoom_ws",
+        )
+
         # 구독 중인 종목인지 확인
         if ticker not in self._active_tickers:
             print(f"[WS BRIDGE] Ticker {ticker} not in active_tickers: {self._active_tickers}")
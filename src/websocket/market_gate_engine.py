@@ -0,0 +1,497 @@
+"""
+실시간 Market Gate 엔진
+
+Kiwoom 실시간 업종지수(KOSPI/KOSDAQ)와 섹터 ETF 체결 이벤트를 받아 Market Gate를
+프로세스 메모리에서 유지합니다. 점수는 입력의 gate_bucket 구간이 바뀔 때만 다시 계산하고,
+MarketStatus 저장은 Gate 상태 전환 시 또는 persist_interval마다 한 번만 수행합니다.
+
+엔진이 저장할 때마다 Redis 하트비트 키를 갱신하며, Celery update_market_gate 태스크는
+하트비트가 살아 있는 동안 스크래핑을 건너뜁니다.
+
+Usage:
+    engine = get_market_gate_engine()
+    await engine.start(kiwoom_pipeline)
+
+    snapshot = engine.snapshot()  # 실시간 데이터가 없으면 None (DB 조회로 대체)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.kiwoom.base import IndexRealtimePrice, KiwoomEventType, RealtimePrice
+from src.repositories.market_repository import SECTOR_ETFS, calculate_gate_status, gate_bucket
+
+logger = logging.getLogger(__name__)
+
+# 업종코드 -> 지수 키
+INDEX_KEYS = {
+    "001": "kospi",
+    "201": "kosdaq",
+}
+
+# 주기 저장 간격 (초) - 기존 Celery update-market-gate 주기와 동일
+PERSIST_INTERVAL_SECONDS = 300
+
+# 점수 변화 없는 값 갱신의 브로드캐스트 최소 간격 (초)
+BROADCAST_INTERVAL_SECONDS = 5.0
+
+# 엔진 하트비트 (Celery 태스크가 스크래핑 생략 여부 판단)
+ENGINE_HEARTBEAT_KEY = "market_gate:engine:heartbeat"
+ENGINE_HEARTBEAT_TTL = PERSIST_INTERVAL_SECONDS * 2
+
+MARKET_GATE_TOPIC = "market-gate"
+
+
+def _redis_url() -> str:
+    # Celery 태스크와 같은 Redis (_broadcast_market_gate_update와 동일한 우선순위)
+    return os.getenv("CELERY_BROKER_URL") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def _redis_client():
+    import redis
+
+    return redis.Redis.from_url(_redis_url(), socket_connect_timeout=1.0, socket_timeout=1.0)
+
+
+def is_engine_alive(client=None) -> bool:
+    """
+    실시간 Gate 엔진 하트비트 확인
+
+    Args:
+        client: 동기 Redis 클라이언트 (None이면 새로 연결)
+
+    Returns:
+        하트비트가 유효하면 True (Redis 연결 실패 시 False)
+    """
+    owned = client is None
+    try:
+        if owned:
+            client = _redis_client()
+        return bool(client.exists(ENGINE_HEARTBEAT_KEY))
+    except Exception as e:
+        logger.debug(f"Market Gate 엔진 하트비트 확인 실패: {e}")
+        return False
+    finally:
+        if owned and client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+
+def _sector_signal(change_pct: float) -> str:
+    bucket = gate_bucket(change_pct)
+    return "bullish" if bucket == 2 else "bearish" if bucket == -2 else "neutral"
+
+
+@dataclass
+class GateSnapshot:
+    """메모리에 유지되는 Market Gate 상태 (MarketStatus 컬럼명과 동일)"""
+    gate: str
+    gate_score: int
+    kospi: Optional[float]
+    kospi_change_pct: Optional[float]
+    kosdaq: Optional[float]
+    kosdaq_change_pct: Optional[float]
+    sector_scores: List[Dict[str, Any]] = field(default_factory=list)
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def created_at(self) -> datetime:
+        """MarketStatus.created_at 호환 (계산 시각)"""
+        return self.updated_at
+
+    def to_message(self) -> dict:
+        """market-gate 토픽 브로드캐스트 메시지 (Celery 발행 메시지와 같은 형식)"""
+        return {
+            "type": "market_gate_update",
+            "timestamp": self.updated_at.isoformat(),
+            "data": {
+                "status": self.gate,
+                "level": self.gate_score,
+                "kospi": self.kospi,
+                "kospi_change_pct": self.kospi_change_pct,
+                "kosdaq": self.kosdaq,
+                "kosdaq_change_pct": self.kosdaq_change_pct,
+                "sectors": [
+                    {
+                        "name": s.get("name"),
+                        "ticker": s.get("ticker"),
+                        "change_pct": s.get("change_pct"),
+                        "signal": _sector_signal(s.get("change_pct", 0)),
+                    }
+                    for s in self.sector_scores
+                ],
+            },
+        }
+
+
+class MarketGateEngine:
+    """
+    실시간 Market Gate 엔진
+
+    모든 갱신은 API Gateway 이벤트 루프에서 동기적으로 일어나므로 별도 잠금 없이 동작합니다.
+    """
+
+    def __init__(
+        self,
+        sector_etfs: Optional[Dict[str, str]] = None,
+        persist_interval: float = PERSIST_INTERVAL_SECONDS,
+        broadcast_interval: float = BROADCAST_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.persist_interval = persist_interval
+        self.broadcast_interval = broadcast_interval
+        self._clock = clock
+
+        # 종목코드 -> 섹터명
+        self._sector_names = {ticker: name for name, ticker in (sector_etfs or SECTOR_ETFS).items()}
+
+        self._pipeline: Optional[Any] = None
+        self._running = False
+
+        # 입력 상태
+        self._indices: Dict[str, Dict[str, Optional[float]]] = {}
+        self._sectors: Dict[str, float] = {}
+        # 실시간 지수를 마지막으로 받은 시각 (clock 기준, 시드 데이터만 있으면 None)
+        self._last_event_at: Optional[float] = None
+
+        # 계산 결과
+        self._signature: Optional[Tuple] = None
+        self._gate: Optional[str] = None
+        self._score: Optional[int] = None
+        self._updated_at: Optional[datetime] = None
+
+        # 저장 / 브로드캐스트 상태
+        self._persisted_gate: Optional[str] = None
+        self._last_persist: Optional[float] = None
+        self._dirty = False
+        self._persist_task: Optional[asyncio.Task] = None
+        self._last_broadcast: Optional[float] = None
+        self._broadcast_score: Optional[int] = None
+        self._broadcast_pending = False
+
+        self._stats = {"updates": 0, "recomputes": 0, "persists": 0, "broadcasts": 0}
+
+    # ========================================================================
+    # 수명 주기
+    # ========================================================================
+
+    async def start(self, pipeline: Any, seed: bool = True) -> None:
+        """
+        엔진 시작 (이벤트 핸들러 등록 + 섹터 ETF 구독)
+
+        KOSPI/KOSDAQ 지수 구독은 호출 측(API Gateway lifespan)이 담당합니다.
+
+        Args:
+            pipeline: KiwoomPipelineManager 인스턴스
+            seed: 오늘 저장된 MarketStatus로 초기 입력 채우기
+        """
+        if self._running:
+            logger.warning("MarketGateEngine already running")
+            return
+
+        if seed:
+            try:
+                await asyncio.to_thread(self._seed_from_db)
+            except Exception as e:
+                logger.warning(f"Market Gate 시드 로드 실패: {e}")
+
+        self._pipeline = pipeline
+        self._running = True
+        pipeline.register_event_handler(KiwoomEventType.RECEIVE_INDEX_DATA, self.on_index)
+        pipeline.register_event_handler(KiwoomEventType.RECEIVE_REAL_DATA, self.on_price)
+
+        for ticker in self._sector_names:
+            try:
+                await pipeline.subscribe(ticker)
+            except Exception as e:
+                logger.warning(f"섹터 ETF 구독 실패 ({ticker}): {e}")
+
+        logger.info(f"MarketGateEngine started ({len(self._sector_names)} sector ETFs)")
+
+    async def stop(self) -> None:
+        """엔진 중지 (미저장 변경분 저장)"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._pipeline:
+            self._pipeline.unregister_event_handler(KiwoomEventType.RECEIVE_INDEX_DATA, self.on_index)
+            self._pipeline.unregister_event_handler(KiwoomEventType.RECEIVE_REAL_DATA, self.on_price)
+        self._pipeline = None
+
+        if self._persist_task:
+            await asyncio.gather(self._persist_task, return_exceptions=True)
+        if self._dirty:
+            await self._persist()
+
+        logger.info("MarketGateEngine stopped")
+
+    def _seed_from_db(self) -> None:
+        from src.database.session import get_db_session_sync
+        from src.repositories.market_repository import MarketRepository
+
+        with get_db_session_sync() as db:
+            market_status = MarketRepository(db).get_by_date(date.today())
+            if market_status:
+                self.seed(market_status)
+
+    def seed(self, market_status: Any) -> None:
+        """
+        저장된 MarketStatus로 입력 채우기
+
+        실시간 이벤트가 아직 오지 않은 지수/섹터의 값으로 사용되며, 시드만으로는
+        snapshot()이 활성화되지 않습니다.
+        """
+        for key in INDEX_KEYS.values():
+            self._indices.setdefault(key, {
+                "price": getattr(market_status, key),
+                "change_pct": getattr(market_status, f"{key}_change_pct"),
+            })
+
+        for sector in market_status.sector_scores or []:
+            ticker = sector.get("ticker")
+            if ticker in self._sector_names:
+                self._sectors.setdefault(ticker, sector.get("change_pct") or 0.0)
+
+        self._recompute()
+        self._persisted_gate = market_status.gate
+        self._dirty = False
+        self._broadcast_pending = False
+
+    # ========================================================================
+    # 실시간 입력
+    # ========================================================================
+
+    async def on_index(self, index_data: IndexRealtimePrice) -> None:
+        """업종지수 실시간 이벤트 처리"""
+        key = INDEX_KEYS.get(index_data.code)
+        if key is None or not self._running:
+            return
+
+        self._last_event_at = self._clock()
+        if self.apply_index(key, index_data.index, index_data.change_rate):
+            await self._after_update()
+
+    async def on_price(self, price: RealtimePrice) -> None:
+        """체결 이벤트 처리 (섹터 ETF만)"""
+        if price.ticker not in self._sector_names or not self._running:
+            return
+
+        if self.apply_sector(price.ticker, price.change_rate):
+            await self._after_update()
+
+    def apply_index(self, key: str, price: Optional[float], change_pct: Optional[float]) -> bool:
+        """
+        지수 값 반영
+
+        Returns:
+            값이 바뀌었으면 True
+        """
+        current = self._indices.get(key)
+        if current and current["price"] == price and current["change_pct"] == change_pct:
+            return False
+
+        self._indices[key] = {"price": price, "change_pct": change_pct}
+        self._recompute()
+        return True
+
+    def apply_sector(self, ticker: str, change_pct: float) -> bool:
+        """
+        섹터 ETF 등락률 반영
+
+        Returns:
+            값이 바뀌었으면 True
+        """
+        if self._sectors.get(ticker) == change_pct:
+            return False
+
+        self._sectors[ticker] = change_pct
+        self._recompute()
+        return True
+
+    # ========================================================================
+    # 계산
+    # ========================================================================
+
+    def _sector_scores(self) -> List[Dict[str, Any]]:
+        return [
+            {"name": self._sector_names[ticker], "ticker": ticker, "change_pct": change_pct}
+            for ticker, change_pct in self._sectors.items()
+        ]
+
+    def _recompute(self) -> None:
+        """입력 구간이 바뀐 경우에만 Gate 재계산"""
+        self._stats["updates"] += 1
+        self._dirty = True
+        self._broadcast_pending = True
+        self._updated_at = datetime.now(timezone.utc)
+
+        kospi = self._indices.get("kospi", {}).get("change_pct")
+        kosdaq = self._indices.get("kosdaq", {}).get("change_pct")
+        sector_buckets = [gate_bucket(pct) for pct in self._sectors.values()]
+        signature = (
+            gate_bucket(kospi),
+            gate_bucket(kosdaq),
+            sector_buckets.count(2),
+            sector_buckets.count(-2),
+        )
+        if signature == self._signature:
+            return
+
+        self._signature = signature
+        self._gate, self._score = calculate_gate_status(kospi, kosdaq, self._sector_scores())
+        self._stats["recomputes"] += 1
+
+    async def _after_update(self) -> None:
+        """점수 변화는 즉시, 값 변화는 broadcast_interval마다 브로드캐스트 / 상태 전환·주기 저장"""
+        now = self._clock()
+
+        if self._broadcast_pending and (
+            self._score != self._broadcast_score
+            or self._last_broadcast is None
+            or now - self._last_broadcast >= self.broadcast_interval
+        ):
+            await self._broadcast()
+
+        if not self._dirty or self._persist_task is not None:
+            return
+        if (
+            self._gate != self._persisted_gate
+            or self._last_persist is None
+            or now - self._last_persist >= self.persist_interval
+        ):
+            self._persist_task = asyncio.create_task(self._persist())
+
+    # ========================================================================
+    # 출력
+    # ========================================================================
+
+    def is_live(self) -> bool:
+        """최근(ENGINE_HEARTBEAT_TTL 이내) 실시간 지수 이벤트로 계산된 Gate가 있는지 여부"""
+        return (
+            self._last_event_at is not None
+            and self._clock() - self._last_event_at <= ENGINE_HEARTBEAT_TTL
+            and self._gate is not None
+            and all(self._indices.get(key, {}).get("price") is not None for key in INDEX_KEYS.values())
+        )
+
+    def snapshot(self) -> Optional[GateSnapshot]:
+        """
+        현재 Gate 스냅샷
+
+        Returns:
+            GateSnapshot (실시간 데이터가 없으면 None)
+        """
+        if not self.is_live():
+            return None
+
+        kospi = self._indices["kospi"]
+        kosdaq = self._indices["kosdaq"]
+        return GateSnapshot(
+            gate=self._gate,
+            gate_score=self._score,
+            kospi=kospi["price"],
+            kospi_change_pct=kospi["change_pct"],
+            kosdaq=kosdaq["price"],
+            kosdaq_change_pct=kosdaq["change_pct"],
+            sector_scores=self._sector_scores(),
+            updated_at=self._updated_at,
+        )
+
+    async def _broadcast(self) -> None:
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return
+
+        self._last_broadcast = self._clock()
+        self._broadcast_score = snapshot.gate_score
+        self._broadcast_pending = False
+        try:
+            from src.websocket.server import connection_manager
+
+            await connection_manager.broadcast(snapshot.to_message(), topic=MARKET_GATE_TOPIC)
+            self._stats["broadcasts"] += 1
+        except Exception as e:
+            logger.error(f"Market Gate 브로드캐스트 실패: {e}")
+
+    async def _persist(self) -> None:
+        snapshot = self.snapshot()
+        try:
+            if snapshot is None:
+                return
+
+            self._dirty = False
+            self._last_persist = self._clock()
+            try:
+                await asyncio.to_thread(self._persist_sync, snapshot)
+                self._persisted_gate = snapshot.gate
+                self._stats["persists"] += 1
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Market Gate 저장 실패: {e}")
+        finally:
+            self._persist_task = None
+
+    def _persist_sync(self, snapshot: GateSnapshot) -> None:
+        """MarketStatus 저장 + 하트비트 갱신 (워커 스레드)"""
+        from src.database.session import get_db_session_sync
+        from src.repositories.market_repository import MarketRepository
+
+        with get_db_session_sync() as db:
+            MarketRepository(db).create_or_update(
+                date=date.today(),
+                kospi=snapshot.kospi,
+                kospi_change_pct=snapshot.kospi_change_pct,
+                kosdaq=snapshot.kosdaq,
+                kosdaq_change_pct=snapshot.kosdaq_change_pct,
+                gate=snapshot.gate,
+                gate_score=snapshot.gate_score,
+                sector_scores=snapshot.sector_scores,
+            )
+        logger.info(f"Market Gate 저장: {snapshot.gate} (레벨 {snapshot.gate_score})")
+
+        self._touch_heartbeat()
+
+    def _touch_heartbeat(self) -> None:
+        client = None
+        try:
+            client = _redis_client()
+            client.set(ENGINE_HEARTBEAT_KEY, datetime.now(timezone.utc).isoformat(), ex=ENGINE_HEARTBEAT_TTL)
+        except Exception as e:
+            logger.debug(f"Market Gate 엔진 하트비트 갱신 실패: {e}")
+        finally:
+            if client is not None:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+
+    def get_stats(self) -> dict:
+        """엔진 통계"""
+        return {
+            **self._stats,
+            "running": self._running,
+            "live": self.is_live(),
+            "gate": self._gate,
+            "score": self._score,
+            "sectors": len(self._sectors),
+        }
+
+
+# 전역 엔진 인스턴스
+_market_gate_engine: Optional[MarketGateEngine] = None
+
+
+def get_market_gate_engine() -> MarketGateEngine:
+    """Market Gate 엔진 전역 인스턴스 가져오기"""
+    global _market_gate_engine
+    if _market_gate_engine is None:
+        _market_gate_engine = MarketGateEngine()
+    return _market_gate_engine
@@ -0,0 +1,152 @@
+"""
+최신 가격 스냅샷
+
+Kiwoom 실시간 스트림, Redis Pub/Sub, PriceUpdateBroadcaster 폴링 결과를
+한 곳에 모아 두는 프로세스 내 공유 저장소입니다. 소비자는 DB를 직접 조회하지 않고
+버전(변경 순번) 기준으로 바뀐 종목만 읽어 갑니다.
+
+Usage:
+    snapshot = get_price_snapshot()
+
+    # 피더: 가격 반영 (값이 바뀐 경우에만 버전 증가)
+    snapshot.update("005930", {"price": 80000, "change": 500, ...}, source="kiwoom_ws")
+
+    # 소비자: 마지막으로 읽은 버전 이후 변경분 조회
+    version, changed = snapshot.changed_since(last_version, tickers={"005930"})
+
+    # 폴링 피더가 수집해야 할 종목 등록
+    snapshot.watch("005930", owner="daytrading")
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 변경 여부 비교 필드
+COMPARED_FIELDS = ("price", "change", "change_rate", "volume")
+
+
+class PriceSnapshot:
+    """
+    종목별 최신 가격 스냅샷
+
+    모든 갱신은 하나의 이벤트 루프에서 동기적으로 일어나므로 별도 잠금 없이 동작합니다.
+    """
+
+    def __init__(self):
+        self._prices: Dict[str, dict] = {}
+        self._versions: Dict[str, int] = {}
+        self._version = 0
+
+        # owner -> 관심 종목 (폴링 피더가 함께 수집)
+        self._watchers: Dict[str, Set[str]] = {}
+
+    @property
+    def version(self) -> int:
+        """현재 스냅샷 버전 (변경이 반영될 때마다 1 증가)"""
+        return self._version
+
+    def update(self, ticker: str, price_data: dict, source: str = "unknown") -> bool:
+        """
+        종목 가격 반영
+
+        Args:
+            ticker: 종목코드
+            price_data: 가격 데이터 (price, change, change_rate, volume, ...)
+            source: 데이터 출처 (kiwoom_ws, redis, kiwoom_rest, db)
+
+        Returns:
+            값이 바뀌어 버전이 증가했는지 여부
+        """
+        if not ticker or not price_data or price_data.get("price") is None:
+            return False
+
+        current = self._prices.get(ticker)
+        if current and all(current.get(f) == price_data.get(f) for f in COMPARED_FIELDS):
+            return False
+
+        self._version += 1
+        self._prices[ticker] = {
+            **price_data,
+            "source": source,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._versions[ticker] = self._version
+        return True
+
+    def update_many(self, prices: Dict[str, dict], source: str = "unknown") -> int:
+        """
+        여러 종목 가격 반영
+
+        Returns:
+            변경된 종목 수
+        """
+        return sum(self.update(ticker, data, source) for ticker, data in prices.items())
+
+    def get(self, ticker: str) -> Optional[dict]:
+        """종목 최신 가격"""
+        return self._prices.get(ticker)
+
+    def get_many(self, tickers: Iterable[str]) -> Dict[str, dict]:
+        """여러 종목 최신 가격 (스냅샷에 없는 종목 제외)"""
+        return {t: self._prices[t] for t in tickers if t in self._prices}
+
+    def changed_since(
+        self,
+        version: int,
+        tickers: Optional[Iterable[str]] = None,
+    ) -> Tuple[int, Dict[str, dict]]:
+        """
+        지정 버전 이후 변경된 종목 가격
+
+        Args:
+            version: 마지막으로 읽은 스냅샷 버전
+            tickers: 대상 종목 (None이면 전체)
+
+        Returns:
+            (현재 버전, {ticker: 가격 데이터})
+        """
+        candidates = self._versions.keys() if tickers is None else tickers
+        changed = {
+            ticker: self._prices[ticker]
+            for ticker in candidates
+            if self._versions.get(ticker, 0) > version
+        }
+        return self._version, changed
+
+    def watch(self, ticker: str, owner: str = "default") -> None:
+        """폴링 피더가 수집할 종목 등록"""
+        self._watchers.setdefault(owner, set()).add(ticker)
+
+    def unwatch(self, ticker: str, owner: str = "default") -> None:
+        """폴링 대상 종목 해제"""
+        tickers = self._watchers.get(owner)
+        if tickers:
+            tickers.discard(ticker)
+            if not tickers:
+                del self._watchers[owner]
+
+    def watched_tickers(self) -> Set[str]:
+        """모든 소비자가 등록한 종목"""
+        watched: Set[str] = set()
+        for tickers in self._watchers.values():
+            watched |= tickers
+        return watched
+
+    def clear(self) -> None:
+        """스냅샷 초기화 (테스트용)"""
+        self._prices.clear()
+        self._versions.clear()
+        self._watchers.clear()
+        self._version = 0
+
+
+# 전역 스냅샷 인스턴스
+price_snapshot = PriceSnapshot()
+
+
+def get_price_snapshot() -> PriceSnapshot:
+    """전역 PriceSnapshot 인스턴스 반환"""
+    return price_snapshot
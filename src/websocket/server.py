@@ -11,6 +11,7 @@ from fastapi import WebSocket
 from datetime import datetime, timezone
 
 from src.utils.logging_config import get_logger
+from src.websocket.price_snapshot import price_snapshot
 
 logger = get_logger(__name__)
 
@@ -332,9 +333,6 @@ class PriceUpdateBroadcaster:
         # 구독 중인 종목 목록
         self._active_tickers: Set[str] = set()
 
-        # Kiwoom API 토큰 초기화 플래그
-        self._token_initialized = False
-
         # 실시간 가격 캐시 (Daytrading Scanner에서 사용)
         self._price_cache: Dict[str, dict] = {}  # ticker -> price_data
 
@@ -363,25 +361,22 @@ class PriceUpdateBroadcaster:
         return self._active_tickers.copy()
 
     async def _ensure_token(self) -> bool:
-        """Kiwoom API 토큰 초기화 확인"""
-        if self._token_initialized:
-            return True
+        """
+        Kiwoom API 토큰 확보
 
+        토큰 브로커를 거치는 ensure_token_valid()를 사용해 프로세스 간 공유 토큰을
+        재사용합니다 (직접 발급하면 다른 프로세스의 토큰이 폐기될 수 있음).
+        유효한 토큰이 있으면 추가 요청 없이 반환되므로 매 조회마다 호출합니다.
+        """
         api = get_kiwoom_api()
         if api is None:
             return False
 
         try:
-            success = await api.issue_token()
-            if success:
-                self._token_initialized = True
-                logger.info("Kiwoom API token issued for price broadcasting")
-                return True
-            else:
-                logger.warning("Failed to issue Kiwoom API token")
-                return False
+            await api.ensure_token_valid()
+            return True
         except Exception as e:
-            logger.error(f"Error issuing Kiwoom API token: {e}")
+            logger.error(f"Error ensuring Kiwoom API token: {e}")
             return False
 
     async def _fetch_prices_from_kiwoom(self, tickers: Set[str]) -> Dict[str, dict]:
@@ -499,7 +494,10 @@ class PriceUpdateBroadcaster:
                 # 브로드캐스트할 종목 결정 (기본 종목 + 추가된 종목)
                 tickers_to_broadcast = self.DEFAULT_TICKERS | self._active_tickers
 
-                if not tickers_to_broadcast:
+                # 가격 스냅샷 소비자(단타 브로드캐스터 등)가 등록한 종목도 함께 조회
+                tickers_to_fetch = tickers_to_broadcast | price_snapshot.watched_tickers()
+
+                if not tickers_to_fetch:
                     print("[BROADCASTER LOOP] No tickers to broadcast")
                     await asyncio.sleep(self.interval_seconds)
                     continue
@@ -509,7 +507,7 @@ class PriceUpdateBroadcaster:
                 # Kiwoom API 사용 시 실시간 데이터 조회
                 if os.getenv("USE_KIWOOM_REST", "false").lower() == "true":
                     print("[BROADCASTER LOOP] Using Kiwoom API")
-                    price_updates = await self._fetch_prices_from_kiwoom(tickers_to_broadcast)
+                    price_updates = await self._fetch_prices_from_kiwoom(tickers_to_fetch)
                     if not price_updates:
                         logger.warning("Failed to fetch prices from Kiwoom")
                         await asyncio.sleep(self.interval_seconds)
@@ -517,7 +515,7 @@ class PriceUpdateBroadcaster:
                 else:
                     # Kiwoom 미설정 시 DB에서 최근 가격 데이터 조회
                     print("[BROADCASTER LOOP] Using Database for prices")
-                    price_updates = await self._fetch_prices_from_db(tickers_to_broadcast)
+                    price_updates = await self._fetch_prices_from_db(tickers_to_fetch)
                     if not price_updates:
                         print("[BROADCASTER LOOP] No price data available in database")
                         await asyncio.sleep(self.interval_seconds)
@@ -525,9 +523,15 @@ class PriceUpdateBroadcaster:
 
                 # 가격 캐시 업데이트 (Daytrading Scanner에서 사용)
                 self._price_cache.update(price_updates)
+                price_snapshot.update_many(
+                    price_updates,
+                    source="kiwoom_rest" if os.getenv("USE_KIWOOM_REST", "false").lower() == "true" else "db",
+                )
 
-                # 브로드캐스트 및 API Gateway 캐시 업데이트
+                # 브로드캐스트 및 API Gateway 캐시 업데이트 (스냅샷 전용 종목은 소비자가 전송)
                 for ticker, data in price_updates.items():
+                    if ticker not in tickers_to_broadcast:
+                        continue
                     print(f"[BROADCAST] Sending price update for {ticker}: {data}")
                     message = {
                         "type": "price_update",
@@ -1000,6 +1004,10 @@ class RedisSubscriber:
                             msg_data = json.loads(data)
                             print(f"[REDIS SUB] JSON parsed: {msg_data.get('type') if msg_data else None}")
 
+                            # 가격 메시지는 공유 가격 스냅샷에도 반영
+                            if msg_data and msg_data.get("type") == "price_update" and msg_data.get("ticker"):
+                                price_snapshot.update(msg_data["ticker"], msg_data.get("data") or {}, source="redis")
+
                             # WebSocket으로 브로드캐스트
                             print(f"[REDIS SUB] Broadcasting to {topic}...")
                             await self.connection_manager.broadcast(msg_data, topic=topic)
@@ -0,0 +1,321 @@
+"""
+Celery 비동기 태스크 실행 런타임
+
+태스크마다 asyncio.run()을 호출하면 매번 이벤트 루프, HTTP 클라이언트, Kiwoom 토큰,
+Redis 연결을 새로 만들고 닫습니다. 이 모듈은 워커 프로세스마다 하나의 이벤트 루프를
+백그라운드 스레드에서 계속 돌리고, 태스크는 코루틴을 그 루프에 제출한 뒤 결과만 기다립니다.
+
+- 루프에 묶인 클라이언트(httpx.AsyncClient 등)는 resource()로 등록해 태스크 간 재사용
+- 스레드 풀 워커(--pool threads)에서는 여러 태스크가 같은 루프에서 동시에 I/O 대기
+- 한 태스크 안에서는 run_all()로 여러 코루틴을 동시 실행
+- fork 후 자식 프로세스는 런타임을 새로 시작 (부모의 루프 스레드는 상속되지 않음)
+
+Usage:
+    from tasks.async_runtime import run_async, get_kiwoom_api
+
+    async def _work():
+        api = await get_kiwoom_api()
+        return await api.get_stock_list("KOSPI")
+
+    result = run_async(_work())
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 종료 시 리소스 정리 대기 시간 (초)
+SHUTDOWN_TIMEOUT = 10.0
+
+
+class AsyncRuntime:
+    """
+    워커 프로세스 단위 영속 이벤트 루프
+
+    루프는 첫 run() 호출 시 데몬 스레드에서 시작되고 shutdown()까지 유지됩니다.
+    """
+
+    def __init__(self, name: str = "celery-async-runtime"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        # 루프에 묶인 공유 리소스 (이름 → 인스턴스), 생성 중복 방지용 락
+        self._resources: Dict[str, Any] = {}
+        self._resource_locks: Dict[str, asyncio.Lock] = {}
+
+        # 통계
+        self.submitted = 0
+        self.failed = 0
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._loop.is_running()
+            and self._pid == os.getpid()
+        )
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """루프 스레드 시작 (이미 실행 중이면 그대로 반환)"""
+        if self.is_running:
+            return self._loop
+
+        with self._lock:
+            if self.is_running:
+                return self._loop
+
+            if self._pid is not None and self._pid != os.getpid():
+                # fork로 상속된 상태는 자식에서 쓸 수 없음 (스레드 없음, 리소스는 부모 소유)
+                self._resources = {}
+                self._resource_locks = {}
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            logger.info(f"Async runtime started (pid={self._pid})")
+            return loop
+
+    def _in_runtime_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """
+        코루틴을 런타임 루프에 제출
+
+        Returns:
+            concurrent.futures.Future (다른 스레드에서 result()로 대기)
+        """
+        if self._in_runtime_thread():
+            # 루프 스레드에서 자기 자신을 기다리면 교착
+            coro.close()
+            raise RuntimeError("AsyncRuntime.submit() called from the runtime loop thread")
+
+        loop = self._ensure_started()
+        self.submitted += 1
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴 실행 후 결과 반환 (호출 스레드는 블로킹)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 대기 시간 (초, 초과 시 코루틴 취소 후 TimeoutError)
+                     대기 중 호출 측이 중단되어도 코루틴을 취소합니다.
+
+        Returns:
+            코루틴 반환값
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.failed += 1
+            raise TimeoutError(f"Async task did not finish within {timeout}s") from None
+        except BaseException:
+            # 호출 측 중단 (SoftTimeLimitExceeded, KeyboardInterrupt 등) → 공유 루프에 남지 않도록 취소
+            future.cancel()
+            self.failed += 1
+            raise
+
+    def run_all(
+        self,
+        coros: Iterable[Awaitable],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        여러 코루틴을 한 번에 제출해 동시 실행
+
+        Args:
+            coros: 코루틴 목록
+            timeout: 전체 대기 시간 (초)
+            return_exceptions: True면 실패한 코루틴의 예외를 결과 목록에 담아 반환
+
+        Returns:
+            입력 순서대로의 결과 목록
+        """
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(_gather(), timeout=timeout)
+
+    async def resource(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        루프 공유 리소스 조회 (없으면 생성)
+
+        런타임 루프 안에서만 호출합니다. factory는 동기/비동기 모두 가능하며,
+        리소스는 shutdown() 시 aclose()/close()/disconnect() 순으로 정리됩니다.
+
+        Args:
+            name: 리소스 이름
+            factory: 리소스 생성 함수
+
+        Returns:
+            리소스 인스턴스
+        """
+        existing = self._resources.get(name)
+        if existing is not None:
+            return existing
+
+        lock = self._resource_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            existing = self._resources.get(name)
+            if existing is not None:
+                return existing
+
+            instance = factory()
+            if inspect.isawaitable(instance):
+                instance = await instance
+            self._resources[name] = instance
+            logger.debug(f"Async runtime resource created: {name}")
+            return instance
+
+    async def discard_resource(self, name: str) -> None:
+        """공유 리소스 폐기 (다음 resource() 호출 시 재생성)"""
+        instance = self._resources.pop(name, None)
+        if instance is not None:
+            await _close_resource(name, instance)
+
+    async def _close_resources(self) -> None:
+        for name in list(self._resources):
+            await self.discard_resource(name)
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """리소스 정리 후 루프 종료"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                self._loop = self._thread = self._pid = None
+                return
+
+            if loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(self._close_resources(), loop).result(timeout)
+                except Exception as e:
+                    logger.warning(f"Async runtime resource cleanup failed: {e}")
+                loop.call_soon_threadsafe(loop.stop)
+
+            if thread is not None:
+                thread.join(timeout)
+            if not loop.is_running():
+                loop.close()
+
+            self._loop = self._thread = self._pid = None
+            self._resources = {}
+            self._resource_locks = {}
+            logger.info("Async runtime stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """런타임 통계"""
+        return {
+            "running": self.is_running,
+            "pid": self._pid,
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "resources": sorted(self._resources),
+        }
+
+
+async def _close_resource(name: str, instance: Any) -> None:
+    for method_name in ("aclose", "close", "disconnect"):
+        method = getattr(instance, method_name, None)
+        if method is None:
+            continue
+        try:
+            result = method()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Async runtime resource close failed ({name}): {e}")
+        return
+
+
+# =============================================================================
+# 프로세스 전역 런타임
+# =============================================================================
+
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """프로세스 전역 AsyncRuntime"""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = AsyncRuntime()
+    return _runtime
+
+
+def run_async(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """동기 태스크에서 코루틴 실행 (프로세스 전역 런타임 사용)"""
+    return get_runtime().run(coro, timeout=timeout)
+
+
+def shutdown_runtime(timeout: float = SHUTDOWN_TIMEOUT) -> None:
+    """프로세스 전역 런타임 종료"""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None:
+        runtime.shutdown(timeout)
+
+
+def _reset_after_fork() -> None:
+    """fork된 자식은 부모 런타임을 버리고 새로 시작"""
+    global _runtime, _runtime_lock
+    _runtime = None
+    _runtime_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# =============================================================================
+# 공유 클라이언트
+# =============================================================================
+
+KIWOOM_API_RESOURCE = "kiwoom_rest_api"
+
+
+async def get_kiwoom_api(config=None):
+    """
+    런타임 공유 KiwoomRestAPI
+
+    HTTP 커넥션 풀과 토큰을 태스크 간 재사용합니다. 태스크에서 close()/disconnect()를
+    호출하지 않습니다 (워커 프로세스 종료 시 런타임이 정리).
+
+    Args:
+        config: KiwoomConfig (None이면 KiwoomConfig.from_env()). 설정(서버/앱키)별로 인스턴스를 따로 둡니다.
+    """
+    from src.kiwoom.rest_api import KiwoomRestAPI
+
+    if config is None:
+        return await get_runtime().resource(KIWOOM_API_RESOURCE, KiwoomRestAPI.from_env)
+
+    name = f"{KIWOOM_API_RESOURCE}:{config.base_url}:{config.app_key[:8]}"
+    return await get_runtime().resource(name, lambda: KiwoomRestAPI(config))
@@ -4,12 +4,81 @@ Celery Application Configuration
 """
 
 from celery import Celery
+from celery.signals import celeryd_init, worker_process_shutdown, worker_shutdown
 # from celery.schedules import crontab  # 운영 시 주석 해제
+from kombu import Queue
 import os
 
+from tasks.serialization import SERIALIZER_NAME, register_serializer
+
 # Redis URL 설정
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# ============================================================================
+# 큐 토폴로지
+# ============================================================================
+# realtime: 1~5분 주기 지연 민감 작업 (OHLC 스냅샷, Market Gate, 브로드캐스트)
+# bulk:     30분 이상 걸릴 수 있는 스캔/수집/동기화
+# llm:      LLM 호출 위주 뉴스 수집/감성 분석
+# default:  라우팅되지 않은 기타 작업
+QUEUE_REALTIME = "realtime"
+QUEUE_BULK = "bulk"
+QUEUE_LLM = "llm"
+QUEUE_DEFAULT = "default"
+
+
+class TaskPriority:
+    """
+    태스크 우선순위 상수 (Redis 브로커 기준: 숫자가 작을수록 먼저 처리)
+
+    같은 큐 안에서만 순서에 영향을 줍니다.
+    """
+
+    CRITICAL = 0  # 지연 민감 주기 작업
+    HIGH = 3      # 높은 우선순위 (긴급 작업)
+    MEDIUM = 6    # 중간 우선순위 (기본 작업)
+    LOW = 9       # 낮은 우선순위 (배치 작업)
+
+
+# 태스크 이름(glob) → 큐/우선순위
+TASK_ROUTES = {
+    # 지연 민감
+    "ohlc.*": {"queue": QUEUE_REALTIME, "priority": TaskPriority.CRITICAL},
+    "tasks.market_tasks.update_market_gate": {"queue": QUEUE_REALTIME, "priority": TaskPriority.CRITICAL},
+    "tasks.broadcast_realtime_prices": {"queue": QUEUE_REALTIME, "priority": TaskPriority.CRITICAL},
+    "tasks.parallel_tasks.urgent_signal_scan": {"queue": QUEUE_REALTIME, "priority": TaskPriority.HIGH},
+    "health.check": {"queue": QUEUE_REALTIME, "priority": TaskPriority.HIGH},
+    # LLM
+    "news.*": {"queue": QUEUE_LLM, "priority": TaskPriority.MEDIUM},
+    "tasks.news_tasks.*": {"queue": QUEUE_LLM, "priority": TaskPriority.MEDIUM},
+    "tasks.signal_tasks.analyze_single_stock": {"queue": QUEUE_LLM, "priority": TaskPriority.MEDIUM},
+    # 대량 스캔/수집
+    "tasks.scan_tasks.*": {"queue": QUEUE_BULK, "priority": TaskPriority.MEDIUM},
+    "tasks.signal_tasks.*": {"queue": QUEUE_BULK, "priority": TaskPriority.MEDIUM},
+    "tasks.sync_tasks.*": {"queue": QUEUE_BULK, "priority": TaskPriority.LOW},
+    "tasks.parallel_tasks.*": {"queue": QUEUE_BULK, "priority": TaskPriority.MEDIUM},
+    "tasks.market_tasks.*": {"queue": QUEUE_BULK, "priority": TaskPriority.LOW},
+    "tasks.collect_*": {"queue": QUEUE_BULK, "priority": TaskPriority.LOW},
+    "tasks.sync_all_data": {"queue": QUEUE_BULK, "priority": TaskPriority.LOW},
+}
+
+# 워커 프로파일 (CELERY_WORKER_PROFILE 환경변수로 선택)
+# 프로파일별로 워커를 따로 띄우면 큐마다 동시성/prefetch를 다르게 가져갈 수 있습니다.
+#   CELERY_WORKER_PROFILE=realtime celery -A tasks.celery_app worker -n realtime@%h
+#   CELERY_WORKER_PROFILE=bulk     celery -A tasks.celery_app worker -n bulk@%h
+#   CELERY_WORKER_PROFILE=llm      celery -A tasks.celery_app worker -n llm@%h
+# 프로파일 없이 띄운 워커는 모든 큐를 처리합니다.
+# realtime은 I/O 대기가 대부분이라 스레드 풀을 쓰고, 스레드들이 프로세스 공유 이벤트 루프
+# (tasks.async_runtime)에 코루틴을 제출해 한 프로세스 안에서 동시에 실행됩니다.
+WORKER_PROFILES = {
+    QUEUE_REALTIME: {"queues": [QUEUE_REALTIME], "concurrency": 8, "prefetch_multiplier": 1, "pool": "threads"},
+    QUEUE_BULK: {"queues": [QUEUE_BULK, QUEUE_DEFAULT], "concurrency": 2, "prefetch_multiplier": 1},
+    QUEUE_LLM: {"queues": [QUEUE_LLM], "concurrency": 2, "prefetch_multiplier": 1},
+}
+WORKER_PROFILE = os.getenv("CELERY_WORKER_PROFILE", "").strip().lower() or None
+
+register_serializer()
+
 # Celery 앱 생성
 celery_app = Celery(
     "ralph_stock_tasks",
@@ -29,9 +98,11 @@ celery_app = Celery(
 # Celery 설정
 celery_app.conf.update(
     # 태스크 설정
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # zjson: compact JSON + 큰 페이로드 zlib 압축 (배포 중 기존 json 메시지도 수신)
+    task_serializer=SERIALIZER_NAME,
+    accept_content=[SERIALIZER_NAME, "json"],
+    result_serializer=SERIALIZER_NAME,
+    result_accept_content=[SERIALIZER_NAME, "json"],
     timezone="Asia/Seoul",
     enable_utc=True,
 
@@ -39,9 +110,32 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30분
     task_soft_time_limit=25 * 60,  # 25분
-    worker_prefetch_multiplier=4,
+    # 긴 태스크가 짧은 태스크를 미리 가져가 붙잡지 않도록 1개씩 prefetch
+    worker_prefetch_multiplier=1,
     worker_concurrency=4,
 
+    # 큐/라우팅/우선순위
+    task_queues=[
+        Queue(QUEUE_REALTIME),
+        Queue(QUEUE_BULK),
+        Queue(QUEUE_LLM),
+        Queue(QUEUE_DEFAULT),
+    ],
+    task_default_queue=QUEUE_DEFAULT,
+    task_routes=TASK_ROUTES,
+    task_default_priority=TaskPriority.MEDIUM,
+    broker_transport_options={
+        "queue_order_strategy": "priority",
+        "priority_steps": [TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW],
+        "sep": ":",
+    },
+
+    # 결과를 쓰지 않는 고빈도 주기 작업은 결과 저장 생략
+    task_annotations={
+        "ohlc.save_snapshot": {"ignore_result": True},
+        "ohlc.get_status": {"ignore_result": True},
+    },
+
     # 결과 설정
     result_expires=3600,  # 1시간
     result_extended=True,
@@ -100,6 +194,19 @@ celery_app.conf.update(
             # "schedule": crontab(hour="9,15", minute=0),  # 운영: 매일 09:00, 15:00
         },
 
+        # 시그널 성과 일별 집계 증분 갱신 - 10분 간격
+        "refresh-performance-series": {
+            "task": "tasks.signal_tasks.refresh_performance_series",
+            "schedule": 10 * 60,
+        },
+
+        # 시그널 보관 주기 - 만료 청산 + 보관 기간 지난 시그널 이력 테이블 이관
+        "archive-stale-signals": {
+            "task": "tasks.signal_tasks.archive_stale_signals",
+            "schedule": 24 * 60 * 60,
+            # "schedule": crontab(hour=2, minute=0),  # 운영: 매일 02:00
+        },
+
         # ============================================================================
         # 뉴스 수집 스케줄
         # ============================================================================
@@ -150,6 +257,33 @@ celery_app.conf.update(
 )
 
 
+if WORKER_PROFILE in WORKER_PROFILES:
+    # CLI 옵션(-c, --prefetch-multiplier)이 없을 때 쓰는 기본값
+    celery_app.conf.update(
+        worker_concurrency=WORKER_PROFILES[WORKER_PROFILE]["concurrency"],
+        worker_prefetch_multiplier=WORKER_PROFILES[WORKER_PROFILE]["prefetch_multiplier"],
+    )
+    if "pool" in WORKER_PROFILES[WORKER_PROFILE]:
+        celery_app.conf.worker_pool = WORKER_PROFILES[WORKER_PROFILE]["pool"]
+
+
+@celeryd_init.connect
+def _select_profile_queues(sender=None, instance=None, conf=None, options=None, **kwargs):
+    """워커 프로파일의 큐만 구독 (-Q 옵션이 있으면 그대로 사용)"""
+    if WORKER_PROFILE not in WORKER_PROFILES or (options or {}).get("queues"):
+        return
+    instance.app.amqp.queues.select(WORKER_PROFILES[WORKER_PROFILE]["queues"])
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_async_runtime(**kwargs):
+    """워커(자식) 프로세스 종료 시 공유 이벤트 루프와 클라이언트 정리"""
+    from tasks.async_runtime import shutdown_runtime
+
+    shutdown_runtime()
+
+
 @celery_app.task(name="health.check")
 def health_check():
     """헬스 체크 태스크"""
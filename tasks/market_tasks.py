@@ -9,9 +9,10 @@ import os
 from datetime import date, datetime
 from typing import Optional
 
+from tasks import async_runtime
 from tasks.celery_app import celery_app
 from src.database.session import get_db_session
-from src.repositories.market_repository import MarketRepository
+from src.repositories.market_repository import SECTOR_ETFS, MarketRepository
 
 logger = logging.getLogger(__name__)
 
@@ -74,26 +75,10 @@ def _broadcast_market_gate_update(market_status, gate, gate_score, sector_scores
 KOSPI_CODE = "KS11"    # KOSPI 지수 코드
 KOSDAQ_CODE = "KQ11"   # KOSDAQ 지수 코드
 
-# 섹터 ETF ticker (KODEX)
-# 참고: https://www.krx.co.kr/main/main.jsp
-SECTOR_ETFS = {
-    "반도체": "069500",    # KODEX 반도체
-    "2차전지": "305720",   # KODEX 2차전지
-    "자동차": "116380",    # KODEX 자동차
-    "바이오": "327610",    # KODEX 바이오
-    "금융": "091160",      # KODEX 은행
-    "통신": "327580",      # KODEX 통신
-}
-
 
 def run_async(coro):
-    """동기 함수에서 async 함수 실행을 위한 헬퍼"""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    """동기 함수에서 async 함수 실행을 위한 헬퍼 (워커 프로세스 공유 이벤트 루프)"""
+    return async_runtime.run_async(coro)
 
 
 async def fetch_index_prices():
@@ -192,20 +177,15 @@ async def fetch_index_prices():
 
     # 2. Kiwoom REST API (대안)
     try:
-        from src.kiwoom.rest_api import KiwoomRestAPI
-
-        api = KiwoomRestAPI.from_env()
+        api = await async_runtime.get_kiwoom_api()
 
-        # 토큰 발급
-        if not api.is_token_valid():
-            await api.issue_token()
+        # 토큰 확보 (유효한 공유 토큰이 있으면 재사용)
+        await api.ensure_token_valid()
 
         # KOSPI/KOSDAQ 지수 조회
         kospi_data = await api.get_index_price(KOSPI_CODE)
         kosdaq_data = await api.get_index_price(KOSDAQ_CODE)
 
-        await api.close()
-
         # Kiwoom에서 데이터를 가져왔으면 섹터 ETF도 Kiwoom로 조회
         if kospi_data and kosdaq_data and kospi_data.get("price"):
             sector_scores = []
@@ -218,8 +198,6 @@ async def fetch_index_prices():
                         "change_pct": etf_data.change_rate,
                     })
 
-            await api.close()
-
             return {
                 "kospi": kospi_data,
                 "kosdaq": kosdaq_data,
@@ -239,11 +217,18 @@ def update_market_gate(self):
     Market Gate 업데이트 태스크
 
     Naver Finance 실시간 API를 사용하여 KOSPI/KOSDAQ 지수 데이터를 수집하고
-    데이터베이스에 저장합니다.
+    데이터베이스에 저장합니다. API Gateway의 실시간 Gate 엔진이 동작 중이면
+    (하트비트 유효) 엔진이 Gate를 계산/저장하므로 수집을 건너뜁니다.
 
     Returns:
         Market Gate 상태
     """
+    from src.websocket.market_gate_engine import is_engine_alive
+
+    if is_engine_alive():
+        logger.info("실시간 Market Gate 엔진 동작 중 - 업데이트 생략")
+        return {"status": "skipped", "reason": "realtime_engine"}
+
     try:
         logger.info("Market Gate 업데이트 시작")
 
@@ -320,39 +305,68 @@ def update_market_gate(self):
         return {"status": "error", "message": str(e)}
 
 
+def _get_flow_universe() -> list[str]:
+    """수급 수집 대상 종목 (ETF/ETN, 스팩, 채권 제외)"""
+    from sqlalchemy import select
+    from src.database.models import Stock
+    from src.database.session import get_db_session_sync
+
+    with get_db_session_sync() as db:
+        return list(db.execute(
+            select(Stock.ticker).where(
+                Stock.is_etf.isnot(True),
+                Stock.is_excluded_etf.isnot(True),
+                Stock.is_spac.isnot(True),
+                Stock.is_bond.isnot(True),
+            )
+        ).scalars().all())
+
+
 @celery_app.task(name="tasks.market_tasks.collect_institutional_flow")
-def collect_institutional_flow(tickers: list[str] = None):
+def collect_institutional_flow(
+    tickers: list[str] = None,
+    days: int = 30,
+    base_date: Optional[str] = None,
+):
     """
-    기관 매매 수급 데이터 수집
+    기관/외국인 수급 데이터 수집
+
+    종목별 최신 수급 날짜 이후의 누락분만 수집합니다. 기준일 하루만 빠진 종목은
+    시장 단위 일괄 조회로, 나머지는 종목별 조회(페이싱)로 채우고 배치마다 다중 행 UPSERT로 저장합니다.
 
     Args:
         tickers: 종목코드 리스트 (None이면 전체)
+        days: 수급 이력이 없는 종목의 수집 기간 (달력일)
+        base_date: 기준일자 (YYYYMMDD, None이면 수급이 확정된 마지막 평일)
 
     Returns:
-        수급 데이터
+        {"status": "success", "data": {"count", "rows", "skipped", "failed", "bulk_tickers", "api_calls"}}
     """
-    try:
-        logger.info(f"기관 매매 수급 수집 시작: {len(tickers) if tickers else '전체'}개 종목")
-
-        # TODO: pykrx 또는 FinanceDataReader로 수급 데이터 수집
+    async def _collect():
+        from src.database.session import get_db_session_sync
+        from src.kiwoom.flow_collector import InstitutionalFlowCollector
+
+        collector = InstitutionalFlowCollector(await async_runtime.get_kiwoom_api())
+        with get_db_session_sync() as db:
+            return await collector.collect(
+                targets,
+                db,
+                days=days,
+                base_date=base_date,
+            )
 
-        # Mock 데이터
-        flow_data = {
-            "collected_at": None,
-            "count": 0,
-            "flows": [],
-        }
+    try:
+        targets = tickers or _get_flow_universe()
+        logger.info(f"기관 매매 수급 수집 시작: {len(targets)}개 종목")
 
-        if tickers:
-            for ticker in tickers:
-                flow_data["flows"].append({
-                    "ticker": ticker,
-                    "foreigner": 0,
-                    "institution": 0,
-                })
-            flow_data["count"] = len(tickers)
+        result = run_async(_collect())
+        flow_data = result.to_dict()
+        flow_data["collected_at"] = datetime.now().isoformat()
 
-        logger.info(f"기관 매매 수급 수집 완료: {flow_data['count']}개")
+        logger.info(
+            f"기관 매매 수급 수집 완료: {flow_data['count']}개 종목, {flow_data['rows']}건 "
+            f"(일괄 {flow_data['bulk_tickers']}, API {flow_data['api_calls']}회)"
+        )
 
         return {
             "status": "success",
@@ -364,6 +378,71 @@ def collect_institutional_flow(tickers: list[str] = None):
         return {"status": "error", "message": str(e)}
 
 
+def _load_stock_page(offset: int, limit: int) -> list[tuple[str, str]]:
+    """종목 목록 한 페이지 조회 → [(ticker, name)] (동기, 스레드에서 호출)"""
+    from sqlalchemy import select
+    from src.database.models import Stock
+    from src.database.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        query = select(Stock.ticker, Stock.name).order_by(Stock.ticker)
+        # offset 적용
+        query = query.offset(offset) if offset > 0 else query
+        if limit > 0:
+            query = query.limit(limit)
+        return [(ticker, name) for ticker, name in db.execute(query)]
+    finally:
+        db.close()
+
+
+def _save_daily_prices(ticker: str, chart_data: list) -> None:
+    """일봉 데이터 upsert (동기, 스레드에서 호출)"""
+    from src.database.models import DailyPrice
+    from src.database.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        for item in chart_data:
+            # 날짜 변환 (YYYYMMDD -> date)
+            item_date = item.get("date", "")
+            if not item_date:
+                continue
+
+            try:
+                trade_date = datetime.strptime(item_date, "%Y%m%d").date()
+            except ValueError:
+                continue
+
+            # DailyPrice upsert
+            existing = db.query(DailyPrice).filter(
+                DailyPrice.ticker == ticker,
+                DailyPrice.date == trade_date
+            ).first()
+
+            if existing:
+                existing.open_price = item.get("open")
+                existing.high_price = item.get("high")
+                existing.low_price = item.get("low")
+                existing.close_price = item.get("close")
+                existing.volume = item.get("volume")
+            else:
+                daily_price = DailyPrice(
+                    ticker=ticker,
+                    date=trade_date,
+                    open_price=item.get("open"),
+                    high_price=item.get("high"),
+                    low_price=item.get("low"),
+                    close_price=item.get("close"),
+                    volume=item.get("volume"),
+                )
+                db.add(daily_price)
+
+        db.commit()
+    finally:
+        db.close()
+
+
 @celery_app.task(name="tasks.market_tasks.update_stock_prices")
 def update_stock_prices(limit: int = 100, days: int = 60, offset: int = 0):
     """
@@ -378,12 +457,7 @@ def update_stock_prices(limit: int = 100, days: int = 60, offset: int = 0):
         {"status": "success", "updated": int, "errors": int}
     """
     async def _update_prices():
-        from src.kiwoom.rest_api import KiwoomRestAPI
         from src.kiwoom.base import KiwoomConfig
-        import os
-        from sqlalchemy import select
-        from src.database.models import Stock, DailyPrice
-        from src.database.session import SessionLocal
 
         logger.info(f"일봉 가격 데이터 업데이트 시작 (limit={limit}, days={days})")
 
@@ -403,114 +477,49 @@ def update_stock_prices(limit: int = 100, days: int = 60, offset: int = 0):
             ws_url=os.getenv("KIWOOM_WS_URL", "wss://api.kiwoom.com:10000/api/dostk/websocket"),
         )
 
-        api = KiwoomRestAPI(config)
+        # 워커 프로세스 공유 인스턴스 (커넥션 풀/토큰 재사용, 여기서 닫지 않음)
+        api = await async_runtime.get_kiwoom_api(config)
 
-        try:
-            # 토큰 발급
-            await api.connect()
+        # 토큰 확보 (유효한 토큰이 있으면 재사용)
+        await api.connect()
+
+        # DB에서 종목 목록 조회 (동기 세션은 스레드에서 실행)
+        stocks = await asyncio.to_thread(_load_stock_page, offset, limit)
+
+        updated_count = 0
+        error_count = 0
 
-            # DB에서 종목 목록 조회
-            db = SessionLocal()
+        # 각 종목별 일봉 데이터 조회 및 저장
+        for ticker, name in stocks:
             try:
-                query = select(Stock).order_by(Stock.ticker)
-                # offset 적용
-                query = query.offset(offset) if offset > 0 else query
-                if limit > 0:
-                    query = query.limit(limit)
-                result = db.execute(query)
-                stocks = result.scalars().all()
-            finally:
-                db.close()
-
-            updated_count = 0
-            error_count = 0
-
-            # 각 종목별 일봉 데이터 조회 및 저장
-            for stock in stocks:
-                try:
-                    ticker = stock.ticker
-                    name = stock.name
-
-                    # Kiwoom API로 일봉 데이터 조회
-                    chart_data = await api.get_stock_daily_chart(
-                        ticker=ticker,
-                        days=days,
-                        adjusted_price=True,  # 수정주가
-                    )
-
-                    if chart_data:
-                        # DB 저장
-                        db = SessionLocal()
-                        try:
-                            for item in chart_data:
-                                from datetime import datetime
-
-                                # 날짜 변환 (YYYYMMDD -> date)
-                                item_date = item.get("date", "")
-                                if not item_date:
-                                    continue
-
-                                try:
-                                    trade_date = datetime.strptime(item_date, "%Y%m%d").date()
-                                except:
-                                    continue
-
-                                # DailyPrice upsert
-                                existing = db.query(DailyPrice).filter(
-                                    DailyPrice.ticker == ticker,
-                                    DailyPrice.date == trade_date
-                                ).first()
-
-                                if existing:
-                                    existing.open_price = item.get("open")
-                                    existing.high_price = item.get("high")
-                                    existing.low_price = item.get("low")
-                                    existing.close_price = item.get("close")
-                                    existing.volume = item.get("volume")
-                                else:
-                                    daily_price = DailyPrice(
-                                        ticker=ticker,
-                                        date=trade_date,
-                                        open_price=item.get("open"),
-                                        high_price=item.get("high"),
-                                        low_price=item.get("low"),
-                                        close_price=item.get("close"),
-                                        volume=item.get("volume"),
-                                    )
-                                    db.add(daily_price)
-
-                            db.commit()
-                        finally:
-                            db.close()
-
-                        updated_count += len(chart_data)
-                        logger.info(f"{ticker} {name}: {len(chart_data)}일 데이터 저장 완료")
-
-                    # Rate Limiting 방지: 초당 5회 제한 → 1회/1초
-                    import asyncio
-                    await asyncio.sleep(1.0)
+                # Kiwoom API로 일봉 데이터 조회
+                chart_data = await api.get_stock_daily_chart(
+                    ticker=ticker,
+                    days=days,
+                    adjusted_price=True,  # 수정주가
+                )
 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"종목 {stock.ticker} 가격 데이터 수집 실패: {e}")
-                    continue
+                if chart_data:
+                    # DB 저장 (스레드에서 실행해 이벤트 루프를 막지 않음)
+                    await asyncio.to_thread(_save_daily_prices, ticker, chart_data)
 
-            logger.info(f"일봉 가격 데이터 업데이트 완료: {updated_count}건 저장, {error_count}개 에러")
+                    updated_count += len(chart_data)
+                    logger.info(f"{ticker} {name}: {len(chart_data)}일 데이터 저장 완료")
 
-            return {
-                "status": "success",
-                "updated": updated_count,
-                "errors": error_count,
-            }
+                # Rate Limiting 방지: 초당 5회 제한 → 1회/1초
+                await asyncio.sleep(1.0)
 
-        finally:
-            await api.disconnect()
+            except Exception as e:
+                error_count += 1
+                logger.error(f"종목 {ticker} 가격 데이터 수집 실패: {e}")
+                continue
 
-    try:
-        # Celery 태스크에서 async 실행
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        logger.info(f"일봉 가격 데이터 업데이트 완료: {updated_count}건 저장, {error_count}개 에러")
+
+        return {
+            "status": "success",
+            "updated": updated_count,
+            "errors": error_count,
+        }
 
-    return loop.run_until_complete(_update_prices())
+    return run_async(_update_prices())
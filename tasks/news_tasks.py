@@ -63,7 +63,7 @@ def collect_news(ticker: str, days: int = 7, max_articles: int = 50) -> Dict[str
 
 
 @shared_task(name="news.analyze_sentiment", bind=True, max_retries=3)
-def analyze_sentiment(ticker: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+def analyze_sentiment(self, ticker: str, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     뉴스 감성 분석 태스크
 
@@ -80,13 +80,10 @@ def analyze_sentiment(ticker: str, articles: List[Dict[str, Any]]) -> Dict[str,
         # 감성 분석기 초기화
         analyzer = SentimentAnalyzer()
 
-        # 배치 분석
+        # 배치 분석 (다건 프롬프트 + 캐시)
+        # LLM 배치 실패를 중립으로 저장하지 않도록 예외로 받아 재시도 (성공분은 캐시되어 재요청 없음)
         results = []
-        for article in articles:
-            result = analyzer.analyze(
-                title=article["title"],
-                content=article.get("content", ""),
-            )
+        for article, result in zip(articles, analyzer.analyze_batch(articles, raise_on_failure=True)):
             results.append({
                 "title": article["title"],
                 "sentiment": result.sentiment.value,
@@ -7,7 +7,7 @@ import logging
 from typing import List, Dict, Any
 
 from celery import group, chord, signature
-from tasks.celery_app import celery_app
+from tasks.celery_app import celery_app, TaskPriority
 
 logger = logging.getLogger(__name__)
 
@@ -205,18 +205,6 @@ def update_multiple_markets(markets: List[str]) -> Dict[str, Any]:
         }
 
 
-# 태스크 우선순위 설정
-# Celery 5.2+에서는 task_routing_key와 priority 옵션 사용
-
-
-class TaskPriority:
-    """태스크 우선순위 상수"""
-
-    HIGH = 9      # 높은 우선순위 (긴급 작업)
-    MEDIUM = 5    # 중간 우선순위 (기본 작업)
-    LOW = 1       # 낮은 우선순위 (배치 작업)
-
-
 @celery_app.task(
     name="tasks.parallel_tasks.urgent_signal_scan",
     priority=TaskPriority.HIGH,
@@ -8,6 +8,8 @@ import logging
 from celery import shared_task
 from typing import List, Dict, Any, Optional
 
+from tasks.async_runtime import get_kiwoom_api, run_async
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,13 +17,19 @@ logger = logging.getLogger(__name__)
 def collect_all_stocks_daily_prices(
     market: str = "ALL",
     days: int = 30,
+    resume: bool = True,
 ) -> Dict[str, Any]:
     """
     전 종목 일봉 데이터 수집 태스크
 
+    RealtimeDataCollector.backfill_daily_prices로 최신 봉이 없는 종목만
+    동시 수집합니다. 진행 커서를 Redis에 저장하므로 워커가 재시작되면
+    마지막으로 커밋된 배치 이후부터 이어서 수집합니다.
+
     Args:
         market: 시장 구분 (KOSPI, KOSDAQ, ALL)
         days: 조회 일수
+        resume: 진행 커서 사용 여부
 
     Returns:
         수집 결과 통계
@@ -29,6 +37,10 @@ def collect_all_stocks_daily_prices(
     from src.database.session import get_db_session_sync
     from sqlalchemy import select
     from src.database.models import Stock as StockModel
+    from services.daytrading_scanner.realtime_data_collector import (
+        BackfillCursor,
+        RealtimeDataCollector,
+    )
 
     logger.info(f"📊 {market} 전 종목 일봉 데이터 수집 시작...")
 
@@ -36,13 +48,14 @@ def collect_all_stocks_daily_prices(
         "total": 0,
         "success": 0,
         "failed": 0,
+        "skipped": 0,
         "details": {},
     }
 
     try:
         with get_db_session_sync() as db:
             # 종목 조회
-            query = select(StockModel).where(
+            query = select(StockModel.ticker).where(
                 StockModel.is_etf == False,
                 StockModel.is_admin == False,
                 StockModel.is_spac == False,
@@ -53,50 +66,35 @@ def collect_all_stocks_daily_prices(
             if market != "ALL":
                 query = query.where(StockModel.market == market)
 
-            result = db.execute(query.limit(500))
-            stocks = list(result.scalars().all())
-
-            logger.info(f"총 {len(stocks)}개 종목 일봉 수집 시작")
-
-            # 비동기 수집 실행
-            import asyncio
-
-            async def collect_all():
-                from services.daytrading_scanner.realtime_data_collector import RealtimeDataCollector
-                collector = RealtimeDataCollector()
-
-                total_count = 0
-                for stock in stocks:
-                    try:
-                        count = await collector.collect_daily_prices(
-                            ticker=stock.ticker,
-                            db=db,
-                            days=days,
-                        )
-                        results["details"][stock.ticker] = count
-                        total_count += count
+            tickers = list(db.execute(query).scalars().all())
 
-                        if count > 0:
-                            results["success"] += 1
-                        else:
-                            results["failed"] += 1
+            logger.info(f"총 {len(tickers)}개 종목 일봉 수집 시작")
 
-                        # Rate Limiting 방지
-                        await asyncio.sleep(0.1)
-
-                    except Exception as e:
-                        logger.error(f"❌ {stock.ticker} 일봉 수집 실패: {e}")
-                        results["failed"] += 1
-                        results["details"][stock.ticker] = 0
+            async def _backfill():
+                # 워커 프로세스 공유 KiwoomRestAPI (커넥션 풀/토큰 재사용)
+                collector = RealtimeDataCollector(await get_kiwoom_api())
+                return await collector.backfill_daily_prices(
+                    tickers=tickers,
+                    db=db,
+                    days=days,
+                    cursor=BackfillCursor.for_run(market) if resume else None,
+                )
 
-                results["total"] = total_count
-                return results
+            backfill = run_async(_backfill())
 
-            # 비동기 실행
-            result = asyncio.run(collect_all())
+        results["details"] = backfill.collected
+        results["total"] = sum(backfill.collected.values())
+        results["success"] = len(backfill.collected)
+        results["failed"] = len(backfill.failed)
+        results["skipped"] = len(backfill.skipped)
+        if backfill.resumed_from:
+            results["resumed_from"] = backfill.resumed_from
 
-        logger.info(f"✅ 일봉 데이터 수집 완료: {result}")
-        return result
+        logger.info(
+            f"✅ 일봉 데이터 수집 완료: {results['success']}개 수집, "
+            f"{results['skipped']}개 최신, {results['failed']}개 실패"
+        )
+        return results
 
     except Exception as e:
         logger.error(f"❌ 전 종목 일봉 수집 실패: {e}")
@@ -127,13 +125,11 @@ def broadcast_realtime_prices(
     }
 
     try:
-        import asyncio
-
         async def collect_and_broadcast():
             from services.daytrading_scanner.realtime_data_collector import RealtimeDataCollector
             from src.websocket.server import connection_manager
 
-            collector = RealtimeDataCollector()
+            collector = RealtimeDataCollector(await get_kiwoom_api())
 
             # 수집 및 브로드캐스트
             prices = await collector.collect_and_broadcast_prices(
@@ -150,7 +146,7 @@ def broadcast_realtime_prices(
 
             return results
 
-        result = asyncio.run(collect_and_broadcast())
+        result = run_async(collect_and_broadcast())
 
         logger.info(f"✅ 실시간 가격 브로드캐스트 완료: {result['success']}개 성공")
         return result
@@ -221,7 +217,7 @@ def collect_and_scan_daytrading(
 
             return results
 
-        result = asyncio.run(collect_and_scan())
+        result = run_async(collect_and_scan())
 
         logger.info(f"✅ 일봉 수집 및 단타 스캔 완료: {result}")
         return result
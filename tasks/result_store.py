@@ -0,0 +1,72 @@
+"""
+Celery 태스크 결과 페이로드 저장소
+
+스캔 결과처럼 큰 페이로드는 결과 백엔드에 그대로 넣지 않고 Redis 키에 따로 저장한 뒤,
+태스크 결과에는 참조(result_ref)만 남깁니다. 결과 백엔드 크기와 AsyncResult 조회 비용이
+페이로드 크기와 무관해집니다.
+"""
+
+import logging
+import os
+import uuid
+from typing import Any, Optional
+
+from tasks.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# 페이로드 Redis 키 Prefix / 보관 기간 (초)
+PAYLOAD_KEY_PREFIX = "celery:payload:"
+PAYLOAD_TTL = 24 * 60 * 60
+
+_client = None
+
+
+def _get_client():
+    """결과 백엔드와 같은 Redis (바이너리 모드)"""
+    global _client
+    if _client is None:
+        import redis
+
+        url = os.getenv("CELERY_RESULT_BACKEND") or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        _client = redis.Redis.from_url(url, socket_connect_timeout=2.0, socket_timeout=5.0)
+    return _client
+
+
+def store_payload(kind: str, payload: Any, ttl: int = PAYLOAD_TTL, client=None) -> Optional[str]:
+    """
+    페이로드 저장
+
+    Args:
+        kind: 페이로드 종류 (키 구분용, 예: "vcp_scan")
+        payload: JSON 직렬화 가능한 객체
+        ttl: 보관 기간 (초)
+        client: Redis 클라이언트 (None이면 결과 백엔드 Redis)
+
+    Returns:
+        참조 키 (저장 실패 시 None)
+    """
+    ref = f"{PAYLOAD_KEY_PREFIX}{kind}:{uuid.uuid4().hex}"
+    try:
+        (client or _get_client()).set(ref, dumps(payload), ex=ttl)
+        return ref
+    except Exception as e:
+        logger.warning(f"결과 페이로드 저장 실패 ({kind}): {e}")
+        return None
+
+
+def load_payload(ref: str, client=None) -> Optional[Any]:
+    """
+    참조 키로 페이로드 조회
+
+    Returns:
+        페이로드 (만료/없음/조회 실패 시 None)
+    """
+    if not ref or not ref.startswith(PAYLOAD_KEY_PREFIX):
+        return None
+    try:
+        data = (client or _get_client()).get(ref)
+        return loads(data) if data is not None else None
+    except Exception as e:
+        logger.warning(f"결과 페이로드 조회 실패 ({ref}): {e}")
+        return None
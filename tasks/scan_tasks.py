@@ -4,7 +4,9 @@ VCP 패턴 스캔 비동기 작업
 """
 
 import logging
+from tasks.async_runtime import run_async
 from tasks.celery_app import celery_app
+from tasks.result_store import store_payload
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,7 @@ def scan_vcp_patterns(self, market: str = "KOSPI", top_n: int = 30, save_db: boo
         save_db: DB 저장 여부
 
     Returns:
-        스캔 결과
+        스캔 요약 (전체 결과는 result_ref로 tasks.result_store.load_payload에서 조회)
     """
     try:
         logger.info(f"VCP 스캔 시작: {market}, 상위 {top_n}개")
@@ -29,9 +31,8 @@ def scan_vcp_patterns(self, market: str = "KOSPI", top_n: int = 30, save_db: boo
         from services.vcp_scanner.vcp_analyzer import VCPAnalyzer
 
         analyzer = VCPAnalyzer()
-        # 동기 태스크에서 비동기 함수 실행
-        import asyncio
-        results = asyncio.run(analyzer.scan_market(market, top_n))
+        # 워커 프로세스 공유 이벤트 루프에서 실행
+        results = run_async(analyzer.scan_market(market, top_n))
 
         logger.info(f"VCP 스캔 완료: {len(results)}개 시그널 발견")
 
@@ -45,11 +46,14 @@ def scan_vcp_patterns(self, market: str = "KOSPI", top_n: int = 30, save_db: boo
             except Exception as db_error:
                 logger.error(f"DB 저장 실패: {db_error}")
 
+        # 전체 결과는 결과 백엔드 대신 별도 키에 저장하고 참조만 반환
+        payload = [r.to_dict() for r in results]
         return {
             "status": "success",
             "count": len(results),
             "saved": saved_count,
-            "results": [r.to_dict() for r in results],
+            "tickers": [item.get("ticker") for item in payload],
+            "result_ref": store_payload("vcp_scan", payload) if payload else None,
         }
 
     except Exception as e:
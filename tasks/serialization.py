@@ -0,0 +1,61 @@
+"""
+Celery 메시지 직렬화 (zjson)
+
+compact JSON을 기본으로 하고, 일정 크기 이상이면 zlib으로 압축한 바이너리 페이로드를 사용합니다.
+전 종목 스캔 결과나 샤드 시그널 목록처럼 큰 메시지의 브로커/결과 백엔드 전송량을 줄입니다.
+
+페이로드 형식: 1바이트 플래그 + 본문
+- 0x00: compact JSON (UTF-8)
+- 0x01: zlib 압축된 compact JSON
+
+JSON 인코딩은 kombu 기본 json 직렬화기와 같은 kombu.utils.json을 사용해
+date / datetime / Decimal / UUID 등이 문자열로 뭉개지지 않고 원래 타입으로 복원됩니다.
+"""
+
+import zlib
+from typing import Any
+
+from kombu.serialization import register
+from kombu.utils import json as kombu_json
+
+SERIALIZER_NAME = "zjson"
+CONTENT_TYPE = "application/x-zjson"
+
+# 이 크기(바이트) 이상이면 압축
+COMPRESS_THRESHOLD = 1024
+COMPRESS_LEVEL = 6
+
+_FLAG_PLAIN = b"\x00"
+_FLAG_ZLIB = b"\x01"
+
+
+def dumps(obj: Any) -> bytes:
+    """객체 → zjson 바이트"""
+    raw = kombu_json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return _FLAG_ZLIB + zlib.compress(raw, COMPRESS_LEVEL)
+    return _FLAG_PLAIN + raw
+
+
+def loads(data) -> Any:
+    """zjson 바이트 → 객체"""
+    if isinstance(data, str):
+        data = data.encode("latin-1")
+    data = bytes(data)
+    flag, body = data[:1], data[1:]
+    if flag == _FLAG_ZLIB:
+        body = zlib.decompress(body)
+    elif flag != _FLAG_PLAIN:
+        raise ValueError(f"Unknown zjson payload flag: {flag!r}")
+    return kombu_json.loads(body.decode("utf-8"))
+
+
+def register_serializer() -> None:
+    """kombu 직렬화 레지스트리에 zjson 등록 (중복 호출 안전)"""
+    register(
+        SERIALIZER_NAME,
+        dumps,
+        loads,
+        content_type=CONTENT_TYPE,
+        content_encoding="binary",
+    )
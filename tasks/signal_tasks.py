@@ -4,66 +4,251 @@ Celery Tasks - Signal Engine
 """
 
 import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+from celery import chord
+
 from tasks.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
 
+# 샤드당 종목 수
+JONGGA_SHARD_SIZE = 200
+
+# 샤드 일괄 조회 기간 (스코어러 최장 조회 구간 14일 + 여유)
+JONGGA_PRICE_LOOKBACK_DAYS = 20
+
+# 뉴스 점수용 AI 감성 분석 조회 기간 (일)
+JONGGA_NEWS_LOOKBACK_DAYS = 7
+
+# 진행 상황 보고 간격 (종목 수)
+JONGGA_PROGRESS_INTERVAL = 20
+
+GRADE_ORDER = {"S": 0, "A": 1, "B": 2, "C": 3}
+
+
+def _load_universe(market: str) -> List[Tuple[str, str]]:
+    """
+    스캔 대상 종목 (stocks 테이블)
+
+    ETF/ETN, 관리종목, 스팩, 채권 종목은 제외합니다.
+
+    Returns:
+        [(ticker, name), ...] (종목코드 순)
+    """
+    from sqlalchemy import select, or_
+
+    from src.database.models import Stock
+    from src.database.session import get_db_session_sync
+
+    query = select(Stock.ticker, Stock.name).where(
+        Stock.is_etf.is_not(True),
+        Stock.is_admin.is_not(True),
+        Stock.is_spac.is_not(True),
+        Stock.is_bond.is_not(True),
+        Stock.is_excluded_etf.is_not(True),
+    )
+    if market != "ALL":
+        query = query.where(Stock.market == market)
+    else:
+        query = query.where(or_(Stock.market == "KOSPI", Stock.market == "KOSDAQ"))
+
+    with get_db_session_sync() as db:
+        rows = db.execute(query.order_by(Stock.ticker)).all()
+    return [(row.ticker, row.name) for row in rows]
+
+
+def _prefetch_shard_data(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    샤드 종목의 일봉/수급/뉴스 감성을 종목별 조회 없이 일괄 조회
+
+    Returns:
+        {ticker: {"prices": [DailyPrice...], "flow": InstitutionalFlow | None, "news_score": int}}
+    """
+    from sqlalchemy import and_, func, select
+
+    from src.database.models import AIAnalysis, DailyPrice, InstitutionalFlow
+    from src.database.session import get_db_session_sync
+
+    today = date.today()
+    price_start = today - timedelta(days=JONGGA_PRICE_LOOKBACK_DAYS)
+    news_start = today - timedelta(days=JONGGA_NEWS_LOOKBACK_DAYS)
+
+    data: Dict[str, Dict[str, Any]] = {
+        ticker: {"prices": [], "flow": None, "news_score": 0} for ticker in tickers
+    }
+
+    with get_db_session_sync() as db:
+        # 1. 일봉 (종목당 최근 구간, 날짜 오름차순)
+        prices = db.execute(
+            select(DailyPrice)
+            .where(and_(DailyPrice.ticker.in_(tickers), DailyPrice.date >= price_start))
+            .order_by(DailyPrice.ticker, DailyPrice.date)
+        ).scalars().all()
+        for price in prices:
+            data[price.ticker]["prices"].append(price)
+
+        # 2. 종목별 최신 수급
+        latest_flow = (
+            select(InstitutionalFlow.ticker, func.max(InstitutionalFlow.date).label("date"))
+            .where(and_(InstitutionalFlow.ticker.in_(tickers), InstitutionalFlow.date >= price_start))
+            .group_by(InstitutionalFlow.ticker)
+            .subquery()
+        )
+        flows = db.execute(
+            select(InstitutionalFlow).join(
+                latest_flow,
+                and_(
+                    InstitutionalFlow.ticker == latest_flow.c.ticker,
+                    InstitutionalFlow.date == latest_flow.c.date,
+                ),
+            )
+        ).scalars().all()
+        for flow in flows:
+            data[flow.ticker]["flow"] = flow
+
+        # 3. 뉴스 점수: 최근 긍정 감성 분석 건수 (최대 3점)
+        positives = db.execute(
+            select(AIAnalysis.ticker, func.count(AIAnalysis.id).label("positive_count"))
+            .where(
+                and_(
+                    AIAnalysis.ticker.in_(tickers),
+                    AIAnalysis.analysis_date >= news_start,
+                    AIAnalysis.sentiment == "positive",
+                )
+            )
+            .group_by(AIAnalysis.ticker)
+        ).all()
+        for row in positives:
+            data[row.ticker]["news_score"] = min(3, row.positive_count)
+
+        # 세션 종료 후에도 속성 접근이 가능하도록 분리
+        db.expunge_all()
+
+    return data
+
+
+def _rank_signals(signals: List[Dict[str, Any]], top_n: int, min_score: int) -> List[Dict[str, Any]]:
+    """min_score 필터 후 등급 → 총점 순으로 정렬해 상위 top_n개 선택"""
+    eligible = [s for s in signals if s["score"]["total"] >= min_score]
+    eligible.sort(key=lambda s: (GRADE_ORDER.get(s["grade"], 9), -s["score"]["total"], s["ticker"]))
+    return eligible[:top_n]
+
+
+def _persist_signals(signals: List[Dict[str, Any]], signal_date: date) -> int:
+    """
+    시그널 일괄 저장
+
+    같은 날짜의 기존 OPEN 종가베팅 V2 시그널을 교체합니다 (재실행 시 중복 방지).
+    """
+    from sqlalchemy import and_, delete, insert
+
+    from src.database.models import Signal
+    from src.database.session import get_db_session_sync
+
+    rows = [
+        {
+            "ticker": s["ticker"],
+            "signal_type": "JONGGA_V2",
+            "status": "OPEN",
+            "score": float(s["score"]["total"]),
+            "grade": s["grade"],
+            "total_score": s["score"]["total"],
+            "news_score": s["score"].get("news", 0),
+            "supply_score": s["score"].get("flow", 0),
+            "entry_price": s["entry_price"],
+            "target_price": s["target_price"],
+            "stop_price": s["stop_loss"],
+            "signal_date": signal_date,
+        }
+        for s in signals
+    ]
+
+    with get_db_session_sync() as db:
+        db.execute(
+            delete(Signal).where(
+                and_(
+                    Signal.signal_type == "JONGGA_V2",
+                    Signal.status == "OPEN",
+                    Signal.signal_date == signal_date,
+                )
+            )
+        )
+        if rows:
+            db.execute(insert(Signal), rows)
+        db.commit()
+
+    return len(rows)
+
+
 @celery_app.task(name="tasks.signal_tasks.generate_jongga_signals", bind=True)
 def generate_jongga_signals(
     self,
     capital: int = 10_000_000,
     top_n: int = 30,
     market: str = "KOSPI",
-    min_score: int = 6
+    min_score: int = 6,
+    shard_size: int = JONGGA_SHARD_SIZE,
 ):
     """
     종가베팅 V2 시그널 생성 태스크
 
+    stocks 테이블의 전 종목을 shard_size 단위로 나눠 score_jongga_shard를 chord로
+    병렬 실행하고, reduce_jongga_signals가 순위 산정 및 일괄 저장을 담당합니다.
+    이 태스크는 chord를 발행한 뒤 바로 반환합니다.
+
     Args:
         capital: 총 자본 (기본 1000만원)
         top_n: 상위 N개 종목
         market: 시장 (KOSPI/KOSDAQ/ALL)
         min_score: 최소 점수 (0-12)
+        shard_size: 샤드당 종목 수
 
     Returns:
-        생성된 시그널 리스트
+        발행 결과 (샤드/리듀서 태스크 ID 포함)
     """
     try:
         logger.info(f"종가베팅 시그널 생성 시작: 자본 {capital}, 상위 {top_n}개, 시장 {market}, 최소점수 {min_score}")
 
-        # Signal Engine 호출
-        # TODO: 실제 종목 스캔 로직
-        from services.signal_engine.scorer import SignalScorer
+        universe = _load_universe(market)
+        if not universe:
+            logger.warning(f"스캔 대상 종목 없음: {market}")
+            return {
+                "status": "success",
+                "count": 0,
+                "capital": capital,
+                "signals": [],
+            }
 
-        scorer = SignalScorer()
+        shards = [
+            universe[i:i + shard_size]
+            for i in range(0, len(universe), shard_size)
+        ]
 
-        # Mock 종목 리스트
-        mock_stocks = [
-            ("005930", "삼성전자", 80000),
-            ("000660", "SK하이닉스", 180000),
-            ("035420", "NAVER", 250000),
-        ][:top_n]
+        header = [
+            score_jongga_shard.s(shard, capital=capital, shard_index=index)
+            for index, shard in enumerate(shards)
+        ]
+        callback = reduce_jongga_signals.s(capital=capital, top_n=top_n, min_score=min_score)
+        result = chord(header)(callback)
 
-        signals = []
-        for ticker, name, price in mock_stocks:
-            signal = scorer.calculate(ticker, name, price)
-            if signal:
-                score_total = signal.score.total if hasattr(signal.score, 'total') else 0
-                if score_total >= 6:
-                    signals.append(signal.to_dict())
-
-        # 등급순 정렬
-        grade_order = {"S": 0, "A": 1, "B": 2, "C": 3}
-        signals.sort(key=lambda s: grade_order[s["grade"]])
+        shard_task_ids = [child.id for child in (result.parent.results if result.parent else [])]
 
-        logger.info(f"종가베팅 시그널 생성 완료: {len(signals)}개")
+        logger.info(
+            f"종가베팅 시그널 샤드 발행: {len(universe)}개 종목, {len(shards)}개 샤드, "
+            f"reducer={result.id}"
+        )
 
         return {
-            "status": "success",
-            "count": len(signals),
+            "status": "dispatched",
+            "market": market,
             "capital": capital,
-            "signals": signals,
+            "total_tickers": len(universe),
+            "shards": len(shards),
+            "shard_task_ids": shard_task_ids,
+            "reducer_task_id": result.id,
         }
 
     except Exception as e:
@@ -72,6 +257,102 @@ def generate_jongga_signals(
         return {"status": "error", "message": str(e)}
 
 
+@celery_app.task(name="tasks.signal_tasks.score_jongga_shard", bind=True)
+def score_jongga_shard(
+    self,
+    shard: List[Tuple[str, str]],
+    capital: int = 10_000_000,
+    shard_index: int = 0,
+) -> Dict[str, Any]:
+    """
+    종목 샤드 점수 계산 (chord header)
+
+    샤드 종목의 일봉/수급/뉴스 감성을 한 번에 조회한 뒤 종목별로 점수를 계산합니다.
+    진행 상황은 PROGRESS 상태 메타데이터({"shard", "done", "total"})로 보고합니다.
+
+    Args:
+        shard: [(ticker, name), ...]
+        capital: 포지션 사이징 기준 자본
+        shard_index: 샤드 번호
+
+    Returns:
+        {"shard": 번호, "scanned": 종목 수, "signals": [시그널 dict...]}
+    """
+    from services.signal_engine.scorer import SignalScorer
+
+    total = len(shard)
+    data = _prefetch_shard_data([ticker for ticker, _ in shard])
+    scorer = SignalScorer()
+    signals = []
+
+    for done, (ticker, name) in enumerate(shard, start=1):
+        stock_data = data.get(ticker)
+        if stock_data and stock_data["prices"]:
+            price = int(stock_data["prices"][-1].close_price)
+            signal = scorer.calculate(
+                ticker,
+                name,
+                price,
+                prices=stock_data["prices"],
+                flow=stock_data["flow"],
+                news_score=stock_data["news_score"],
+                capital=capital,
+            )
+            if signal:
+                signals.append(signal.to_dict())
+
+        if self.request.id and (done % JONGGA_PROGRESS_INTERVAL == 0 or done == total):
+            self.update_state(
+                state="PROGRESS",
+                meta={"shard": shard_index, "done": done, "total": total},
+            )
+
+    logger.info(f"종가베팅 샤드 {shard_index} 완료: {total}개 종목, 후보 {len(signals)}개")
+
+    return {"shard": shard_index, "scanned": total, "signals": signals}
+
+
+@celery_app.task(name="tasks.signal_tasks.reduce_jongga_signals")
+def reduce_jongga_signals(
+    shard_results: List[Dict[str, Any]],
+    capital: int = 10_000_000,
+    top_n: int = 30,
+    min_score: int = 6,
+) -> Dict[str, Any]:
+    """
+    샤드 결과 집계 (chord callback)
+
+    등급/총점 순으로 정렬해 min_score, top_n을 적용한 뒤 한 번에 저장합니다.
+
+    Args:
+        shard_results: score_jongga_shard 결과 목록
+
+    Returns:
+        생성된 시그널 리스트
+    """
+    candidates = [signal for result in shard_results for signal in result.get("signals", [])]
+    scanned = sum(result.get("scanned", 0) for result in shard_results)
+    signals = _rank_signals(candidates, top_n=top_n, min_score=min_score)
+
+    result = {
+        "count": len(signals),
+        "scanned": scanned,
+        "capital": capital,
+        "signals": signals,
+    }
+
+    try:
+        saved = _persist_signals(signals, date.today())
+    except Exception as e:
+        # 저장 실패를 성공으로 보고하지 않도록 error 상태로 반환 (집계 결과는 유지)
+        logger.error(f"종가베팅 시그널 저장 실패: {e}")
+        return {"status": "error", "message": str(e), "saved": 0, **result}
+
+    logger.info(f"종가베팅 시그널 생성 완료: {scanned}개 종목 스캔, {len(signals)}개 선정, {saved}개 저장")
+
+    return {"status": "success", "saved": saved, **result}
+
+
 @celery_app.task(name="tasks.signal_tasks.analyze_single_stock")
 def analyze_single_stock(ticker: str, name: str, price: int):
     """단일 종목 시그널 분석"""
@@ -92,3 +373,70 @@ def analyze_single_stock(ticker: str, name: str, price: int):
     except Exception as e:
         logger.error(f"종목 분석 실패 ({ticker}): {e}")
         return {"status": "error", "message": str(e)}
+
+
+@celery_app.task(name="tasks.signal_tasks.refresh_performance_series")
+def refresh_performance_series(since: str = None):
+    """
+    시그널 성과 일별 집계 증분 갱신
+
+    Args:
+        since: 이 날짜(YYYY-MM-DD) 이후 전체 재집계 (미지정 시 마지막 갱신 이후 변경분만)
+
+    Returns:
+        갱신 결과
+    """
+    try:
+        from datetime import date
+
+        from src.database.session import get_db_session_sync
+        from src.repositories.performance_repository import PerformanceRepository
+
+        with get_db_session_sync() as db:
+            updated = PerformanceRepository(db).refresh_daily_series(
+                since=date.fromisoformat(since) if since else None,
+            )
+
+        logger.info(f"성과 일별 집계 갱신 완료: {updated}개 (signal_type, date)")
+        return {"status": "success", "updated": updated}
+
+    except Exception as e:
+        logger.error(f"성과 일별 집계 갱신 실패: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@celery_app.task(name="tasks.signal_tasks.archive_stale_signals")
+def archive_stale_signals(signal_retention_days: int = None, daytrading_retention_days: int = None):
+    """
+    시그널 보관 주기 처리
+
+    오래된 OPEN 시그널을 만료 청산하고, 보관 기간이 지난 CLOSED 시그널을
+    이력 테이블(signals_history, daytrading_signals_history)로 옮깁니다.
+
+    Args:
+        signal_retention_days: VCP/종가베팅 시그널 보관 기간 (일, 기본 SIGNAL_RETENTION_DAYS)
+        daytrading_retention_days: 단타 신호 보관 기간 (일, 기본 DAYTRADING_RETENTION_DAYS)
+
+    Returns:
+        처리 결과
+    """
+    try:
+        from src.database.session import get_db_session_sync
+        from src.repositories.signal_archive_repository import (
+            DAYTRADING_RETENTION_DAYS,
+            SIGNAL_RETENTION_DAYS,
+            SignalArchiveRepository,
+        )
+
+        with get_db_session_sync() as db:
+            result = SignalArchiveRepository(db).run_retention(
+                signal_retention_days=signal_retention_days or SIGNAL_RETENTION_DAYS,
+                daytrading_retention_days=daytrading_retention_days or DAYTRADING_RETENTION_DAYS,
+            )
+
+        logger.info(f"시그널 보관 주기 처리 완료: {result}")
+        return {"status": "success", **result}
+
+    except Exception as e:
+        logger.error(f"시그널 보관 주기 처리 실패: {e}")
+        return {"status": "error", "message": str(e)}
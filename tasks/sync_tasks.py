@@ -3,8 +3,10 @@ Celery Tasks - Stock Sync
 종목 동기화 비동기 작업 (Kiwoom REST API)
 """
 
+import asyncio
 import logging
 import os
+from tasks.async_runtime import get_kiwoom_api, run_async
 from tasks.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -27,10 +29,8 @@ def sync_stock_list(self, markets: list = None):
     try:
         logger.info(f"종목 동기화 시작: {markets}")
 
-        # 비동기 함수를 동기 태스크에서 실행
-        import asyncio
-
-        results = asyncio.run(_sync_stock_list_async(markets))
+        # 워커 프로세스 공유 이벤트 루프에서 실행
+        results = run_async(_sync_stock_list_async(markets))
 
         logger.info(f"종목 동기화 완료: {results}")
         return results
@@ -41,6 +41,44 @@ def sync_stock_list(self, markets: list = None):
         return {"status": "error", "message": str(e)}
 
 
+def _save_stock_list(stocks: list) -> int:
+    """
+    종목 목록 저장 (동기, 스레드에서 호출)
+
+    Returns:
+        저장된 종목 수
+    """
+    from src.database.session import SessionLocal
+    from src.repositories.stock_repository import StockRepository
+    from src.repositories.stock_search_index import invalidate_stock_search_index
+
+    with SessionLocal() as session:
+        repo = StockRepository(session)
+        count = 0
+
+        for stock_data in stocks:
+            try:
+                repo.create_if_not_exists(
+                    ticker=stock_data["ticker"],
+                    name=stock_data["name"],
+                    market=stock_data["market"],
+                    sector="",
+                    market_cap=0,
+                    is_spac=stock_data.get("is_spac", False),  # 스팩 종목 여부
+                    is_bond=stock_data.get("is_bond", False),  # 회사채/채권 종목 여부
+                    is_excluded_etf=stock_data.get("is_excluded_etf", False),  # 제외할 ETF/ETN 여부
+                )
+                count += 1
+            except Exception as e:
+                logger.error(f"종목 저장 실패 {stock_data['ticker']}: {e}")
+
+    # 모든 프로세스의 종목 검색 색인이 새 목록으로 재구성되도록 버전 증가
+    if count:
+        invalidate_stock_search_index()
+
+    return count
+
+
 async def _sync_stock_list_async(markets: list) -> dict:
     """
     종목 목록 동기화 비동기 함수
@@ -51,11 +89,7 @@ async def _sync_stock_list_async(markets: list) -> dict:
     Returns:
         동기화 결과
     """
-    from src.kiwoom.rest_api import KiwoomRestAPI
     from src.kiwoom.base import KiwoomConfig
-    from src.database.session import SessionLocal
-    from src.repositories.stock_repository import StockRepository
-    import os
 
     # Kiwoom API 설정
     app_key = os.getenv("KIWOOM_APP_KEY")
@@ -74,7 +108,8 @@ async def _sync_stock_list_async(markets: list) -> dict:
         use_mock=False,
     )
 
-    api = KiwoomRestAPI(config)
+    # 워커 프로세스 공유 인스턴스 (커넥션 풀/토큰 재사용, 여기서 닫지 않음)
+    api = await get_kiwoom_api(config)
 
     results = {
         "synced": 0,
@@ -83,55 +118,32 @@ async def _sync_stock_list_async(markets: list) -> dict:
         "konex_count": 0,
     }
 
-    try:
-        # 토큰 발급
-        await api.connect()
+    # 토큰 확보 (유효한 토큰이 있으면 재사용)
+    await api.connect()
 
-        # 종목 목록 조회 및 저장
-        for market in markets:
-            try:
-                # 종목 목록 조회
-                stocks = await api.get_stock_list(market)
-
-                # DB 저장
-                with SessionLocal() as session:
-                    repo = StockRepository(session)
-                    count = 0
-
-                    for stock_data in stocks:
-                        try:
-                            repo.create_if_not_exists(
-                                ticker=stock_data["ticker"],
-                                name=stock_data["name"],
-                                market=stock_data["market"],
-                                sector="",
-                                market_cap=0,
-                                is_spac=stock_data.get("is_spac", False),  # 스팩 종목 여부
-                                is_bond=stock_data.get("is_bond", False),  # 회사채/채권 종목 여부
-                                is_excluded_etf=stock_data.get("is_excluded_etf", False),  # 제외할 ETF/ETN 여부
-                            )
-                            count += 1
-                        except Exception as e:
-                            logger.error(f"종목 저장 실패 {stock_data['ticker']}: {e}")
-
-                    results["synced"] += count
-
-                    if market == "KOSPI":
-                        results["kospi_count"] = count
-                    elif market == "KOSDAQ":
-                        results["kosdaq_count"] = count
-                    elif market == "KONEX":
-                        results["konex_count"] = count
-
-                    logger.info(f"{market} 종목 {count}개 동기화 완료")
+    # 종목 목록 조회 및 저장
+    for market in markets:
+        try:
+            # 종목 목록 조회
+            stocks = await api.get_stock_list(market)
 
-            except Exception as e:
-                logger.error(f"{market} 종목 동기화 실패: {e}")
+            # DB 저장 (동기 세션은 스레드에서 실행해 공유 루프를 막지 않음)
+            count = await asyncio.to_thread(_save_stock_list, stocks)
+            results["synced"] += count
 
-        return results
+            if market == "KOSPI":
+                results["kospi_count"] = count
+            elif market == "KOSDAQ":
+                results["kosdaq_count"] = count
+            elif market == "KONEX":
+                results["konex_count"] = count
+
+            logger.info(f"{market} 종목 {count}개 동기화 완료")
+
+        except Exception as e:
+            logger.error(f"{market} 종목 동기화 실패: {e}")
 
-    finally:
-        await api.disconnect()
+    return results
 
 
 @celery_app.task(name="tasks.sync_tasks.trigger_vcp_scan_via_api")
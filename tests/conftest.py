@@ -102,6 +102,20 @@ def database_setup():
     print("🧹 Test session completed")
 
 
+@pytest.fixture(autouse=True)
+def isolated_kiwoom_token_broker():
+    """
+    키움 토큰 브로커 격리
+
+    테스트 간 토큰 캐시가 공유되지 않도록 Redis 없는 브로커를 테스트마다 새로 설치합니다.
+    """
+    from src.kiwoom.token_broker import KiwoomTokenBroker, reset_token_broker, set_token_broker
+
+    set_token_broker(KiwoomTokenBroker(redis_url=None))
+    yield
+    reset_token_broker()
+
+
 @pytest.fixture
 def mock_session():
     """
@@ -114,7 +114,8 @@ class TestRealtimeDataCollector:
         mock_kiwoom_api.get_stock_daily_chart.assert_called_once_with(
             ticker="005930", days=30, base_date=None, adjusted_price=True
         )
-        assert mock_db_session.execute.call_count == 3
+        # 다중 행 UPSERT 한 번으로 저장
+        assert mock_db_session.execute.call_count == 1
         assert mock_db_session.commit.call_count == 1
 
     @pytest.mark.asyncio
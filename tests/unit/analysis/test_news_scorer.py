@@ -17,6 +17,15 @@ from src.analysis.sentiment_analyzer import Sentiment, SentimentResult
 from services.signal_engine.scorer import SignalScorer
 
 
+def _with_batch(mock_analyzer):
+    """analyze_batch를 기사별 analyze mock 호출로 연결"""
+    mock_analyzer.analyze_batch.side_effect = lambda articles: [
+        mock_analyzer.analyze(title=a["title"], content=a.get("content", ""))
+        for a in articles
+    ]
+    return mock_analyzer
+
+
 class TestNewsScorerCalculateDailyScore:
     """NewsScorer.calculate_daily_score() 테스트"""
 
@@ -33,7 +42,7 @@ class TestNewsScorerCalculateDailyScore:
         )
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "삼성전자 실적 호조", "content": "매출 증가", "source": "A"},
@@ -60,7 +69,7 @@ class TestNewsScorerCalculateDailyScore:
         ]
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "실적 호조", "content": "매출 증가"},
@@ -86,7 +95,7 @@ class TestNewsScorerCalculateDailyScore:
         ]
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "실적 호조", "content": "매출 증가"},
@@ -122,7 +131,7 @@ class TestNewsScorerCalculateDailyScore:
         mock_analyzer.analyze.side_effect = Exception("API Error")
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "뉴스 제목", "content": "뉴스 내용"},
@@ -147,7 +156,7 @@ class TestNewsScorerCalculateDailyScore:
         ]
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "실적 큰 폭 개선", "content": "매출 급증"},
@@ -172,7 +181,7 @@ class TestNewsScorerCalculateDailyScore:
         ]
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "실적 호조", "content": "소폭 증가"},
@@ -198,7 +207,7 @@ class TestNewsScorerCalculateDailyScore:
         )
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "실적 부진", "content": "매출 감소"},
@@ -225,7 +234,7 @@ class TestNewsScorerCalculateDailyScore:
         )
 
         scorer = NewsScorer()
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "삼성전자 호조", "content": "실적 개선", "source": "Reuters"},
@@ -288,7 +297,7 @@ class TestNewsScorerCalculateWeeklyScore:
             )
 
         mock_analyzer.analyze.side_effect = mock_analyze_side_effect
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         weekly_articles = {
             date(2026, 1, 26): [{"title": "호조", "content": "상승"}],
@@ -339,7 +348,7 @@ class TestNewsScorerExtractKeywords:
             )
 
         mock_analyzer.analyze.side_effect = mock_analyze_side_effect
-        scorer.analyzer = mock_analyzer
+        scorer.analyzer = _with_batch(mock_analyzer)
 
         articles = [
             {"title": "성장", "content": "성장 모멘텀"},
@@ -0,0 +1,299 @@
+"""
+BatchSentimentPipeline 단위 테스트
+
+로컬 Gemini 대역(generateContent) HTTP 서버로 다음을 검증합니다.
+- 다건 프롬프트 + 구조화(JSON) 출력
+- 동시 요청 수 제한
+- 정규화 본문 해시 캐시
+- 어휘 사전 중립 판정으로 LLM 호출 생략
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.analysis.sentiment_analyzer import Sentiment
+from src.analysis.sentiment_pipeline import (
+    BatchSentimentPipeline,
+    GeminiRestClient,
+    LexiconPreClassifier,
+    SentimentBatchError,
+    SentimentCache,
+    article_key,
+)
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    """generateContent 대역: 제목 키워드로 감성 라벨링"""
+
+    def do_POST(self):
+        state = self.server.state
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        with state["lock"]:
+            state["requests"].append(body)
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+
+        try:
+            time.sleep(state["latency"])
+
+            if state["fail"]:
+                self.send_response(500)
+                self.end_headers()
+                return
+
+            prompt = body["contents"][0]["parts"][0]["text"]
+            items = [json.loads(line) for line in prompt.splitlines() if line.startswith('{"id"')]
+            output = []
+            for item in items[state["drop"]:]:
+                title = item["title"]
+                if "상승" in title or "호조" in title:
+                    sentiment = "positive"
+                elif "하락" in title or "적자" in title:
+                    sentiment = "negative"
+                else:
+                    sentiment = "neutral"
+                output.append({
+                    "id": item["id"],
+                    "sentiment": sentiment,
+                    "confidence": 0.8,
+                    "keywords": [title.split()[0]],
+                    "summary": title,
+                })
+
+            payload = json.dumps({
+                "candidates": [{"content": {"parts": [{"text": json.dumps(output, ensure_ascii=False)}]}}]
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with state["lock"]:
+                state["active"] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeRedis:
+    """mget / pipeline(set) 만 지원하는 Redis 대역"""
+
+    def __init__(self):
+        self.data = {}
+
+    def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class _Pipe:
+            def __init__(self):
+                self.ops = []
+
+            def set(self, key, value, ex=None):
+                self.ops.append((key, value))
+
+            def execute(self):
+                redis.data.update(self.ops)
+
+        return _Pipe()
+
+
+@pytest.fixture
+def llm_server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGeminiHandler)
+    httpd.state = {
+        "lock": threading.Lock(),
+        "requests": [],
+        "active": 0,
+        "max_active": 0,
+        "latency": 0.0,
+        "fail": False,
+        "drop": 0,
+    }
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    client = GeminiRestClient("test-key", base_url=f"http://127.0.0.1:{httpd.server_address[1]}")
+    yield client, httpd.state
+
+    client.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def redis_store():
+    return FakeRedis()
+
+
+def _pipeline(client, redis_store, **kwargs):
+    return BatchSentimentPipeline(client=client, cache=SentimentCache(client=redis_store), **kwargs)
+
+
+def _articles(n, word="상승"):
+    return [{"title": f"종목{i} 주가 {word}", "content": f"본문 {i}"} for i in range(n)]
+
+
+class TestBatchSentimentPipeline:
+    """BatchSentimentPipeline 테스트"""
+
+    def test_packs_articles_per_prompt(self, llm_server, redis_store):
+        client, state = llm_server
+        pipeline = _pipeline(client, redis_store, batch_size=10)
+        articles = _articles(13) + _articles(12, word="하락")[:12]
+
+        results = pipeline.analyze(articles)
+
+        assert len(state["requests"]) == 3
+        assert pipeline.stats.llm_items == 25
+        assert [r.sentiment for r in results[:13]] == [Sentiment.POSITIVE] * 13
+        assert results[13].sentiment == Sentiment.NEGATIVE
+        assert results[13].score == -0.8
+
+        config = state["requests"][0]["generationConfig"]
+        assert config["responseMimeType"] == "application/json"
+        assert config["responseSchema"]["type"] == "ARRAY"
+
+    def test_bounded_in_flight(self, llm_server, redis_store):
+        client, state = llm_server
+        state["latency"] = 0.05
+        pipeline = _pipeline(client, redis_store, batch_size=2, max_in_flight=2)
+
+        pipeline.analyze(_articles(12))
+
+        assert len(state["requests"]) == 6
+        assert state["max_active"] == 2
+
+    def test_cache_hit_skips_llm(self, llm_server, redis_store):
+        client, state = llm_server
+        articles = _articles(3)
+        _pipeline(client, redis_store).analyze(articles)
+
+        # 새 파이프라인(다른 프로세스 가정)도 같은 저장소로 재사용, 공백/대소문자 차이 무시
+        variant = [{"title": "  " + a["title"].upper() + " ", "content": a["content"]} for a in articles]
+        pipeline = _pipeline(client, redis_store)
+        results = pipeline.analyze(variant + articles)
+
+        assert len(state["requests"]) == 1
+        assert pipeline.stats.cache_hits == 6
+        assert all(r.sentiment == Sentiment.POSITIVE for r in results)
+        assert article_key(articles[0]["title"], articles[0]["content"]) in redis_store.data
+
+    def test_duplicate_articles_sent_once(self, llm_server, redis_store):
+        client, state = llm_server
+        pipeline = _pipeline(client, redis_store)
+
+        results = pipeline.analyze(_articles(1) * 4)
+
+        prompt = state["requests"][0]["contents"][0]["parts"][0]["text"]
+        assert sum(line.startswith('{"id"') for line in prompt.splitlines()) == 1
+        assert len(results) == 4
+
+    def test_lexicon_neutral_short_circuit(self, llm_server, redis_store):
+        client, state = llm_server
+        pipeline = _pipeline(client, redis_store)
+
+        results = pipeline.analyze([
+            {"title": "코스피 보합 마감", "content": "관망세 지속"},
+            {"title": "삼성전자 주가 상승", "content": ""},
+        ])
+
+        assert pipeline.stats.lexicon_neutral == 1
+        assert results[0].sentiment == Sentiment.NEUTRAL
+        assert results[1].sentiment == Sentiment.POSITIVE
+        prompt = state["requests"][0]["contents"][0]["parts"][0]["text"]
+        assert "보합" not in prompt
+
+    def test_failures_fall_back_to_neutral_uncached(self, llm_server, redis_store):
+        client, state = llm_server
+        state["fail"] = True
+        pipeline = _pipeline(client, redis_store)
+
+        results = pipeline.analyze(_articles(2))
+
+        assert pipeline.stats.failed == 2
+        assert all(r.sentiment == Sentiment.NEUTRAL and r.confidence == 0.0 for r in results)
+        assert redis_store.data == {}
+
+    def test_missing_items_fall_back(self, llm_server, redis_store):
+        client, state = llm_server
+        state["drop"] = 1
+        pipeline = _pipeline(client, redis_store)
+
+        results = pipeline.analyze(_articles(3))
+
+        assert results[0].confidence == 0.0
+        assert results[1].sentiment == Sentiment.POSITIVE
+        assert len(redis_store.data) == 2
+
+
+    def test_raise_on_failure_keeps_successful_results_cached(self, llm_server, redis_store):
+        client, state = llm_server
+        state["drop"] = 1
+        pipeline = _pipeline(client, redis_store)
+
+        with pytest.raises(SentimentBatchError) as exc_info:
+            pipeline.analyze(_articles(3), raise_on_failure=True)
+
+        assert (exc_info.value.failed, exc_info.value.total) == (1, 3)
+        # 재시도 시 실패분만 다시 요청하도록 성공 결과는 캐시
+        assert len(redis_store.data) == 2
+
+
+class FlakyRedis(FakeRedis):
+    """지정한 횟수만큼 mget 실패"""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+        self.calls = 0
+
+    def mget(self, keys):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("redis down")
+        return super().mget(keys)
+
+
+class TestSentimentCache:
+    """SentimentCache Redis 장애 처리 테스트"""
+
+    def test_redis_error_backs_off_then_retries(self, monkeypatch):
+        import src.analysis.sentiment_pipeline as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        redis = FlakyRedis(failures=1)
+        redis.data["k"] = '{"sentiment": "positive"}'
+        cache = SentimentCache(client=redis, retry_interval=60)
+
+        assert cache.get_many(["k"]) == {}
+        # 대기 시간 동안은 Redis를 건너뜀
+        now[0] += 30
+        assert cache.get_many(["k"]) == {}
+        assert redis.calls == 1
+
+        # 대기 시간이 지나면 다시 Redis 사용
+        now[0] += 31
+        assert cache.get_many(["k"]) == {"k": {"sentiment": "positive"}}
+        assert redis.calls == 2
+
+
+class TestLexiconPreClassifier:
+    """LexiconPreClassifier 테스트"""
+
+    def test_classify(self):
+        classifier = LexiconPreClassifier()
+
+        assert classifier.classify("정기 주주총회 개최 안내").sentiment == Sentiment.NEUTRAL
+        assert classifier.classify("실적 부진 우려") is None
+        assert classifier.classify("제목", "본문에 급등 언급") is None
@@ -0,0 +1,312 @@
+"""
+Test Suite: Tiered Cache (L1 + L2)
+프로세스 내 L1 캐시, singleflight, 조기 갱신, 태그 무효화 테스트
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.cache.cache_client import CacheMetrics
+from src.cache.local_cache import CacheEntry, LocalCache, SingleFlight
+from src.cache import tiered_cache as tiered_module
+from src.cache.tiered_cache import TieredCache, make_cache_key
+
+
+def _entry(value, ttl=60.0, tags=(), delta=0.0):
+    return CacheEntry(value=value, expires_at=time.time() + ttl, delta=delta, tags=set(tags))
+
+
+def _stored(value, **kwargs):
+    """TieredCache 보관 형식(JSON 텍스트) 엔트리"""
+    return _entry(json.dumps(value), **kwargs)
+
+
+class TestLocalCache:
+    """L1 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        """최대 크기 초과 시 가장 오래 사용하지 않은 엔트리 제거"""
+        l1 = LocalCache(max_entries=2, ttl=60)
+        l1.set("a", _entry(1))
+        l1.set("b", _entry(2))
+        assert l1.get("a").value == 1  # a 최근 사용
+        l1.set("c", _entry(3))
+
+        assert l1.get("b") is None
+        assert l1.get("a").value == 1
+        assert l1.get("c").value == 3
+
+    def test_ttl_expiry(self):
+        """L2 만료 시각이 지나면 L1에서도 제거"""
+        l1 = LocalCache(max_entries=10, ttl=60)
+        l1.set("a", _entry(1, ttl=-1))
+        assert l1.get("a") is None
+        assert len(l1) == 0
+
+    def test_invalidate_tags(self):
+        """태그 단위 무효화"""
+        l1 = LocalCache()
+        l1.set("p1", _entry(1, tags=["prices"]))
+        l1.set("p2", _entry(2, tags=["prices", "kospi"]))
+        l1.set("s1", _entry(3, tags=["signals"]))
+
+        assert l1.invalidate_tags(["prices"]) == 2
+        assert l1.get("p1") is None
+        assert l1.get("p2") is None
+        assert l1.get("s1").value == 3
+
+
+class TestSingleFlight:
+    """동시 미스 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        """같은 키 동시 호출은 한 번만 실행"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("k", load) for _ in range(20)))
+
+        assert calls == 1
+        assert results == ["value"] * 20
+        assert not flight.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_exception_shared(self):
+        """실패 시 대기자 모두 같은 예외를 받음"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+class TestTieredCache:
+    """L1 + L2 조합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_l1_only_miss_then_hit(self):
+        """L2 없이도 L1으로 캐싱 + 네임스페이스 메트릭 기록"""
+        metrics = CacheMetrics()
+        cache = TieredCache(l2=None, metrics=metrics)
+        loader = AsyncMock(return_value={"price": 100})
+
+        assert await cache.get_or_compute("price:1", loader, ttl=60, namespace="price") == {"price": 100}
+        assert await cache.get_or_compute("price:1", loader, ttl=60, namespace="price") == {"price": 100}
+
+        assert loader.await_count == 1
+        stats = metrics.to_dict()["namespaces"]["price"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["l1_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_single_computation(self):
+        """동시 미스는 loader 1회 호출"""
+        cache = TieredCache(l2=None, metrics=CacheMetrics())
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return [1, 2, 3]
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("signals", load, ttl=60) for _ in range(50))
+        )
+        assert calls == 1
+        assert all(r == [1, 2, 3] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_none_not_cached(self):
+        """None 결과는 캐싱하지 않음"""
+        cache = TieredCache(l2=None, metrics=CacheMetrics())
+        loader = AsyncMock(return_value=None)
+
+        await cache.get_or_compute("k", loader, ttl=60)
+        await cache.get_or_compute("k", loader, ttl=60)
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_serves_stale_and_recomputes(self):
+        """조기 갱신 대상이면 기존 값 반환 후 백그라운드 재계산"""
+        cache = TieredCache(l2=None, beta=1e9, metrics=CacheMetrics())
+        cache.l1.set("k", _stored("old", ttl=30, delta=1.0))
+        loader = AsyncMock(return_value="new")
+
+        assert await cache.get_or_compute("k", loader, ttl=60) == "old"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert loader.await_count == 1
+        assert json.loads(cache.l1.get("k").value) == "new"
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1(self):
+        """L2 적중 시 L1 적재, 다음 조회는 L2를 거치지 않음"""
+        l2 = MagicMock()
+        l2.available = True
+        l2.get = AsyncMock(return_value={"__tc__": 2, "v": "42", "e": time.time() + 60, "d": 0, "t": []})
+        cache = TieredCache(l2=l2, metrics=CacheMetrics())
+        loader = AsyncMock()
+
+        assert await cache.get_or_compute("k", loader, ttl=60) == 42
+        assert await cache.get_or_compute("k", loader, ttl=60) == 42
+
+        assert l2.get.await_count == 1
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_l1_and_l2_return_same_form_and_fresh_copies(self):
+        """L1/L2 어느 쪽에서 적중해도 같은 타입의 새 객체 반환"""
+        stored = {}
+        l2 = MagicMock()
+        l2.available = True
+        l2.get = AsyncMock(side_effect=lambda key, namespace=None: stored.get(key))
+
+        async def l2_set(key, value, ttl=None):
+            stored[key] = json.loads(json.dumps(value))
+
+        l2.set = AsyncMock(side_effect=l2_set)
+        when = datetime(2026, 10, 16, 9, 0)
+        loader = AsyncMock(return_value={"at": when, "items": [1]})
+
+        cache = TieredCache(l2=l2, metrics=CacheMetrics())
+        computed = await cache.get_or_compute("k", loader, ttl=60)
+        from_l1 = await cache.get_or_compute("k", loader, ttl=60)
+        from_l2 = await TieredCache(l2=l2, metrics=CacheMetrics()).get_or_compute("k", loader, ttl=60)
+
+        assert computed == from_l1 == from_l2 == {"at": str(when), "items": [1]}
+
+        from_l1["items"].append(2)
+        assert await cache.get_or_compute("k", loader, ttl=60) == {"at": str(when), "items": [1]}
+        assert loader.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_l2_reconnects_with_backoff(self):
+        """Redis가 처음에 끊겨 있어도 이후 조회에서 재연결 시도"""
+        l2 = MagicMock()
+        l2.available = False
+        l2.get = AsyncMock(return_value=None)
+        l2.set = AsyncMock(return_value=True)
+        attempts = 0
+
+        async def initialize():
+            nonlocal attempts
+            attempts += 1
+            l2.available = attempts >= 2
+
+        l2.initialize = AsyncMock(side_effect=initialize)
+        cache = TieredCache(l2=l2, metrics=CacheMetrics())
+        cache.start = AsyncMock()
+        loader = AsyncMock(return_value=1)
+
+        await cache.get_or_compute("k", loader, ttl=60)
+        await asyncio.sleep(0)
+        assert attempts == 1 and not l2.available
+
+        # 백오프 간격 전에는 재시도하지 않음
+        await cache.get_or_compute("k", loader, ttl=60)
+        await asyncio.sleep(0)
+        assert attempts == 1
+
+        cache._next_reconnect = 0.0
+        await cache.get_or_compute("k", loader, ttl=60)
+        await asyncio.sleep(0)
+        assert attempts == 2 and l2.available
+        cache.start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_listener_resubscribes_after_error(self, monkeypatch):
+        """Pub/Sub 오류 후 재구독하고, 놓친 무효화에 대비해 L1 비움"""
+        monkeypatch.setattr(tiered_module, "RECONNECT_MIN_DELAY", 0)
+        received = asyncio.Event()
+
+        class FakePubSub:
+            def __init__(self, fail):
+                self.fail = fail
+
+            async def subscribe(self, channel):
+                pass
+
+            async def close(self):
+                pass
+
+            async def listen(self):
+                if self.fail:
+                    raise ConnectionError("connection lost")
+                yield {"type": "message", "data": json.dumps({"origin": "other", "keys": ["a"]})}
+                received.set()
+                await asyncio.Event().wait()
+
+        pubsubs = [FakePubSub(fail=True), FakePubSub(fail=False)]
+        l2 = MagicMock()
+        l2.available = True
+        l2.client.pubsub.side_effect = lambda **kwargs: pubsubs.pop(0)
+        l2._make_key.side_effect = lambda key: key
+
+        cache = TieredCache(l2=l2, metrics=CacheMetrics())
+        cache.l1.set("b", _stored(2))
+        await cache.start()
+        await asyncio.wait_for(received.wait(), timeout=1)
+
+        assert cache.l1.get("b") is None
+        await cache.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_broadcasts(self):
+        """태그 무효화 시 L2 삭제 + Pub/Sub 발행"""
+        l2 = MagicMock()
+        l2.available = True
+        l2.delete_tags = AsyncMock(return_value=2)
+        l2.publish = AsyncMock(return_value=True)
+        cache = TieredCache(l2=l2, metrics=CacheMetrics())
+        cache.l1.set("k", _entry(1, tags=["signals"]))
+
+        assert await cache.invalidate_tags(["signals"]) == 2
+        assert cache.l1.get("k") is None
+        channel, message = l2.publish.await_args.args
+        assert message["tags"] == ["signals"]
+
+    def test_remote_invalidation_applied(self):
+        """다른 워커의 무효화 메시지로 L1 제거, 자기 메시지는 무시"""
+        cache = TieredCache(l2=None, metrics=CacheMetrics())
+        cache.l1.set("a", _entry(1, tags=["prices"]))
+        cache.l1.set("b", _entry(2))
+
+        cache._apply_invalidation({"origin": cache._instance_id, "tags": ["prices"]})
+        assert cache.l1.get("a") is not None
+
+        cache._apply_invalidation({"origin": "other", "tags": ["prices"], "keys": ["b"]})
+        assert cache.l1.get("a") is None
+        assert cache.l1.get("b") is None
+
+
+class TestMakeCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_kwargs_order_independent(self):
+        key1 = make_cache_key("price:get", ("005930",), {"a": 1, "b": 2})
+        key2 = make_cache_key("price:get", ("005930",), {"b": 2, "a": 1})
+        assert key1 == key2
+        assert key1.startswith("price:get:")
+
+    def test_different_args_different_keys(self):
+        assert make_cache_key("f", ("1",), {}) != make_cache_key("f", (1,), {})
@@ -0,0 +1,176 @@
+"""
+ArticleIndex 단위 테스트
+
+- Aho–Corasick 다중 패턴 매칭 (leftmost-longest, 영문 경계)
+- 소스별 색인 조회/TTL
+- 폴링 주기당 피드 1회 수집
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.collectors.article_index import AhoCorasickMatcher, ArticleIndex
+from src.collectors.etfnews_collector import ETFNewsCollector
+from src.collectors.yonhap_collector import YonhapCollector
+
+
+ALIASES = {
+    "삼성전자": ["005930"],
+    "삼성": ["005930"],
+    "LG전자": ["066570"],
+    "LG": ["003550"],
+    "SK하이닉스": ["000660"],
+    "하이닉스": ["000660"],
+    "NAVER": ["035420"],
+    "TIGER 카카오": ["035720"],
+}
+
+
+def _article(title, hours_ago=1, content=""):
+    return {
+        "title": title,
+        "url": f"https://example.com/{abs(hash(title))}",
+        "content": content,
+        "published_at": (datetime.now() - timedelta(hours=hours_ago)).isoformat(),
+    }
+
+
+@pytest.fixture
+def index():
+    return ArticleIndex(alias_loader=lambda: ALIASES)
+
+
+class TestAhoCorasickMatcher:
+    """AhoCorasickMatcher 테스트"""
+
+    def test_finds_all_patterns_in_one_pass(self):
+        matcher = AhoCorasickMatcher(ALIASES)
+
+        assert matcher.find("삼성전자·SK하이닉스 동반 강세") == {"005930", "000660"}
+
+    def test_longest_match_wins(self):
+        matcher = AhoCorasickMatcher(ALIASES)
+
+        # "LG전자" 안의 "LG"는 지주사로 중복 태깅되지 않음
+        assert matcher.find("LG전자, 신제품 출시") == {"066570"}
+        assert matcher.find("LG 그룹 지배구조") == {"003550"}
+
+    def test_ascii_word_boundary(self):
+        matcher = AhoCorasickMatcher(ALIASES)
+
+        assert matcher.find("NAVERS 클럽") == set()
+        assert matcher.find("naver 웹툰 상장") == {"035420"}
+        assert matcher.find("TIGER 카카오그룹 ETF") == {"035720"}
+
+    def test_no_match(self):
+        matcher = AhoCorasickMatcher(ALIASES)
+
+        assert matcher.find("코스피 보합 마감") == set()
+        assert matcher.find("") == set()
+
+
+class TestArticleIndex:
+    """ArticleIndex 테스트"""
+
+    def test_lookup_newest_first_within_days(self, index):
+        index.index_articles("yonhap", [
+            _article("삼성전자 실적", hours_ago=30),
+            _article("LG전자 신제품", hours_ago=2),
+            _article("삼성전자 신고가", hours_ago=1),
+            _article("반도체 업황", hours_ago=3, content="SK하이닉스와 삼성 HBM 경쟁"),
+            _article("삼성전자 옛 기사", hours_ago=24 * 20),
+        ])
+
+        titles = [a["title"] for a in index.lookup("005930", "yonhap", days=7)]
+
+        assert titles == ["삼성전자 신고가", "반도체 업황", "삼성전자 실적"]
+        assert [a["title"] for a in index.lookup("000660", "yonhap")] == ["반도체 업황"]
+        assert index.lookup("005930", "yonhap", max_articles=1)[0]["title"] == "삼성전자 신고가"
+        assert index.lookup("005930", "etf") == []
+
+    def test_refresh_fetches_once_per_ttl(self, index):
+        fetch = Mock(return_value=[_article("NAVER 실적")])
+
+        assert index.refresh("yonhap", fetch) is True
+        assert index.refresh("yonhap", fetch) is False
+        fetch.assert_called_once()
+
+        index.ttl = 0
+        index._indexed_at["yonhap"] -= 1
+        assert index.refresh("yonhap", fetch) is True
+        assert fetch.call_count == 2
+
+    def test_alias_loader_called_once(self):
+        loader = Mock(return_value=ALIASES)
+        index = ArticleIndex(alias_loader=loader)
+
+        index.index_articles("a", [_article("삼성전자")])
+        index.index_articles("b", [_article("NAVER")])
+
+        loader.assert_called_once()
+
+    def test_failed_alias_load_retried_soon(self):
+        loader = Mock(side_effect=[RuntimeError("db down"), ALIASES])
+        index = ArticleIndex(alias_loader=loader, alias_ttl=3600, alias_retry_ttl=60)
+
+        # 실패 시 기본 별칭으로 매칭
+        index.index_articles("a", [_article("LG전자 신제품"), _article("네이버 실적")])
+        assert index.lookup("066570", "a") == []
+        assert [a["title"] for a in index.lookup("035420", "a")] == ["네이버 실적"]
+
+        # 재시도 간격 전에는 다시 로드하지 않음
+        index.index_articles("b", [_article("LG전자 신제품")])
+        assert loader.call_count == 1
+
+        # 재시도 간격 경과 후 DB 사전으로 재구성
+        index._matcher_expires_at -= 61
+        index.index_articles("c", [_article("LG전자 신제품")])
+        assert loader.call_count == 2
+        assert [a["title"] for a in index.lookup("066570", "c")] == ["LG전자 신제품"]
+
+    def test_empty_alias_load_not_cached_for_full_ttl(self):
+        loader = Mock(side_effect=[{}, ALIASES])
+        index = ArticleIndex(alias_loader=loader, alias_ttl=3600, alias_retry_ttl=60)
+
+        index.index_articles("a", [_article("LG전자 신제품")])
+        index._matcher_expires_at -= 61
+        index.index_articles("b", [_article("LG전자 신제품")])
+
+        assert loader.call_count == 2
+        assert index.lookup("066570", "b")
+
+
+class TestCollectorsUseIndex:
+    """수집기 종목별 조회가 공유 색인을 사용하는지 테스트"""
+
+    def test_yonhap_fetches_feed_once_for_many_tickers(self, index):
+        collector = YonhapCollector(article_index=index)
+        collector.fetch_all_news = Mock(return_value=[
+            _article("삼성전자, 실적 호조"),
+            _article("LG전자, 신제품 출시"),
+            _article("SK하이닉스 HBM 증설"),
+        ])
+
+        samsung = collector.fetch_ticker_news("005930")
+        hynix = collector.fetch_ticker_news("000660")
+        unknown = collector.fetch_ticker_news("999999")
+
+        collector.fetch_all_news.assert_called_once()
+        assert [a["title"] for a in samsung] == ["삼성전자, 실적 호조"]
+        assert [a["title"] for a in hynix] == ["SK하이닉스 HBM 증설"]
+        assert unknown == []
+
+    def test_etf_lookup_by_product_alias(self, index):
+        collector = ETFNewsCollector(article_index=index)
+        collector.fetch_etf_news = Mock(return_value=[
+            _article("TIGER 카카오그룹 ETF 순자산 증가"),
+            _article("KODEX 200 거래량 1위"),
+        ])
+
+        articles = collector.fetch_etf_by_ticker("035720")
+        collector.fetch_etf_by_ticker("005930")
+
+        collector.fetch_etf_news.assert_called_once()
+        assert [a["title"] for a in articles] == ["TIGER 카카오그룹 ETF 순자산 증가"]
@@ -0,0 +1,242 @@
+"""
+AsyncNewsCrawler 단위 테스트
+
+로컬 HTTP fixture 서버로 다음을 검증합니다.
+- lxml 기사 추출
+- URL / 본문 해시 중복 제거
+- ETag 조건부 GET (304)
+- 호스트별 동시성 제한 / 요청 간격
+"""
+
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.collectors.async_crawler import AsyncNewsCrawler, DedupStore, extract_article
+from src.collectors.news_collector import NewsCollector
+
+
+ARTICLE_HTML = """
+<html><head>
+<meta property="og:title" content="OG 제목">
+<meta property="article:published_time" content="{published}">
+</head><body>
+<h2 id="title_area">{title}</h2>
+<span class="media_end_head_top_link_text">테스트언론</span>
+<div id="newsct_article">
+  <p>{body}</p>
+  <script>var x = 1;</script>
+  <div class="ad">광고</div>
+  <p>둘째 문단</p>
+</div>
+</body></html>
+"""
+
+
+def _article_html(title, body="본문 내용"):
+    return ARTICLE_HTML.format(
+        title=title,
+        body=body,
+        published=datetime.now().replace(microsecond=0).isoformat() + "+09:00",
+    )
+
+
+PAGES = {
+    "/a1": _article_html("첫 번째 기사"),
+    "/a2": _article_html("두 번째 기사"),
+    # /a1과 같은 본문을 다른 URL로 배포
+    "/a1-copy": _article_html("첫 번째 기사"),
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server_version = "Fixture/1.0"
+
+    def do_GET(self):
+        state = self.server.state
+        with state["lock"]:
+            state["requests"].append((self.path, dict(self.headers)))
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+
+        try:
+            time.sleep(state["latency"])
+
+            if self.path == "/listing":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = "<html><body>목록</body></html>".encode("utf-8")
+                self.send_response(200)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            page = PAGES.get(self.path.split("?")[0])
+            if page is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            body = page.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with state["lock"]:
+                state["active"] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    httpd.state = {
+        "lock": threading.Lock(),
+        "requests": [],
+        "active": 0,
+        "max_active": 0,
+        "latency": 0.0,
+    }
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield base_url, httpd.state
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _paths(state):
+    return [path for path, _ in state["requests"]]
+
+
+class TestExtractArticle:
+    """extract_article 테스트"""
+
+    def test_extracts_fields_and_strips_noise(self):
+        article = extract_article(_article_html("제목", body="첫 문단"), "http://x/1")
+
+        assert article["title"] == "제목"
+        assert article["source"] == "테스트언론"
+        assert article["content"] == "첫 문단\n둘째 문단"
+        assert datetime.fromisoformat(article["published_at"]).tzinfo is None
+
+    def test_empty_html(self):
+        assert extract_article("", "http://x/1") is None
+
+
+class TestAsyncNewsCrawler:
+    """AsyncNewsCrawler 테스트"""
+
+    async def test_fetch_articles_dedups_url_and_content(self, server):
+        base_url, state = server
+        urls = [f"{base_url}/a1", f"{base_url}/a2", f"{base_url}/a1-copy", f"{base_url}/a1"]
+
+        async with AsyncNewsCrawler(politeness_delay=0) as crawler:
+            articles = await crawler.fetch_articles(urls)
+
+            assert [a["title"] for a in articles] == ["첫 번째 기사", "두 번째 기사"]
+            assert sorted(_paths(state)) == ["/a1", "/a1-copy", "/a2"]
+
+            # 두 번째 호출은 요청 없이 저장된 결과 사용
+            again = await crawler.fetch_articles(urls)
+
+        assert again == articles
+        assert len(state["requests"]) == 3
+
+    async def test_missing_page_not_cached(self, server):
+        base_url, state = server
+
+        async with AsyncNewsCrawler(politeness_delay=0) as crawler:
+            assert await crawler.fetch_articles([f"{base_url}/missing"]) == []
+            await crawler.fetch_articles([f"{base_url}/missing"])
+
+        assert _paths(state) == ["/missing", "/missing"]
+
+    async def test_conditional_get_reuses_body(self, server):
+        base_url, state = server
+
+        async with AsyncNewsCrawler(politeness_delay=0) as crawler:
+            first = await crawler.fetch(f"{base_url}/listing", revalidate=True)
+            second = await crawler.fetch(f"{base_url}/listing", revalidate=True)
+
+        assert first.status == 200 and not first.not_modified
+        assert second.status == 304 and second.not_modified
+        assert second.text == first.text
+        assert state["requests"][1][1].get("If-None-Match") == '"v1"'
+
+    async def test_per_host_concurrency_limit(self, server):
+        base_url, state = server
+        state["latency"] = 0.05
+        urls = [f"{base_url}/a2?n={i}" for i in range(6)]
+
+        async with AsyncNewsCrawler(per_host_concurrency=2, politeness_delay=0) as crawler:
+            await crawler.fetch_articles(urls)
+
+        assert len(state["requests"]) == 6
+        assert state["max_active"] == 2
+
+    async def test_politeness_delay(self, server):
+        base_url, state = server
+        urls = [f"{base_url}/a2?n={i}" for i in range(3)]
+
+        async with AsyncNewsCrawler(per_host_concurrency=3, politeness_delay=0.05) as crawler:
+            started = time.monotonic()
+            await crawler.fetch_articles(urls)
+            elapsed = time.monotonic() - started
+
+        # 동시 3건 허용이어도 요청 시작은 0.05초 간격
+        assert elapsed >= 0.1
+        assert len(state["requests"]) == 3
+
+    async def test_shared_dedup_store(self, server):
+        base_url, state = server
+        store = DedupStore()
+
+        async with AsyncNewsCrawler(dedup=store, politeness_delay=0) as crawler:
+            await crawler.fetch_articles([f"{base_url}/a1"])
+        async with AsyncNewsCrawler(dedup=store, politeness_delay=0) as crawler:
+            articles = await crawler.fetch_articles([f"{base_url}/a1"])
+
+        assert len(articles) == 1
+        assert _paths(state) == ["/a1"]
+
+
+class TestNewsCollectorAsync:
+    """NewsCollector.fetch_stock_news_async 테스트"""
+
+    async def test_elw_search_then_concurrent_details(self):
+        article_url = "https://n.news.naver.com/mnews/article/001/0001234567"
+        search_html = f'<html><body><a href="{article_url}">기사</a></body></html>'
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            if request.url.host == "search.naver.com":
+                return httpx.Response(200, text=search_html)
+            return httpx.Response(200, text=_article_html("ELW 관련 기사 제목"))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        crawler = AsyncNewsCrawler(client=client, politeness_delay=0)
+
+        articles = await NewsCollector().fetch_stock_news_async("0001A0", crawler=crawler)
+        await client.aclose()
+
+        assert [a.title for a in articles] == ["ELW 관련 기사 제목"]
+        assert articles[0].url == article_url
+        assert articles[0].ticker == "0001A0"
+        assert len(requested) == 2
@@ -0,0 +1,204 @@
+"""
+Test Suite: Event Dispatcher
+핸들러별 큐/워커 분리 실행, 순서 보장, 지표 테스트
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from services.event_bus.dispatcher import HandlerDispatcher
+from services.event_bus.event_bus import Event, EventBus
+
+
+def _event(i, ticker="005930"):
+    return Event(
+        event_type="price.updated",
+        data={"i": i, "ticker": ticker},
+        timestamp="2024-01-01T00:00:00",
+        source="test",
+    )
+
+
+def _message(channel, event):
+    return {"type": "message", "channel": channel, "data": event.to_json()}
+
+
+class TestEventBusDispatch:
+    """EventBus 디스패치 테스트"""
+
+    async def test_slow_handler_does_not_stall_others(self):
+        bus = EventBus()
+        fast_seen = []
+        total = 20000
+        fast_done = asyncio.Event()
+
+        async def slow_handler(event):
+            await asyncio.sleep(0.05)
+
+        async def fast_handler(event):
+            fast_seen.append(event.data["i"])
+            if len(fast_seen) == total:
+                fast_done.set()
+
+        await bus.subscribe("prices", slow_handler, queue_size=100)
+        await bus.subscribe("prices", fast_handler, queue_size=50000)
+
+        messages = [_message("prices", _event(i)) for i in range(total)]
+
+        started = time.perf_counter()
+        for i, message in enumerate(messages):
+            await bus._handle_message(message)
+            if i % 500 == 0:
+                # 실제 리스너는 소켓 읽기에서 양보
+                await asyncio.sleep(0)
+        listen_rate = total / (time.perf_counter() - started)
+
+        await asyncio.wait_for(fast_done.wait(), timeout=5)
+
+        stats = bus.get_handler_stats()
+        await bus.disconnect()
+
+        assert listen_rate > 10000
+        assert fast_seen == list(range(total))
+        slow = next(v for k, v in stats.items() if k.endswith("slow_handler"))
+        assert slow["enqueued"] == total
+        assert slow["dropped"] > 0
+        assert slow["queue_depth"] <= 100
+
+    async def test_sync_handler_runs_off_loop(self):
+        bus = EventBus()
+        threads = []
+
+        def sync_handler(event):
+            threads.append(threading.current_thread().name)
+
+        await bus.subscribe("signals", sync_handler)
+        await bus._handle_message(_message("signals", _event(1)))
+        await bus.drain()
+        await bus.disconnect()
+
+        assert threads and threads[0].startswith("event-handler")
+
+    async def test_sync_handler_after_reconnect(self, monkeypatch):
+        import services.event_bus.event_bus as event_bus_module
+
+        def make_client():
+            client = Mock(close=AsyncMock())
+            client.pubsub.return_value = Mock(close=AsyncMock())
+            return client
+
+        monkeypatch.setattr(
+            event_bus_module.redis, "from_url", AsyncMock(side_effect=lambda *a, **k: make_client())
+        )
+        bus = EventBus()
+        seen = []
+
+        await bus.subscribe("signals", lambda event: seen.append(event.data["i"]))
+        await bus.connect()
+        await bus._handle_message(_message("signals", _event(1)))
+        await bus.drain()
+        await bus.disconnect()
+
+        # disconnect에서 종료된 executor를 재연결 후 다시 쓰지 않아야 함
+        await bus.connect()
+        await bus._handle_message(_message("signals", _event(2)))
+        await bus.drain()
+        stats = next(iter(bus.get_handler_stats().values()))
+        await bus.disconnect()
+
+        assert seen == [1, 2]
+        assert stats["failed"] == 0
+
+    async def test_handler_failure_is_counted(self):
+        bus = EventBus()
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        await bus.subscribe("signals", broken)
+        await bus._handle_message(_message("signals", _event(1)))
+        await bus.drain()
+        stats = next(iter(bus.get_handler_stats().values()))
+        await bus.disconnect()
+
+        assert stats["failed"] == 1
+        assert stats["processed"] == 0
+
+
+class TestHandlerDispatcher:
+    """HandlerDispatcher 테스트"""
+
+    async def test_per_key_ordering_with_concurrency(self):
+        seen = {}
+        active = 0
+        max_active = 0
+
+        async def handler(event):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.001)
+            seen.setdefault(event.data["ticker"], []).append(event.data["i"])
+            active -= 1
+
+        dispatcher = HandlerDispatcher(
+            handler, concurrency=4, ordering="key", key=lambda e: e.data["ticker"]
+        )
+        tickers = ["005930", "000660", "035420", "035720", "005380", "051910"]
+        for i in range(60):
+            dispatcher.submit("prices", _event(i, ticker=tickers[i % len(tickers)]))
+
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        assert max_active > 1
+        for order in seen.values():
+            assert order == sorted(order)
+        assert dispatcher.stats.processed == 60
+
+    async def test_unordered_shared_queue(self):
+        active = 0
+        max_active = 0
+
+        async def handler(event):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        dispatcher = HandlerDispatcher(handler, concurrency=3, ordering="none")
+        for i in range(9):
+            dispatcher.submit("prices", _event(i))
+
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        assert max_active == 3
+
+    async def test_drop_new_policy_and_lag(self):
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+
+        dispatcher = HandlerDispatcher(handler, queue_size=2, overflow="drop_new")
+        results = [dispatcher.submit("c", _event(i)) for i in range(5)]
+        await asyncio.sleep(0.02)
+        release.set()
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        assert results == [True, True, False, False, False]
+        assert dispatcher.stats.dropped == 3
+        assert dispatcher.stats.max_lag > 0
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            HandlerDispatcher(lambda e: None, ordering="key")
+        with pytest.raises(ValueError):
+            HandlerDispatcher(lambda e: None, ordering="random")
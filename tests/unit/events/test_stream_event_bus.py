@@ -0,0 +1,441 @@
+"""
+Test Suite: Stream Event Bus
+Redis Streams 전송 (컨슈머 그룹, 배치 ACK, pending 재처리, 보관 개수 제한, 코덱) 테스트
+
+기본은 아래 FakeStreamRedis로 실행하고, fakeredis가 설치되어 있거나
+TEST_REDIS_URL이 설정되어 있으면 같은 테스트를 해당 백엔드로도 실행합니다.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from redis.exceptions import ResponseError
+
+from services.event_bus.codec import BinaryCodec, JsonCodec, get_codec
+from services.event_bus.event_bus import Event, create_signal_event
+from services.event_bus.streams import DEAD_LETTER_SUFFIX, StreamEventBus
+
+
+def _b(value):
+    return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+
+def _id_key(entry_id):
+    ms, seq = _b(entry_id).decode().split("-")
+    return int(ms), int(seq)
+
+
+class FakeStreamRedis:
+    """스트림 명령만 구현한 redis.asyncio 대역 (decode_responses=False 응답 형식)"""
+
+    def __init__(self):
+        self.streams = {}
+        self.groups = {}
+        self.round_trips = 0
+        self._last_id = (0, 0)
+
+    def _next_id(self):
+        ms = int(time.time() * 1000)
+        seq = self._last_id[1] + 1 if ms <= self._last_id[0] else 0
+        self._last_id = (max(ms, self._last_id[0]), seq)
+        return f"{self._last_id[0]}-{seq}".encode()
+
+    # --- 명령 구현 (동기) ---
+    def _xadd(self, name, fields, id="*", maxlen=None, approximate=True):
+        entries = self.streams.setdefault(_b(name), [])
+        entry_id = self._next_id()
+        entries.append((entry_id, {_b(k): _b(v) for k, v in fields.items()}))
+        if maxlen is not None and len(entries) > maxlen:
+            del entries[:len(entries) - maxlen]
+        return entry_id
+
+    def _xack(self, name, groupname, *ids):
+        pending = self.groups[(_b(name), _b(groupname))]["pending"]
+        return sum(1 for entry_id in ids if pending.pop(_b(entry_id), None) is not None)
+
+    def _entry(self, name, entry_id):
+        for eid, fields in self.streams.get(_b(name), []):
+            if eid == entry_id:
+                return fields
+        return None
+
+    # --- 단일 명령 ---
+    async def xadd(self, name, fields, **kwargs):
+        self.round_trips += 1
+        return self._xadd(name, fields, **kwargs)
+
+    async def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        self.round_trips += 1
+        key = (_b(name), _b(groupname))
+        if key in self.groups:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        entries = self.streams.setdefault(_b(name), [])
+        last = entries[-1][0] if (id == "$" and entries) else b"0-0"
+        self.groups[key] = {"last": last, "pending": {}}
+        return True
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        self.round_trips += 1
+        response = []
+        for name in streams:
+            group = self.groups[(_b(name), _b(groupname))]
+            new = [
+                (eid, fields) for eid, fields in self.streams.get(_b(name), [])
+                if _id_key(eid) > _id_key(group["last"])
+            ][:count]
+            if not new:
+                continue
+            group["last"] = new[-1][0]
+            now = time.monotonic()
+            for eid, _ in new:
+                group["pending"][eid] = [_b(consumername), now, 1]
+            response.append([_b(name), new])
+        if not response and block:
+            await asyncio.sleep(min(block, 10) / 1000)
+        return response
+
+    async def xack(self, name, groupname, *ids):
+        self.round_trips += 1
+        return self._xack(name, groupname, *ids)
+
+    async def xpending_range(self, name, groupname, min, max, count, consumername=None, idle=None):
+        self.round_trips += 1
+        now = time.monotonic()
+        result = []
+        pending = self.groups[(_b(name), _b(groupname))]["pending"]
+        for eid in sorted(pending, key=_id_key):
+            consumer, delivered_at, times = pending[eid]
+            idle_ms = int((now - delivered_at) * 1000)
+            if idle is not None and idle_ms < idle:
+                continue
+            result.append({
+                "message_id": eid,
+                "consumer": consumer,
+                "time_since_delivered": idle_ms,
+                "times_delivered": times,
+            })
+        return result[:count]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids):
+        self.round_trips += 1
+        now = time.monotonic()
+        pending = self.groups[(_b(name), _b(groupname))]["pending"]
+        claimed = []
+        for eid in message_ids:
+            eid = _b(eid)
+            entry = pending.get(eid)
+            if entry is None or (now - entry[1]) * 1000 < min_idle_time:
+                continue
+            pending[eid] = [_b(consumername), now, entry[2] + 1]
+            claimed.append((eid, self._entry(name, eid)))
+        return claimed
+
+    async def xdel(self, name, *ids):
+        self.round_trips += 1
+        entries = self.streams.get(_b(name), [])
+        before = len(entries)
+        entries[:] = [(eid, fields) for eid, fields in entries if eid not in {_b(i) for i in ids}]
+        return before - len(entries)
+
+    async def xlen(self, name):
+        self.round_trips += 1
+        return len(self.streams.get(_b(name), []))
+
+    async def close(self):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def xadd(self, *args, **kwargs):
+        self.ops.append((self.redis._xadd, args, kwargs))
+
+    def xack(self, *args, **kwargs):
+        self.ops.append((self.redis._xack, args, kwargs))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [op(*args, **kwargs) for op, args, kwargs in self.ops]
+
+
+def _make_client(backend):
+    if backend == "fake":
+        return FakeStreamRedis()
+    if backend == "fakeredis":
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis()
+    url = os.getenv("TEST_REDIS_URL")
+    if not url:
+        pytest.skip("TEST_REDIS_URL not set")
+    import redis.asyncio as aioredis
+    return aioredis.from_url(url)
+
+
+@pytest.fixture(params=["fake", "fakeredis", "redis"])
+def client(request):
+    return _make_client(request.param)
+
+
+@pytest.fixture
+def make_bus(client):
+    prefix = f"test:events:{uuid.uuid4().hex[:8]}:"
+    buses = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("consumer", f"c{len(buses)}")
+        kwargs.setdefault("block_ms", 10)
+        bus = StreamEventBus(client=client, stream_prefix=prefix, group_start_id="0", **kwargs)
+        buses.append(bus)
+        return bus
+
+    yield factory
+
+    for bus in buses:
+        if bus._executor:
+            bus._executor.shutdown(wait=False)
+
+
+def _event(i, ticker="005930"):
+    return Event(
+        event_type="price.updated",
+        data={"i": i, "ticker": ticker},
+        timestamp="2024-01-01T00:00:00",
+        source="test",
+    )
+
+
+class TestEventCodec:
+    """이벤트 코덱 테스트"""
+
+    @pytest.mark.parametrize("codec", [JsonCodec(), BinaryCodec()])
+    def test_round_trip(self, codec):
+        event = _event(1)
+        assert codec.decode(codec.encode(event)) == event
+
+    def test_binary_smaller_than_json(self):
+        event = Event(
+            event_type="prices.snapshot",
+            data={"prices": [{"ticker": f"{i:06d}", "close": 70000 + i} for i in range(200)]},
+            timestamp="2024-01-01T09:00:00",
+            source="collector",
+        )
+
+        binary = BinaryCodec().encode(event)
+
+        assert len(binary) < len(event.to_json().encode("utf-8")) // 3
+        assert BinaryCodec().decode(binary) == event
+
+    def test_subclass_fields_merged_into_data(self):
+        event = create_signal_event("005930", "vcp", 85, "A")
+
+        decoded = BinaryCodec().decode(BinaryCodec().encode(event))
+
+        assert type(decoded) is Event
+        assert decoded.data["score"] == 85
+        assert decoded.data["grade"] == "A"
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            get_codec("msgpack")
+
+
+class TestStreamEventBus:
+    """StreamEventBus 테스트"""
+
+    async def test_events_published_before_consume_are_delivered(self, make_bus):
+        publisher = make_bus()
+        consumer = make_bus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event.data["i"])
+
+        await consumer.subscribe("prices", handler)
+        await consumer.ensure_groups()
+        # 컨슈머가 내려가 있는 동안 발행
+        await publisher.publish_many([("prices", _event(i)) for i in range(5)])
+
+        acked = await consumer.read_batch()
+
+        assert acked == 5
+        assert seen == [0, 1, 2, 3, 4]
+        assert consumer.get_stats()["prices"]["acked"] == 5
+
+    async def test_publish_many_single_round_trip(self, make_bus, client):
+        if not isinstance(client, FakeStreamRedis):
+            pytest.skip("round trip counting needs the fake client")
+        bus = make_bus()
+
+        ids = await bus.publish_many([("prices", _event(i)) for i in range(50)])
+
+        assert len(ids) == 50
+        assert client.round_trips == 1
+
+    async def test_maxlen_bounds_stream(self, make_bus, client):
+        bus = make_bus(maxlen=10)
+
+        await bus.publish_many([("prices", _event(i)) for i in range(300)])
+
+        # MAXLEN ~ 는 노드(기본 100개) 단위 근사 트리밍이므로 maxlen보다 조금 더 남을 수 있음
+        assert await client.xlen(bus.stream_key("prices")) <= 100
+
+    async def test_group_shares_entries_between_consumers(self, make_bus):
+        publisher = make_bus()
+        first, second = make_bus(batch_size=3), make_bus(batch_size=3)
+        seen = {"first": [], "second": []}
+
+        async def on_first(event):
+            seen["first"].append(event.data["i"])
+
+        async def on_second(event):
+            seen["second"].append(event.data["i"])
+
+        await first.subscribe("prices", on_first)
+        await second.subscribe("prices", on_second)
+        await first.ensure_groups()
+        await publisher.publish_many([("prices", _event(i)) for i in range(6)])
+
+        await first.read_batch()
+        await second.read_batch()
+
+        assert seen["first"] == [0, 1, 2]
+        assert seen["second"] == [3, 4, 5]
+
+    async def test_failed_entry_reclaimed_after_crash(self, make_bus):
+        publisher = make_bus()
+        crashed = make_bus(claim_idle_ms=20)
+        survivor = make_bus(claim_idle_ms=20)
+        seen = []
+
+        async def broken(event):
+            raise RuntimeError("consumer crashed")
+
+        async def handler(event):
+            seen.append(event.data["i"])
+
+        await crashed.subscribe("prices", broken)
+        await survivor.subscribe("prices", handler)
+        await crashed.ensure_groups()
+        await publisher.publish("prices", _event(7))
+
+        assert await crashed.read_batch() == 0
+        assert await survivor.reclaim_pending() == 0  # 아직 유휴 시간 전
+        await asyncio.sleep(0.05)
+        acked = await survivor.reclaim_pending()
+
+        assert acked == 1
+        assert seen == [7]
+        assert survivor.get_stats()["prices"]["reclaimed"] == 1
+        assert await survivor.reclaim_pending() == 0
+
+    async def test_poison_entry_dead_lettered(self, make_bus, client):
+        publisher = make_bus()
+        bus = make_bus(claim_idle_ms=0, max_deliveries=2)
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        await bus.subscribe("prices", broken)
+        await bus.ensure_groups()
+        await publisher.publish("prices", _event(1))
+
+        await bus.read_batch()          # 1회차 전달
+        await asyncio.sleep(0.005)
+        await bus.reclaim_pending()     # 2회차 전달
+        await asyncio.sleep(0.005)
+        await bus.reclaim_pending()     # 최대 횟수 도달 → dead-letter
+
+        stats = bus.get_stats()["prices"]
+        dead_stream = f"{bus.stream_key('prices')}{DEAD_LETTER_SUFFIX}"
+        assert stats["failed"] == 2
+        assert stats["dead_lettered"] == 1
+        assert await client.xlen(dead_stream) == 1
+        assert await bus.reclaim_pending() == 0
+
+    async def test_trimmed_pending_entry_acked(self, make_bus, client):
+        publisher = make_bus()
+        crashed = make_bus(claim_idle_ms=0)
+        survivor = make_bus(claim_idle_ms=0)
+        seen = []
+
+        async def broken(event):
+            raise RuntimeError("consumer crashed")
+
+        async def handler(event):
+            seen.append(event.data["i"])
+
+        await crashed.subscribe("prices", broken)
+        await survivor.subscribe("prices", handler)
+        await crashed.ensure_groups()
+        entry_id = await publisher.publish("prices", _event(1))
+        await crashed.read_batch()
+
+        # 재처리 전에 본문이 잘려 나감 (maxlen 트리밍)
+        stream = survivor.stream_key("prices")
+        await client.xdel(stream, entry_id)
+        await asyncio.sleep(0.005)
+
+        assert await survivor.reclaim_pending() == 0
+        assert seen == []
+        assert await client.xpending_range(stream, survivor.group, min="-", max="+", count=10) == []
+
+    async def test_binary_codec_and_sync_handler(self, make_bus):
+        publisher = make_bus(codec="binary")
+        consumer = make_bus()
+        seen = []
+
+        def sync_handler(event):
+            seen.append((event.data["ticker"], event.data["grade"]))
+
+        await consumer.subscribe("signals", sync_handler)
+        await consumer.ensure_groups()
+        await publisher.publish("signals", create_signal_event("005930", "vcp", 85, "A"))
+
+        assert await consumer.read_batch() == 1
+        assert seen == [("005930", "A")]
+
+    async def test_concurrent_entries_within_batch(self, make_bus):
+        publisher = make_bus()
+        consumer = make_bus()
+        active = 0
+        max_active = 0
+
+        async def handler(event):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await consumer.subscribe("prices", handler, concurrency=4)
+        await consumer.ensure_groups()
+        await publisher.publish_many([("prices", _event(i)) for i in range(8)])
+
+        assert await consumer.read_batch() == 8
+        assert max_active == 4
+
+    async def test_start_and_stop_listening(self, make_bus):
+        publisher = make_bus()
+        consumer = make_bus()
+        received = asyncio.Event()
+
+        async def handler(event):
+            received.set()
+
+        await consumer.subscribe("prices", handler)
+        task = asyncio.create_task(consumer.start_listening())
+        await asyncio.sleep(0.02)
+        await publisher.publish("prices", _event(1))
+
+        await asyncio.wait_for(received.wait(), timeout=2)
+        await consumer.stop_listening()
+        await asyncio.wait_for(task, timeout=2)
@@ -2,6 +2,9 @@
 헬스체커 테스트
 """
 
+import asyncio
+import time
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
@@ -286,3 +289,134 @@ class TestGlobalFunctions:
         with patch("src.health.health_checker._health_checker", None):
             checker = get_health_checker()
             assert checker is None
+
+
+class TestConcurrentChecks:
+    """동시 실행 / 마감 시간 / 캐시 테스트"""
+
+    @pytest.fixture
+    def checker(self):
+        checker = HealthChecker(start_time=1000.0, timeout=0.5, cache_ttl=0.05)
+        self.calls = 0
+
+        def make_check(name, delay):
+            async def check(*args):
+                self.calls += 1
+                await asyncio.sleep(delay)
+                return ServiceHealth(name=name, status=HealthStatus.HEALTHY)
+            return check
+
+        checker._check_database = make_check("database", 0.1)
+        checker._check_redis = make_check("redis", 0.1)
+        checker._check_api_gateway = make_check("api_gateway", 0.1)
+        checker.register_checker("custom", make_check("custom", 0.1))
+        return checker
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self, checker):
+        started = time.perf_counter()
+        health = await checker.check_all()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.3
+        assert list(health.services) == ["database", "redis", "api_gateway", "custom"]
+        assert health.status == HealthStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_overall_deadline(self, checker):
+        async def hanging():
+            await asyncio.sleep(10)
+
+        checker.register_checker("hanging", hanging)
+
+        started = time.perf_counter()
+        health = await checker.check_all()
+
+        assert time.perf_counter() - started < 1.0
+        assert health.services["hanging"].status == HealthStatus.UNHEALTHY
+        assert "timed out" in health.services["hanging"].message
+        assert health.services["database"].status == HealthStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_system_health_cached_and_shared(self, checker):
+        results = await asyncio.gather(*(checker.system_health() for _ in range(20)))
+
+        assert all(result is results[0] for result in results)
+        assert self.calls == 4
+
+        await checker.system_health()
+        assert self.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_stale_system_health_refreshes_in_background(self, checker):
+        first = await checker.system_health()
+        await asyncio.sleep(0.06)
+
+        started = time.perf_counter()
+        stale = await checker.system_health()
+
+        assert stale is first
+        assert time.perf_counter() - started < 0.05
+        await asyncio.sleep(0.15)
+        assert await checker.system_health() is not first
+        assert self.calls == 8
+
+    @pytest.mark.asyncio
+    async def test_readiness_checks_core_dependencies_only(self, checker):
+        async def down(*args):
+            return ServiceHealth(name="vcp_scanner", status=HealthStatus.UNHEALTHY)
+
+        checker._check_http_service = down
+        checker.register_http_service("vcp_scanner", "http://vcp:5112")
+
+        health = await checker.readiness()
+
+        assert list(health.services) == ["database", "redis"]
+        assert health.status == HealthStatus.HEALTHY
+        assert self.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_logged(self, checker, caplog):
+        await checker.readiness()
+        await asyncio.sleep(0.06)
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        checker.check_core = broken
+        with caplog.at_level("WARNING", logger="src.health.health_checker"):
+            await checker.readiness()
+            await asyncio.sleep(0.01)
+
+        assert "헬스체크 캐시 갱신 실패 (readiness): boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_registered_http_service_included(self, checker):
+        async def fake_http(name, base_url, health_path):
+            return ServiceHealth(name=name, status=HealthStatus.DEGRADED, message=base_url)
+
+        checker._check_http_service = fake_http
+        checker.register_http_service("vcp_scanner", "http://vcp:5112")
+
+        health = await checker.check_all()
+
+        assert health.services["vcp_scanner"].message == "http://vcp:5112"
+        assert health.status == HealthStatus.DEGRADED
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused(self):
+        checker = HealthChecker(start_time=1000.0, timeout=2.0)
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_client = AsyncMock()
+            mock_client.get.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            for _ in range(3):
+                await checker._check_http_service("svc", "http://localhost:5111")
+            await checker.close()
+
+        assert mock_client_class.call_count == 1
+        assert mock_client.get.await_count == 3
+        mock_client.aclose.assert_awaited_once()
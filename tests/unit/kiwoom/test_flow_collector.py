@@ -0,0 +1,298 @@
+"""
+기관/외국인 수급 수집기 단위 테스트
+
+InstitutionalFlowCollector의 gap 감지, 일괄 조회(ka10058), 종목별 페이싱 조회(ka10060),
+파생 컬럼 재계산, 다중 행 UPSERT 동작을 in-memory SQLite로 검증합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.kiwoom.flow_collector import (
+    InstitutionalFlowCollector,
+    derive_flow_metrics,
+    latest_completed_session,
+    latest_weekday,
+    normalize_ticker,
+    parse_signed_number,
+    previous_weekday,
+    upsert_institutional_flows,
+)
+from src.utils.rate_limiter import AsyncTokenBucket
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+TARGET = latest_weekday()
+PREV = previous_weekday(TARGET)
+BASE_DATE = TARGET.strftime("%Y%m%d")
+
+
+@pytest.fixture
+def db_session():
+    from src.database.session import Base
+    from src.database.models import InstitutionalFlow
+
+    # 수집기가 DB 작업을 워커 스레드에서 실행하므로 스레드 간 단일 연결 공유
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    # 000001: 최신 보유, 000002/000003: 전일까지 보유, 000004: 10일 전까지 보유
+    session.add(InstitutionalFlow(ticker="000001", date=TARGET, foreign_net_buy=1, inst_net_buy=1))
+    session.add(InstitutionalFlow(ticker="000002", date=PREV, foreign_net_buy=1, inst_net_buy=1))
+    session.add(InstitutionalFlow(ticker="000003", date=PREV, foreign_net_buy=1, inst_net_buy=1))
+    session.add(InstitutionalFlow(ticker="000004", date=TARGET - timedelta(days=10)))
+    session.commit()
+
+    yield session
+
+    session.close()
+
+
+class FakeKiwoomAPI:
+    """일괄/종목별 수급 조회 대역"""
+
+    def __init__(self, ranking=None, ranking_fails=False, pages=1):
+        # ranking: {(investor, trade_type): [(ticker, amount), ...]}
+        self.ranking = ranking or {}
+        self.ranking_fails = ranking_fails
+        self.pages = pages
+        self.ranking_calls = []
+        self.chart_calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_investor_daily_trade_stocks(
+        self, start_date, end_date, investor_type, market_type="001", trade_type="2",
+        exchange_type="3", cont_yn="N", next_key="",
+    ):
+        self.ranking_calls.append((investor_type, market_type, trade_type, next_key))
+        if self.ranking_fails:
+            return None
+        items = self.ranking.get((investor_type, trade_type), []) if market_type == "001" else []
+        page = int(next_key or 0)
+        more = page + 1 < self.pages
+        return {
+            "data": [{"stk_cd": f"A{t}", "netslmt_qty": str(v)} for t, v in items] if page == 0 else [],
+            "cont_yn": "Y" if more else "N",
+            "next_key": str(page + 1) if more else "",
+        }
+
+    async def get_investor_chart(self, ticker, date, amt_qty_tp="1", unit_tp="1000"):
+        assert (amt_qty_tp, unit_tp) == ("2", "1"), "수량(단주)으로 조회해야 함"
+        self.chart_calls.append(ticker)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {
+            "ticker": ticker,
+            "date": date,
+            "data": [
+                {
+                    "dt": (TARGET - timedelta(days=i)).strftime("%Y%m%d"),
+                    "frgnr_invsr": "+100",
+                    "orgn": "-20",
+                }
+                for i in range(30)
+            ],
+        }
+
+
+def make_collector(api, **kwargs):
+    return InstitutionalFlowCollector(api, rate_limiter=AsyncTokenBucket(1000), **kwargs)
+
+
+def flow_count(db, ticker):
+    from src.database.models import InstitutionalFlow
+    return db.execute(
+        select(func.count()).select_from(InstitutionalFlow).where(InstitutionalFlow.ticker == ticker)
+    ).scalar()
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def test_parse_helpers():
+    assert parse_signed_number("+1,234") == 1234
+    assert parse_signed_number("-56") == -56
+    assert parse_signed_number(None) == 0
+    assert normalize_ticker("A005930") == "005930"
+    assert normalize_ticker("005930_AL") == "005930"
+
+
+def test_latest_completed_session():
+    # 2026-10-16 (금)
+    assert latest_completed_session(datetime(2026, 10, 16, 15, 0)) == datetime(2026, 10, 15).date()
+    assert latest_completed_session(datetime(2026, 10, 16, 18, 30)) == datetime(2026, 10, 16).date()
+    # 주말 / 월요일 장중 → 금요일
+    assert latest_completed_session(datetime(2026, 10, 18, 10, 0)) == datetime(2026, 10, 16).date()
+    assert latest_completed_session(datetime(2026, 10, 19, 10, 0)) == datetime(2026, 10, 16).date()
+    # aware 시각은 KST로 변환 (UTC 08:00 = KST 17:00, UTC 10:00 = KST 19:00)
+    assert latest_completed_session(datetime(2026, 10, 16, 8, 0, tzinfo=timezone.utc)) == datetime(2026, 10, 15).date()
+    assert latest_completed_session(datetime(2026, 10, 16, 10, 0, tzinfo=timezone.utc)) == datetime(2026, 10, 16).date()
+
+
+def test_derive_flow_metrics():
+    rows = [
+        {"foreign_net_buy": f, "inst_net_buy": i, "is_double_buy": f > 0 and i > 0}
+        for f, i in [(-10, 5), (20, 5), (30, -5), (40, 5), (50, 5), (60, 5)]
+    ]
+    derive_flow_metrics(rows)
+
+    last = rows[-1]
+    assert last["foreign_net_5d"] == 200
+    assert last["foreign_net_20d"] == last["foreign_net_60d"] == 190
+    assert last["foreign_consecutive_days"] == 5
+    assert last["inst_consecutive_days"] == 3
+    assert (last["foreign_trend"], last["inst_trend"]) == ("buying", "buying")
+    # 50 + 15 + 10 + 2*5 + 2*3 + 5
+    assert last["supply_demand_score"] == 96.0
+    assert last["supply_demand_stage"] == "accumulation"
+    assert rows[0]["supply_demand_stage"] == "neutral"
+
+
+def test_upsert_updates_existing_rows(db_session):
+    from src.database.models import InstitutionalFlow
+
+    upsert_institutional_flows(db_session, [
+        {"ticker": "000001", "date": TARGET, "foreign_net_buy": 7, "inst_net_buy": 3, "is_double_buy": True},
+    ])
+    db_session.commit()
+
+    row = db_session.execute(
+        select(InstitutionalFlow).where(InstitutionalFlow.ticker == "000001")
+    ).scalar_one()
+    assert (row.foreign_net_buy, row.inst_net_buy, row.is_double_buy) == (7, 3, True)
+
+
+# =============================================================================
+# Collector
+# =============================================================================
+
+class TestInstitutionalFlowCollector:
+
+    async def test_bulk_fills_daily_gap(self, db_session):
+        """기준일 하루만 빠진 종목은 일괄 조회로 채우고 종목별 조회하지 않음"""
+        api = FakeKiwoomAPI(ranking={
+            ("9000", "2"): [("000002", 500)],
+            ("9999", "1"): [("000002", 30), ("000003", 10)],
+        })
+        collector = make_collector(api)
+
+        result = await collector.collect(["000001", "000002", "000003"], db_session, base_date=BASE_DATE)
+
+        assert result.skipped == ["000001"]
+        assert result.bulk_tickers == 2
+        assert api.chart_calls == []
+
+        from src.database.models import InstitutionalFlow
+        rows = {
+            r.ticker: r for r in db_session.execute(
+                select(InstitutionalFlow).where(InstitutionalFlow.date == TARGET)
+            ).scalars()
+        }
+        assert (rows["000002"].foreign_net_buy, rows["000002"].inst_net_buy) == (500, -30)
+        # 일괄 목록에 없는 투자자 = 순매수 0
+        assert (rows["000003"].foreign_net_buy, rows["000003"].inst_net_buy) == (0, -10)
+        # 파생 컬럼은 저장된 전일 행과 합산해 계산
+        assert (rows["000002"].foreign_net_5d, rows["000002"].inst_net_5d) == (501, -29)
+        assert rows["000002"].foreign_consecutive_days == 2
+        assert rows["000003"].inst_trend == "selling"
+
+    async def test_empty_ranking_is_non_trading_day(self, db_session):
+        """휴장일/미확정으로 일괄 목록이 비면 0 수급 행을 만들지 않고 종목별 조회도 하지 않음"""
+        api = FakeKiwoomAPI()
+        collector = make_collector(api)
+
+        result = await collector.collect(["000002", "000003"], db_session, base_date=BASE_DATE)
+
+        assert result.collected == {}
+        assert sorted(result.skipped) == ["000002", "000003"]
+        assert api.chart_calls == []
+        assert flow_count(db_session, "000002") == 1
+
+    async def test_one_empty_investor_list_falls_back(self, db_session):
+        """한 투자자 목록만 비어 있으면 그 목록에 없는 종목은 종목별 조회"""
+        api = FakeKiwoomAPI(ranking={("9000", "2"): [("000002", 500)]})
+        collector = make_collector(api)
+
+        result = await collector.collect(["000002", "000003"], db_session, base_date=BASE_DATE)
+
+        assert result.bulk_tickers == 0
+        assert sorted(api.chart_calls) == ["000002", "000003"]
+
+    async def test_backfill_refreshes_later_derived_rows(self, db_session):
+        """과거 날짜를 채우면 이후 저장된 행의 합계도 같은 UPSERT로 갱신"""
+        from src.database.models import InstitutionalFlow
+
+        api = FakeKiwoomAPI()
+        collector = make_collector(api)
+        # 000004: 10일 전 행만 보유 → 그 이후 구간 수집
+        await collector.collect(["000004"], db_session, base_date=BASE_DATE)
+        stored = db_session.execute(
+            select(InstitutionalFlow).where(InstitutionalFlow.ticker == "000004")
+            .order_by(InstitutionalFlow.date.desc())
+        ).scalars().first()
+
+        assert stored.foreign_net_5d == 500
+        assert stored.inst_net_5d == -100
+        assert stored.foreign_trend == "buying"
+
+    async def test_multi_day_gap_uses_per_ticker_fetch(self, db_session):
+        """여러 날 누락된 종목은 종목별 조회로 누락 구간만 저장"""
+        api = FakeKiwoomAPI()
+        collector = make_collector(api)
+
+        result = await collector.collect(["000004"], db_session, base_date=BASE_DATE)
+
+        assert api.chart_calls == ["000004"]
+        # 대역은 달력일 기준 행을 반환 → (10일 전, 기준일] 10행
+        assert result.collected["000004"] == 10
+        assert flow_count(db_session, "000004") == 11
+
+    async def test_incomplete_ranking_falls_back(self, db_session):
+        """일괄 조회 실패 시 종목별 조회로 대체"""
+        api = FakeKiwoomAPI(ranking_fails=True)
+        collector = make_collector(api)
+
+        result = await collector.collect(["000002", "000003"], db_session, base_date=BASE_DATE)
+
+        assert result.bulk_tickers == 0
+        assert sorted(api.chart_calls) == ["000002", "000003"]
+        assert result.collected == {"000002": 1, "000003": 1}
+
+    async def test_ranking_pagination(self, db_session):
+        """연속조회를 끝까지 따라감"""
+        api = FakeKiwoomAPI(pages=3)
+        collector = make_collector(api)
+
+        await collector.collect(["000002"], db_session, base_date=BASE_DATE)
+
+        # 2 투자자 x 2 방향 x (코스피 3페이지 + 코스닥 3페이지)
+        assert len(api.ranking_calls) == 24
+
+    async def test_concurrency_and_new_ticker_lookback(self, db_session):
+        """이력 없는 종목은 days 구간 수집, 동시 조회 수 제한"""
+        api = FakeKiwoomAPI()
+        collector = make_collector(api, concurrency=2, batch_size=3)
+        tickers = [f"10000{i}" for i in range(6)]
+
+        result = await collector.collect(tickers, db_session, days=5, base_date=BASE_DATE, use_bulk=False)
+
+        assert api.max_active <= 2
+        assert set(result.collected) == set(tickers)
+        assert all(count == 5 for count in result.collected.values())
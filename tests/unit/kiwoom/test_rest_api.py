@@ -175,6 +175,44 @@ class TestStockPriceQuery:
             assert price.ticker == "005930"
             assert price.price == 72500
 
+    @pytest.mark.asyncio
+    async def test_get_current_prices_batch(self, config):
+        """다중 종목 현재가 일괄 조회 (ka10095) 테스트"""
+        from datetime import datetime, timezone
+
+        api = KiwoomRestAPI(config)
+        api._access_token = "test_token"
+        api._token_expires_at = (datetime.now(timezone.utc).timestamp() + 3600)
+
+        requests = []
+
+        async def mock_post(url, json=None, headers=None):
+            requests.append((url, json, headers))
+            codes = json["stk_cd"].split("|")
+            mock_resp = Mock()
+            mock_resp.json = Mock(return_value={
+                "return_code": 0,
+                "atn_stk_infr": [
+                    {"stk_cd": code, "cur_prc": "-72500", "pred_pre": "-500",
+                     "flu_rt": "-0.69", "trde_qty": "1234567", "buy_bid": "72400", "sel_bid": "72600"}
+                    for code in codes if code != "999999"
+                ],
+            })
+            mock_resp.raise_for_status = Mock()
+            return mock_resp
+
+        with patch('httpx.AsyncClient.post', side_effect=mock_post):
+            prices = await api.get_current_prices(["005930", "000660", "999999"], chunk_size=2)
+
+        assert len(requests) == 2
+        assert requests[0][2]["api-id"] == "ka10095"
+        assert requests[0][1] == {"stk_cd": "005930|000660"}
+        assert set(prices) == {"005930", "000660"}
+        assert prices["005930"].price == 72500
+        assert prices["005930"].change == -500
+        assert prices["005930"].change_rate == -0.69
+        assert prices["005930"].volume == 1234567
+
 
 class TestOrderPlacement:
     """주문 관련 테스트"""
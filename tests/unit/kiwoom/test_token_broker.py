@@ -0,0 +1,218 @@
+"""
+키움 토큰 브로커 테스트
+
+여러 프로세스는 같은 FakeRedis 서버를 공유하는 브로커 인스턴스로 흉내냅니다.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.kiwoom.base import KiwoomConfig
+from src.kiwoom.rest_api import KiwoomRestAPI
+from src.kiwoom.token_broker import KiwoomToken, KiwoomTokenBroker
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+APP_KEY = "test_app_key"
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_broker(server, **kwargs) -> KiwoomTokenBroker:
+    return KiwoomTokenBroker(client=fakeredis.FakeRedis(server=server), **kwargs)
+
+
+def make_issuer(prefix: str = "token", ttl: float = 3600, delay: float = 0.0):
+    """호출 횟수를 세는 발급 함수"""
+    calls = {"count": 0}
+
+    async def issuer():
+        calls["count"] += 1
+        if delay:
+            await asyncio.sleep(delay)
+        return KiwoomToken(f"{prefix}-{calls['count']}", time.time() + ttl)
+
+    issuer.calls = calls
+    return issuer
+
+
+class TestKiwoomToken:
+    """토큰 값 객체 테스트"""
+
+    def test_json_roundtrip(self):
+        token = KiwoomToken("abc", 1234.5)
+        assert KiwoomToken.from_json(token.to_json()) == token
+
+    def test_is_valid_with_margin(self):
+        token = KiwoomToken("abc", time.time() + 100)
+        assert token.is_valid()
+        assert not token.is_valid(margin=200)
+
+
+class TestTokenBroker:
+    """공유 캐시 / single-flight 테스트"""
+
+    async def test_cold_start_uses_shared_token(self, server):
+        """다른 프로세스가 발급한 유효 토큰이 있으면 발급하지 않음"""
+        first = make_broker(server)
+        issuer = make_issuer()
+        token = await first.get_token(APP_KEY, issuer)
+
+        cold = make_broker(server)
+        cold_issuer = make_issuer("other")
+        shared = await cold.get_token(APP_KEY, cold_issuer)
+
+        assert shared == token
+        assert cold_issuer.calls["count"] == 0
+        assert cold.stats["shared_hits"] == 1
+
+        # 이후 호출은 프로세스 캐시에서 처리
+        await cold.get_token(APP_KEY, cold_issuer)
+        assert cold.stats["local_hits"] == 1
+
+    async def test_concurrent_callers_issue_once(self, server):
+        """동시 요청은 한 번만 발급"""
+        brokers = [make_broker(server), make_broker(server)]
+        issuer = make_issuer(delay=0.05)
+
+        tokens = await asyncio.gather(
+            *[brokers[i % 2].get_token(APP_KEY, issuer) for i in range(10)]
+        )
+
+        assert issuer.calls["count"] == 1
+        assert len({t.access_token for t in tokens}) == 1
+
+    async def test_stale_token_forces_single_refresh(self, server):
+        """401로 거부된 토큰은 한 번만 재발급"""
+        broker = make_broker(server)
+        issuer = make_issuer()
+        old = await broker.get_token(APP_KEY, issuer)
+
+        tokens = await asyncio.gather(
+            *[broker.get_token(APP_KEY, issuer, stale_token=old.access_token) for _ in range(5)]
+        )
+
+        assert issuer.calls["count"] == 2
+        assert all(t.access_token == "token-2" for t in tokens)
+
+    async def test_proactive_refresh_before_expiry(self, server):
+        """만료 margin 이내면 미리 갱신"""
+        broker = make_broker(server, refresh_margin=600)
+        issuer = make_issuer(ttl=300)
+        await broker.get_token(APP_KEY, issuer)
+
+        await broker.get_token(APP_KEY, issuer)
+        assert issuer.calls["count"] == 2
+
+    async def test_lock_held_elsewhere_keeps_current_token(self, server):
+        """다른 프로세스가 갱신 중이면 아직 유효한 기존 토큰 사용"""
+        broker = make_broker(server, refresh_margin=600)
+        await broker.store(APP_KEY, KiwoomToken("expiring", time.time() + 300))
+        lock_key = broker.cache_key(APP_KEY) + ":lock"
+        fakeredis.FakeRedis(server=server).set(lock_key, "other-process", px=30000)
+
+        issuer = make_issuer()
+        token = await broker.get_token(APP_KEY, issuer)
+
+        assert token.access_token == "expiring"
+        assert issuer.calls["count"] == 0
+
+    async def test_waits_for_other_process_issue(self, server):
+        """유효한 토큰이 없으면 다른 프로세스의 발급 결과를 대기"""
+        broker = make_broker(server)
+        other = make_broker(server)
+        lock_key = broker.cache_key(APP_KEY) + ":lock"
+        fakeredis.FakeRedis(server=server).set(lock_key, "other-process", px=30000)
+
+        async def publish_later():
+            await asyncio.sleep(0.3)
+            await other.store(APP_KEY, KiwoomToken("from-other", time.time() + 3600))
+
+        issuer = make_issuer()
+        token, _ = await asyncio.gather(broker.get_token(APP_KEY, issuer), publish_later())
+
+        assert token.access_token == "from-other"
+        assert issuer.calls["count"] == 0
+        assert broker.stats["waited"] == 1
+
+    async def test_lock_released_after_issue(self, server):
+        broker = make_broker(server)
+        await broker.get_token(APP_KEY, make_issuer())
+        assert fakeredis.FakeRedis(server=server).get(broker.cache_key(APP_KEY) + ":lock") is None
+
+    async def test_without_redis_uses_process_cache(self):
+        """Redis 없이도 프로세스 내 single-flight 동작"""
+        broker = KiwoomTokenBroker(redis_url=None)
+        issuer = make_issuer(delay=0.05)
+
+        tokens = await asyncio.gather(*[broker.get_token(APP_KEY, issuer) for _ in range(5)])
+
+        assert issuer.calls["count"] == 1
+        assert len({t.access_token for t in tokens}) == 1
+
+    async def test_redis_error_falls_back_to_local_issue(self):
+        client = Mock()
+        client.get.side_effect = ConnectionError("down")
+        broker = KiwoomTokenBroker(client=client)
+        issuer = make_issuer()
+
+        token = await broker.get_token(APP_KEY, issuer)
+
+        assert token.access_token == "token-1"
+        assert issuer.calls["count"] == 1
+
+
+class TestRestApiWithBroker:
+    """KiwoomRestAPI 연동 테스트"""
+
+    @pytest.fixture
+    def config(self):
+        return KiwoomConfig(
+            app_key=APP_KEY,
+            secret_key="test_secret",
+            base_url="https://api.kiwoom.com",
+            ws_url="wss://api.kiwoom.com:10000/api/dostk/websocket",
+            use_mock=False,
+        )
+
+    async def test_instances_share_token(self, config, server):
+        """같은 브로커를 쓰는 인스턴스는 토큰을 한 번만 발급"""
+        broker = make_broker(server)
+        first = KiwoomRestAPI(config, token_broker=broker)
+        second = KiwoomRestAPI(config, token_broker=make_broker(server))
+
+        issue = AsyncMock(return_value=KiwoomToken("shared", time.time() + 3600))
+        with patch.object(KiwoomRestAPI, "_request_new_token", issue):
+            await first.ensure_token_valid()
+            await second.ensure_token_valid()
+
+        assert issue.await_count == 1
+        assert first._access_token == second._access_token == "shared"
+
+    async def test_401_refreshes_through_broker(self, config, server):
+        api = KiwoomRestAPI(config, token_broker=make_broker(server))
+        api._access_token = "rejected"
+        api._token_expires_at = time.time() + 3600
+
+        unauthorized = Mock(status_code=401)
+        ok = Mock(status_code=200, json=Mock(return_value={"ok": True}), raise_for_status=Mock())
+        client = AsyncMock()
+        client.is_closed = False
+        client.request = AsyncMock(side_effect=[unauthorized, ok])
+        api._set_client(client)
+
+        issue = AsyncMock(return_value=KiwoomToken("fresh", time.time() + 3600))
+        with patch.object(KiwoomRestAPI, "_request_new_token", issue):
+            result = await api._request_with_auth("POST", "/api/test")
+
+        assert result == {"ok": True}
+        assert issue.await_count == 1
+        sent = client.request.await_args_list[1].kwargs["headers"]["Authorization"]
+        assert sent == "Bearer fresh"
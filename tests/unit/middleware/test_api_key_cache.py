@@ -0,0 +1,142 @@
+"""
+API Key 검증 캐시 및 사용량 배치 기록 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.middleware.api_key_auth import APIKeyAuthMiddleware
+from src.middleware.api_key_cache import (
+    APIKeyUsageRecorder,
+    APIKeyValidationCache,
+    ValidatedAPIKey,
+    hash_api_key,
+)
+
+
+def _valid_result(key_id=1, scope="read", expires_at=None):
+    key = ValidatedAPIKey(id=key_id, name="test", scope=scope, expires_at=expires_at)
+    return {"valid": True, "key": key, "scope": scope}
+
+
+class TestAPIKeyValidationCache:
+    """검증 결과 캐시 테스트"""
+
+    def test_positive_and_negative_entries(self):
+        cache = APIKeyValidationCache()
+        cache.put("good", _valid_result())
+        cache.put("bad", {"valid": False, "error": "Invalid API Key"})
+
+        assert cache.get("good")["valid"] is True
+        assert cache.get("bad")["valid"] is False
+        assert cache.get("unknown") is None
+
+    def test_transient_errors_not_cached(self):
+        """DB 장애 결과는 캐싱하지 않음"""
+        cache = APIKeyValidationCache()
+        cache.put("k", {"valid": False, "error": "Authentication failed", "transient": True})
+        assert cache.get("k") is None
+
+    def test_negative_ttl_expiry(self):
+        cache = APIKeyValidationCache(negative_ttl=-1)
+        cache.put("bad", {"valid": False, "error": "Invalid API Key"})
+        assert cache.get("bad") is None
+
+    def test_expired_key_evicted(self):
+        """캐시된 키의 만료일이 지나면 재검증"""
+        cache = APIKeyValidationCache()
+        past = datetime.now(timezone.utc) - timedelta(seconds=1)
+        cache.put("k", _valid_result(expires_at=past))
+        assert cache.get("k") is None
+
+    def test_invalidation_events(self):
+        """Pub/Sub 이벤트로 키 단위/전체 무효화"""
+        cache = APIKeyValidationCache()
+        cache.put("a", _valid_result())
+        cache.put("b", _valid_result(key_id=2))
+
+        cache._apply_event({"key_hash": "a"})
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+        cache._apply_event({"all": True})
+        assert cache.get("b") is None
+
+
+class TestAPIKeyAuthMiddlewareCache:
+    """미들웨어 검증 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_db_queried_once_per_key(self):
+        middleware = APIKeyAuthMiddleware(app=None)
+
+        with patch.object(
+            APIKeyAuthMiddleware, "_query_api_key", return_value=_valid_result()
+        ) as mock_query:
+            for _ in range(5):
+                result = await middleware._validate_api_key("kr_secret")
+
+        assert result["valid"] is True
+        assert mock_query.call_count == 1
+        assert middleware._cache.get(hash_api_key("kr_secret")) is not None
+
+
+    @pytest.mark.asyncio
+    async def test_listener_restarted_after_it_stops(self):
+        """무효화 구독이 끊기면 재시도 간격 후 다시 시작"""
+        middleware = APIKeyAuthMiddleware(app=None)
+        cache = middleware._cache
+        started = []
+
+        async def fake_start():
+            started.append(True)
+            cache._listener_task = asyncio.create_task(asyncio.sleep(0))
+
+        with patch.object(cache, "start", side_effect=fake_start), \
+                patch.object(middleware._usage, "start"):
+            await middleware._ensure_started()
+            await cache._listener_task
+            assert not cache.listening
+
+            # 재시도 간격 전에는 재시작하지 않음
+            await middleware._ensure_started()
+            assert len(started) == 1
+
+            middleware._next_listener_start = 0.0
+            await middleware._ensure_started()
+            assert len(started) == 2
+            await cache._listener_task
+
+
+class TestAPIKeyUsageRecorder:
+    """사용량 배치 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_single_batch(self):
+        recorder = APIKeyUsageRecorder()
+        for _ in range(3):
+            recorder.record(1)
+        recorder.record(2)
+
+        with patch.object(APIKeyUsageRecorder, "_write_batch") as mock_write:
+            assert await recorder.flush() == 2
+
+        mock_write.assert_called_once()
+        batch = mock_write.call_args.args[0]
+        assert batch[1][0] == 3
+        assert batch[2][0] == 1
+        assert recorder.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeued(self):
+        recorder = APIKeyUsageRecorder()
+        recorder.record(1)
+
+        with patch.object(APIKeyUsageRecorder, "_write_batch", side_effect=RuntimeError("db down")):
+            assert await recorder.flush() == 0
+
+        recorder.record(1)
+        assert recorder.pending[1][0] == 2
@@ -0,0 +1,157 @@
+"""
+게이트웨이 순수 ASGI 파이프라인 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.asgi_pipeline import (
+    GatewayPipelineMiddleware,
+    PipelineStage,
+    RateLimitStage,
+    build_default_stages,
+)
+from src.middleware.metrics_middleware import (
+    api_active_connections,
+    api_errors_total,
+    api_requests_total,
+)
+from src.middleware.rate_limit import RateLimitMiddleware
+from src.middleware.slow_endpoint import get_slow_endpoint_tracker
+from src.utils.metrics import metrics_registry
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    tracker = get_slow_endpoint_tracker()
+    threshold = tracker.threshold
+    metrics_registry.reset_all()
+    tracker.clear()
+    yield
+    tracker.clear()
+    tracker._threshold = threshold
+
+
+class _CaptureStage(PipelineStage):
+    name = "capture"
+
+    def __init__(self):
+        self.contexts = []
+
+    def on_complete(self, ctx):
+        self.contexts.append(ctx)
+
+
+def _make_app(stages):
+    app = FastAPI()
+    app.add_middleware(GatewayPipelineMiddleware, stages=stages)
+
+    @app.get("/api/stocks/{ticker}")
+    async def get_stock(ticker: str, request: Request):
+        return {"ticker": ticker, "request_id": request.state.request_id}
+
+    @app.get("/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/api/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+class TestGatewayPipelineMiddleware:
+    """파이프라인 동작 테스트"""
+
+    def test_request_id_propagated(self):
+        client = TestClient(_make_app(build_default_stages()))
+
+        response = client.get("/api/stocks/005930", headers={"X-Request-ID": "req-1"})
+
+        assert response.status_code == 200
+        assert response.headers["X-Request-ID"] == "req-1"
+        assert response.json()["request_id"] == "req-1"
+
+        generated = client.get("/api/stocks/005930")
+        assert generated.headers["X-Request-ID"] == generated.json()["request_id"]
+
+    def test_route_template_captured(self):
+        capture = _CaptureStage()
+        client = TestClient(_make_app([capture]))
+
+        client.get("/api/stocks/005930")
+
+        ctx = capture.contexts[0]
+        assert ctx.route_template == "/api/stocks/{ticker}"
+        assert ctx.status_code == 200
+        assert ctx.duration > 0
+        assert "ttfb" in ctx.timings
+
+    def test_metrics_recorded(self):
+        client = TestClient(_make_app(build_default_stages()))
+
+        client.get("/api/stocks/005930")
+        client.get("/api/unknown")
+
+        assert api_requests_total.get() == 2
+        assert api_errors_total.get() == 1
+        assert api_active_connections.get() == 0
+
+    def test_exception_recorded_and_reraised(self):
+        capture = _CaptureStage()
+        client = TestClient(_make_app(build_default_stages() + [capture]))
+
+        with pytest.raises(RuntimeError):
+            client.get("/api/boom")
+
+        assert isinstance(capture.contexts[0].error, RuntimeError)
+        assert api_errors_total.get() == 1
+        assert api_active_connections.get() == 0
+
+    def test_streaming_response_passes_through(self):
+        client = TestClient(_make_app(build_default_stages()))
+
+        response = client.get("/api/stream")
+
+        assert response.text == "chunk0\nchunk1\nchunk2\n"
+        assert "X-Request-ID" in response.headers
+
+    def test_slow_endpoint_grouped_by_template(self):
+        client = TestClient(_make_app(build_default_stages(slow_threshold=0.0)))
+
+        client.get("/api/stocks/005930")
+        client.get("/api/stocks/000660")
+
+        slow = get_slow_endpoint_tracker().get_slow_endpoints()
+        assert slow[0]["path"] == "GET /api/stocks/{ticker}"
+        assert slow[0]["count"] == 2
+
+    def test_slow_endpoint_stage_keeps_global_threshold(self):
+        tracker = get_slow_endpoint_tracker()
+        threshold = tracker.threshold
+
+        build_default_stages(slow_threshold=0.0)
+
+        assert tracker.threshold == threshold
+
+    def test_rate_limit_stage_short_circuits(self):
+        limiter = RateLimitMiddleware(app=None, requests=1, window=60)
+        capture = _CaptureStage()
+        client = TestClient(_make_app([capture, RateLimitStage(limiter)]))
+
+        first = client.get("/api/stocks/005930")
+        denied = client.get("/api/stocks/005930")
+
+        assert first.headers["X-RateLimit-Limit"] == "1"
+        assert denied.status_code == 429
+        assert capture.contexts[1].status_code == 429
@@ -0,0 +1,162 @@
+"""
+분산 Rate Limiter 테스트 (Redis Lua 경로 + 로컬 Token Bucket 폴백)
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.middleware.distributed_rate_limit import (
+    DistributedRateLimiter,
+    LocalTokenBucketLimiter,
+    RateLimitTier,
+)
+from src.middleware.rate_limit import RateLimitMiddleware
+
+
+def _redis_with_script(script):
+    client = MagicMock()
+    client.register_script = MagicMock(return_value=script)
+    return client
+
+
+class TestLocalTokenBucketLimiter:
+    """로컬 폴백 limiter 테스트"""
+
+    def test_limit_enforced(self):
+        limiter = LocalTokenBucketLimiter()
+        tiers = [RateLimitTier("default", 3, 60)]
+
+        results = [limiter.hit("ip:1", tiers) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert results[2].remaining == 0
+        assert results[3].retry_after >= 1
+        assert results[3].backend == "local"
+
+    def test_denied_request_consumes_no_tokens(self):
+        """어느 한 티어라도 거부되면 다른 티어 토큰도 소모하지 않음"""
+        limiter = LocalTokenBucketLimiter()
+        tiers = [RateLimitTier("burst", 1, 60), RateLimitTier("default", 10, 60)]
+
+        assert limiter.hit("ip:1", tiers).allowed
+        denied = limiter.hit("ip:1", tiers)
+
+        assert not denied.allowed
+        assert denied.tier == "burst"
+        assert limiter.hit("ip:1", [tiers[1]]).remaining == 8
+
+    def test_bounded_buckets(self):
+        limiter = LocalTokenBucketLimiter(max_buckets=10)
+        tiers = [RateLimitTier("default", 5, 60)]
+        for i in range(50):
+            limiter.hit(f"ip:{i}", tiers)
+        assert len(limiter) == 10
+
+
+class TestDistributedRateLimiter:
+    """Redis 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip_for_all_tiers(self):
+        reset_ms = int((time.time() + 30) * 1000)
+        script = AsyncMock(return_value=[1, 9, reset_ms, 2, reset_ms])
+        limiter = DistributedRateLimiter(redis_client=_redis_with_script(script))
+        tiers = [RateLimitTier("ep:/api/kr/scan", 10, 60), RateLimitTier("burst", 3, 1)]
+
+        result = await limiter.hit("ip:1", tiers)
+
+        script.assert_awaited_once()
+        keys = script.await_args.kwargs["keys"]
+        args = script.await_args.kwargs["args"]
+        assert keys == ["ratelimit:{ip:1}:ep:/api/kr/scan", "ratelimit:{ip:1}:burst"]
+        assert args[1:] == [10, 60000, 3, 1000]
+
+        # 남은 요청이 가장 적은 티어 기준으로 헤더 노출
+        assert result.allowed
+        assert result.tier == "burst"
+        assert result.headers()["X-RateLimit-Remaining"] == "2"
+        assert result.headers()["X-RateLimit-Limit"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_denied_result(self):
+        reset_ms = int((time.time() + 12) * 1000)
+        script = AsyncMock(return_value=[0, 0, reset_ms])
+        limiter = DistributedRateLimiter(redis_client=_redis_with_script(script))
+
+        result = await limiter.hit("ip:1", [RateLimitTier("default", 5, 60)])
+
+        assert not result.allowed
+        assert 1 <= result.retry_after <= 12
+        assert "Retry-After" in result.headers()
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_redis_unavailable(self):
+        script = AsyncMock(side_effect=ConnectionError("redis down"))
+        limiter = DistributedRateLimiter(redis_client=_redis_with_script(script))
+        tiers = [RateLimitTier("default", 2, 60)]
+
+        results = [await limiter.hit("ip:1", tiers) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert all(r.backend == "local" for r in results)
+        # 재시도 간격 동안 Redis를 다시 호출하지 않음
+        assert script.await_count == 1
+
+
+class TestRateLimitMiddlewareDistributed:
+    """미들웨어 통합 테스트"""
+
+    def _client(self, limiter):
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            requests=2,
+            window=60,
+            distributed_limiter=limiter,
+        )
+
+        @app.get("/api/test")
+        async def endpoint():
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_headers_and_429(self):
+        script = AsyncMock(side_effect=ConnectionError("redis down"))
+        client = self._client(DistributedRateLimiter(redis_client=_redis_with_script(script)))
+
+        first = client.get("/api/test")
+        assert first.status_code == 200
+        assert first.headers["X-RateLimit-Limit"] == "2"
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert "X-RateLimit-Reset" in first.headers
+
+        client.get("/api/test")
+        denied = client.get("/api/test")
+        assert denied.status_code == 429
+        assert denied.headers["X-RateLimit-Remaining"] == "0"
+        assert int(denied.headers["Retry-After"]) >= 1
+
+    def test_429_body_matches_local_limiter(self):
+        script = AsyncMock(side_effect=ConnectionError("redis down"))
+        distributed = self._client(DistributedRateLimiter(redis_client=_redis_with_script(script)))
+        local = self._client(None)
+
+        bodies = []
+        for client in (distributed, local):
+            for _ in range(2):
+                client.get("/api/test")
+            denied = client.get("/api/test")
+            assert denied.status_code == 429
+            bodies.append(denied.json())
+
+        # 공유 limiter 사용 여부와 관계없이 같은 오류 형식
+        assert set(bodies[0]) == set(bodies[1]) == {"detail"}
+        assert set(bodies[0]["detail"]) == set(bodies[1]["detail"]) == {
+            "error", "remaining", "reset_at", "retry_after",
+        }
+        assert bodies[0]["detail"]["error"] == bodies[1]["detail"]["error"]
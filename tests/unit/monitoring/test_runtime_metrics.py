@@ -0,0 +1,188 @@
+"""
+런타임 지표 테스트
+
+- 이벤트 루프 지연 / 백분위수
+- GC 일시 정지, DB 커넥션 풀 체크아웃 대기
+- ResourceMonitor 비차단 샘플링 및 링 버퍼 기록
+"""
+
+import asyncio
+import gc
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from src.monitoring.resource_monitor import ResourceMonitor
+from src.monitoring.runtime_metrics import (
+    GCPauseTracker,
+    LoopLagProbe,
+    PoolWaitTracker,
+    percentile,
+    summarize_ms,
+)
+
+
+class TestSummaries:
+    """백분위수 / 요약 검증"""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 100) == 100
+        assert percentile([], 95) == 0.0
+
+    def test_summarize_ms(self):
+        summary = summarize_ms([0.001, 0.002, 0.010])
+
+        assert summary["count"] == 3
+        assert summary["max"] == 10.0
+        assert summary["p50"] == 2.0
+
+
+class TestLoopLagProbe:
+    """이벤트 루프 지연 측정 검증"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_up_as_lag(self):
+        probe = LoopLagProbe(interval=0.01)
+        probe.start()
+        await asyncio.sleep(0.03)
+
+        time.sleep(0.1)  # 루프 차단
+        await asyncio.sleep(0.03)
+        await probe.stop()
+
+        assert probe.summary()["max"] >= 80
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        probe = LoopLagProbe(interval=0.001, history_size=5)
+        probe.start()
+        await asyncio.sleep(0.05)
+        await probe.stop()
+
+        assert len(probe.samples) == 5
+
+
+class TestGCPauseTracker:
+    """GC 일시 정지 측정 검증"""
+
+    def test_records_collections(self):
+        tracker = GCPauseTracker()
+        tracker.install()
+        try:
+            gc.collect()
+        finally:
+            tracker.uninstall()
+
+        summary = tracker.summary()
+        assert summary["count"] >= 1
+        assert summary["collections"][2] >= 1
+        assert tracker._callback not in gc.callbacks
+
+
+class TestPoolWaitTracker:
+    """DB 커넥션 풀 체크아웃 대기 검증"""
+
+    def test_records_wait_and_timeout(self):
+        engine = create_engine(
+            "sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05
+        )
+        tracker = PoolWaitTracker("test", engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        summary = tracker.summary()
+        assert summary["count"] == 2
+        assert summary["max"] >= 40
+        assert summary["timeouts"] == 1
+        assert summary["size"] == 1
+
+    def test_reinstalls_after_dispose(self):
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+        tracker = PoolWaitTracker("test", engine)
+
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert tracker.summary()["count"] == 1
+
+    def test_main_engine_registered_with_global_monitor(self, monkeypatch):
+        import src.database.session as session_module
+        import src.monitoring.resource_monitor as resource_monitor
+
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+        monkeypatch.setattr(session_module, "engine", engine)
+        monkeypatch.setattr(resource_monitor, "_resource_monitor", None)
+
+        monitor = resource_monitor.get_resource_monitor()
+        with engine.connect():
+            pass
+
+        assert monitor.get_runtime_stats()["db_pools"]["main"]["count"] == 1
+
+
+class TestResourceMonitorRuntime:
+    """ResourceMonitor 런타임 지표 검증"""
+
+    @pytest.mark.asyncio
+    async def test_sample_runs_off_loop(self, monkeypatch):
+        monitor = ResourceMonitor(check_interval_seconds=1)
+        threads = []
+        original = monitor.get_current_usage
+
+        def tracked():
+            threads.append(threading.current_thread())
+            return original()
+
+        monkeypatch.setattr(monitor, "get_current_usage", tracked)
+
+        usage = await monitor.sample()
+
+        assert threads[0] is not threading.main_thread()
+        assert usage.runtime["tasks"] >= 1
+        assert set(usage.runtime) == {"event_loop_lag_ms", "tasks", "gc", "db_pools"}
+
+    @pytest.mark.asyncio
+    async def test_history_ring_buffer(self):
+        monitor = ResourceMonitor(check_interval_seconds=1, history_size=3)
+
+        for _ in range(5):
+            await monitor.sample()
+
+        history = monitor.get_history()
+        assert len(history) == 3
+        assert len(monitor.get_history(limit=1)) == 1
+        assert "open_sockets" in history[0]
+
+    def test_cpu_sampling_does_not_wait(self):
+        monitor = ResourceMonitor()
+
+        with patch("src.monitoring.resource_monitor.psutil.cpu_percent", return_value=10.0) as cpu:
+            monitor.get_current_usage()
+
+        cpu.assert_called_once_with(interval=None)
+
+    def test_loop_lag_alert(self):
+        monitor = ResourceMonitor(loop_lag_threshold_ms=100.0)
+        alerts = []
+        monitor.on_alert(alerts.append)
+        usage = monitor.get_current_usage()
+        usage.cpu_percent = 0.0
+        usage.memory.percent = 0.0
+        usage.runtime = {"event_loop_lag_ms": {"p95": 250.0}}
+
+        monitor._check_alerts(usage)
+
+        assert alerts == [usage]
@@ -191,8 +191,17 @@ class TestBacktestRepositoryGetSummary:
         """요약 통계 올바른 집계"""
         # Arrange
         config_name = "vcp_conservative"
+        rows = sample_backtest_results[:2]
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = sample_backtest_results[:2]
+        mock_result.one.return_value = Mock(
+            total_backtests=len(rows),
+            avg_return_pct=sum(r.total_return_pct for r in rows) / len(rows),
+            avg_win_rate=sum(r.win_rate for r in rows) / len(rows),
+            best_return_pct=max(r.total_return_pct for r in rows),
+            worst_return_pct=min(r.total_return_pct for r in rows),
+            avg_sharpe_ratio=sum(r.sharpe_ratio for r in rows) / len(rows),
+            avg_max_drawdown_pct=sum(r.max_drawdown_pct for r in rows) / len(rows),
+        )
         mock_session.execute.return_value = mock_result
 
         # Act
@@ -210,7 +219,7 @@ class TestBacktestRepositoryGetSummary:
         """데이터 없을 때 0 반환"""
         # Arrange
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.one.return_value = Mock(total_backtests=0)
         mock_session.execute.return_value = mock_result
 
         # Act
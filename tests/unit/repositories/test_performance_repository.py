@@ -3,8 +3,9 @@ Performance Repository Unit Tests
 누적 수익률 및 성과 분석 테스트
 """
 
+import pytest
 from unittest.mock import Mock, patch
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 
 # ============================================================================
@@ -81,8 +82,7 @@ class TestPerformanceRepository:
         assert repo is not None
         assert repo.session == mock_session
 
-    @patch('src.repositories.performance_repository.DailyPrice')
-    def test_calculate_cumulative_return(self, mock_daily_price_class):
+    def test_calculate_cumulative_return(self):
         """누적 수익률 계산 테스트"""
         from src.repositories.performance_repository import PerformanceRepository
 
@@ -90,7 +90,7 @@ class TestPerformanceRepository:
 
         # Mock empty result
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
         mock_session.execute.return_value = mock_result
 
         repo = PerformanceRepository(mock_session)
@@ -102,8 +102,7 @@ class TestPerformanceRepository:
         assert isinstance(result, list)
         assert len(result) == 0  # No signals = empty result
 
-    @patch('src.repositories.performance_repository.DailyPrice')
-    def test_calculate_signal_performance(self, mock_daily_price_class):
+    def test_calculate_signal_performance(self):
         """시그널 성과 계산 테스트"""
         from src.repositories.performance_repository import PerformanceRepository
 
@@ -111,7 +110,7 @@ class TestPerformanceRepository:
 
         # Mock empty result
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.one.return_value = Mock(total_signals=0, closed_signals=0)
         mock_session.execute.return_value = mock_result
 
         repo = PerformanceRepository(mock_session)
@@ -124,8 +123,7 @@ class TestPerformanceRepository:
         assert "win_rate" in result
         assert "avg_return" in result
 
-    @patch('src.repositories.performance_repository.DailyPrice')
-    def test_get_performance_by_period(self, mock_daily_price_class):
+    def test_get_performance_by_period(self):
         """기간별 성과 조회 테스트"""
         from src.repositories.performance_repository import PerformanceRepository
 
@@ -133,7 +131,8 @@ class TestPerformanceRepository:
         repo = PerformanceRepository(mock_session)
 
         # Mock empty result
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value.all.return_value = []
+        mock_session.execute.return_value.one.return_value = Mock(total_signals=0, closed_signals=0)
 
         # Get performance
         result = repo.get_performance_by_period(period="1mo")
@@ -147,8 +146,7 @@ class TestPerformanceRepository:
         assert "mdd" in result
         assert "sharpe_ratio" in result
 
-    @patch('src.repositories.performance_repository.DailyPrice')
-    def test_get_top_performers(self, mock_daily_price_class):
+    def test_get_top_performers(self):
         """최고 성과 종목 조회 테스트"""
         from src.repositories.performance_repository import PerformanceRepository
 
@@ -156,7 +154,7 @@ class TestPerformanceRepository:
 
         # Mock empty result
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = []
         mock_session.execute.return_value = mock_result
 
         repo = PerformanceRepository(mock_session)
@@ -168,8 +166,7 @@ class TestPerformanceRepository:
         assert isinstance(result, list)
         assert len(result) == 0  # No signals = empty result
 
-    @patch('src.repositories.performance_repository.DailyPrice')
-    def test_exception_handling(self, mock_daily_price_class):
+    def test_exception_handling(self):
         """예외 처리 테스트"""
         from src.repositories.performance_repository import PerformanceRepository
 
@@ -177,7 +174,7 @@ class TestPerformanceRepository:
 
         # Mock query to return empty result
         mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.one.return_value = Mock(total_signals=0, closed_signals=0)
         mock_session.execute.return_value = mock_result
 
         repo = PerformanceRepository(mock_session)
@@ -283,3 +280,131 @@ class TestPerformanceRoutes:
             total_count=1
         )
         assert top_response.total_count == 1
+
+
+# ============================================================================
+# SQL Aggregation Tests (SQLite)
+# ============================================================================
+
+class TestPerformanceRepositorySQL:
+    """청산일 종가 조인 및 일별 집계 테스트 (in-memory SQLite)"""
+
+    @pytest.fixture
+    def db_session(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from src.database.session import Base
+        from src.database.models import Signal, DailyPrice
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+
+        today = date.today()
+        for i, mock_signal in enumerate(MOCK_CLOSED_SIGNALS):
+            signal_date = today - timedelta(days=10 - i)
+            exit_time = datetime.combine(today - timedelta(days=5 - i), datetime.min.time())
+            session.add(Signal(
+                ticker=mock_signal.ticker,
+                signal_type=mock_signal.signal_type,
+                status="CLOSED",
+                entry_price=mock_signal.entry_price,
+                signal_date=signal_date,
+                exit_time=exit_time.replace(hour=15, minute=30),
+            ))
+            session.add(DailyPrice(
+                ticker=mock_signal.ticker,
+                date=exit_time.date(),
+                close_price=MOCK_DAILY_PRICES[mock_signal.ticker].close_price,
+                volume=1000,
+            ))
+        # 청산일 종가가 없는 시그널
+        session.add(Signal(
+            ticker="999999",
+            signal_type="VCP",
+            status="CLOSED",
+            entry_price=10000,
+            signal_date=today - timedelta(days=3),
+            exit_time=datetime.combine(today, datetime.min.time()),
+        ))
+        session.commit()
+
+        yield session
+
+        session.close()
+
+    def test_signal_performance_single_query(self, db_session):
+        from src.repositories.performance_repository import PerformanceRepository
+
+        result = PerformanceRepository(db_session).calculate_signal_performance(days=30)
+
+        assert result["total_signals"] == 4
+        assert result["closed_signals"] == 3
+        assert result["win_rate"] == pytest.approx(200 / 3)
+        assert result["best_return"] == pytest.approx(10.0)
+        assert result["worst_return"] == pytest.approx(-10.0)
+
+    def test_top_performers_sorted_in_sql(self, db_session):
+        from src.repositories.performance_repository import PerformanceRepository
+
+        performers = PerformanceRepository(db_session).get_top_performers(limit=2, days=30)
+
+        assert [p["ticker"] for p in performers] == ["000660", "005930"]
+        assert performers[0]["exit_price"] == 132000
+        assert performers[0]["return_pct"] == 10.0
+
+    def test_cumulative_return_reads_daily_series(self, db_session):
+        from src.repositories.performance_repository import PerformanceRepository
+
+        repo = PerformanceRepository(db_session)
+        assert repo.calculate_cumulative_return() == []
+
+        assert repo.refresh_daily_series() == 3
+        cumulative = repo.calculate_cumulative_return()
+
+        assert len(cumulative) == 3
+        expected = 100 * (1 + 0.0666667) * 1.10 * 0.90 - 100
+        assert cumulative[-1]["cumulative_return_pct"] == pytest.approx(expected, rel=1e-4)
+
+        vcp_only = repo.calculate_cumulative_return(signal_type="VCP")
+        assert len(vcp_only) == 2
+
+    def test_incremental_refresh_picks_up_new_closes(self, db_session):
+        from src.database.models import Signal, DailyPrice
+        from src.repositories.performance_repository import PerformanceRepository
+
+        repo = PerformanceRepository(db_session)
+        repo.refresh_daily_series()
+
+        # 새로 청산된 시그널 (기존 시그널 날짜와 동일)
+        existing_date = date.today() - timedelta(days=10)
+        db_session.add(Signal(
+            ticker="068270",
+            signal_type="VCP",
+            status="CLOSED",
+            entry_price=100000,
+            signal_date=existing_date,
+            exit_time=datetime.now(),
+        ))
+        db_session.add(DailyPrice(
+            ticker="068270", date=date.today(), close_price=120000, volume=1000,
+        ))
+        db_session.commit()
+
+        assert repo.refresh_daily_series() == 1
+        series = repo.get_daily_series(signal_type="VCP")
+
+        assert series[0]["signal_count"] == 2
+        assert series[0]["daily_return_pct"] == pytest.approx((6.6666667 + 20.0) / 2, rel=1e-4)
+
+    def test_period_performance_uses_series(self, db_session):
+        from src.repositories.performance_repository import PerformanceRepository
+
+        repo = PerformanceRepository(db_session)
+        repo.refresh_daily_series()
+
+        result = repo.get_performance_by_period(period="1mo")
+
+        assert result["total_signals"] == 4
+        assert result["mdd"] == pytest.approx(10.0)
+        assert result["sharpe_ratio"] == pytest.approx(repo.calculate_sharpe_ratio(days=30))
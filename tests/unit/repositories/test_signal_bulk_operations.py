@@ -0,0 +1,325 @@
+"""
+시그널 Repository 일괄 처리 / 보관 주기 단위 테스트
+
+upsert, 조건 기반 일괄 청산/만료, SQL 집계 요약, 이력 테이블 이관을
+in-memory SQLite로 검증합니다.
+"""
+
+from datetime import date, datetime, time, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import (
+    AIAnalysis,
+    DaytradingSignal,
+    Signal,
+    daytrading_signals_history,
+    signals_history,
+)
+from src.repositories.ai_analysis_repository import AIAnalysisRepository
+from src.repositories.daytrading_signal_repository import DaytradingSignalRepository
+from src.repositories.signal_archive_repository import SignalArchiveRepository
+from src.repositories.signal_repository import EXPIRED_EXIT_REASON, SignalRepository
+
+TODAY = date(2026, 10, 16)
+
+
+@pytest.fixture
+def db_session():
+    from src.database.session import Base
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    yield session
+
+    session.close()
+
+
+def signal_row(ticker, signal_date=TODAY, signal_type="VCP", score=80.0, status="OPEN"):
+    return {
+        "ticker": ticker,
+        "signal_type": signal_type,
+        "signal_date": signal_date,
+        "status": status,
+        "score": score,
+        "grade": "A",
+    }
+
+
+def count(db, table):
+    return db.execute(select(func.count()).select_from(table)).scalar()
+
+
+# =============================================================================
+# SignalRepository
+# =============================================================================
+
+class TestSignalRepositoryBulk:
+
+    def test_upsert_inserts_and_updates(self, db_session):
+        repo = SignalRepository(db_session)
+        repo.bulk_create([signal_row("005930", score=70.0)])
+
+        result = repo.upsert_signals([
+            signal_row("005930", score=90.0),
+            signal_row("000660"),
+            signal_row("005930", signal_type="JONGGA_V2"),
+        ])
+
+        assert result == {"inserted": 2, "updated": 1}
+        assert count(db_session, Signal) == 3
+        updated = db_session.execute(
+            select(Signal).where(Signal.ticker == "005930", Signal.signal_type == "VCP")
+        ).scalar_one()
+        assert updated.score == 90.0
+
+    def test_close_signals_by_predicate_and_ids(self, db_session):
+        repo = SignalRepository(db_session)
+        repo.bulk_create([
+            signal_row("005930"),
+            signal_row("000660"),
+            signal_row("035720", signal_type="JONGGA_V2"),
+        ])
+
+        closed = repo.close_signals(Signal.signal_type == "VCP", exit_reason="손절")
+        assert closed == 2
+
+        jongga_id = db_session.execute(
+            select(Signal.id).where(Signal.signal_type == "JONGGA_V2")
+        ).scalar()
+        assert repo.close_signals(signal_ids=[jongga_id]) == 1
+        assert repo.close_signals(signal_ids=[]) == 0
+
+        statuses = db_session.execute(select(Signal.status, Signal.exit_time)).all()
+        assert all(status == "CLOSED" and exit_time is not None for status, exit_time in statuses)
+
+    def test_expire_signals_only_old_open(self, db_session):
+        repo = SignalRepository(db_session)
+        repo.bulk_create([
+            signal_row("005930", signal_date=TODAY - timedelta(days=90)),
+            signal_row("000660", signal_date=TODAY),
+            signal_row("035720", signal_date=TODAY - timedelta(days=90), status="CLOSED"),
+        ])
+
+        assert repo.expire_signals(TODAY - timedelta(days=60)) == 1
+
+        expired = db_session.execute(
+            select(Signal).where(Signal.exit_reason == EXPIRED_EXIT_REASON)
+        ).scalars().all()
+        assert [s.ticker for s in expired] == ["005930"]
+
+    def test_summary_aggregated_in_sql(self, db_session):
+        repo = SignalRepository(db_session)
+        repo.bulk_create([
+            signal_row("005930", score=80.0),
+            signal_row("000660", score=60.0, status="CLOSED"),
+            signal_row("035720", signal_type="JONGGA_V2", score=None),
+            signal_row("051910", signal_date=TODAY - timedelta(days=1), score=99.0),
+        ])
+
+        summary = repo.get_summary_by_date(TODAY)
+
+        assert summary["total"] == 3
+        assert summary["by_status"] == {"OPEN": 2, "CLOSED": 1}
+        assert summary["by_type"] == {"VCP": 2, "JONGGA_V2": 1}
+        # 점수 없는 시그널은 0점으로 평균
+        assert summary["avg_score"] == pytest.approx(140.0 / 3)
+
+        daily = repo.get_daily_summaries(TODAY - timedelta(days=1), TODAY, signal_type="VCP")
+        assert [(d["date"], d["total"], d["open"], d["closed"]) for d in daily] == [
+            (TODAY, 2, 1, 1),
+            (TODAY - timedelta(days=1), 1, 1, 0),
+        ]
+
+
+# =============================================================================
+# DaytradingSignalRepository / AIAnalysisRepository
+# =============================================================================
+
+def daytrading_row(ticker, score=70, signal_date=TODAY):
+    return {
+        "ticker": ticker,
+        "name": ticker,
+        "market": "KOSPI",
+        "score": score,
+        "grade": "A",
+        "signal_date": signal_date,
+    }
+
+
+class TestDaytradingSignalRepositoryBulk:
+
+    def test_upsert_open_signals(self, db_session):
+        repo = DaytradingSignalRepository(db_session)
+        repo.bulk_create([{**daytrading_row("005930", score=50), "status": "OPEN"}])
+
+        result = repo.upsert_open_signals([daytrading_row("005930", score=90), daytrading_row("000660")])
+
+        assert result == {"inserted": 1, "updated": 1}
+        assert repo.get_by_ticker("005930").score == 90
+        assert repo.get_by_ticker("000660").status == "OPEN"
+
+    def test_bulk_update_status_and_close_stale(self, db_session):
+        repo = DaytradingSignalRepository(db_session)
+        repo.upsert_open_signals([
+            daytrading_row("005930", signal_date=TODAY - timedelta(days=10)),
+            daytrading_row("000660"),
+        ])
+
+        assert repo.close_stale(TODAY - timedelta(days=5)) == 1
+        assert repo.get_by_ticker("005930").exit_reason == "EXPIRED"
+
+        assert repo.bulk_update_status(
+            "CLOSED", DaytradingSignal.status == "OPEN", exit_reason="장 마감"
+        ) == 1
+        assert repo.get_active_signals() == []
+
+
+def test_save_analyses_bulk(db_session):
+    repo = AIAnalysisRepository(db_session)
+
+    saved = repo.save_analyses([
+        {
+            "ticker": ticker,
+            "analysis_date": TODAY,
+            "sentiment": "positive",
+            "score": 0.5,
+            "summary": "요약",
+            "keywords": ["실적"],
+            "recommendation": "BUY",
+        }
+        for ticker in ("005930", "000660")
+    ])
+
+    assert saved == 2
+    rows = repo.get_by_date(TODAY)
+    assert {r.ticker for r in rows} == {"005930", "000660"}
+    assert all(r.news_urls == [] and r.confidence == 0.5 for r in rows)
+    assert count(db_session, AIAnalysis) == 2
+
+
+# =============================================================================
+# SignalArchiveRepository
+# =============================================================================
+
+class TestSignalArchive:
+
+    def test_run_retention_moves_stale_closed_signals(self, db_session):
+        SignalRepository(db_session).bulk_create([
+            signal_row("005930", signal_date=TODAY - timedelta(days=200), status="CLOSED"),
+            signal_row("000660", signal_date=TODAY - timedelta(days=250)),  # OPEN → 만료 후 이관
+            signal_row("035720", signal_date=TODAY - timedelta(days=10), status="CLOSED"),
+            signal_row("051910", signal_date=TODAY),
+        ])
+        DaytradingSignalRepository(db_session).upsert_open_signals([
+            daytrading_row("005930", signal_date=TODAY - timedelta(days=40)),
+            daytrading_row("000660"),
+        ])
+
+        result = SignalArchiveRepository(db_session, batch_size=1).run_retention(today=TODAY)
+
+        assert result == {
+            "expired_signals": 1,
+            "expired_daytrading_signals": 1,
+            "archived_signals": 2,
+            "archived_daytrading_signals": 1,
+        }
+        assert sorted(db_session.execute(select(Signal.ticker)).scalars()) == ["035720", "051910"]
+        assert count(db_session, signals_history) == 2
+        assert count(db_session, daytrading_signals_history) == 1
+
+        history = SignalArchiveRepository(db_session).get_signal_history("000660")
+        assert history[0]["exit_reason"] == EXPIRED_EXIT_REASON
+        assert history[0]["archived_at"] is not None
+
+    def test_archive_is_idempotent(self, db_session):
+        SignalRepository(db_session).bulk_create([
+            signal_row("005930", signal_date=TODAY - timedelta(days=200), status="CLOSED"),
+        ])
+        archive = SignalArchiveRepository(db_session)
+
+        assert archive.archive_signals(TODAY - timedelta(days=180)) == 1
+        assert archive.archive_signals(TODAY - timedelta(days=180)) == 0
+        assert count(db_session, signals_history) == 1
+
+    def test_performance_rebuild_includes_archived_signals(self, db_session):
+        from src.database.models import DailyPrice, SignalPerformanceDaily
+        from src.repositories.performance_repository import PerformanceRepository
+
+        signal_date = date.today() - timedelta(days=200)
+        exit_day = signal_date + timedelta(days=5)
+        db_session.add(Signal(
+            ticker="005930", signal_type="VCP", status="CLOSED", entry_price=100000,
+            signal_date=signal_date, exit_time=datetime.combine(exit_day, time(15, 30)),
+        ))
+        db_session.add(DailyPrice(ticker="005930", date=exit_day, close_price=110000, volume=1000))
+        db_session.commit()
+
+        assert SignalArchiveRepository(db_session).archive_signals(date.today() - timedelta(days=180)) == 1
+        assert count(db_session, Signal) == 0
+
+        # 집계가 비어 있어도 전체 재구축이 이력 테이블을 함께 읽음
+        repo = PerformanceRepository(db_session)
+        db_session.execute(delete(SignalPerformanceDaily))
+        assert repo.refresh_daily_series() == 1
+        assert repo.get_daily_series()[0]["daily_return_pct"] == pytest.approx(10.0)
+
+        assert repo.calculate_signal_performance(days=365)["total_signals"] == 1
+        assert [p["ticker"] for p in repo.get_top_performers(days=365)] == ["005930"]
+
+
+class TestHistoryPartitions:
+    """PostgreSQL 월 파티션 생성 (DDL 렌더링 확인용 세션 모의)"""
+
+    @staticmethod
+    def _pg_session(default_partition, *scalars):
+        from sqlalchemy.dialects import postgresql
+
+        session = Mock()
+        session.get_bind.return_value.dialect = postgresql.dialect()
+        result = Mock()
+        result.first.return_value = Mock(default_partition=default_partition)
+        result.scalar.side_effect = list(scalars)
+        session.execute.return_value = result
+        return session
+
+    @staticmethod
+    def _statements(session):
+        return [str(c.args[0]) for c in session.execute.call_args_list]
+
+    def test_creates_missing_month_partition(self):
+        session = self._pg_session("signals_history_default", False, False)
+
+        SignalArchiveRepository(session)._ensure_partitions(signals_history, {date(2026, 3, 5), date(2026, 3, 9)})
+
+        assert self._statements(session)[-1] == (
+            "CREATE TABLE signals_history_202603 PARTITION OF signals_history "
+            "FOR VALUES FROM ('2026-03-01') TO ('2026-04-01')"
+        )
+
+    def test_moves_default_partition_rows_before_attach(self):
+        session = self._pg_session("signals_history_default", False, True)
+
+        SignalArchiveRepository(session)._ensure_partitions(signals_history, {date(2026, 3, 5)})
+
+        create, move, attach = self._statements(session)[-3:]
+        assert create.startswith("CREATE TABLE signals_history_202603 (LIKE signals_history")
+        assert move.startswith("WITH moved AS (DELETE FROM signals_history_default")
+        assert attach == (
+            "ALTER TABLE signals_history ATTACH PARTITION signals_history_202603 "
+            "FOR VALUES FROM ('2026-03-01') TO ('2026-04-01')"
+        )
+
+    def test_partition_failure_propagates(self):
+        session = self._pg_session(None, False)
+        session.execute.side_effect = [session.execute.return_value] * 2 + [RuntimeError("ddl failed")]
+
+        archive = SignalArchiveRepository(session)
+        with pytest.raises(RuntimeError, match="ddl failed"):
+            archive._ensure_partitions(signals_history, {date(2026, 3, 5)})
+        assert archive._partitions == set()
@@ -201,11 +201,15 @@ class TestSignalRepositoryExtended:
         from src.repositories.signal_repository import SignalRepository
 
         mock_session = Mock(spec=Session)
+        # (status, signal_type) GROUP BY 집계 결과
+        mock_result = Mock()
+        mock_result.all.return_value = [
+            Mock(status="OPEN", signal_type="VCP", count=1, score_sum=85.0),
+            Mock(status="CLOSED", signal_type="JONGGA_V2", count=1, score_sum=10.0),
+        ]
+        mock_session.execute.return_value = mock_result
         repo = SignalRepository(mock_session)
 
-        # Mock get_by_date_range to return signals
-        repo.get_by_date_range = Mock(return_value=MOCK_SIGNALS)
-
         # Get summary
         result = repo.get_summary_by_date(date(2024, 1, 15))
 
@@ -215,6 +219,11 @@ class TestSignalRepositoryExtended:
         assert "by_status" in result
         assert "by_type" in result
         assert "avg_score" in result
+        assert result["total"] == 2
+        assert result["by_status"] == {"OPEN": 1, "CLOSED": 1}
+        assert result["by_type"] == {"VCP": 1, "JONGGA_V2": 1}
+        assert result["avg_score"] == 47.5
+        mock_session.execute.assert_called_once()
 
     def test_update_status_not_found(self):
         """존재하지 않는 시그널 업데이트 테스트"""
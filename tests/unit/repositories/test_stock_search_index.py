@@ -0,0 +1,266 @@
+"""
+StockSearchIndex 단위 테스트
+
+- 티커 / 종목명 / 별칭 / 초성 / 접두 / 오타 허용 검색
+- 점수 → 시가총액 순 정렬
+- 로더 실패 / 만료 후 재로드
+- 챗봇 retriever 색인 경로
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.repositories.stock_search_index import (
+    StockEntry,
+    StockSearchIndex,
+    is_choseong_query,
+    to_choseong,
+)
+
+
+ENTRIES = [
+    StockEntry("005930", "삼성전자", "KOSPI", "반도체", 400_000, aliases=["KODEX 삼성"]),
+    StockEntry("006400", "삼성SDI", "KOSPI", "2차전지", 30_000),
+    StockEntry("028260", "삼성물산", "KOSPI", "유통", 25_000),
+    StockEntry("000660", "SK하이닉스", "KOSPI", "반도체", 150_000, aliases=["하이닉스"]),
+    StockEntry("035720", "카카오", "KOSPI", "IT", 20_000),
+    StockEntry("035420", "NAVER", "KOSPI", "IT", 30_000, aliases=["네이버"]),
+    StockEntry("0001A0", "테스트ELW", "KOSDAQ", None, 0),
+]
+
+
+@pytest.fixture
+def index():
+    index = StockSearchIndex(loader=lambda: ENTRIES)
+    index.refresh()
+    return index
+
+
+def _tickers(entries):
+    return [e.ticker for e in entries]
+
+
+class TestChoseong:
+    """초성 변환 테스트"""
+
+    def test_to_choseong(self):
+        assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+        assert to_choseong("sk하이닉스") == "skㅎㅇㄴㅅ"
+
+    def test_is_choseong_query(self):
+        assert is_choseong_query("ㅋㅋㅇ")
+        assert not is_choseong_query("카카오")
+        assert not is_choseong_query("")
+
+
+class TestStockSearchIndex:
+    """StockSearchIndex 검색 테스트"""
+
+    def test_exact_ticker_and_name(self, index):
+        assert _tickers(index.search("005930")) == ["005930"]
+        assert _tickers(index.search("삼성전자"))[0] == "005930"
+        assert index.get("0001a0").name == "테스트ELW"
+        assert index.get("999999") is None
+
+    def test_prefix_ranked_by_market_cap(self, index):
+        assert _tickers(index.search("삼성", limit=3)) == ["005930", "006400", "028260"]
+
+    def test_alias_and_case_insensitive(self, index):
+        assert _tickers(index.search("naver")) == ["035420"]
+        assert _tickers(index.search("네이버")) == ["035420"]
+        assert _tickers(index.search("하이닉스"))[0] == "000660"
+
+    def test_choseong(self, index):
+        assert _tickers(index.search("ㅅㅅㅈㅈ")) == ["005930"]
+        assert _tickers(index.search("ㅋㅋㅇ")) == ["035720"]
+
+    def test_typo_tolerant(self, index):
+        assert _tickers(index.search("삼성전지"))[0] == "005930"
+        assert _tickers(index.search("SK하이닉수"))[0] == "000660"
+
+    def test_name_with_particle(self, index):
+        assert _tickers(index.search("카카오랑"))[0] == "035720"
+        assert _tickers(index.search("삼성전자 현재가 알려줘"))[0] == "005930"
+
+    def test_no_match(self, index):
+        assert index.search("없는회사") == []
+        assert index.search("삼") == []
+
+    def test_lookup_is_fast(self, index):
+        started = time.perf_counter()
+        for _ in range(1000):
+            index.search("삼성전지")
+        per_call = (time.perf_counter() - started) / 1000
+
+        assert per_call < 0.001
+
+
+class TestIndexLoading:
+    """색인 로드 / 재로드 테스트"""
+
+    def test_loads_once_on_first_lookup(self):
+        loader = Mock(return_value=ENTRIES)
+        index = StockSearchIndex(loader=loader)
+
+        index.search("삼성")
+        index.get("005930")
+
+        loader.assert_called_once()
+        assert index.is_loaded and len(index) == len(ENTRIES)
+
+    def test_ensure_loaded(self):
+        loader = Mock(return_value=ENTRIES)
+        index = StockSearchIndex(loader=loader)
+
+        assert not index.is_loaded
+        assert index.ensure_loaded() is True
+        assert index.ensure_loaded() is True
+        loader.assert_called_once()
+        assert StockSearchIndex(loader=lambda: []).ensure_loaded() is False
+
+    def test_failed_load_serves_empty_and_retries_later(self):
+        loader = Mock(side_effect=RuntimeError("db down"))
+        index = StockSearchIndex(loader=loader, retry_interval=60)
+
+        assert index.search("삼성") == []
+        assert index.search("삼성") == []
+        assert not index.is_loaded
+        loader.assert_called_once()
+
+    def test_invalidate_reloads_in_background(self):
+        entries = list(ENTRIES)
+        release = threading.Event()
+
+        def loader():
+            if len(entries) > len(ENTRIES):
+                release.wait(2)
+            return list(entries)
+
+        index = StockSearchIndex(loader=loader)
+        index.refresh()
+
+        entries.append(StockEntry("373220", "LG에너지솔루션", "KOSPI", "2차전지", 90_000))
+        index.invalidate()
+        # 재로드 중에도 기존 스냅샷으로 즉시 응답
+        assert index.search("LG에너지솔루션") == []
+        release.set()
+
+        deadline = time.monotonic() + 2
+        while not index.search("LG에너지솔루션") and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _tickers(index.search("LG에너지솔루션")) == ["373220"]
+
+
+class TestIndexVersion:
+    """종목 마스터 버전 키 기반 재로드 테스트"""
+
+    def test_version_change_triggers_reload(self):
+        version = {"value": "1"}
+        loader = Mock(return_value=ENTRIES)
+        index = StockSearchIndex(
+            loader=loader,
+            version_reader=lambda: version["value"],
+            version_check_interval=0,
+        )
+
+        assert index.ensure_loaded() is True
+        assert index.ensure_loaded() is True
+        loader.assert_called_once()
+
+        version["value"] = "2"
+        index.ensure_loaded()
+
+        deadline = time.monotonic() + 2
+        while loader.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert loader.call_count == 2
+
+    def test_version_checked_at_most_once_per_interval(self):
+        reader = Mock(return_value="1")
+        index = StockSearchIndex(loader=lambda: ENTRIES, version_reader=reader, version_check_interval=60)
+
+        for _ in range(5):
+            index.ensure_loaded()
+
+        # 최초 로드 시 1회 + 주기 확인 1회
+        assert reader.call_count == 2
+
+    def test_version_reader_failure_keeps_index(self):
+        loader = Mock(return_value=ENTRIES)
+        index = StockSearchIndex(
+            loader=loader,
+            version_reader=Mock(side_effect=ConnectionError("redis down")),
+            version_check_interval=0,
+        )
+
+        assert index.ensure_loaded() is True
+        assert index.ensure_loaded() is True
+        loader.assert_called_once()
+
+    def test_invalidate_bumps_shared_version(self, monkeypatch):
+        fakeredis = pytest.importorskip("fakeredis")
+        import src.repositories.stock_search_index as module
+
+        monkeypatch.setattr(module, "_version_client", fakeredis.FakeRedis())
+        assert module.read_stock_index_version() is None
+
+        module.invalidate_stock_search_index()
+        module.invalidate_stock_search_index()
+
+        assert module.read_stock_index_version() == "2"
+
+
+class TestRetrieverUsesIndex:
+    """챗봇 retriever 색인 경로 테스트"""
+
+    @pytest.fixture
+    def retriever(self, index):
+        from services.chatbot.retriever import KnowledgeRetriever
+
+        retriever = KnowledgeRetriever(stock_index=index)
+        retriever._get_stock_repo = Mock(side_effect=AssertionError("DB 조회 금지"))
+        return retriever
+
+    def test_name_query(self, retriever):
+        results = retriever.search_stocks("삼성전지 전망 알려줘")
+
+        assert results[0] == {
+            "ticker": "005930", "name": "삼성전자", "market": "KOSPI", "sector": "반도체",
+        }
+
+    def test_ticker_query(self, retriever):
+        assert retriever.search_stocks("000660 뉴스")[0]["name"] == "SK하이닉스"
+
+    def test_unknown_elw_ticker_fallback(self, retriever):
+        result = retriever.search_stocks("0002B0 뉴스 알려줘")[0]
+
+        assert result["_is_fallback"] is True
+        assert result["market"] == "KOSDAQ-ELW"
+
+    def test_unloaded_index_loaded_on_first_search(self):
+        from services.chatbot.retriever import KnowledgeRetriever
+
+        loader = Mock(return_value=ENTRIES)
+        retriever = KnowledgeRetriever(stock_index=StockSearchIndex(loader=loader))
+        retriever._get_stock_repo = Mock(side_effect=AssertionError("DB 조회 금지"))
+
+        assert retriever.search_stocks("카카오 주가")[0]["ticker"] == "035720"
+        loader.assert_called_once()
+
+    def test_empty_injected_index_falls_back_to_db(self):
+        from services.chatbot.retriever import KnowledgeRetriever
+
+        empty = StockSearchIndex(loader=lambda: [])
+        retriever = KnowledgeRetriever(stock_index=empty)
+        repo = Mock()
+        repo.search.return_value = []
+        retriever._get_stock_repo = Mock(return_value=repo)
+
+        # 빈 색인(len 0)도 주입된 색인으로 사용하고, 비어 있으면 DB 경로로 처리
+        assert retriever._get_stock_index() is empty
+        assert retriever.search_stocks("카카오") == []
+        repo.search.assert_any_call("카카오", limit=5)
@@ -0,0 +1,229 @@
+"""
+일봉 백필 단위 테스트
+
+RealtimeDataCollector.backfill_daily_prices의 gap 감지, 동시 수집,
+다중 행 UPSERT, 커서 재개 동작을 in-memory SQLite로 검증합니다.
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from services.daytrading_scanner.realtime_data_collector import (
+    RealtimeDataCollector,
+    latest_trading_day,
+    upsert_daily_prices,
+)
+from src.utils.rate_limiter import AsyncTokenBucket
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+TARGET = latest_trading_day()
+
+
+@pytest.fixture
+def db_session():
+    from src.database.session import Base
+    from src.database.models import DailyPrice
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    # 000001: 최신 봉 보유, 000002: 5일 전까지 보유
+    session.add(DailyPrice(ticker="000001", date=TARGET, close_price=100, volume=1))
+    session.add(DailyPrice(ticker="000002", date=TARGET - timedelta(days=5), close_price=100, volume=1))
+    session.commit()
+
+    yield session
+
+    session.close()
+
+
+class FakeKiwoomAPI:
+    """호출 기록 및 동시 실행 수를 추적하는 Kiwoom API 대역"""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self.active = 0
+        self.max_active = 0
+
+    async def get_stock_daily_chart(self, ticker, days, base_date=None, adjusted_price=True):
+        self.calls.append((ticker, days))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        if ticker in self.fail:
+            raise RuntimeError("API error")
+
+        return [
+            {
+                "date": (TARGET - timedelta(days=i)).strftime("%Y%m%d"),
+                "open": 100, "high": 110, "low": 90, "close": 105, "volume": 1000,
+            }
+            for i in range(min(days, 3))
+        ]
+
+
+class MemoryCursor:
+    def __init__(self, value=None):
+        self.value = value
+        self.saved = []
+        self.cleared = False
+
+    def load(self):
+        return self.value
+
+    def save(self, ticker):
+        self.saved.append(ticker)
+
+    def clear(self):
+        self.cleared = True
+
+
+def _bucket():
+    return AsyncTokenBucket(rate=1000)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestDailyPriceBackfill:
+    """backfill_daily_prices 테스트"""
+
+    async def test_gap_detection_skips_up_to_date(self, db_session):
+        api = FakeKiwoomAPI()
+        collector = RealtimeDataCollector(kiwoom_api=api)
+
+        result = await collector.backfill_daily_prices(
+            ["000001", "000002", "000003"], db_session, days=30, rate_limiter=_bucket(),
+        )
+
+        assert result.skipped == ["000001"]
+        called = dict(api.calls)
+        assert "000001" not in called
+        # 기존 봉이 있으면 누락 구간만 조회
+        assert called["000002"] == 6
+        assert called["000003"] == 30
+        assert result.collected == {"000002": 3, "000003": 3}
+
+    async def test_batch_upsert_persists_rows(self, db_session):
+        from src.database.models import DailyPrice
+
+        collector = RealtimeDataCollector(kiwoom_api=FakeKiwoomAPI())
+        await collector.backfill_daily_prices(
+            ["000002", "000003"], db_session, rate_limiter=_bucket(), batch_size=10,
+        )
+
+        counts = dict(db_session.execute(
+            select(DailyPrice.ticker, func.count()).group_by(DailyPrice.ticker)
+        ).all())
+        assert counts == {"000001": 1, "000002": 4, "000003": 3}
+        latest = db_session.get(DailyPrice, ("000002", TARGET))
+        assert latest.close_price == 105
+
+    async def test_concurrency_bounded(self, db_session):
+        api = FakeKiwoomAPI()
+        collector = RealtimeDataCollector(kiwoom_api=api)
+        tickers = [f"1{i:05d}" for i in range(12)]
+
+        await collector.backfill_daily_prices(
+            tickers, db_session, concurrency=3, rate_limiter=_bucket(),
+        )
+
+        assert len(api.calls) == 12
+        assert 1 < api.max_active <= 3
+
+    async def test_failures_reported(self, db_session):
+        collector = RealtimeDataCollector(kiwoom_api=FakeKiwoomAPI(fail={"000003"}))
+
+        result = await collector.backfill_daily_prices(
+            ["000002", "000003"], db_session, rate_limiter=_bucket(),
+        )
+
+        assert result.failed == ["000003"]
+        assert "000002" in result.collected
+
+    async def test_cursor_resume(self, db_session):
+        api = FakeKiwoomAPI()
+        collector = RealtimeDataCollector(kiwoom_api=api)
+        cursor = MemoryCursor(value="000003")
+
+        result = await collector.backfill_daily_prices(
+            ["000002", "000003", "000004", "000005", "000006"], db_session,
+            batch_size=2, rate_limiter=_bucket(), cursor=cursor,
+        )
+
+        assert result.resumed_from == "000003"
+        assert sorted(t for t, _ in api.calls) == ["000004", "000005", "000006"]
+        assert cursor.saved == ["000005", "000006"]
+        assert cursor.cleared
+
+
+    async def test_cursor_stops_at_failed_batch(self, db_session):
+        collector = RealtimeDataCollector(kiwoom_api=FakeKiwoomAPI(fail={"000005"}))
+        cursor = MemoryCursor()
+
+        result = await collector.backfill_daily_prices(
+            ["000002", "000003", "000004", "000005", "000006", "000007"], db_session,
+            batch_size=2, rate_limiter=_bucket(), cursor=cursor,
+        )
+
+        # 실패 종목이 있는 배치 이후로는 커서를 진행하지 않음 (재시작 시 000004 이후부터 다시 수집)
+        assert result.failed == ["000005"]
+        assert cursor.saved == ["000003"]
+        assert "000006" in result.collected and "000007" in result.collected
+
+
+class TestUpsertDailyPrices:
+    """upsert_daily_prices 테스트"""
+
+    def test_duplicate_keys_collapsed(self, db_session):
+        from src.database.models import DailyPrice
+
+        day = TARGET - timedelta(days=1)
+        rows = [
+            {"ticker": "000009", "date": day, "open_price": 1, "high_price": 1,
+             "low_price": 1, "close_price": 1, "volume": 1},
+            {"ticker": "000009", "date": day, "open_price": 2, "high_price": 2,
+             "low_price": 2, "close_price": 2, "volume": 2},
+        ]
+
+        assert upsert_daily_prices(db_session, rows) == 1
+        db_session.commit()
+        assert db_session.get(DailyPrice, ("000009", day)).close_price == 2
+
+
+class TestAsyncTokenBucket:
+    """AsyncTokenBucket 테스트"""
+
+    async def test_paces_after_burst(self):
+        bucket = AsyncTokenBucket(rate=50, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 버스트 2개 이후 3개는 0.02초 간격
+        assert elapsed >= 0.05
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0)
+
+
+def test_latest_trading_day_skips_weekend():
+    assert latest_trading_day("20240106") == date(2024, 1, 5)  # 토요일 → 금요일
+    assert latest_trading_day("20240108") == date(2024, 1, 8)
@@ -0,0 +1,110 @@
+"""
+현재가 일괄 수집/브로드캐스트 단위 테스트
+
+- 다중 종목 조회 우선, 누락 종목 개별 조회 fallback
+- 클라이언트별 price_batch 단일 프레임 전송
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+from services.daytrading_scanner.broadcaster import broadcast_price_batch
+from services.daytrading_scanner.realtime_data_collector import RealtimeDataCollector
+from src.kiwoom.base import RealtimePrice
+
+
+def _quote(ticker, price):
+    return RealtimePrice(
+        ticker=ticker,
+        price=price,
+        change=100,
+        change_rate=0.1,
+        volume=1000,
+        bid_price=price - 50,
+        ask_price=price + 50,
+        timestamp="2024-01-01T00:00:00+00:00",
+    )
+
+
+class FakeConnectionManager:
+    def __init__(self, subscriptions):
+        self.subscriptions = subscriptions
+        self.sent = []
+
+    async def send_personal_message(self, message, client_id):
+        self.sent.append((client_id, message))
+        return True
+
+
+class TestCollectCurrentPrices:
+    """collect_current_prices_for_tickers 테스트"""
+
+    async def test_batch_quote_with_single_fallback(self):
+        api = Mock()
+        api.get_current_prices = AsyncMock(return_value={
+            "005930": _quote("005930", 75800),
+            "000660": _quote("000660", 120000),
+        })
+        api.get_current_price = AsyncMock(return_value=_quote("035420", 150000))
+        collector = RealtimeDataCollector(kiwoom_api=api)
+
+        with patch.object(collector, "_get_prices_from_redis", AsyncMock(return_value={})):
+            prices = await collector.collect_current_prices_for_tickers(["005930", "000660", "035420"])
+
+        api.get_current_prices.assert_awaited_once_with(["005930", "000660", "035420"])
+        api.get_current_price.assert_awaited_once_with("035420")
+        assert prices["005930"]["price"] == 75800
+        assert prices["035420"]["price"] == 150000
+
+    async def test_cached_prices_skip_api(self):
+        api = Mock()
+        api.get_current_prices = AsyncMock(return_value={})
+        collector = RealtimeDataCollector(kiwoom_api=api)
+
+        cached = {"005930": {"price": 75800}}
+        with patch.object(collector, "_get_prices_from_redis", AsyncMock(return_value=cached)):
+            prices = await collector.collect_current_prices_for_tickers(["005930"])
+
+        assert prices == cached
+        api.get_current_prices.assert_not_called()
+
+    async def test_collect_and_broadcast_sends_one_frame_per_client(self):
+        collector = RealtimeDataCollector(kiwoom_api=Mock())
+        manager = FakeConnectionManager({
+            "price:005930": {"client-1", "client-2"},
+            "price:000660": {"client-1"},
+        })
+        prices = {
+            "005930": {"price": 75800, "change": 100, "change_rate": 0.1, "volume": 1000},
+            "000660": {"price": 120000, "change": -100, "change_rate": -0.1, "volume": 500},
+            "035420": None,
+        }
+
+        with patch.object(collector, "collect_current_prices_for_tickers", AsyncMock(return_value=prices)):
+            await collector.collect_and_broadcast_prices(list(prices), connection_manager=manager)
+
+        frames = dict(manager.sent)
+        assert len(manager.sent) == 2
+        assert frames["client-1"]["type"] == "price_batch"
+        assert set(frames["client-1"]["data"]["prices"]) == {"005930", "000660"}
+        assert set(frames["client-2"]["data"]["prices"]) == {"005930"}
+
+
+class TestBroadcastPriceBatch:
+    """broadcast_price_batch 테스트"""
+
+    async def test_no_subscribers(self):
+        manager = FakeConnectionManager({})
+
+        sent = await broadcast_price_batch({"005930": {"price": 1}}, manager)
+
+        assert sent == 0
+        assert manager.sent == []
+
+    async def test_fallback_without_subscriptions(self):
+        manager = Mock(spec=["broadcast"])
+        manager.broadcast = AsyncMock()
+
+        await broadcast_price_batch({"005930": {"price": 1}, "000660": {"price": 2}}, manager)
+
+        topics = [call.kwargs["topic"] for call in manager.broadcast.await_args_list]
+        assert topics == ["price:005930", "price:000660"]
@@ -4,9 +4,7 @@ GET /session/{session_id} 엔드포인트 테스트
 먼저 실패하는 테스트를 작성하고, 그 후에 구현합니다.
 """
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
 
@@ -53,13 +51,13 @@ class TestSessionEndpoint:
         from services.chatbot.main import app
         assert app is not None
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_found(self, mock_get_session_manager):
         """세션 조회 성공 테스트"""
         from services.chatbot.main import app
 
         # Mock session manager - MagicMock 사용
-        mock_manager = MagicMock()
+        mock_manager = AsyncMock()
         mock_manager.get_session_info.return_value = MOCK_SESSION_INFO
         mock_manager.get_history_formatted.return_value = MOCK_MESSAGES
         mock_get_session_manager.return_value = mock_manager
@@ -77,12 +75,12 @@ class TestSessionEndpoint:
         mock_manager.get_session_info.assert_called_once_with(MOCK_SESSION_ID)
         mock_manager.get_history_formatted.assert_called_once_with(MOCK_SESSION_ID)
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_not_found(self, mock_get_session_manager):
         """세션을 찾을 수 없을 때 테스트"""
         from services.chatbot.main import app
 
-        mock_manager = MagicMock()
+        mock_manager = AsyncMock()
         mock_manager.get_session_info.return_value = None
         mock_get_session_manager.return_value = mock_manager
 
@@ -93,12 +91,12 @@ class TestSessionEndpoint:
         assert response.status_code == 404
         assert "detail" in response.json()
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_with_empty_messages(self, mock_get_session_manager):
         """메시지가 없는 세션 조회 테스트"""
         from services.chatbot.main import app
 
-        mock_manager = MagicMock()
+        mock_manager = AsyncMock()
         mock_manager.get_session_info.return_value = MOCK_SESSION_INFO
         mock_manager.get_history_formatted.return_value = []
         mock_get_session_manager.return_value = mock_manager
@@ -111,12 +109,12 @@ class TestSessionEndpoint:
         assert data["messages"] == []
         assert data["message_count"] == 3  # 메타데이터는 정상
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_response_structure(self, mock_get_session_manager):
         """응답 구조 검증 테스트"""
         from services.chatbot.main import app
 
-        mock_manager = MagicMock()
+        mock_manager = AsyncMock()
         mock_manager.get_session_info.return_value = MOCK_SESSION_INFO
         mock_manager.get_history_formatted.return_value = MOCK_MESSAGES
         mock_get_session_manager.return_value = mock_manager
@@ -140,12 +138,12 @@ class TestSessionEndpoint:
             assert "content" in msg
             assert "timestamp" in msg
 
-    @patch('services.chatbot.main.get_session_manager')
+    @patch('services.chatbot.main.get_session_store')
     def test_get_session_exception_handling(self, mock_get_session_manager):
         """예외 처리 테스트"""
         from services.chatbot.main import app
 
-        mock_manager = MagicMock()
+        mock_manager = AsyncMock()
         mock_manager.get_session_info.side_effect = Exception("Redis error")
         mock_get_session_manager.return_value = mock_manager
 
@@ -0,0 +1,187 @@
+"""
+AsyncSessionStore 단위 테스트
+
+- 메시지 추가/세션 생성이 트랜잭션 파이프라인 1회로 처리되는지
+- 바이너리 메시지 인코딩 (압축 포함)
+- 저장 개수 제한 / 토큰 예산 기반 기록 윈도우
+"""
+
+import pytest
+
+from services.chatbot.session_store import (
+    HISTORY_PREFIX,
+    MAX_HISTORY_MESSAGES,
+    SESSION_PREFIX,
+    AsyncSessionStore,
+    decode_message,
+    encode_message,
+    estimate_tokens,
+)
+
+
+class FakeAsyncRedis:
+    """파이프라인 왕복 횟수를 기록하는 redis.asyncio 대역"""
+
+    def __init__(self):
+        self.lists = {}
+        self.hashes = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    # --- 단일 명령 ---
+    async def lrange(self, key, start, end):
+        self.round_trips += 1
+        return self._lrange(key, start, end)
+
+    async def hgetall(self, key):
+        self.round_trips += 1
+        return {k.encode(): str(v).encode() for k, v in self.hashes.get(key, {}).items()}
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self.lists.pop(key, None)
+            self.hashes.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    # --- 내부 구현 ---
+    def _lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:end + 1] if end >= 0 else items[start:]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        redis = self.redis
+        redis.round_trips += 1
+        for name, args, kwargs in self.ops:
+            if name == "lpush":
+                redis.lists.setdefault(args[0], []).insert(0, args[1])
+            elif name == "ltrim":
+                key, start, end = args
+                redis.lists[key] = redis.lists.get(key, [])[start:end + 1]
+            elif name == "expire":
+                redis.ttls[args[0]] = args[1]
+            elif name == "hset":
+                fields = kwargs.get("mapping") or {args[1]: args[2]}
+                redis.hashes.setdefault(args[0], {}).update(fields)
+            elif name == "hsetnx":
+                redis.hashes.setdefault(args[0], {}).setdefault(args[1], args[2])
+            elif name == "hincrby":
+                fields = redis.hashes.setdefault(args[0], {})
+                fields[args[1]] = int(fields.get(args[1], 0)) + args[2]
+            else:
+                raise AssertionError(f"unexpected command: {name}")
+        return [None] * len(self.ops)
+
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def store(redis):
+    return AsyncSessionStore(client=redis)
+
+
+class TestMessageCodec:
+    """바이너리 메시지 인코딩 테스트"""
+
+    def test_round_trip(self):
+        raw = encode_message("assistant", "삼성전자 VCP A등급", timestamp=1_700_000_000.0)
+        message = decode_message(raw)
+
+        assert message["role"] == "assistant"
+        assert message["content"] == "삼성전자 VCP A등급"
+        assert message["tokens"] == estimate_tokens("삼성전자 VCP A등급")
+        assert message["timestamp"].startswith("2023-11-")
+
+    def test_long_content_compressed(self):
+        content = "외국인 순매수 지속. " * 200
+        raw = encode_message("user", content)
+
+        assert len(raw) < len(content.encode("utf-8")) // 4
+        assert decode_message(raw)["content"] == content
+
+    def test_unknown_role(self):
+        with pytest.raises(ValueError):
+            encode_message("tool", "x")
+
+
+class TestAsyncSessionStore:
+    """AsyncSessionStore 테스트"""
+
+    async def test_add_message_single_round_trip(self, store, redis):
+        assert await store.add_message("s1", "user", "안녕") is True
+
+        assert redis.round_trips == 1
+        assert redis.hashes[f"{SESSION_PREFIX}s1"]["message_count"] == 1
+        assert redis.ttls[f"{HISTORY_PREFIX}s1"] == redis.ttls[f"{SESSION_PREFIX}s1"]
+
+    async def test_history_order_and_info(self, store):
+        session_id = await store.create_session()
+        await store.add_message(session_id, "user", "질문")
+        await store.add_message(session_id, "assistant", "답변")
+
+        history = await store.get_history_formatted(session_id)
+        info = await store.get_session_info(session_id)
+
+        assert [(m["role"], m["content"]) for m in history] == [("user", "질문"), ("assistant", "답변")]
+        assert set(history[0]) == {"role", "content", "timestamp"}
+        assert info["message_count"] == 2
+        assert await store.get_message_count(session_id) == 2
+
+    async def test_history_capped(self, store, redis):
+        for i in range(MAX_HISTORY_MESSAGES + 5):
+            await store.add_message("s1", "user", f"메시지 {i}")
+
+        history = await store.get_history("s1")
+
+        assert len(redis.lists[f"{HISTORY_PREFIX}s1"]) == MAX_HISTORY_MESSAGES
+        assert history[0]["content"] == f"메시지 {MAX_HISTORY_MESSAGES + 4}"
+
+    async def test_history_window_respects_token_budget(self, store, redis):
+        await store.add_message("s1", "user", "오래된 긴 질문 " * 100)
+        await store.add_message("s1", "assistant", "짧은 답")
+        await store.add_message("s1", "user", "새 질문")
+        redis.round_trips = 0
+
+        window = await store.get_history_window("s1", token_budget=50)
+
+        assert [m["content"] for m in window] == ["짧은 답", "새 질문"]
+        assert redis.round_trips == 1
+
+    async def test_history_window_keeps_latest_over_budget(self, store):
+        await store.add_message("s1", "user", "아주 긴 질문 " * 100)
+
+        window = await store.get_history_window("s1", token_budget=10)
+
+        assert len(window) == 1
+
+    async def test_clear_session(self, store, redis):
+        await store.add_message("s1", "user", "안녕")
+
+        assert await store.clear_session("s1") is True
+        assert await store.get_history("s1") == []
+        assert await store.get_session_info("s1") is None
+
+    async def test_fallback_without_redis(self):
+        store = AsyncSessionStore(redis_url="redis://127.0.0.1:1/0")
+
+        session_id = await store.create_session()
+
+        assert session_id
+        assert await store.add_message(session_id, "user", "안녕") is False
+        assert await store.get_history_window(session_id) == []
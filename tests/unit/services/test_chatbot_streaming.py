@@ -0,0 +1,251 @@
+"""
+Chatbot Async/Streaming Pipeline Tests
+- 검색 단계 동시 실행 / 단계별 마감 시간
+- LLM 답변 스트리밍
+- /chat/stream SSE 엔드포인트
+"""
+
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from services.chatbot.llm_client import LLMClient, LLMResponse
+from services.chatbot.retriever import KnowledgeRetriever
+
+
+MOCK_STOCKS = [
+    {"ticker": "005930", "name": "삼성전자"},
+    {"ticker": "000660", "name": "SK하이닉스"},
+]
+
+
+def _slow(result, delay):
+    def call(*args, **kwargs):
+        time.sleep(delay)
+        return result
+    return call
+
+
+@pytest.fixture
+def retriever():
+    retriever = KnowledgeRetriever()
+    retriever.search_stocks = Mock(return_value=MOCK_STOCKS)
+    retriever.search_signals = Mock(side_effect=lambda ticker, limit: [{"ticker": ticker}])
+    retriever.search_news = Mock(return_value=[{"ticker": "005930", "summary": "뉴스"}])
+    retriever.get_market_status = Mock(return_value={"status": "GREEN"})
+    retriever.enrich_with_kiwoom_data = AsyncMock(side_effect=lambda ctx: ctx)
+    return retriever
+
+
+def _parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestRetrieveContextAsync:
+    """KnowledgeRetriever.retrieve_context_async 테스트"""
+
+    async def test_same_shape_as_sync(self, retriever):
+        context = await retriever.retrieve_context_async("삼성전자 시장 현황")
+
+        assert context["stocks"] == MOCK_STOCKS
+        assert context["signals"] == [{"ticker": "005930"}, {"ticker": "000660"}]
+        assert context["news"] == [{"ticker": "005930", "summary": "뉴스"}]
+        assert context["market_status"] == {"status": "GREEN"}
+        assert context["timed_out_stages"] == []
+        retriever.search_news.assert_called_once_with(ticker="005930", limit=2)
+
+    async def test_stages_run_concurrently(self, retriever):
+        retriever.search_signals = Mock(side_effect=_slow([], 0.2))
+        retriever.search_news = Mock(side_effect=_slow([], 0.2))
+        retriever.get_market_status = Mock(side_effect=_slow({}, 0.2))
+
+        async def slow_enrich(ctx):
+            await asyncio.sleep(0.2)
+            return ctx
+
+        retriever.enrich_with_kiwoom_data = slow_enrich
+
+        started = time.monotonic()
+        await retriever.retrieve_context_async("삼성전자 시장")
+        elapsed = time.monotonic() - started
+
+        # 시그널(2종목 순차 0.4s)이 가장 긴 단계, 나머지는 겹쳐서 실행
+        assert elapsed < 0.7
+
+    async def test_slow_stage_times_out_with_partial_context(self, retriever):
+        retriever.search_news = Mock(side_effect=_slow([{"ticker": "late"}], 0.5))
+
+        started = time.monotonic()
+        context = await retriever.retrieve_context_async(
+            "삼성전자", stage_timeouts={"news": 0.05}
+        )
+
+        assert time.monotonic() - started < 0.4
+        assert context["news"] == []
+        assert context["signals"]
+        assert context["timed_out_stages"] == ["news"]
+
+    async def test_failed_stage_is_empty(self, retriever):
+        retriever.search_stocks = Mock(side_effect=RuntimeError("db down"))
+
+        context = await retriever.retrieve_context_async("삼성전자")
+
+        assert context["stocks"] == []
+        retriever.search_signals.assert_not_called()
+
+    async def test_threaded_stages_use_own_sessions(self, retriever):
+        opened = []
+
+        @contextmanager
+        def fake_session():
+            session = Mock(name=f"session{len(opened)}")
+            opened.append(session)
+            yield session
+            session.closed = True
+
+        seen = []
+
+        def record(result):
+            def call(*args, **kwargs):
+                repo = retriever._get_stock_repo()
+                seen.append((threading.get_ident(), repo.session, retriever._get_signal_repo().session))
+                return result
+            return call
+
+        retriever.search_stocks = Mock(side_effect=record(MOCK_STOCKS))
+        retriever.search_signals = Mock(side_effect=record([]))
+
+        with patch("src.database.session.get_db_session_sync", fake_session):
+            await retriever.retrieve_context_async("삼성전자")
+
+        # 종목 단계와 시그널 단계가 각자 세션을 열고 닫음 (시그널 2종목은 한 세션)
+        assert len(opened) == 2
+        assert all(session.closed for session in opened)
+        assert [stock for _, stock, _ in seen] == [opened[0], opened[1], opened[1]]
+        assert all(stock is signal for _, stock, signal in seen)
+        # 스레드 밖에서는 공유 저장소(지연 생성)로 돌아감
+        assert getattr(retriever._local, "stock_repo", None) is None
+
+    async def test_kiwoom_enrich_concurrent_per_stock(self):
+        retriever = KnowledgeRetriever()
+
+        async def price(ticker):
+            await asyncio.sleep(0.1)
+            return {"price": 100}
+
+        retriever.get_realtime_price = price
+        context = {"stocks": [{"ticker": "005930"}, {"ticker": "000660"}, {"ticker": "035420"}]}
+
+        with patch("services.chatbot.retriever.is_kiwoom_available", return_value=True):
+            started = time.monotonic()
+            await retriever.enrich_with_kiwoom_data(context)
+
+        assert time.monotonic() - started < 0.25
+        assert all(s["realtime_price"]["price"] == 100 for s in context["stocks"])
+
+
+class TestStreamReply:
+    """LLMClient.stream_reply 테스트"""
+
+    async def test_mock_mode_streams_words(self):
+        client = LLMClient(api_key=None)
+
+        chunks = [c async for c in client.stream_reply("## 사용자 질문\n시장 상태 어때?")]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == LLMClient.MOCK_RESPONSES["시장"]
+
+    async def test_streams_gemini_chunks(self):
+        client = LLMClient(api_key=None)
+        client._use_mock = False
+        client._client = Mock()
+        client._client.generate_content.return_value = iter([Mock(text="안녕"), Mock(text="하세요")])
+
+        chunks = [c async for c in client.stream_reply("prompt")]
+
+        assert chunks == ["안녕", "하세요"]
+        client._client.generate_content.assert_called_once_with("prompt", stream=True)
+
+    async def test_error_before_first_chunk_falls_back_to_mock(self):
+        client = LLMClient(api_key=None)
+        client._use_mock = False
+        client._client = Mock()
+        client._client.generate_content.side_effect = RuntimeError("quota")
+
+        chunks = [c async for c in client.stream_reply("삼성전자")]
+
+        assert "".join(chunks) == LLMClient.MOCK_RESPONSES["삼성전자"]
+
+    def test_build_response(self):
+        response = LLMClient(api_key=None).build_response(" VCP 패턴 추천 ")
+
+        assert response.reply == "VCP 패턴 추천"
+        assert "VCP 시그널 확인" in response.suggestions
+
+
+class TestChatStreamEndpoint:
+    """/chat/stream SSE 엔드포인트 테스트"""
+
+    @patch("services.chatbot.main.build_rag_prompt", return_value="prompt")
+    @patch("services.chatbot.main.get_session_store")
+    @patch("services.chatbot.main.get_retriever")
+    @patch("services.chatbot.main.get_llm_client")
+    def test_streams_tokens_then_done(self, mock_llm, mock_retriever, mock_session, _prompt):
+        from fastapi.testclient import TestClient
+        from services.chatbot.main import app
+
+        session_mgr = AsyncMock()
+        session_mgr.get_history_window.return_value = []
+        mock_session.return_value = session_mgr
+
+        ret = Mock()
+        ret.retrieve_context_async = AsyncMock(return_value={
+            "query_type": "stock", "stocks": MOCK_STOCKS[:1], "timed_out_stages": ["news"],
+        })
+        mock_retriever.return_value = ret
+
+        async def stream(prompt, history):
+            for chunk in ["삼성전자는 ", "VCP ", "A등급"]:
+                yield chunk
+
+        llm = Mock()
+        llm.stream_reply = stream
+        llm.build_response.side_effect = lambda text: LLMResponse(reply=text, suggestions=["x"])
+        mock_llm.return_value = llm
+
+        response = TestClient(app).post("/chat/stream", json={"message": "삼성전자 어때?", "session_id": "s-1"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["meta", "context", "token", "token", "token", "done"]
+        assert events[0][1] == {"session_id": "s-1"}
+        assert events[1][1]["timed_out_stages"] == ["news"]
+        assert events[-1][1]["reply"] == "삼성전자는 VCP A등급"
+        session_mgr.add_message.assert_called_with("s-1", "assistant", "삼성전자는 VCP A등급")
+
+    @patch("services.chatbot.main.get_session_store")
+    @patch("services.chatbot.main.get_retriever")
+    @patch("services.chatbot.main.get_llm_client")
+    def test_error_event(self, mock_llm, mock_retriever, mock_session):
+        from fastapi.testclient import TestClient
+        from services.chatbot.main import app
+
+        mock_session.return_value = AsyncMock()
+        ret = Mock()
+        ret.retrieve_context_async = AsyncMock(side_effect=RuntimeError("boom"))
+        mock_retriever.return_value = ret
+
+        response = TestClient(app).post("/chat/stream", json={"message": "hi"})
+
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["meta", "error"]
@@ -0,0 +1,202 @@
+"""
+Celery 비동기 태스크 런타임 테스트
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tasks import async_runtime
+from tasks.async_runtime import AsyncRuntime
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime(name="test-async-runtime")
+    yield rt
+    rt.shutdown(timeout=2)
+
+
+class FakeClient:
+    """aclose()로 정리되는 클라이언트 대역"""
+
+    instances = 0
+
+    def __init__(self):
+        FakeClient.instances += 1
+        self.closed = False
+        self.loop = asyncio.get_running_loop()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestAsyncRuntime:
+
+    def test_loop_persists_across_runs(self, runtime):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = runtime.run(current_loop())
+        second = runtime.run(current_loop())
+
+        assert first is second
+        assert runtime.get_stats()["submitted"] == 2
+
+    def test_resource_reused_and_closed_on_shutdown(self, runtime):
+        FakeClient.instances = 0
+
+        async def use_client():
+            return await runtime.resource("client", FakeClient)
+
+        first = runtime.run(use_client())
+        second = runtime.run(use_client())
+
+        assert first is second
+        assert FakeClient.instances == 1
+        assert runtime.get_stats()["resources"] == ["client"]
+
+        runtime.shutdown(timeout=2)
+
+        assert first.closed
+        assert not runtime.is_running
+
+    def test_restart_after_shutdown(self, runtime):
+        async def answer():
+            return 42
+
+        runtime.run(answer())
+        runtime.shutdown(timeout=2)
+
+        assert runtime.run(answer()) == 42
+
+    def test_run_all_executes_concurrently(self, runtime):
+        async def work(i):
+            await asyncio.sleep(0.1)
+            if i == 3:
+                raise ValueError("boom")
+            return i
+
+        started = time.monotonic()
+        results = runtime.run_all([work(i) for i in range(5)])
+        elapsed = time.monotonic() - started
+
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert elapsed < 0.4
+
+    def test_concurrent_callers_share_loop(self, runtime):
+        """스레드 풀 워커처럼 여러 스레드가 동시에 제출해도 한 루프에서 겹쳐 실행"""
+        async def io_task():
+            await asyncio.sleep(0.1)
+            return asyncio.get_running_loop()
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            loops = list(pool.map(lambda _: runtime.run(io_task()), range(4)))
+        elapsed = time.monotonic() - started
+
+        assert len(set(map(id, loops))) == 1
+        assert elapsed < 0.4
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+
+        async def wait_cancelled():
+            await asyncio.wait_for(cancelled.wait(), 1)
+            return True
+
+        assert runtime.run(wait_cancelled())
+        assert runtime.get_stats()["failed"] == 1
+
+    def test_interrupted_caller_cancels_coroutine(self, runtime, monkeypatch):
+        from celery.exceptions import SoftTimeLimitExceeded
+
+        started = threading.Event()
+        cancelled = asyncio.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        def interrupted(future, timeout=None):
+            started.wait(1)
+            raise SoftTimeLimitExceeded()
+
+        with monkeypatch.context() as patched:
+            patched.setattr(concurrent.futures.Future, "result", interrupted)
+            with pytest.raises(SoftTimeLimitExceeded):
+                runtime.run(slow())
+
+        async def wait_cancelled():
+            await asyncio.wait_for(cancelled.wait(), 1)
+            return True
+
+        assert runtime.run(wait_cancelled())
+        assert runtime.get_stats()["failed"] == 1
+
+    def test_submit_from_loop_thread_rejected(self, runtime):
+        async def nested():
+            async def inner():
+                return 1
+
+            runtime.submit(inner())
+
+        with pytest.raises(RuntimeError):
+            runtime.run(nested())
+
+
+class TestSharedKiwoomApi:
+
+    @pytest.fixture(autouse=True)
+    def global_runtime(self):
+        yield
+        async_runtime.shutdown_runtime(timeout=2)
+
+    def test_shared_instance_per_config(self):
+        from src.kiwoom.base import KiwoomConfig
+
+        config = KiwoomConfig(
+            app_key="test_app_key",
+            secret_key="test_secret",
+            base_url="https://mockapi.kiwoom.com",
+            ws_url="wss://mockapi.kiwoom.com:10000/api/dostk/websocket",
+        )
+        other = KiwoomConfig(
+            app_key="other_app_key",
+            secret_key="test_secret",
+            base_url="https://mockapi.kiwoom.com",
+            ws_url="wss://mockapi.kiwoom.com:10000/api/dostk/websocket",
+        )
+
+        async def get_apis():
+            return (
+                await async_runtime.get_kiwoom_api(config),
+                await async_runtime.get_kiwoom_api(config),
+                await async_runtime.get_kiwoom_api(other),
+            )
+
+        first, again = async_runtime.run_async(get_apis())[:2]
+        third = async_runtime.run_async(get_apis())[2]
+
+        assert first is again
+        assert third is not first
+        assert async_runtime.get_runtime() is async_runtime.get_runtime()
@@ -48,29 +48,21 @@ class TestVCPTasks:
 class TestSignalTasks:
     """시그널 생성 태스크 테스트"""
 
-    @patch("services.signal_engine.scorer.SignalScorer")
-    def test_generate_jongga_signals_task(self, mock_scorer_class):
+    @patch("tasks.signal_tasks.chord")
+    @patch("tasks.signal_tasks._load_universe")
+    def test_generate_jongga_signals_task(self, mock_universe, mock_chord):
         """종가베팅 시그널 생성 태스크 테스트"""
-        # Mock signal 객체 생성
-        mock_signal = Mock()
-        mock_signal.score.total = 8
-        mock_signal.to_dict.return_value = {
-            "ticker": "005930",
-            "name": "삼성전자",
-            "grade": "A",
-            "score": {"total": 8}
-        }
-
-        # Mock scorer 인스턴스 설정
-        mock_scorer = Mock()
-        mock_scorer.calculate.return_value = mock_signal
-        mock_scorer_class.return_value = mock_scorer
+        mock_universe.return_value = [("005930", "삼성전자")]
+        chord_result = Mock(id="reducer-id")
+        chord_result.parent.results = [Mock(id="shard-id")]
+        mock_chord.return_value.return_value = chord_result
 
         result = generate_jongga_signals(10_000_000, 10)
 
         assert result is not None
         assert "status" in result
-        assert result["status"] == "success"
+        assert result["status"] == "dispatched"
+        assert result["reducer_task_id"] == "reducer-id"
 
     @patch("services.signal_engine.scorer.SignalScorer")
     def test_analyze_single_stock_task(self, mock_scorer_class):
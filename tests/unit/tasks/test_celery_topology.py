@@ -0,0 +1,141 @@
+"""
+Celery 큐 토폴로지 / 직렬화 / 결과 참조 테스트
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from tasks import serialization
+from tasks.celery_app import (
+    QUEUE_BULK,
+    QUEUE_DEFAULT,
+    QUEUE_LLM,
+    QUEUE_REALTIME,
+    WORKER_PROFILES,
+    TaskPriority,
+    celery_app,
+)
+from tasks.result_store import PAYLOAD_KEY_PREFIX, load_payload, store_payload
+
+
+def route_of(task_name: str) -> dict:
+    return celery_app.amqp.router.route({}, task_name)
+
+
+class TestTaskRouting:
+    """태스크 라우팅 테스트"""
+
+    @pytest.mark.parametrize("task_name, queue", [
+        ("ohlc.save_snapshot", QUEUE_REALTIME),
+        ("tasks.market_tasks.update_market_gate", QUEUE_REALTIME),
+        ("tasks.scan_tasks.scan_vcp_patterns", QUEUE_BULK),
+        ("tasks.signal_tasks.generate_jongga_signals", QUEUE_BULK),
+        ("tasks.market_tasks.collect_institutional_flow", QUEUE_BULK),
+        ("tasks.sync_all_data", QUEUE_BULK),
+        ("news.pipeline", QUEUE_LLM),
+        ("tasks.news_tasks.scheduled_daily_collection", QUEUE_LLM),
+        ("tasks.signal_tasks.analyze_single_stock", QUEUE_LLM),
+        ("unknown.task", QUEUE_DEFAULT),
+    ])
+    def test_queue_routing(self, task_name, queue):
+        assert route_of(task_name)["queue"].name == queue
+
+    def test_latency_critical_tasks_have_highest_priority(self):
+        assert route_of("ohlc.save_snapshot")["priority"] == TaskPriority.CRITICAL
+        assert route_of("tasks.market_tasks.update_market_gate")["priority"] == TaskPriority.CRITICAL
+
+    def test_priority_steps_match_redis_semantics(self):
+        """Redis 브로커는 숫자가 작을수록 먼저 처리"""
+        assert TaskPriority.CRITICAL < TaskPriority.HIGH < TaskPriority.MEDIUM < TaskPriority.LOW
+        options = celery_app.conf.broker_transport_options
+        assert options["queue_order_strategy"] == "priority"
+        assert TaskPriority.MEDIUM in options["priority_steps"]
+
+    def test_prefetch_one_by_default(self):
+        assert celery_app.conf.worker_prefetch_multiplier == 1
+
+    def test_realtime_profile_uses_thread_pool(self):
+        """I/O 위주 realtime 워커는 스레드들이 공유 이벤트 루프에 태스크를 겹쳐 실행"""
+        assert WORKER_PROFILES[QUEUE_REALTIME]["pool"] == "threads"
+        assert "pool" not in WORKER_PROFILES[QUEUE_BULK]
+
+    def test_all_beat_tasks_routed_to_declared_queue(self):
+        declared = {queue.name for queue in celery_app.conf.task_queues}
+        for entry in celery_app.conf.beat_schedule.values():
+            assert route_of(entry["task"])["queue"].name in declared
+
+
+class TestZjsonSerializer:
+    """zjson 직렬화 테스트"""
+
+    def test_small_payload_is_plain(self):
+        data = serialization.dumps({"a": 1, "이름": "삼성전자"})
+        assert data[:1] == b"\x00"
+        assert serialization.loads(data) == {"a": 1, "이름": "삼성전자"}
+
+    def test_large_payload_is_compressed(self):
+        payload = [{"ticker": f"{i:06d}", "score": 50.0} for i in range(500)]
+        data = serialization.dumps(payload)
+        assert data[:1] == b"\x01"
+        assert len(data) < len(json.dumps(payload))
+        assert serialization.loads(data) == payload
+
+    @pytest.mark.parametrize("size", [1, 200])
+    def test_round_trip_preserves_types(self, size):
+        payload = {
+            "rows": [
+                {
+                    "date": date(2026, 10, 16),
+                    "at": datetime(2026, 10, 16, 9, 0, 1, tzinfo=timezone.utc),
+                    "price": Decimal("71500.50"),
+                    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                }
+            ] * size,
+        }
+        data = serialization.dumps(payload)
+
+        assert data[:1] == (b"\x00" if size == 1 else b"\x01")
+        assert serialization.loads(data) == payload
+
+    def test_unknown_flag_rejected(self):
+        with pytest.raises(ValueError):
+            serialization.loads(b"\x07{}")
+
+    def test_registered_as_task_serializer(self):
+        from kombu.serialization import dumps as kombu_dumps, loads as kombu_loads
+
+        content_type, encoding, body = kombu_dumps({"x": [1, 2]}, serializer="zjson")
+        assert celery_app.conf.task_serializer == "zjson"
+        assert content_type == serialization.CONTENT_TYPE
+        assert kombu_loads(body, content_type, encoding, accept={content_type}) == {"x": [1, 2]}
+
+
+class TestResultStore:
+    """결과 페이로드 참조 테스트"""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeRedis()
+
+    def test_store_and_load(self, redis_client):
+        payload = [{"ticker": "005930", "score": 80}] * 100
+        ref = store_payload("vcp_scan", payload, client=redis_client)
+
+        assert ref.startswith(PAYLOAD_KEY_PREFIX + "vcp_scan:")
+        assert load_payload(ref, client=redis_client) == payload
+        assert redis_client.ttl(ref) > 0
+
+    def test_store_failure_returns_none(self):
+        client = Mock()
+        client.set.side_effect = ConnectionError("down")
+        assert store_payload("vcp_scan", [1], client=client) is None
+
+    def test_load_rejects_foreign_keys(self, redis_client):
+        redis_client.set("other:key", b"\x00[]")
+        assert load_payload("other:key", client=redis_client) is None
@@ -49,10 +49,11 @@ class TestCollectionTasks:
         assert collect_supply_demand is not None
         assert sync_all_data is not None
 
+    @patch('src.tasks.collection_tasks.invalidate_stock_search_index')
     @patch('src.tasks.collection_tasks.KRXCollector')
     @patch('src.tasks.collection_tasks.StockRepository')
     @patch('src.tasks.collection_tasks.SessionLocal')
-    def test_collect_stock_list_success(self, mock_session_local, mock_repo_class, mock_krx_class):
+    def test_collect_stock_list_success(self, mock_session_local, mock_repo_class, mock_krx_class, mock_invalidate):
         """종목 리스트 수집 성공 테스트"""
         from src.tasks.collection_tasks import collect_stock_list
 
@@ -74,6 +75,8 @@ class TestCollectionTasks:
         # Verify
         assert result == 2  # 2 stocks in MOCK_STOCK_LIST
         mock_collector.fetch_stock_list.assert_called_once_with(market="KOSPI")
+        # 다른 프로세스의 종목 검색 색인 재로드 트리거
+        mock_invalidate.assert_called_once()
 
     @patch('src.tasks.collection_tasks.KRXCollector')
     @patch('src.tasks.collection_tasks.SessionLocal')
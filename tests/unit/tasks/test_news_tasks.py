@@ -141,6 +141,27 @@ class TestCollectAndSaveTask:
         assert result["saved_count"] == 0
 
 
+class TestAnalyzeSentimentTask:
+    """감성 분석 태스크 테스트"""
+
+    @patch("tasks.news_tasks.SentimentAnalyzer")
+    def test_llm_batch_failure_retries(self, mock_analyzer_class):
+        """LLM 배치 실패를 중립으로 반환하지 않고 재시도"""
+        from celery.exceptions import Retry
+        from src.analysis.sentiment_pipeline import SentimentBatchError
+
+        error = SentimentBatchError(failed=2, total=2)
+        mock_analyzer_class.return_value.analyze_batch.side_effect = error
+
+        with patch.object(analyze_sentiment, "retry", side_effect=Retry()) as mock_retry:
+            with pytest.raises(Retry):
+                analyze_sentiment("005930", [{"title": "기사1"}, {"title": "기사2"}])
+
+        mock_analyzer_class.return_value.analyze_batch.assert_called_once()
+        assert mock_analyzer_class.return_value.analyze_batch.call_args.kwargs == {"raise_on_failure": True}
+        mock_retry.assert_called_once_with(exc=error, countdown=60)
+
+
 class TestScheduledCollection:
     """스케줄된 뉴스 수집 테스트"""
 
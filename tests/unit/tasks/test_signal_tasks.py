@@ -5,105 +5,129 @@ Unit Tests for Signal Tasks
 
 from unittest.mock import Mock, patch
 
-from tasks.signal_tasks import generate_jongga_signals, analyze_single_stock
+from tasks.signal_tasks import (
+    generate_jongga_signals,
+    score_jongga_shard,
+    reduce_jongga_signals,
+    analyze_single_stock,
+)
 
 
-class TestGenerateJonggaSignals:
-    """generate_jongga_signals 태스크 테스트"""
+def _signal_dict(ticker, grade, total):
+    return {
+        "ticker": ticker,
+        "grade": grade,
+        "score": {"total": total},
+        "entry_price": 10000,
+        "target_price": 10500,
+        "stop_loss": 9700,
+    }
 
-    @patch("services.signal_engine.scorer.SignalScorer")
-    def test_전체종목_시그널생성_성공(self, mock_scorer_class):
-        """전체 종목 시그널 생성 성공"""
-        # Mock 설정
-        mock_signal = Mock()
-        mock_signal.score.total = 8
-        mock_signal.to_dict.return_value = {
-            "ticker": "005930",
-            "name": "삼성전자",
-            "grade": "A",
-            "score": {"total": 8}
-        }
 
-        mock_scorer = Mock()
-        mock_scorer.calculate.return_value = mock_signal
-        mock_scorer_class.return_value = mock_scorer
+class TestGenerateJonggaSignals:
+    """generate_jongga_signals 태스크 테스트 (샤드 chord 발행)"""
+
+    @patch("tasks.signal_tasks.chord")
+    @patch("tasks.signal_tasks._load_universe")
+    def test_전체종목_샤드발행(self, mock_universe, mock_chord):
+        """전 종목을 shard_size 단위로 나눠 chord 발행"""
+        mock_universe.return_value = [(f"{i:06d}", f"종목{i}") for i in range(5)]
+        chord_result = Mock(id="reducer-id")
+        chord_result.parent.results = [Mock(id="s0"), Mock(id="s1"), Mock(id="s2")]
+        mock_chord.return_value.return_value = chord_result
+
+        task = generate_jongga_signals.s(capital=10_000_000, top_n=3, market="ALL", shard_size=2)
+        result = task()
 
-        # Arrange
-        task = generate_jongga_signals.s(capital=10_000_000, top_n=3)
+        assert result["status"] == "dispatched"
+        assert result["total_tickers"] == 5
+        assert result["shards"] == 3
+        assert result["shard_task_ids"] == ["s0", "s1", "s2"]
+        assert result["reducer_task_id"] == "reducer-id"
+        mock_universe.assert_called_once_with("ALL")
 
-        # Act
-        result = task()
+        header = mock_chord.call_args[0][0]
+        assert [len(sig.args[0]) for sig in header] == [2, 2, 1]
+        callback = mock_chord.return_value.call_args[0][0]
+        assert callback.kwargs == {"capital": 10_000_000, "top_n": 3, "min_score": 6}
+
+    @patch("tasks.signal_tasks.chord")
+    @patch("tasks.signal_tasks._load_universe", return_value=[])
+    def test_대상종목_없음(self, mock_universe, mock_chord):
+        """대상 종목이 없으면 발행 없이 빈 결과"""
+        result = generate_jongga_signals.s(capital=50_000_000, top_n=5)()
 
-        # Assert: 최소한 성공 상태 반환
         assert result["status"] == "success"
-        assert "count" in result
-        assert "signals" in result
+        assert result["count"] == 0
+        assert result["capital"] == 50_000_000
+        mock_chord.assert_not_called()
+
 
+class TestScoreJonggaShard:
+    """score_jongga_shard 태스크 테스트"""
+
+    @patch("tasks.signal_tasks._prefetch_shard_data")
     @patch("services.signal_engine.scorer.SignalScorer")
-    def test_점수필터링_동작확인(self, mock_scorer_class):
-        """점수 필터링 동작 확인 (6점 이상만 포함)"""
-        # Mock 설정 - 6점 이상 시그널
-        mock_signal_high = Mock()
-        mock_signal_high.score.total = 8
-        mock_signal_high.to_dict.return_value = {
-            "ticker": "005930",
-            "name": "삼성전자",
-            "grade": "A",
-            "score": {"total": 8}
+    def test_일괄조회_데이터로_점수계산(self, mock_scorer_class, mock_prefetch):
+        """샤드 데이터를 한 번만 조회하고 스코어러에 전달"""
+        prices = [Mock(close_price=70000), Mock(close_price=71000)]
+        flow = Mock()
+        mock_prefetch.return_value = {
+            "005930": {"prices": prices, "flow": flow, "news_score": 2},
+            "000660": {"prices": [], "flow": None, "news_score": 0},
         }
+        mock_signal = Mock()
+        mock_signal.to_dict.return_value = _signal_dict("005930", "A", 8)
+        mock_scorer_class.return_value.calculate.return_value = mock_signal
 
-        # Mock 설정 - 6점 미만 시그널
-        mock_signal_low = Mock()
-        mock_signal_low.score.total = 4
-        mock_signal_low.to_dict.return_value = {
-            "ticker": "000660",
-            "name": "SK하이닉스",
-            "grade": "C",
-            "score": {"total": 4}
-        }
+        result = score_jongga_shard.s(
+            [("005930", "삼성전자"), ("000660", "SK하이닉스")], capital=20_000_000, shard_index=1,
+        )()
 
-        mock_scorer = Mock()
-        # 모든 호출에 대해 충분한 side_effect 제공 (3개 종목)
-        mock_scorer.calculate.side_effect = [mock_signal_high, mock_signal_low, mock_signal_high]
-        mock_scorer_class.return_value = mock_scorer
+        mock_prefetch.assert_called_once_with(["005930", "000660"])
+        mock_scorer_class.return_value.calculate.assert_called_once_with(
+            "005930", "삼성전자", 71000,
+            prices=prices, flow=flow, news_score=2, capital=20_000_000,
+        )
+        assert result["shard"] == 1
+        assert result["scanned"] == 2
+        assert [s["ticker"] for s in result["signals"]] == ["005930"]
 
-        # Arrange
-        task = generate_jongga_signals.s(capital=10_000_000, top_n=10)
 
-        # Act
-        result = task()
+class TestReduceJonggaSignals:
+    """reduce_jongga_signals 태스크 테스트"""
+
+    @patch("tasks.signal_tasks._persist_signals", side_effect=lambda signals, _: len(signals))
+    def test_점수필터링_정렬_저장(self, mock_persist):
+        """min_score 필터, 등급/점수 정렬, top_n 적용 후 일괄 저장"""
+        shard_results = [
+            {"shard": 0, "scanned": 2, "signals": [_signal_dict("000001", "B", 7), _signal_dict("000002", "C", 4)]},
+            {"shard": 1, "scanned": 2, "signals": [_signal_dict("000003", "A", 9), _signal_dict("000004", "A", 10)]},
+        ]
+
+        result = reduce_jongga_signals(shard_results, capital=10_000_000, top_n=2, min_score=6)
 
-        # Assert
         assert result["status"] == "success"
-        # 모든 시그널이 6점 이상인지 확인
+        assert result["scanned"] == 4
+        assert [s["ticker"] for s in result["signals"]] == ["000004", "000003"]
+        assert result["count"] == result["saved"] == 2
         for signal in result["signals"]:
             assert signal["score"]["total"] >= 6
+        mock_persist.assert_called_once()
 
-    @patch("services.signal_engine.scorer.SignalScorer")
-    def test_capital_top_n_파라미터(self, mock_scorer_class):
-        """capital과 top_n 파라미터 전달 확인"""
-        # Mock 설정
-        mock_signal = Mock()
-        mock_signal.score.total = 7
-        mock_signal.to_dict.return_value = {
-            "ticker": "005930",
-            "grade": "B",
-            "score": {"total": 7}
-        }
+    @patch("tasks.signal_tasks._persist_signals", side_effect=RuntimeError("db down"))
+    def test_저장실패_에러상태_반환(self, mock_persist):
+        """저장 실패 시 error 상태와 함께 집계 결과 반환"""
+        result = reduce_jongga_signals(
+            [{"shard": 0, "scanned": 1, "signals": [_signal_dict("005930", "S", 11)]}],
+            capital=50_000_000,
+        )
 
-        mock_scorer = Mock()
-        mock_scorer.calculate.return_value = mock_signal
-        mock_scorer_class.return_value = mock_scorer
-
-        # Arrange
-        task = generate_jongga_signals.s(capital=50_000_000, top_n=5)
-
-        # Act
-        result = task()
-
-        # Assert
-        assert result["status"] == "success"
+        assert result["status"] == "error"
+        assert result["message"] == "db down"
         assert result["capital"] == 50_000_000
+        assert result["saved"] == 0
+        assert result["count"] == 1
 
 
 class TestAnalyzeSingleStock:
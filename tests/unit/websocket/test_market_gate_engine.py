@@ -0,0 +1,278 @@
+"""
+실시간 Market Gate 엔진 단위 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.kiwoom.base import IndexRealtimePrice, KiwoomEventType, RealtimePrice
+from src.repositories.market_repository import calculate_gate_status, gate_bucket
+from src.websocket import market_gate_engine as engine_module
+from src.websocket.market_gate_engine import (
+    ENGINE_HEARTBEAT_KEY,
+    ENGINE_HEARTBEAT_TTL,
+    MARKET_GATE_TOPIC,
+    MarketGateEngine,
+    is_engine_alive,
+)
+
+SECTORS = {"반도체": "069500", "2차전지": "305720", "자동차": "116380", "바이오": "327610"}
+
+
+def _index(code, index, change_rate):
+    name = {"001": "KOSPI", "201": "KOSDAQ"}[code]
+    return IndexRealtimePrice(code, name, index, 0.0, change_rate, 0, "2026-10-16T09:00:00")
+
+
+def _tick(ticker, change_rate):
+    return RealtimePrice(ticker, 10000.0, 0.0, change_rate, 0, 0.0, 0.0, "2026-10-16T09:00:00")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeConnectionManager:
+    def __init__(self):
+        self.sent = []
+
+    async def broadcast(self, message, topic=None):
+        self.sent.append((topic, message))
+
+
+class FakePipeline:
+    def __init__(self):
+        self.handlers = {}
+        self.subscribed = []
+
+    def register_event_handler(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unregister_event_handler(self, event_type, handler):
+        self.handlers[event_type].remove(handler)
+
+    async def subscribe(self, ticker):
+        self.subscribed.append(ticker)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    import src.websocket.server as server
+
+    fake = FakeConnectionManager()
+    monkeypatch.setattr(server, "connection_manager", fake)
+    return fake
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+async def _start_engine(clock):
+    pipeline = FakePipeline()
+    engine = MarketGateEngine(sector_etfs=SECTORS, persist_interval=300, broadcast_interval=5, clock=clock)
+    engine.persisted = []
+    engine._persist_sync = engine.persisted.append
+    await engine.start(pipeline, seed=False)
+    engine.pipeline = pipeline
+    return engine
+
+
+async def _settle(engine):
+    if engine._persist_task:
+        await engine._persist_task
+
+
+class TestGateCalculation:
+    """Gate 점수 계산 테스트"""
+
+    @pytest.mark.parametrize("change_pct, bucket", [
+        (1.5, 2), (1.0, 1), (0.01, 1), (0.0, 0), (None, 0), (-0.5, -1), (-1.0, -1), (-1.01, -2),
+    ])
+    def test_bucket_boundaries(self, change_pct, bucket):
+        assert gate_bucket(change_pct) == bucket
+
+    @pytest.mark.parametrize("kospi, kosdaq, sectors, expected", [
+        (1.5, 1.2, [3.0, 2.0], ("GREEN", 100)),
+        (0.5, -0.5, [], ("YELLOW", 50)),
+        (-1.5, -0.2, [-2.0, -3.0, 0.5], ("RED", 10)),
+        (-0.3, -0.4, [2.0] * 6, ("YELLOW", 50)),
+    ])
+    def test_calculate_gate_status(self, kospi, kosdaq, sectors, expected):
+        sector_scores = [{"change_pct": pct} for pct in sectors]
+        assert calculate_gate_status(kospi, kosdaq, sector_scores) == expected
+
+
+@pytest.mark.usefixtures("manager")
+class TestMarketGateEngine:
+    """실시간 Gate 엔진 테스트"""
+
+    async def test_start_registers_handlers_and_subscribes_sectors(self, clock):
+        engine = await _start_engine(clock)
+        pipeline = engine.pipeline
+        assert engine.on_index in pipeline.handlers[KiwoomEventType.RECEIVE_INDEX_DATA]
+        assert engine.on_price in pipeline.handlers[KiwoomEventType.RECEIVE_REAL_DATA]
+        assert sorted(pipeline.subscribed) == sorted(SECTORS.values())
+
+    async def test_snapshot_requires_both_indices(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        assert engine.snapshot() is None
+
+        await engine.on_index(_index("201", 850.0, 1.5))
+        snapshot = engine.snapshot()
+        assert (snapshot.gate, snapshot.gate_score) == ("GREEN", 80)
+        assert snapshot.kospi == 2600.0
+        assert snapshot.kosdaq_change_pct == 1.5
+
+    async def test_snapshot_expires_without_recent_events(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        await engine.on_index(_index("201", 850.0, 1.5))
+
+        clock.now = ENGINE_HEARTBEAT_TTL
+        assert engine.snapshot() is not None
+
+        # 피드가 끊긴 채 TTL 경과 → 오래된 Gate를 실시간 값으로 내보내지 않음
+        clock.now = ENGINE_HEARTBEAT_TTL + 1
+        assert engine.snapshot() is None
+        assert engine.get_stats()["live"] is False
+
+        await engine.on_index(_index("001", 2605.0, 0.6))
+        assert engine.snapshot().kospi == 2605.0
+
+    async def test_recomputes_only_on_bucket_change(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        await engine.on_index(_index("201", 850.0, 0.3))
+        recomputes = engine.get_stats()["recomputes"]
+
+        # 같은 구간 내 값 변화 → 재계산 없이 값만 갱신
+        await engine.on_index(_index("001", 2601.0, 0.6))
+        await engine.on_price(_tick("069500", 0.8))
+        assert engine.get_stats()["recomputes"] == recomputes
+        assert engine.snapshot().kospi == 2601.0
+
+        # 섹터가 강세 구간으로 이동 → 재계산
+        await engine.on_price(_tick("069500", 1.2))
+        assert engine.get_stats()["recomputes"] == recomputes + 1
+        assert engine.snapshot().gate_score == 75
+
+    async def test_ignores_unrelated_events(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_price(_tick("005930", 5.0))
+        await engine.on_index(IndexRealtimePrice("002", "대형주", 1.0, 0.0, 1.0, 0, ""))
+        assert engine.get_stats()["updates"] == 0
+
+    async def test_persists_on_transition_and_interval(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        await engine.on_index(_index("201", 850.0, -0.5))
+        await _settle(engine)
+        assert [s.gate for s in engine.persisted] == ["YELLOW"]
+
+        # 같은 상태 내 변화는 주기 전까지 저장하지 않음
+        clock.now = 100
+        await engine.on_index(_index("001", 2610.0, 0.9))
+        await _settle(engine)
+        assert len(engine.persisted) == 1
+
+        # 상태 전환 → 즉시 저장
+        clock.now = 120
+        await engine.on_index(_index("001", 2640.0, 1.6))
+        await engine.on_index(_index("201", 860.0, 1.6))
+        await _settle(engine)
+        assert [s.gate for s in engine.persisted] == ["YELLOW", "GREEN"]
+
+        # 주기 경과 → 저장
+        clock.now = 500
+        await engine.on_index(_index("001", 2650.0, 1.7))
+        await _settle(engine)
+        assert len(engine.persisted) == 3
+        assert engine.persisted[-1].kospi == 2650.0
+
+    async def test_broadcast_throttled_unless_score_changes(self, clock, manager):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        await engine.on_index(_index("201", 850.0, 0.5))
+        assert len(manager.sent) == 1
+        topic, message = manager.sent[0]
+        assert topic == MARKET_GATE_TOPIC
+        assert message["type"] == "market_gate_update"
+        assert message["data"]["level"] == 70
+
+        clock.now = 1
+        await engine.on_index(_index("001", 2601.0, 0.6))
+        assert len(manager.sent) == 1
+
+        # 점수 변화는 즉시 전송
+        clock.now = 2
+        await engine.on_price(_tick("305720", -2.0))
+        assert len(manager.sent) == 2
+        assert manager.sent[-1][1]["data"]["sectors"][0]["signal"] == "bearish"
+
+        clock.now = 10
+        await engine.on_index(_index("001", 2602.0, 0.7))
+        assert len(manager.sent) == 3
+
+    async def test_seed_fills_missing_inputs_without_going_live(self, manager, clock):
+        engine = MarketGateEngine(sector_etfs=SECTORS, clock=clock)
+        engine._persist_sync = Mock()
+        engine.seed(SimpleNamespace(
+            kospi=2590.0, kospi_change_pct=-0.2,
+            kosdaq=840.0, kosdaq_change_pct=-0.1,
+            gate="YELLOW",
+            sector_scores=[{"name": "반도체", "ticker": "069500", "change_pct": 2.0}],
+        ))
+
+        assert engine.snapshot() is None
+        await engine.start(FakePipeline(), seed=False)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+
+        snapshot = engine.snapshot()
+        assert snapshot.kosdaq == 840.0
+        assert snapshot.sector_scores == [{"name": "반도체", "ticker": "069500", "change_pct": 2.0}]
+        await engine.stop()
+
+    async def test_stop_flushes_unsaved_state(self, clock):
+        engine = await _start_engine(clock)
+        await engine.on_index(_index("001", 2600.0, 0.5))
+        await engine.on_index(_index("201", 850.0, 0.5))
+        await _settle(engine)
+
+        clock.now = 10
+        await engine.on_index(_index("001", 2605.0, 0.7))
+        await engine.stop()
+
+        assert len(engine.persisted) == 2
+        assert engine.pipeline.handlers[KiwoomEventType.RECEIVE_INDEX_DATA] == []
+
+
+class TestEngineHeartbeat:
+    """엔진 하트비트 / Celery 태스크 생략 테스트"""
+
+    def test_is_engine_alive(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        client = fakeredis.FakeRedis()
+
+        assert is_engine_alive(client) is False
+        client.set(ENGINE_HEARTBEAT_KEY, "1", ex=60)
+        assert is_engine_alive(client) is True
+
+    def test_redis_failure_means_not_alive(self):
+        client = Mock()
+        client.exists.side_effect = ConnectionError("down")
+        assert is_engine_alive(client) is False
+
+    def test_update_market_gate_skipped_while_engine_alive(self, monkeypatch):
+        from tasks.market_tasks import update_market_gate
+
+        monkeypatch.setattr(engine_module, "is_engine_alive", lambda: True)
+        assert update_market_gate() == {"status": "skipped", "reason": "realtime_engine"}
@@ -0,0 +1,139 @@
+"""
+PriceSnapshot 및 스냅샷 기반 DaytradingPriceBroadcaster 단위 테스트
+"""
+
+import pytest
+
+from services.daytrading_scanner.price_broadcaster import DaytradingPriceBroadcaster
+from src.websocket.price_snapshot import PriceSnapshot
+
+
+def _price(price, volume=1000):
+    return {"price": price, "change": 0, "change_rate": 0.0, "volume": volume}
+
+
+class FakeConnectionManager:
+    def __init__(self, subscriptions=None):
+        self.subscriptions = subscriptions or {}
+        self.sent = []
+
+    async def send_personal_message(self, message, client_id):
+        self.sent.append((client_id, message))
+        return True
+
+
+class TestPriceSnapshot:
+    """PriceSnapshot 테스트"""
+
+    def test_version_bumps_only_on_change(self):
+        snapshot = PriceSnapshot()
+
+        assert snapshot.update("005930", _price(80000), source="db") is True
+        assert snapshot.update("005930", _price(80000), source="kiwoom_ws") is False
+        assert snapshot.version == 1
+
+        assert snapshot.update("005930", _price(80100)) is True
+        assert snapshot.version == 2
+        assert snapshot.get("005930")["price"] == 80100
+
+    def test_ignores_empty_price(self):
+        snapshot = PriceSnapshot()
+
+        assert snapshot.update("005930", {}) is False
+        assert snapshot.update("", _price(1)) is False
+        assert snapshot.version == 0
+
+    def test_changed_since_filters_by_version_and_tickers(self):
+        snapshot = PriceSnapshot()
+        snapshot.update_many({"005930": _price(80000), "000660": _price(120000)})
+        version = snapshot.version
+
+        snapshot.update("000660", _price(121000))
+        snapshot.update("035420", _price(200000))
+
+        current, changed = snapshot.changed_since(version, tickers={"005930", "000660"})
+
+        assert current == snapshot.version
+        assert set(changed) == {"000660"}
+
+        _, everything = snapshot.changed_since(0)
+        assert set(everything) == {"005930", "000660", "035420"}
+
+    def test_watch_by_owner(self):
+        snapshot = PriceSnapshot()
+        snapshot.watch("005930", owner="daytrading")
+        snapshot.watch("005930", owner="other")
+        snapshot.watch("000660", owner="daytrading")
+
+        snapshot.unwatch("005930", owner="daytrading")
+
+        assert snapshot.watched_tickers() == {"005930", "000660"}
+
+
+class TestDaytradingPriceBroadcasterSnapshot:
+    """스냅샷 변경분 전송 테스트"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return PriceSnapshot()
+
+    @pytest.fixture
+    def manager(self):
+        return FakeConnectionManager({
+            "price:005930": {"client-1"},
+            "price:000660": {"client-1"},
+        })
+
+    def test_tickers_registered_with_snapshot(self, snapshot):
+        broadcaster = DaytradingPriceBroadcaster(snapshot=snapshot)
+
+        broadcaster.add_ticker("005930")
+        assert snapshot.watched_tickers() == {"005930"}
+
+        broadcaster.remove_ticker("005930")
+        assert snapshot.watched_tickers() == set()
+
+    async def test_pushes_only_changed_tickers(self, snapshot, manager):
+        broadcaster = DaytradingPriceBroadcaster(snapshot=snapshot)
+        broadcaster.set_connection_manager(manager)
+        broadcaster.add_ticker("005930")
+        broadcaster.add_ticker("000660")
+
+        snapshot.update_many({"005930": _price(80000), "000660": _price(120000)})
+        assert await broadcaster._fetch_and_broadcast_prices() == 2
+
+        # 변경 없음 → 전송 없음
+        assert await broadcaster._fetch_and_broadcast_prices() == 0
+
+        snapshot.update("000660", _price(121000))
+        assert await broadcaster._fetch_and_broadcast_prices() == 1
+
+        last_frame = manager.sent[-1][1]
+        assert last_frame["type"] == "price_batch"
+        assert list(last_frame["data"]["prices"]) == ["000660"]
+
+    async def test_new_ticker_receives_current_price(self, snapshot, manager):
+        broadcaster = DaytradingPriceBroadcaster(snapshot=snapshot)
+        broadcaster.set_connection_manager(manager)
+        snapshot.update("005930", _price(80000))
+
+        broadcaster.add_ticker("000660")
+        await broadcaster._fetch_and_broadcast_prices()
+
+        # 스냅샷 이후 추가된 종목도 첫 주기에 현재가 전송
+        broadcaster.add_ticker("005930")
+        assert await broadcaster._fetch_and_broadcast_prices() == 1
+        assert manager.sent[-1][1]["data"]["prices"]["005930"]["price"] == 80000
+
+        # 스냅샷에 없던 종목은 가격이 들어오면 전송
+        snapshot.update("000660", _price(120000))
+        assert await broadcaster._fetch_and_broadcast_prices() == 1
+
+    async def test_untracked_tickers_ignored(self, snapshot, manager):
+        broadcaster = DaytradingPriceBroadcaster(snapshot=snapshot)
+        broadcaster.set_connection_manager(manager)
+        broadcaster.add_ticker("005930")
+
+        snapshot.update("035420", _price(200000))
+
+        assert await broadcaster._fetch_and_broadcast_prices() == 0
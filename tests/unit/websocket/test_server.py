@@ -568,6 +568,31 @@ class TestPriceUpdateBroadcasterExtended:
 
             await broadcaster.stop()
 
+    @pytest.mark.asyncio
+    async def test_ensure_token_uses_token_broker(self):
+        """토큰 확보는 브로커 경로(ensure_token_valid)를 사용하고 직접 발급하지 않음"""
+        broadcaster = PriceUpdateBroadcaster()
+        api = MagicMock()
+        api.ensure_token_valid = AsyncMock()
+        api.issue_token = AsyncMock()
+
+        with patch("src.websocket.server.get_kiwoom_api", return_value=api):
+            assert await broadcaster._ensure_token() is True
+            assert await broadcaster._ensure_token() is True
+
+        assert api.ensure_token_valid.await_count == 2
+        api.issue_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_token_failure(self):
+        """토큰 확보 실패 시 False"""
+        broadcaster = PriceUpdateBroadcaster()
+        api = MagicMock()
+        api.ensure_token_valid = AsyncMock(side_effect=RuntimeError("broker down"))
+
+        with patch("src.websocket.server.get_kiwoom_api", return_value=api):
+            assert await broadcaster._ensure_token() is False
+
     @pytest.mark.asyncio
     async def test_broadcast_loop_running(self):
         """브로드캐스트 루프 실행 테스트"""